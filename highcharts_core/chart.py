@@ -1,7 +1,19 @@
+import concurrent.futures
 import os
 from typing import Optional, List
 from collections import UserDict
 
+try:
+    import orjson as json
+except ImportError:
+    try:
+        import rapidjson as json
+    except ImportError:
+        try:
+            import simplejson as json
+        except ImportError:
+            import json
+
 from validator_collection import validators, checkers
 
 from highcharts_core import constants, errors, utility_functions
@@ -9,7 +21,7 @@ from highcharts_core.decorators import class_sensitive, validate_types
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.options import HighchartsOptions
 from highcharts_core.utility_classes.javascript_functions import CallbackFunction
-from highcharts_core.js_literal_functions import serialize_to_js_literal
+from highcharts_core.js_literal_functions import serialize_to_js_literal, get_js_literal
 from highcharts_core.headless_export import ExportServer
 from highcharts_core.options.series.series_generator import (
     create_series_obj,
@@ -18,6 +30,15 @@ from highcharts_core.options.series.series_generator import (
 from highcharts_core.global_options.shared_options import SharedOptions
 
 
+def _series_from_csv(series_cls, as_string_or_file, series_in_rows, kwargs):
+    """Create one or more series of type ``series_cls`` from CSV data. Defined at the
+    module level so that it can be executed in a process pool."""
+    if series_in_rows:
+        return series_cls.from_csv_in_rows(as_string_or_file, **kwargs)
+
+    return series_cls.from_csv(as_string_or_file, **kwargs)
+
+
 class Chart(HighchartsMeta):
     """Python representation of a Highcharts ``Chart`` object."""
 
@@ -74,6 +95,7 @@ class Chart(HighchartsMeta):
         self._module_url = None
 
         self._random_slug = {}
+        self._delta_snapshot = None
 
         self.callback = kwargs.get("callback", None)
         self.container = kwargs.get("container", None)
@@ -1020,6 +1042,460 @@ class Chart(HighchartsMeta):
 
         self.options.series = updated_series
 
+    @staticmethod
+    def _get_delta_points(series) -> list:
+        """Return the data points of ``series`` in their serializable form (either
+        primitive arrays or data point objects)."""
+        data = series.data
+        if data is None:
+            return []
+        if hasattr(data, "to_array"):
+            return data.to_array()
+
+        return [x for x in data]
+
+    @staticmethod
+    def _get_delta_key(point):
+        """Return a value that can be used to compare ``point`` for equality."""
+        if not hasattr(point, "to_array"):
+            return point
+
+        as_array = point.to_array()
+        if isinstance(as_array, list):
+            return as_array
+
+        return point.to_js_literal()
+
+    @staticmethod
+    def _match_delta(previous, current):
+        """Determine how ``current`` can be derived from ``previous`` by dropping points
+        from its start and appending points to its end.
+
+        :returns: A 2-member :class:`tuple <python:tuple>` containing the number of
+          points dropped from the start of ``previous`` and the number of points
+          appended to its end, or :obj:`None <python:None>` if ``current`` cannot be
+          (efficiently) derived from ``previous`` in that way.
+        :rtype: :class:`tuple <python:tuple>` of :class:`int <python:int>`, or
+          :obj:`None <python:None>`
+        """
+        if not current:
+            return None
+        if not previous:
+            return 0, len(current)
+
+        first = current[0]
+        start = 0
+        while True:
+            try:
+                dropped = previous.index(first, start)
+            except ValueError:
+                return None
+
+            retained = len(previous) - dropped
+            if retained <= len(current) and previous[dropped:] == current[:retained]:
+                appended = len(current) - retained
+                if appended > retained:
+                    return None
+
+                return dropped, appended
+
+            start = dropped + 1
+
+    def _get_series_snapshot(self) -> dict:
+        snapshot = {}
+        if not self.options or not self.options.series:
+            return snapshot
+
+        for index, series in enumerate(self.options.series):
+            key = series.id if series.id is not None else index
+            snapshot[key] = [
+                self._get_delta_key(x) for x in self._get_delta_points(series)
+            ]
+
+        return snapshot
+
+    def snapshot_data(self):
+        """Record the data points currently held by the chart's series as the baseline
+        against which subsequent deltas (produced by
+        :meth:`.get_data_delta() <highcharts_core.chart.Chart.get_data_delta>`,
+        :meth:`.to_delta_js_literal() <highcharts_core.chart.Chart.to_delta_js_literal>`,
+        or :meth:`.to_delta_json() <highcharts_core.chart.Chart.to_delta_json>`) are
+        calculated.
+
+        .. hint::
+
+          Call this method immediately after rendering the chart (e.g. using
+          :meth:`.to_js_literal() <highcharts_core.chart.Chart.to_js_literal>` or
+          :meth:`.display() <highcharts_core.chart.Chart.display>`), so that subsequent
+          updates to the chart's data only need to send the points that have changed.
+
+        """
+        self._delta_snapshot = self._get_series_snapshot()
+
+    def get_data_delta(self, commit=True) -> List[dict]:
+        """Calculate the operations needed to bring a chart that was rendered with the
+        data recorded by
+        :meth:`.snapshot_data() <highcharts_core.chart.Chart.snapshot_data>` up to date
+        with the chart's current data.
+
+        Series are matched by their
+        :meth:`.id <highcharts_core.options.series.base.SeriesBase.id>`, falling back
+        to their position within the chart if they have no ``id``. Where a series' new
+        data can be derived from its previous data by dropping points from its start and
+        appending points to its end (as is typical of live, sliding-window charts), only
+        the appended points are returned. Otherwise, the series' full data is returned
+        for use with ``series.setData()``.
+
+        Each operation is a :class:`dict <python:dict>` with the following keys:
+
+          * ``series``: the ``id`` (or index) of the series the operation applies to
+          * ``method``: one of ``'addPoint'``, ``'removePoint'``, ``'setData'``,
+            ``'addSeries'``, or ``'remove'``
+          * ``points``: the data points to add (for ``'addPoint'`` and ``'setData'``)
+          * ``shift``: whether adding each point should drop the first point of the
+            series (for ``'addPoint'``)
+          * ``count``: the number of points to remove from the start of the series
+            (for ``'removePoint'``)
+          * ``options``: the series to add (for ``'addSeries'``)
+
+        .. note::
+
+          If no snapshot has been recorded, the full data of every series will be
+          returned for use with ``series.setData()``.
+
+        :param commit: If ``True``, records the chart's current data as the new
+          baseline for subsequent deltas. Defaults to ``True``.
+        :type commit: :class:`bool <python:bool>`
+
+        :returns: The (ordered) operations to apply to the rendered chart.
+        :rtype: :class:`list <python:list>` of :class:`dict <python:dict>`
+        """
+        previous_snapshot = self._delta_snapshot
+        current_snapshot = {}
+        operations = []
+        added_series = []
+
+        series_list = []
+        if self.options and self.options.series:
+            series_list = [x for x in self.options.series]
+
+        for index, series in enumerate(series_list):
+            key = series.id if series.id is not None else index
+            points = self._get_delta_points(series)
+            current = [self._get_delta_key(x) for x in points]
+            current_snapshot[key] = current
+
+            if previous_snapshot is not None and key not in previous_snapshot:
+                added_series.append(
+                    {"series": key, "method": "addSeries", "options": series}
+                )
+                continue
+
+            if previous_snapshot is None:
+                match = None
+            else:
+                match = self._match_delta(previous_snapshot[key], current)
+                if match is None and previous_snapshot[key] == current:
+                    continue
+
+            if match is None:
+                operations.append(
+                    {"series": key, "method": "setData", "points": points}
+                )
+                continue
+
+            dropped, appended = match
+            shifted = min(dropped, appended)
+            if dropped > shifted:
+                operations.append(
+                    {"series": key, "method": "removePoint", "count": dropped - shifted}
+                )
+
+            new_points = points[len(points) - appended :]
+            if shifted:
+                operations.append(
+                    {
+                        "series": key,
+                        "method": "addPoint",
+                        "points": new_points[:shifted],
+                        "shift": True,
+                    }
+                )
+            if appended > shifted:
+                operations.append(
+                    {
+                        "series": key,
+                        "method": "addPoint",
+                        "points": new_points[shifted:],
+                        "shift": False,
+                    }
+                )
+
+        if previous_snapshot is not None:
+            removed_keys = [x for x in previous_snapshot if x not in current_snapshot]
+            removed_indices = sorted(
+                [x for x in removed_keys if isinstance(x, int)], reverse=True
+            )
+            removed_ids = [x for x in removed_keys if not isinstance(x, int)]
+            for key in removed_ids + removed_indices:
+                operations.append({"series": key, "method": "remove"})
+
+        operations.extend(added_series)
+
+        if commit:
+            self._delta_snapshot = current_snapshot
+
+        return operations
+
+    @staticmethod
+    def _get_delta_reference(variable_name, key) -> str:
+        if isinstance(key, int):
+            return f"{variable_name}.series[{key}]"
+
+        key = key.replace("\\", "\\\\").replace("'", "\\'")
+
+        return f"{variable_name}.get('{key}')"
+
+    def to_delta_js_literal(
+        self,
+        variable_name=None,
+        redraw=True,
+        commit=True,
+        encoding="utf-8",
+        careful_validation=False,
+    ) -> Optional[str]:
+        """Return the JavaScript code which applies the changes to the chart's data
+        since the last snapshot to the rendered chart, using ``series.addPoint()``,
+        ``series.removePoint()``, and ``series.setData()`` rather than re-rendering the
+        chart.
+
+        .. seealso::
+
+          * :meth:`.get_data_delta() <highcharts_core.chart.Chart.get_data_delta>`
+          * :meth:`.snapshot_data() <highcharts_core.chart.Chart.snapshot_data>`
+
+        :param variable_name: The name of the JavaScript variable that holds the rendered
+          chart. If :obj:`None <python:None>`, defaults to
+          :meth:`.variable_name <highcharts_core.chart.Chart.variable_name>` or
+          ``'chart'`` if that is not set.
+        :type variable_name: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param redraw: If ``True``, ends the code with a call to ``chart.redraw()``.
+          Defaults to ``True``.
+        :type redraw: :class:`bool <python:bool>`
+
+        :param commit: If ``True``, records the chart's current data as the new
+          baseline for subsequent deltas. Defaults to ``True``.
+        :type commit: :class:`bool <python:bool>`
+
+        :param encoding: The character encoding to apply to the resulting object. Defaults
+          to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :param careful_validation: if ``True``, will carefully validate JavaScript values
+          along the way using the
+          `esprima-python <https://github.com/Kronuz/esprima-python>`__ library. Defaults
+          to ``False``.
+        :type careful_validation: :class:`bool <python:bool>`
+
+        :returns: The JavaScript code, or :obj:`None <python:None>` if there have been no
+          changes.
+        :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        variable_name = validators.variable_name(variable_name, allow_empty=True)
+        variable_name = variable_name or self.variable_name or "chart"
+
+        def to_literal(item):
+            serialized = serialize_to_js_literal(
+                item, encoding=encoding, careful_validation=careful_validation
+            )
+            return get_js_literal(serialized, careful_validation=careful_validation)
+
+        statements = []
+        for operation in self.get_data_delta(commit=commit):
+            reference = self._get_delta_reference(variable_name, operation["series"])
+            method = operation["method"]
+            if method == "setData":
+                points = (
+                    "[" + ",".join([to_literal(x) for x in operation["points"]]) + "]"
+                )
+                statements.append(f"{reference}.setData({points}, false);")
+            elif method == "removePoint":
+                count = operation["count"]
+                if count == 1:
+                    statements.append(f"{reference}.removePoint(0, false);")
+                else:
+                    statements.append(
+                        f"for (var i = 0; i < {count}; i++) "
+                        f"{{ {reference}.removePoint(0, false); }}"
+                    )
+            elif method == "addPoint":
+                shift = "true" if operation["shift"] else "false"
+                points = [to_literal(x) for x in operation["points"]]
+                if len(points) == 1:
+                    statements.append(
+                        f"{reference}.addPoint({points[0]}, false, {shift});"
+                    )
+                else:
+                    statements.append(
+                        f"[{','.join(points)}].forEach(function(point) "
+                        f"{{ {reference}.addPoint(point, false, {shift}); }});"
+                    )
+            elif method == "remove":
+                statements.append(f"{reference}.remove(false);")
+            elif method == "addSeries":
+                options = operation["options"].to_js_literal(
+                    encoding=encoding, careful_validation=careful_validation
+                )
+                statements.append(f"{variable_name}.addSeries({options}, false);")
+
+        if not statements:
+            return None
+
+        if redraw:
+            statements.append(f"{variable_name}.redraw();")
+
+        return "\n".join(statements)
+
+    def to_delta_json(self, commit=True, encoding="utf-8"):
+        """Return the changes to the chart's data since the last snapshot as a JSON
+        array of operations, for application to the rendered chart by your own
+        JavaScript code (e.g. over a websocket).
+
+        .. seealso::
+
+          * :meth:`.get_data_delta() <highcharts_core.chart.Chart.get_data_delta>`,
+            which describes the structure of each operation
+          * :meth:`.snapshot_data() <highcharts_core.chart.Chart.snapshot_data>`
+
+        .. note::
+
+          This method will either return a standard :class:`str <python:str>` or a
+          :class:`bytes <python:bytes>` object depending on the JSON serialization library
+          you are using. For example, if your environment has
+          `orjson <https://github.com/ijl/orjson>`_, the result will be a
+          :class:`bytes <python:bytes>` representation of the string.
+
+        :param commit: If ``True``, records the chart's current data as the new
+          baseline for subsequent deltas. Defaults to ``True``.
+        :type commit: :class:`bool <python:bool>`
+
+        :param encoding: The character encoding to apply to the resulting object. Defaults
+          to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :rtype: :class:`str <python:str>` or :class:`bytes <python:bytes>`
+        """
+
+        def to_json_value(item):
+            if not hasattr(item, "_to_untrimmed_dict"):
+                return item
+            return item.trim_dict(
+                item._to_untrimmed_dict(),
+                to_json=True,
+                context=item.__class__.__name__,
+            )
+
+        operations = self.get_data_delta(commit=commit)
+        for operation in operations:
+            if "points" in operation:
+                operation["points"] = [to_json_value(x) for x in operation["points"]]
+            if "options" in operation:
+                operation["options"] = to_json_value(operation["options"])
+
+        try:
+            as_json = json.dumps(operations, encoding=encoding)
+        except TypeError:
+            as_json = json.dumps(operations)
+
+        return as_json
+
+    def diff(
+        self,
+        other,
+        as_json=False,
+        variable_name=None,
+        redraw=True,
+        encoding="utf-8",
+        careful_validation=False,
+    ):
+        """Return the minimal update needed to transform the rendered chart into
+        ``other``, either as a JavaScript ``chart.update()`` call or as JSON.
+
+        .. seealso::
+
+          * :meth:`HighchartsOptions.diff() <highcharts_core.options.Options.diff>`,
+            which describes how the patch is calculated
+
+        :param other: The chart (or chart options) to compare the instance against.
+        :type other: :class:`Chart <highcharts_core.chart.Chart>` or
+          :class:`HighchartsOptions <highcharts_core.options.HighchartsOptions>` or
+          coercable
+
+        :param as_json: If ``True``, returns a JSON object with an ``options`` key
+          containing the patch and a ``oneToOne`` key indicating whether the patch
+          removes series or axes. If ``False``, returns the JavaScript ``chart.update()``
+          call. Defaults to ``False``.
+        :type as_json: :class:`bool <python:bool>`
+
+        :param variable_name: The name of the JavaScript variable that holds the rendered
+          chart. If :obj:`None <python:None>`, defaults to
+          :meth:`.variable_name <highcharts_core.chart.Chart.variable_name>` or
+          ``'chart'`` if that is not set.
+        :type variable_name: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param redraw: Whether the chart should be redrawn once the update has been
+          applied. Defaults to ``True``.
+        :type redraw: :class:`bool <python:bool>`
+
+        :param encoding: The character encoding to apply to the resulting object. Defaults
+          to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :param careful_validation: if ``True``, will carefully validate JavaScript values
+          along the way using the
+          `esprima-python <https://github.com/Kronuz/esprima-python>`__ library. Defaults
+          to ``False``.
+        :type careful_validation: :class:`bool <python:bool>`
+
+        :returns: The JavaScript code or JSON string, or :obj:`None <python:None>` if
+          the charts are equivalent.
+        :rtype: :class:`str <python:str>`, :class:`bytes <python:bytes>`, or
+          :obj:`None <python:None>`
+        """
+        if checkers.is_type(other, "Chart"):
+            other = other.options
+        other = validate_types(other, types=HighchartsOptions)
+
+        options = self.options or HighchartsOptions()
+        patch, one_to_one = options._get_diff(other)
+        if not patch:
+            return None
+
+        if as_json:
+            as_dict = {
+                "options": options._patch_to_json(patch),
+                "oneToOne": one_to_one,
+            }
+            try:
+                return json.dumps(as_dict, encoding=encoding)
+            except TypeError:
+                return json.dumps(as_dict)
+
+        variable_name = validators.variable_name(variable_name, allow_empty=True)
+        variable_name = variable_name or self.variable_name or "chart"
+
+        patch_as_str = options._patch_to_js_literal(
+            patch, encoding=encoding, careful_validation=careful_validation
+        )
+        redraw_as_str = "true" if redraw else "false"
+        one_to_one_as_str = "true" if one_to_one else "false"
+
+        return (
+            f"{variable_name}.update({patch_as_str}, "
+            f"{redraw_as_str}, {one_to_one_as_str});"
+        )
+
     @classmethod
     def from_series(cls, *series, kwargs=None):
         """Creates a new :class:`Chart <highcharts_core.chart.Chart>` instance populated
@@ -1433,6 +1909,11 @@ class Chart(HighchartsMeta):
         escape_character="\\",
         series_in_rows=False,
         series_index=None,
+        chunksize=None,
+        chunk_downsample=None,
+        chunk_aggregation=None,
+        max_workers=None,
+        executor="thread",
         **kwargs,
     ):
         """Create a new :class:`Chart <highcharts_core.chart.Chart>` instance with
@@ -1496,14 +1977,18 @@ class Chart(HighchartsMeta):
 
         :param as_string_or_file: The CSV data to use to pouplate data. Accepts either
           the raw CSV data as a :class:`str <python:str>` or a path to a file in the
-          runtime environment that contains the CSV data.
+          runtime environment that contains the CSV data. Also accepts an iterable of
+          CSV strings and/or paths, in which case each is parsed in parallel (see
+          ``max_workers`` and ``executor``) and the chart is populated with the series
+          generated from each, in order.
 
           .. tip::
 
             Unwrapped empty column values are automatically interpreted as null
             (:obj:`None <python:None>`).
 
-        :type as_string_or_file: :class:`str <python:str>` or Path-like
+        :type as_string_or_file: :class:`str <python:str>`, Path-like, or iterable of
+          :class:`str <python:str>` / Path-like
 
         :param property_column_map: A :class:`dict <python:dict>` used to indicate which
           data point property should be set to which CSV column. The keys in the
@@ -1643,6 +2128,41 @@ class Chart(HighchartsMeta):
         :type series_index: :class:`int <python:int>`, slice, or
           :obj:`None <python:None>`
 
+        :param chunksize: If supplied, the CSV data is read in chunks of (at most)
+          ``chunksize`` records, so that peak memory use is proportional to
+          ``chunksize`` and to the size of the resulting series rather than to the size
+          of the CSV data. If the CSV data is a file, it is read using a memory map.
+          Requires `NumPy <https://numpy.org>`__ and a ``property_column_map``.
+          Defaults to :obj:`None <python:None>`, which reads the CSV data in full.
+        :type chunksize: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param chunk_downsample: If supplied (together with ``chunksize``), each chunk is
+          downsampled as it is read. Accepts either the number of data points to retain
+          from each chunk, or a :class:`dict <python:dict>` of keyword arguments for
+          :meth:`DataPointCollection.downsample() <highcharts_core.options.series.data.collections.DataPointCollection.downsample>`.
+          Defaults to :obj:`None <python:None>`.
+        :type chunk_downsample: :class:`int <python:int>`, :class:`dict <python:dict>`,
+          or :obj:`None <python:None>`
+
+        :param chunk_aggregation: If supplied (together with ``chunksize``), each chunk is
+          aggregated into regular time intervals as it is read. Accepts a
+          :class:`dict <python:dict>` of keyword arguments for
+          :meth:`DataPointCollection.group_by_time() <highcharts_core.options.series.data.collections.DataPointCollection.group_by_time>`
+          (e.g. ``{'unit': 'hour', 'approximation': 'average'}``). Defaults to
+          :obj:`None <python:None>`.
+        :type chunk_aggregation: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param max_workers: The maximum number of workers to use when parsing multiple
+          CSV strings or files. Defaults to :obj:`None <python:None>`, which applies the
+          :mod:`concurrent.futures <python:concurrent.futures>` default.
+        :type max_workers: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param executor: The type of pool used to parse multiple CSV strings or files.
+          Accepts ``'thread'`` or ``'process'``. Because parsing CSV data is largely
+          CPU-bound, ``'process'`` will typically make better use of multiple cores.
+          Defaults to ``'thread'``.
+        :type executor: :class:`str <python:str>`
+
         :param **kwargs: Remaining keyword arguments will be attempted on the resulting
           :term:`series` instance and the data points it contains.
 
@@ -1652,6 +2172,8 @@ class Chart(HighchartsMeta):
 
         :raises HighchartsCSVDeserializationError: if ``property_column_map`` references
           CSV columns by their label, but the CSV data does not contain a header row
+        :raises HighchartsValueError: if ``executor`` is not ``'thread'`` or
+          ``'process'``
 
         """
         series_type = validators.string(series_type, allow_empty=False)
@@ -1667,41 +2189,76 @@ class Chart(HighchartsMeta):
 
         series_cls = SERIES_CLASSES.get(series_type, None)
 
-        if series_in_rows:
-            series = series_cls.from_csv_in_rows(
-                as_string_or_file,
-                has_header_row=has_header_row,
-                series_kwargs=series_kwargs,
-                delimiter=delimiter,
-                null_text=null_text,
-                wrapper_character=wrapper_character,
-                line_terminator=line_terminator,
-                wrap_all_strings=wrap_all_strings,
-                double_wrapper_character_when_nested=double_wrapper_character_when_nested,
-                escape_character=escape_character,
-                **kwargs,
-            )
+        csv_kwargs = {
+            "has_header_row": has_header_row,
+            "delimiter": delimiter,
+            "null_text": null_text,
+            "wrapper_character": wrapper_character,
+            "line_terminator": line_terminator,
+            "wrap_all_strings": wrap_all_strings,
+            "double_wrapper_character_when_nested": double_wrapper_character_when_nested,
+            "escape_character": escape_character,
+            **kwargs,
+        }
+        if not series_in_rows:
+            csv_kwargs["property_column_map"] = property_column_map
+            csv_kwargs["chunksize"] = chunksize
+            csv_kwargs["chunk_downsample"] = chunk_downsample
+            csv_kwargs["chunk_aggregation"] = chunk_aggregation
+
+        is_multiple = checkers.is_iterable(
+            as_string_or_file, forbid_literals=(str, bytes, dict, UserDict)
+        ) and not isinstance(as_string_or_file, os.PathLike)
+        if is_multiple:
+            sources = [x for x in as_string_or_file]
         else:
-            series = series_cls.from_csv(
-                as_string_or_file,
-                property_column_map=property_column_map,
-                has_header_row=has_header_row,
-                series_kwargs=series_kwargs,
-                delimiter=delimiter,
-                null_text=null_text,
-                wrapper_character=wrapper_character,
-                line_terminator=line_terminator,
-                wrap_all_strings=wrap_all_strings,
-                double_wrapper_character_when_nested=double_wrapper_character_when_nested,
-                escape_character=escape_character,
-                **kwargs,
-            )
+            sources = [as_string_or_file]
 
-        if isinstance(series, list) and series_index is not None:
-            series = series[series_index]
+        series_kwargs = validators.dict(series_kwargs, allow_empty=True) or {}
 
-        if not isinstance(series, list):
-            series = [series]
+        def get_task_kwargs():
+            # Each task receives its own copy of series_kwargs, which is modified
+            # while the series are created.
+            return {"series_kwargs": dict(series_kwargs), **csv_kwargs}
+
+        if len(sources) > 1:
+            executor = validators.string(executor).lower()
+            if executor == "thread":
+                executor_cls = concurrent.futures.ThreadPoolExecutor
+            elif executor == "process":
+                executor_cls = concurrent.futures.ProcessPoolExecutor
+            else:
+                raise errors.HighchartsValueError(
+                    f'executor expects "thread" or "process". Received: "{executor}"'
+                )
+
+            with executor_cls(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(
+                        _series_from_csv,
+                        series_cls,
+                        source,
+                        series_in_rows,
+                        get_task_kwargs(),
+                    )
+                    for source in sources
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                _series_from_csv(series_cls, source, series_in_rows, get_task_kwargs())
+                for source in sources
+            ]
+
+        series = []
+        for result in results:
+            if isinstance(result, list) and series_index is not None:
+                result = result[series_index]
+
+            if isinstance(result, list):
+                series.extend(result)
+            else:
+                series.append(result)
 
         options_kwargs["series"] = series
 
@@ -1810,6 +2367,7 @@ class Chart(HighchartsMeta):
         chart_kwargs=None,
         series_in_rows=False,
         series_index=None,
+        group_by=None,
         **kwargs,
     ):
         """Create a :class:`Chart <highcharts_core.chart.Chart>` instance whose
@@ -1932,6 +2490,11 @@ class Chart(HighchartsMeta):
         :type series_index: :class:`int <python:int>`, slice, or
           :obj:`None <python:None>`
 
+        :param group_by: If supplied, the label of a column (or of the index) whose
+          distinct values should each produce a separate series (named for the value).
+          Defaults to :obj:`None <python:None>`.
+        :type group_by: :class:`str <python:str>` or :obj:`None <python:None>`
+
         :param **kwargs: Additional keyword arguments that are - in turn - propagated to
           the series created from the ``df``.
 
@@ -1978,12 +2541,208 @@ class Chart(HighchartsMeta):
 
         series_cls = SERIES_CLASSES.get(series_type, None)
 
-        if series_in_rows:
+        if series_in_rows and group_by is None:
             series = series_cls.from_pandas_in_rows(
                 df, series_kwargs=series_kwargs, series_index=series_index, **kwargs
             )
         else:
             series = series_cls.from_pandas(
+                df,
+                property_map=property_map,
+                series_kwargs=series_kwargs,
+                series_in_rows=series_in_rows,
+                series_index=series_index,
+                group_by=group_by,
+                **kwargs,
+            )
+
+        if isinstance(series, series_cls):
+            series = [series]
+
+        options_kwargs["series"] = series
+        options = HighchartsOptions(**options_kwargs)
+
+        instance = cls(**chart_kwargs)
+        instance.options = options
+
+        return instance
+
+    @classmethod
+    def from_polars(
+        cls,
+        df,
+        property_map=None,
+        series_type="line",
+        series_kwargs=None,
+        options_kwargs=None,
+        chart_kwargs=None,
+        series_in_rows=False,
+        series_index=None,
+        **kwargs,
+    ):
+        """Create a :class:`Chart <highcharts_core.chart.Chart>` instance whose
+        series are populated from a `Polars <https://pola.rs/>`__
+        :class:`DataFrame <polars:polars.DataFrame>` or
+        :class:`LazyFrame <polars:polars.LazyFrame>`.
+
+          .. code-block:: python
+
+            from highcharts_core.chart import Chart
+
+            # Given a Polars DataFrame or LazyFrame instance named "df"
+
+            # EXAMPLE 1: The minimum code:
+
+            my_chart = Chart.from_polars(df, series_type = 'line')
+
+            # EXAMPLE 2: For more precise configuration and *multiple* series:
+
+            my_chart = Chart.from_polars(df,
+                                         property_map = {
+                                             'x': 'date',
+                                             'y': ['value1', 'value2', 'value3'],
+                                             'id': 'id'
+                                         },
+                                         series_type = 'line')
+
+        :param df: The :class:`DataFrame <polars:polars.DataFrame>` or
+          :class:`LazyFrame <polars:polars.LazyFrame>` from which data should be loaded.
+          A :class:`LazyFrame <polars:polars.LazyFrame>` is collected with only the
+          columns referenced in ``property_map``.
+        :type df: :class:`DataFrame <polars:polars.DataFrame>` or
+          :class:`LazyFrame <polars:polars.LazyFrame>`
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column in ``df``. The keys in the
+          :class:`dict <python:dict>` should correspond to properties in the data point
+          class, while the value should indicate the label for the column. Defaults to
+          :obj:`None <python:None>`.
+
+            .. note::
+
+              If any of the values in ``property_map`` contain an iterable, then
+              one series will be produced for each item in the iterable. For example,
+              the following:
+
+                .. code-block:: python
+
+                  {
+                      'x': 'timestamp',
+                      'y': ['value1', 'value2', 'value3']
+                  }
+
+              will return *three* series, each of which will have its
+              :meth:`.x <CartesianData.x>` value populated from the column
+              labeled ``'timestamp'``, and whose :meth:`.y <CartesianData.y>`
+              values will be populated from the columns labeled ``'value1'``,
+              ``'value2'``, and ``'value3'``, respectively.
+
+        :type property_map: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param series_type: Indicates the series type that should be created from the data
+          in ``df``. Defaults to ``'line'``.
+        :type series_type: :class:`str <python:str>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+            The ``data`` value will be created from ``df`` instead.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param options_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the :class:`HighchartsOptions`
+          instance. Defaults to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``options_kwargs`` contains a ``series`` key, the ``series`` value will be
+            *overwritten*. The ``series`` value will be created from the data in ``df``.
+
+        :type options_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param chart_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the :class:`Chart` instance.
+          Defaults to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``chart_kwargs`` contains an ``options`` key, ``options`` will be
+            *overwritten*. The ``options`` value will be created from the
+            ``options_kwargs`` and the data in ``df`` instead.
+
+        :type chart_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param series_in_rows: if ``True``, will attempt a streamlined cartesian series
+          with x-values taken from column names, y-values taken from row values, and
+          the series name taken from the first column (if it contains strings).
+          Defaults to :obj:`False <python:False>`.
+        :type series_in_rows: :class:`bool <python:bool>`
+
+        :param series_index: If supplied, generate the chart with the series that
+          Highcharts for Python generated from ``df`` at the ``series_index`` position.
+          Defaults to :obj:`None <python:None>`, which includes all series generated
+          from ``df`` on the chart.
+
+        :type series_index: :class:`int <python:int>`, slice, or
+          :obj:`None <python:None>`
+
+        :param **kwargs: Additional keyword arguments that are - in turn - propagated to
+          the series created from the ``df``.
+
+        :returns: A :class:`Chart <highcharts_core.chart.Chart>` instance with its
+          data populated from the data in ``df``.
+        :rtype: :class:`Chart <highcharts_core.chart.Chart>`
+
+        :raises HighchartsPolarsDeserializationError: if ``property_map`` references
+          a column that does not exist in the data frame
+        :raises HighchartsDependencyError: if `Polars <https://pola.rs/>`__ or NumPy are
+          not available in the runtime environment
+        """
+        if not series_type:
+            raise errors.HighchartsValueError("series_type cannot be empty")
+        series_type = str(series_type).lower()
+        if series_type not in SERIES_CLASSES:
+            raise errors.HighchartsValueError(
+                f"series_type expects a valid Highcharts "
+                f"series type. Received: {series_type}"
+            )
+
+        if not isinstance(options_kwargs, (dict, UserDict, type(None))):
+            raise errors.HighchartsValueError(
+                f"options_kwarts expects a dict. "
+                f"Received: {options_kwargs.__class__.__name__}"
+            )
+        if not options_kwargs:
+            options_kwargs = {}
+
+        if not isinstance(chart_kwargs, (dict, UserDict, type(None))):
+            raise errors.HighchartsValueError(
+                f"chart_kwargs expects a dict. "
+                f"Received: {chart_kwargs.__class__.__name__}"
+            )
+        if not chart_kwargs:
+            chart_kwargs = {}
+
+        if not isinstance(kwargs, (dict, UserDict, type(None))):
+            raise errors.HighchartsValueError(
+                f"kwargs expects a dict. " f"Received: {kwargs.__class__.__name__}"
+            )
+        if not kwargs:
+            kwargs = {}
+
+        series_cls = SERIES_CLASSES.get(series_type, None)
+
+        if series_in_rows:
+            series = series_cls.from_polars_in_rows(
+                df, series_kwargs=series_kwargs, series_index=series_index, **kwargs
+            )
+        else:
+            series = series_cls.from_polars(
                 df,
                 property_map=property_map,
                 series_kwargs=series_kwargs,
@@ -2011,6 +2770,14 @@ class Chart(HighchartsMeta):
         series_kwargs=None,
         options_kwargs=None,
         chart_kwargs=None,
+        use_arrow=None,
+        sample_fraction=None,
+        seed=None,
+        bucket_by=None,
+        bucket=None,
+        bins=None,
+        top_k=None,
+        agg="avg",
     ):
         """Create a :class:`Chart <highcharts_core.chart.Chart>` instance whose
         data is populated from a
@@ -2066,12 +2833,73 @@ class Chart(HighchartsMeta):
 
         :type chart_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
 
+        :param use_arrow: If ``True``, collects ``df`` to the driver as Arrow record
+          batches whose columns are converted directly to
+          :class:`numpy.ndarray <numpy:numpy.ndarray>` values, without creating a Python
+          object for each row. If ``False`` (or if NumPy is not available), collects
+          ``df`` row-by-row as JSON. Defaults to :obj:`None <python:None>`, which uses
+          Arrow if both NumPy and
+          `PyArrow <https://arrow.apache.org/docs/python/>`__ are available, and JSON
+          otherwise.
+        :type use_arrow: :class:`bool <python:bool>` or :obj:`None <python:None>`
+
+        :param sample_fraction: If supplied, only a random sample of (approximately)
+          this proportion of the rows in ``df`` is collected, with the sample being
+          drawn within Spark. Defaults to :obj:`None <python:None>`, which collects all
+          rows.
+        :type sample_fraction: :class:`float <python:float>` or
+          :obj:`None <python:None>`
+
+        :param seed: The seed to use when sampling rows with ``sample_fraction``.
+          Defaults to :obj:`None <python:None>`.
+        :type seed: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param bucket_by: The column in ``df`` whose values should be grouped when
+          aggregating with ``bucket``, ``bins``, or ``top_k``. Must be one of the columns
+          referenced in ``property_map``. If :obj:`None <python:None>`, defaults to the
+          column mapped to ``'x'`` (or, when only ``top_k`` is supplied, the column
+          mapped to ``'name'`` if there is one). Defaults to :obj:`None <python:None>`.
+        :type bucket_by: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param bucket: If supplied, groups the rows of ``df`` into regular intervals of
+          ``bucket_by`` within Spark, and aggregates the remaining columns within each
+          interval. For date / time columns, accepts an interval such as ``'1h'``,
+          ``'15min'``, or ``'1 day'`` (see
+          :func:`parse_time_interval() <highcharts_core.utility_functions.parse_time_interval>`),
+          while for numerical columns accepts the width of each interval. Defaults to
+          :obj:`None <python:None>`.
+        :type bucket: :class:`str <python:str>`, numeric, or :obj:`None <python:None>`
+
+        :param bins: If supplied, groups the rows of ``df`` into this number of
+          equal-width bins of ``bucket_by`` within Spark (e.g. for a histogram), and
+          aggregates the remaining columns within each bin. Each bin is identified by its
+          lower edge. Defaults to :obj:`None <python:None>`.
+        :type bins: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param top_k: If supplied, only collects the ``top_k`` groups with the highest
+          ``'y'`` value. If neither ``bucket`` nor ``bins`` are supplied, the rows of
+          ``df`` are grouped by the distinct values of ``bucket_by`` (e.g. for a
+          categorical series). Defaults to :obj:`None <python:None>`.
+        :type top_k: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param agg: How numerical columns are aggregated within each group when using
+          ``bucket``, ``bins``, or ``top_k``. Accepts ``'avg'`` (or ``'mean'``),
+          ``'sum'``, ``'min'``, ``'max'``, or ``'count'``, or a
+          :class:`dict <python:dict>` mapping data point properties to one of those
+          values. Non-numerical columns take the first value in each group. If
+          ``property_map`` does not map a column to ``'y'``, ``'y'`` receives the number
+          of rows in each group. Defaults to ``'avg'``.
+        :type agg: :class:`str <python:str>` or :class:`dict <python:dict>`
+
         :returns: A :class:`Chart <highcharts_core.chart.Chart>` instance with its
           data populated from the data in ``df``.
         :rtype: :class:`Chart <highcharts_core.chart.Chart>`
 
         :raises HighchartsPySparkDeserializationError: if ``property_map`` references
-          a column that does not exist in the data frame
+          a column that does not exist in the data frame, or if ``bucket_by`` is not
+          referenced in ``property_map``
+        :raises HighchartsValueError: if ``bucket``, ``bins``, ``top_k``, or ``agg`` are
+          not valid
         :raises HighchartsDependencyError: if
           `PySpark <https://spark.apache.org/docs/latest/api/python/>`_ is not available
           in the runtime environment
@@ -2089,7 +2917,19 @@ class Chart(HighchartsMeta):
 
         series_cls = SERIES_CLASSES.get(series_type, None)
 
-        series = series_cls.from_pyspark(df, property_map, series_kwargs)
+        series = series_cls.from_pyspark(
+            df,
+            property_map,
+            series_kwargs,
+            use_arrow=use_arrow,
+            sample_fraction=sample_fraction,
+            seed=seed,
+            bucket_by=bucket_by,
+            bucket=bucket,
+            bins=bins,
+            top_k=top_k,
+            agg=agg,
+        )
 
         options = HighchartsOptions(**options_kwargs)
         options.series = [series]
@@ -2099,6 +2939,262 @@ class Chart(HighchartsMeta):
 
         return instance
 
+    @classmethod
+    def from_arrow(
+        cls,
+        table,
+        property_map,
+        series_type="line",
+        series_kwargs=None,
+        options_kwargs=None,
+        chart_kwargs=None,
+        series_index=None,
+        **kwargs,
+    ):
+        """Create a :class:`Chart <highcharts_core.chart.Chart>` instance whose
+        series are populated from an `Apache Arrow <https://arrow.apache.org/>`__
+        :class:`Table <pyarrow:pyarrow.Table>` or
+        :class:`RecordBatch <pyarrow:pyarrow.RecordBatch>`.
+
+          .. code-block:: python
+
+            from highcharts_core.chart import Chart
+
+            # Given a PyArrow Table instance named "table"
+            my_chart = Chart.from_arrow(table,
+                                        property_map = {
+                                            'x': 'timestamp',
+                                            'y': ['value1', 'value2']
+                                        },
+                                        series_type = 'line')
+
+        :param table: The :class:`Table <pyarrow:pyarrow.Table>` or
+          :class:`RecordBatch <pyarrow:pyarrow.RecordBatch>` from which data should be
+          loaded.
+        :type table: :class:`Table <pyarrow:pyarrow.Table>` or
+          :class:`RecordBatch <pyarrow:pyarrow.RecordBatch>`
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column in ``table``. The keys in
+          the :class:`dict <python:dict>` should correspond to properties in the data
+          point class, while the value should indicate the name of the column.
+
+            .. note::
+
+              If any of the values in ``property_map`` contain an iterable, then
+              one series will be produced for each item in the iterable.
+
+        :type property_map: :class:`dict <python:dict>`
+
+        :param series_type: Indicates the series type that should be created from the data
+          in ``table``. Defaults to ``'line'``.
+        :type series_type: :class:`str <python:str>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+            The ``data`` value will be created from ``table`` instead.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param options_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the :class:`HighchartsOptions`
+          instance. Defaults to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``options_kwargs`` contains a ``series`` key, the ``series`` value will be
+            *overwritten*. The ``series`` value will be created from the data in
+            ``table``.
+
+        :type options_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param chart_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the :class:`Chart` instance.
+          Defaults to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``chart_kwargs`` contains an ``options`` key, ``options`` will be
+            *overwritten*. The ``options`` value will be created from the
+            ``options_kwargs`` and the data in ``table`` instead.
+
+        :type chart_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param series_index: If supplied, generate the chart with the series that
+          Highcharts for Python generated from ``table`` at the ``series_index``
+          position. Defaults to :obj:`None <python:None>`, which includes all series
+          generated from ``table`` on the chart.
+        :type series_index: :class:`int <python:int>`, slice, or
+          :obj:`None <python:None>`
+
+        :param **kwargs: Additional keyword arguments that are - in turn - propagated to
+          the series created from ``table``.
+
+        :returns: A :class:`Chart <highcharts_core.chart.Chart>` instance with its
+          data populated from the data in ``table``.
+        :rtype: :class:`Chart <highcharts_core.chart.Chart>`
+
+        :raises HighchartsArrowDeserializationError: if ``property_map`` references
+          a column that does not exist in ``table``
+        :raises HighchartsDependencyError: if NumPy or
+          `PyArrow <https://arrow.apache.org/docs/python/>`__ are not available in the
+          runtime environment
+        """
+        series_type = validators.string(series_type, allow_empty=False)
+        series_type = series_type.lower()
+        if series_type not in SERIES_CLASSES:
+            raise errors.HighchartsValueError(
+                f"series_type expects a valid Highcharts "
+                f"series type. Received: {series_type}"
+            )
+
+        options_kwargs = validators.dict(options_kwargs, allow_empty=True) or {}
+        chart_kwargs = validators.dict(chart_kwargs, allow_empty=True) or {}
+
+        series_cls = SERIES_CLASSES.get(series_type, None)
+
+        series = series_cls.from_arrow(
+            table,
+            property_map,
+            series_kwargs=series_kwargs,
+            series_index=series_index,
+            **kwargs,
+        )
+        if isinstance(series, series_cls):
+            series = [series]
+
+        options_kwargs["series"] = series
+        options = HighchartsOptions(**options_kwargs)
+
+        instance = cls(**chart_kwargs)
+        instance.options = options
+
+        return instance
+
+    @classmethod
+    def from_matrix(
+        cls,
+        matrix,
+        x_categories=None,
+        y_categories=None,
+        series_type="heatmap",
+        series_kwargs=None,
+        options_kwargs=None,
+        chart_kwargs=None,
+        **kwargs,
+    ):
+        """Create a :class:`Chart <highcharts_core.chart.Chart>` instance containing a
+        heatmap (or tilemap) series populated from the cells of a two-dimensional
+        matrix, with the categories of the chart's axes populated from
+        ``x_categories`` and ``y_categories``.
+
+          .. code-block:: python
+
+            from highcharts_core.chart import Chart
+
+            my_chart = Chart.from_matrix(correlations,
+                                         x_categories = column_names,
+                                         y_categories = column_names)
+
+        :param matrix: The matrix whose cells should be plotted, where each row
+          corresponds to a position on the y-axis and each column to a position on the
+          x-axis.
+        :type matrix: 2-dimensional Array-like
+
+        :param x_categories: The labels of the matrix's columns. Non-numerical labels
+          are applied as the x-axis
+          :meth:`categories <highcharts_core.options.axes.x_axis.XAxis.categories>`.
+          Defaults to :obj:`None <python:None>`.
+        :type x_categories: Array-like or :obj:`None <python:None>`
+
+        :param y_categories: The labels of the matrix's rows. Non-numerical labels are
+          applied as the y-axis
+          :meth:`categories <highcharts_core.options.axes.y_axis.YAxis.categories>`.
+          Defaults to :obj:`None <python:None>`.
+        :type y_categories: Array-like or :obj:`None <python:None>`
+
+        :param series_type: Indicates the series type that should be created from
+          ``matrix``. Accepts ``'heatmap'`` or ``'tilemap'``. Defaults to
+          ``'heatmap'``.
+        :type series_type: :class:`str <python:str>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param options_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the :class:`HighchartsOptions`
+          instance. Defaults to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``options_kwargs`` contains a ``series`` key, the ``series`` value will be
+            *overwritten*. If it contains ``x_axis`` or ``y_axis`` keys, they are used
+            as-is unless they do not define categories of their own.
+
+        :type options_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param chart_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the :class:`Chart` instance.
+          Defaults to :obj:`None <python:None>`.
+        :type chart_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param **kwargs: Additional keyword arguments that are - in turn - propagated to
+          the series created from ``matrix``.
+
+        :returns: A :class:`Chart <highcharts_core.chart.Chart>` instance with its
+          data populated from ``matrix``.
+        :rtype: :class:`Chart <highcharts_core.chart.Chart>`
+
+        :raises HighchartsValueError: if ``series_type`` is not a heatmap series type,
+          if ``matrix`` is not two-dimensional, or if the number of categories does not
+          match its shape
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        series_type = validators.string(series_type, allow_empty=False)
+        series_type = series_type.lower()
+        series_cls = SERIES_CLASSES.get(series_type, None)
+        if series_cls is None or not hasattr(series_cls, "from_matrix"):
+            raise errors.HighchartsValueError(
+                f"series_type expects a heatmap series type. Received: {series_type}"
+            )
+
+        options_kwargs = validators.dict(options_kwargs, allow_empty=True) or {}
+        chart_kwargs = validators.dict(chart_kwargs, allow_empty=True) or {}
+
+        series = series_cls.from_matrix(
+            matrix,
+            x_categories=x_categories,
+            y_categories=y_categories,
+            series_kwargs=series_kwargs,
+            **kwargs,
+        )
+
+        for key, categories in [("x_axis", x_categories), ("y_axis", y_categories)]:
+            if categories is None or key in options_kwargs:
+                continue
+            categories = [x for x in categories]
+            is_categorical = series_cls._get_matrix_coordinates(
+                categories, len(categories), key
+            )[1]
+            if is_categorical:
+                options_kwargs[key] = {"categories": [str(x) for x in categories]}
+
+        options_kwargs["series"] = [series]
+        options = HighchartsOptions(**options_kwargs)
+
+        instance = cls(**chart_kwargs)
+        instance.options = options
+
+        return instance
+
     @classmethod
     def from_options(cls, options, chart_kwargs=None):
         """Create a :class:`Chart <highcharts_core.chart.Chart>` instance from a
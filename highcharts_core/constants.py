@@ -992,4 +992,51 @@ DATA_COLUMN_TYPES = [
     'number',
     'float',
     'date',
-]
\ No newline at end of file
+]
+
+TIME_UNITS_IN_MS = {
+    'millisecond': 1,
+    'second': 1000,
+    'minute': 60 * 1000,
+    'hour': 60 * 60 * 1000,
+    'day': 24 * 60 * 60 * 1000,
+    'week': 7 * 24 * 60 * 60 * 1000,
+}
+
+TIME_UNIT_ALIASES = {
+    'ms': 'millisecond',
+    'milliseconds': 'millisecond',
+    's': 'second',
+    'sec': 'second',
+    'secs': 'second',
+    'seconds': 'second',
+    'm': 'minute',
+    'min': 'minute',
+    'mins': 'minute',
+    'minutes': 'minute',
+    'h': 'hour',
+    'hr': 'hour',
+    'hrs': 'hour',
+    'hours': 'hour',
+    'd': 'day',
+    'days': 'day',
+    'w': 'week',
+    'wk': 'week',
+    'weeks': 'week',
+}
+
+DEFAULT_STOPWORDS = frozenset([
+    'a', 'about', 'above', 'after', 'again', 'against', 'all', 'am', 'an', 'and', 'any',
+    'are', 'as', 'at', 'be', 'because', 'been', 'before', 'being', 'below', 'between',
+    'both', 'but', 'by', 'can', 'could', 'did', 'do', 'does', 'doing', 'down', 'during',
+    'each', 'few', 'for', 'from', 'further', 'had', 'has', 'have', 'having', 'he', 'her',
+    'here', 'hers', 'herself', 'him', 'himself', 'his', 'how', 'i', 'if', 'in', 'into',
+    'is', 'it', 'its', 'itself', 'just', 'me', 'more', 'most', 'my', 'myself', 'no',
+    'nor', 'not', 'now', 'of', 'off', 'on', 'once', 'only', 'or', 'other', 'our', 'ours',
+    'ourselves', 'out', 'over', 'own', 's', 'same', 'she', 'should', 'so', 'some',
+    'such', 't', 'than', 'that', 'the', 'their', 'theirs', 'them', 'themselves', 'then',
+    'there', 'these', 'they', 'this', 'those', 'through', 'to', 'too', 'under', 'until',
+    'up', 'very', 'was', 'we', 'were', 'what', 'when', 'where', 'which', 'while', 'who',
+    'whom', 'why', 'will', 'with', 'would', 'you', 'your', 'yours', 'yourself',
+    'yourselves',
+])
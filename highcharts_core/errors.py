@@ -74,6 +74,24 @@ class HighchartsPySparkDeserializationError(HighchartsError):
     pass
 
 
+class HighchartsArrowDeserializationError(HighchartsError):
+    """:exc:`ValueError <python:ValueError>` encountered when Highcharts for Python is
+    unable to properly deserialize Apache Arrow data."""
+    pass
+
+
+class HighchartsPolarsDeserializationError(HighchartsError):
+    """:exc:`ValueError <python:ValueError>` encountered when Highcharts for Python is
+    unable to properly deserialize Polars data."""
+    pass
+
+
+class HighchartsSQLDeserializationError(HighchartsError):
+    """:exc:`ValueError <python:ValueError>` encountered when Highcharts for Python is
+    unable to properly deserialize the results of a SQL query."""
+    pass
+
+
 class HighchartsMissingKeyError(HighchartsParseError):
     """:exc:`ValueError <python:ValueError>` encountered when Highcharts for Python
     encounters a missing key when parsing a JavaScript object literal."""
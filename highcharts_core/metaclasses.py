@@ -305,7 +305,7 @@ class HighchartsMeta(ABC):
             # ndarray -> (for json) -> list
             elif HAS_NUMPY and to_json and isinstance(value, np.ndarray):
                 untrimmed_value = utility_functions.from_ndarray(value)
-                trimmed_value = HighchartsMeta.trim_iterable(value,
+                trimmed_value = HighchartsMeta.trim_iterable(untrimmed_value,
                                                              to_json = to_json,
                                                              context = context,
                                                              for_export = for_export)
@@ -335,6 +335,14 @@ class HighchartsMeta(ABC):
 
                 if trimmed_value:
                     as_dict[key] = trimmed_value
+            # DataPointCollection -> (for json) -> array
+            elif to_json and checkers.is_type(value, 'DataPointCollection'):
+                trimmed_value = HighchartsMeta.trim_iterable(value.to_array(),
+                                                             to_json = to_json,
+                                                             context = context,
+                                                             for_export = for_export)
+                if trimmed_value:
+                    as_dict[key] = trimmed_value
             # HighchartsMeta -> dict --> object
             elif value and hasattr(value, '_to_untrimmed_dict'):
                 untrimmed_value = value._to_untrimmed_dict()
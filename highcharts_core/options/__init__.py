@@ -1,11 +1,13 @@
 """Implements the :class:`HighchartsOptions` class."""
 from typing import Optional, List
 
-from validator_collection import validators
+from validator_collection import validators, checkers
 
-from highcharts_core import utility_functions
+from highcharts_core import constants, utility_functions
 from highcharts_core.metaclasses import HighchartsMeta
-from highcharts_core.decorators import class_sensitive
+from highcharts_core.decorators import class_sensitive, validate_types
+from highcharts_core.js_literal_functions import serialize_to_js_literal, get_js_literal, \
+    assemble_js_literal
 from highcharts_core.utility_classes.gradients import Gradient
 from highcharts_core.utility_classes.patterns import Pattern
 from highcharts_core.options.series.series_generator import create_series_obj
@@ -693,6 +695,245 @@ class Options(HighchartsMeta):
 
         instance.add_series(series)
 
+    @staticmethod
+    def _is_diffable(value) -> bool:
+        """Indicates whether ``value`` can be compared property-by-property when
+        calculating a :meth:`.diff() <highcharts_core.options.Options.diff>`, or whether
+        it must be replaced as a whole."""
+        return hasattr(value, '_to_untrimmed_dict') and \
+            not hasattr(value, 'to_array') and \
+            not checkers.is_type(value, ('CallbackFunction', 'JavaScriptClass'))
+
+    @staticmethod
+    def _get_diff_literal(value):
+        """Return the JavaScript literal representation of ``value``, used to compare
+        values that cannot be compared property-by-property."""
+        serialized = serialize_to_js_literal(value)
+        if serialized is None:
+            return None
+
+        return get_js_literal(serialized)
+
+    @classmethod
+    def _diff_values(cls, original, updated):
+        """Calculate the patch needed to update ``original`` to ``updated``.
+
+        :returns: A 2-member :class:`tuple <python:tuple>` indicating whether the value
+          has changed, and the value to apply as a patch.
+        :rtype: :class:`tuple <python:tuple>`
+        """
+        if original is None and updated is None:
+            return False, None
+        if updated is None:
+            return True, constants.EnforcedNull
+        if original is None:
+            return True, updated
+
+        if type(original) is type(updated) and cls._is_diffable(original):
+            patch = cls._diff_objects(original, updated)
+            return bool(patch), patch
+
+        if cls._get_diff_literal(original) == cls._get_diff_literal(updated):
+            return False, None
+
+        return True, updated
+
+    @classmethod
+    def _diff_objects(cls, original, updated) -> dict:
+        """Calculate the (nested) patch needed to update the Highcharts object
+        ``original`` to ``updated``."""
+        original_dict = original._to_untrimmed_dict()
+        updated_dict = updated._to_untrimmed_dict()
+
+        patch = {}
+        keys = [x for x in updated_dict] + [x for x in original_dict
+                                            if x not in updated_dict]
+        for key in keys:
+            is_changed, value = cls._diff_values(original_dict.get(key, None),
+                                                 updated_dict.get(key, None))
+            if is_changed:
+                patch[key] = value
+
+        return patch
+
+    @classmethod
+    def _diff_collection(cls, original, updated):
+        """Calculate the patch needed to update the collection (e.g. series or axes)
+        ``original`` to ``updated``, matching members on their ``id`` (or their position
+        if they have no ``id``).
+
+        :returns: A 3-member :class:`tuple <python:tuple>` indicating whether the
+          collection has changed, the collection to apply as a patch, and whether members
+          have been removed from the collection.
+        :rtype: :class:`tuple <python:tuple>`
+        """
+        original = [x for x in original or []]
+        updated = [x for x in updated or []]
+
+        def get_key(item, index):
+            item_id = getattr(item, 'id', None)
+            return item_id if item_id is not None else index
+
+        original_members = {}
+        for index, item in enumerate(original):
+            original_members[get_key(item, index)] = item
+
+        is_changed = False
+        patch = []
+        updated_keys = []
+        for index, item in enumerate(updated):
+            key = get_key(item, index)
+            updated_keys.append(key)
+            original_item = original_members.get(key, None)
+            if original_item is None or type(original_item) is not type(item):
+                is_changed = True
+                patch.append(item)
+                continue
+
+            item_patch = cls._diff_objects(original_item, item)
+            if item_patch:
+                is_changed = True
+            if getattr(item, 'id', None) is not None:
+                item_patch = {'id': item.id, **item_patch}
+
+            patch.append(item_patch)
+
+        has_removals = any([x not in updated_keys for x in original_members])
+
+        return is_changed or has_removals, patch, has_removals
+
+    def _get_diff(self, other):
+        """Calculate the patch needed to update the instance to ``other``.
+
+        :returns: A 2-member :class:`tuple <python:tuple>` containing the patch and an
+          indicator of whether members of a collection (e.g. series) have been removed,
+          which requires the patch to be applied with ``oneToOne`` set to ``true``.
+        :rtype: :class:`tuple <python:tuple>`
+        """
+        other = validate_types(other, types = self.__class__)
+        if other is None:
+            other = self.__class__()
+
+        original_dict = self._to_untrimmed_dict()
+        updated_dict = other._to_untrimmed_dict()
+
+        patch = {}
+        one_to_one = False
+        keys = [x for x in updated_dict] + [x for x in original_dict
+                                            if x not in updated_dict]
+        for key in keys:
+            original = original_dict.get(key, None)
+            updated = updated_dict.get(key, None)
+            if key in ['series', 'xAxis', 'yAxis', 'zAxis', 'colorAxis'] and \
+               (original or updated):
+                if original is not None and not checkers.is_iterable(original):
+                    original = [original]
+                if updated is not None and not checkers.is_iterable(updated):
+                    updated = [updated]
+                is_changed, value, has_removals = self._diff_collection(original,
+                                                                        updated)
+                one_to_one = one_to_one or has_removals
+            else:
+                is_changed, value = self._diff_values(original, updated)
+
+            if is_changed:
+                patch[key] = value
+
+        return patch, one_to_one
+
+    @classmethod
+    def _patch_to_js_literal(cls,
+                             patch,
+                             encoding = 'utf-8',
+                             careful_validation = False):
+        """Serialize a patch produced by
+        :meth:`.diff() <highcharts_core.options.Options.diff>` to its JavaScript
+        object literal representation."""
+        if isinstance(patch, dict):
+            as_dict = {}
+            for key in patch:
+                as_dict[key] = cls._patch_to_js_literal(
+                    patch[key],
+                    encoding = encoding,
+                    careful_validation = careful_validation
+                )
+
+            return assemble_js_literal(as_dict,
+                                       careful_validation = careful_validation) or '{}'
+        elif isinstance(patch, list):
+            return [cls._patch_to_js_literal(x,
+                                             encoding = encoding,
+                                             careful_validation = careful_validation)
+                    for x in patch]
+
+        return serialize_to_js_literal(patch,
+                                       encoding = encoding,
+                                       careful_validation = careful_validation)
+
+    @classmethod
+    def _patch_to_json(cls, patch):
+        """Convert a patch produced by
+        :meth:`.diff() <highcharts_core.options.Options.diff>` to its JSON-compatible
+        representation."""
+        if isinstance(patch, dict):
+            return {key: cls._patch_to_json(patch[key]) for key in patch
+                    if not checkers.is_type(patch[key], 'CallbackFunction')}
+        elif isinstance(patch, list):
+            return [cls._patch_to_json(x) for x in patch]
+        elif isinstance(patch, constants.EnforcedNullType):
+            return None
+        elif checkers.is_type(patch, 'DataPointCollection'):
+            return HighchartsMeta.trim_iterable(patch.to_array(), to_json = True)
+        elif hasattr(patch, '_to_untrimmed_dict'):
+            return HighchartsMeta.trim_dict(patch._to_untrimmed_dict(),
+                                            to_json = True,
+                                            context = patch.__class__.__name__)
+
+        return HighchartsMeta.trim_iterable(patch, to_json = True)
+
+    def diff(self, other, as_json = False):
+        """Calculate the minimal (nested) patch needed to update the instance to
+        ``other``, in a form that can be supplied to the Highcharts (JS)
+        ``chart.update()`` method.
+
+        Only the options which differ between the two instances are included in the
+        patch. Nested objects are compared property-by-property, while values that
+        cannot be merged by Highcharts (JS) (e.g. arrays of data points) are replaced
+        as a whole. Options that are present in the instance but not in ``other`` are
+        set to ``null``.
+
+        Series and axes are matched on their ``id`` (or their position, if they do not
+        have an ``id``), and are returned as a complete list in which unchanged members
+        are represented by their ``id`` alone.
+
+        .. seealso::
+
+          * :meth:`Chart.diff() <highcharts_core.chart.Chart.diff>`, which produces the
+            JavaScript ``chart.update()`` call that applies the patch.
+
+        .. note::
+
+          If ``as_json`` is ``True``, JavaScript functions in the patch are omitted
+          because they cannot be represented in JSON.
+
+        :param other: The options to compare the instance against.
+        :type other: :class:`Options <highcharts_core.options.Options>` or coercable
+
+        :param as_json: If ``True``, returns the patch as a JSON-compatible
+          :class:`dict <python:dict>`. If ``False``, values in the patch are
+          **Highcharts for Python** objects. Defaults to ``False``.
+        :type as_json: :class:`bool <python:bool>`
+
+        :returns: The patch to apply, which will be empty if the two instances are
+          equivalent.
+        :rtype: :class:`dict <python:dict>`
+        """
+        patch = self._get_diff(other)[0]
+        if as_json:
+            patch = self._patch_to_json(patch)
+
+        return patch
+
 
 class HighchartsOptions(Options):
     """The Python representation of the `Highcharts <https://highcharts.com>`_
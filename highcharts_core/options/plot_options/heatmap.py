@@ -57,19 +57,19 @@ class HeatmapOptions(SeriesOptions):
                                                  minimum = 0)
 
     @property
-    def colsize(self) -> Optional[int]:
+    def colsize(self) -> Optional[int | float | Decimal]:
         """The column size - how many X axis units each column in the heatmap should span.
         Defaults to ``1``.
 
-        :rtype: :class:`int <python:int>` or :obj:`None <python:None>`
+        :rtype: numeric or :obj:`None <python:None>`
         """
         return self._colsize
 
     @colsize.setter
     def colsize(self, value):
-        self._colsize = validators.integer(value,
+        self._colsize = validators.numeric(value,
                                            allow_empty = True,
-                                           minimum = 1)
+                                           minimum = 0)
 
     @property
     def interpolation(self) -> Optional[bool]:
@@ -114,19 +114,19 @@ class HeatmapOptions(SeriesOptions):
         self._point_padding = validators.numeric(value, allow_empty = True)
 
     @property
-    def rowsize(self) -> Optional[int]:
+    def rowsize(self) -> Optional[int | float | Decimal]:
         """The row size - how many Y axis units each heatmap row should span. Defaults to
         ``1``.
 
-        :rtype: :class:`int <python:int>` or :obj:`None <python:None>`
+        :rtype: numeric or :obj:`None <python:None>`
         """
         return self._rowsize
 
     @rowsize.setter
     def rowsize(self, value):
-        self._rowsize = validators.integer(value,
+        self._rowsize = validators.numeric(value,
                                            allow_empty = True,
-                                           minimum = 1)
+                                           minimum = 0)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
@@ -5,14 +5,14 @@ from validator_collection import validators
 
 from highcharts_core import errors
 from highcharts_core.decorators import class_sensitive, validate_types
-from highcharts_core.options.series.base import SeriesBase
+from highcharts_core.options.series.base import SeriesBase, ConnectionSeriesMixin
 from highcharts_core.options.series.data.arcdiagram import ArcDiagramData, ArcDiagramDataCollection
 from highcharts_core.options.plot_options.arcdiagram import ArcDiagramOptions
 from highcharts_core.utility_functions import mro__to_untrimmed_dict, is_ndarray
 from highcharts_core.utility_classes.nodes import NodeOptions
 
 
-class ArcDiagramSeries(SeriesBase, ArcDiagramOptions):
+class ArcDiagramSeries(SeriesBase, ArcDiagramOptions, ConnectionSeriesMixin):
     """Arc diagram series is a chart drawing style in which the vertices of the chart
     are positioned along a line on the Euclidean plane and the edges are drawn as a
     semicircle in one of the two half-planes delimited by the line, or as smooth
@@ -1,3 +1,5 @@
+import itertools
+import os
 from typing import Optional, List
 from decimal import Decimal
 from collections import UserDict
@@ -110,6 +112,8 @@ class SeriesBase(SeriesOptions):
         except AttributeError as error:
             if name in ['__iter__', '__next__', 'requires_js_object']:
                 raise error
+            if name.startswith('_'):
+                raise error
             pass
 
         if not self.data:
@@ -536,6 +540,9 @@ class SeriesBase(SeriesOptions):
                       escape_character = "\\",
                       series_in_rows = False,
                       series_index = True,
+                      chunksize = None,
+                      chunk_downsample = None,
+                      chunk_aggregation = None,
                       **kwargs):
         """Replace the existing
         :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
@@ -693,6 +700,32 @@ class SeriesBase(SeriesOptions):
           :obj:`None <python:None>`.
         :type series_index: :class:`int <python:int>` or :obj:`None <python:None>`
 
+        :param chunksize: If supplied, the CSV data is read in chunks of (at most)
+          ``chunksize`` records, so that peak memory use is proportional to
+          ``chunksize`` and to the size of the resulting series rather than to the size
+          of the CSV data. If the CSV data is a file, it is read using a memory map.
+          Requires `NumPy <https://numpy.org>`__ and a ``property_column_map``.
+          Defaults to :obj:`None <python:None>`, which reads the CSV data in full.
+        :type chunksize: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param chunk_downsample: If supplied (together with ``chunksize``), each chunk is
+          downsampled as it is read. Accepts either the number of data points to retain
+          from each chunk, or a :class:`dict <python:dict>` of keyword arguments for
+          :meth:`DataPointCollection.downsample() <highcharts_core.options.series.data.collections.DataPointCollection.downsample>`.
+          Defaults to :obj:`None <python:None>`.
+        :type chunk_downsample: :class:`int <python:int>`, :class:`dict <python:dict>`,
+          or :obj:`None <python:None>`
+
+        :param chunk_aggregation: If supplied (together with ``chunksize``), each chunk is
+          aggregated into regular time intervals as it is read. Accepts a
+          :class:`dict <python:dict>` of keyword arguments for
+          :meth:`DataPointCollection.group_by_time() <highcharts_core.options.series.data.collections.DataPointCollection.group_by_time>`
+          (e.g. ``{'unit': 'hour', 'approximation': 'average'}``). A summary of the
+          last interval of each chunk (rather than its data points) is carried over to
+          the next chunk, so intervals that span chunks are aggregated correctly
+          provided the CSV data is sorted by its ``x`` values. Defaults to :obj:`None <python:None>`.
+        :type chunk_aggregation: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
         :param **kwargs: Remaining keyword arguments will be attempted on the resulting
           :term:`series` instance and the data points it contains.
 
@@ -714,6 +747,9 @@ class SeriesBase(SeriesOptions):
             escape_character = escape_character,
             series_in_rows = series_in_rows,
             series_index = series_index,
+            chunksize = chunksize,
+            chunk_downsample = chunk_downsample,
+            chunk_aggregation = chunk_aggregation,
             **kwargs
         )
 
@@ -729,6 +765,321 @@ class SeriesBase(SeriesOptions):
 
         self.data = new_instance.data
 
+    @classmethod
+    def _get_collection_from_columns(cls, columns):
+        """Create a data point collection from a :class:`dict <python:dict>` of typed
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` columns, whose keys are data point
+        properties.
+
+        If all columns contain numerical or date/time values, the collection is created
+        without any per-data point objects. Otherwise, each data point's values are
+        validated by the data point class.
+
+        :rtype: :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+        """
+        collection_cls = cls._data_collection_class()
+        is_typed = all([x.dtype.kind in ['i', 'u', 'f', 'M'] for x in columns.values()])
+        if is_typed:
+            return collection_cls.from_columns(columns)
+
+        collection = collection_cls()
+        for key in columns:
+            setattr(collection, key, utility_functions.from_ndarray(columns[key]))
+
+        return collection
+
+    @staticmethod
+    def _get_property_map_columns(property_map):
+        """Return the (de-duplicated) names of the columns referenced in
+        ``property_map``, in the order they are first referenced.
+
+        :param property_map: A :class:`dict <python:dict>` mapping data point
+          properties to a column name or an iterable of column names.
+        :type property_map: :class:`dict <python:dict>`
+
+        :rtype: :class:`list <python:list>`
+        """
+        columns = []
+        for map_value in property_map.values():
+            is_iterable = not isinstance(map_value, (str, bytes, dict, UserDict)) and \
+                hasattr(map_value, '__iter__')
+            for item in (map_value if is_iterable else [map_value]):
+                if item not in columns:
+                    columns.append(item)
+
+        return columns
+
+    @classmethod
+    def _from_columns_multi_map(cls,
+                                property_map,
+                                column_names,
+                                get_column,
+                                series_kwargs = None,
+                                error_cls = errors.HighchartsValueError,
+                                groups = None,
+                                **kwargs):
+        """Create one or more :term:`series` instances from columnar data, with one
+        series produced for each item in any iterable values of ``property_map``.
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column. Values may be a column
+          name or an iterable of column names.
+        :type property_map: :class:`dict <python:dict>`
+
+        :param column_names: The names of the columns that are available.
+        :type column_names: iterable of :class:`str <python:str>`
+
+        :param get_column: Callable which receives a column name and returns that
+          column's values as a :class:`numpy.ndarray <numpy:numpy.ndarray>`. Each column
+          is retrieved at most once.
+        :type get_column: callable
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating each series instance.
+          Defaults to :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param error_cls: The exception to raise if ``property_map`` references a column
+          that does not exist, or implies mismatched numbers of series. Defaults to
+          :exc:`HighchartsValueError`.
+        :type error_cls: :class:`type <python:type>`
+
+        :param groups: If supplied, the value returned by
+          :func:`get_group_slices() <highcharts_core.utility_functions.get_group_slices>`
+          for the column by which rows should be split into separate series. Each column
+          is then re-ordered once, and each group's series is populated from views of
+          the re-ordered columns (and named for the group's key). Defaults to
+          :obj:`None <python:None>`.
+        :type groups: :class:`tuple <python:tuple>` or :obj:`None <python:None>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instances.
+
+        :rtype: :class:`list <python:list>` of series instances (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`)
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        property_map = validators.dict(property_map)
+        column_names = [x for x in column_names]
+
+        fixed_values = {}
+        iterable_values = {}
+        number_of_series = 1
+        mismatched_series = {}
+        names = []
+        for key in property_map:
+            map_value = property_map[key]
+
+            is_iterable = not isinstance(map_value, (str, bytes, dict, UserDict)) and \
+                hasattr(map_value, '__iter__')
+            items = [x for x in map_value] if is_iterable else [map_value]
+            for item in items:
+                if item not in column_names:
+                    raise error_cls(f'Unable to find a column labeled "{item}".')
+
+            if is_iterable:
+                implied_series = len(items)
+                if number_of_series == 1 and implied_series > number_of_series:
+                    number_of_series = implied_series
+                elif implied_series != number_of_series:
+                    mismatched_series[key] = implied_series
+
+                iterable_values[key] = items
+            else:
+                fixed_values[key] = map_value
+
+            if key == 'y':
+                names.extend(items)
+
+        if mismatched_series:
+            raise error_cls(f'Unable to create series. The property map implied '
+                            f'multiple series were needed, but properties had '
+                            f'mismatched number of values:\n{mismatched_series}')
+
+        if groups is not None:
+            group_keys, order, slices = groups
+        else:
+            group_keys, order, slices = [None], None, [slice(None)]
+
+        cached_columns = {}
+        series_list = []
+        for group_key, group_slice in zip(group_keys, slices):
+            for index in range(number_of_series):
+                series_columns = {key: iterable_values[key][index]
+                                  for key in iterable_values}
+                series_columns.update(fixed_values)
+
+                columns = {}
+                for key in series_columns:
+                    column_name = series_columns[key]
+                    if column_name not in cached_columns:
+                        column = get_column(column_name)
+                        if order is not None:
+                            column = column[order]
+                        cached_columns[column_name] = column
+                    columns[key] = cached_columns[column_name][group_slice]
+
+                series_instance_kwargs = series_kwargs.copy()
+                series_instance_kwargs['data'] = cls._get_collection_from_columns(columns)
+                series_instance = cls(**series_instance_kwargs)
+                if 'name' not in series_kwargs:
+                    if groups is None and index < len(names):
+                        series_instance.name = names[index]
+                    elif groups is not None and number_of_series == 1:
+                        series_instance.name = str(group_key)
+                    elif groups is not None and index < len(names):
+                        series_instance.name = f'{group_key}: {names[index]}'
+                for key in kwargs:
+                    if key not in series_instance_kwargs:
+                        setattr(series_instance, key, kwargs[key])
+
+                series_list.append(series_instance)
+
+        return series_list
+
+    @classmethod
+    def _get_collections_from_chunks(cls,
+                                     chunks,
+                                     series_columns,
+                                     chunk_downsample = None,
+                                     chunk_aggregation = None):
+        """Create one data point collection per series from chunks of typed
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` columns, optionally downsampling
+        and/or aggregating each chunk as it is consumed.
+
+        :param chunks: Iterable which yields the column names and a
+          :class:`dict <python:dict>` of typed columns for each chunk (see
+          :func:`iter_csv_columns() <highcharts_core.utility_functions.iter_csv_columns>`).
+        :type chunks: iterable
+
+        :param series_columns: One :class:`dict <python:dict>` per series, mapping data
+          point properties to the column whose values they should take.
+        :type series_columns: :class:`list <python:list>` of :class:`dict <python:dict>`
+
+        :param chunk_downsample: The number of data points to retain from each chunk,
+          or a :class:`dict <python:dict>` of keyword arguments for
+          :meth:`DataPointCollection.downsample() <highcharts_core.options.series.data.collections.DataPointCollection.downsample>`.
+          Defaults to :obj:`None <python:None>`.
+        :type chunk_downsample: :class:`int <python:int>`, :class:`dict <python:dict>`,
+          or :obj:`None <python:None>`
+
+        :param chunk_aggregation: Keyword arguments for
+          :meth:`DataPointCollection.group_by_time() <highcharts_core.options.series.data.collections.DataPointCollection.group_by_time>`.
+          Defaults to :obj:`None <python:None>`.
+        :type chunk_aggregation: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :rtype: :class:`list <python:list>` of
+          :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+        """
+        if chunk_downsample is not None and not isinstance(chunk_downsample, dict):
+            chunk_downsample = {'n_points': chunk_downsample}
+        chunk_aggregation = validators.dict(chunk_aggregation, allow_empty = True)
+
+        approximation = str((chunk_aggregation or {}).get('approximation',
+                                                          'average')).lower()
+        aggregated_prop = (chunk_aggregation or {}).get('prop', 'y')
+
+        def summarize(columns):
+            """Summarize the values in ``columns`` for each time interval, or return
+            :obj:`None <python:None>` if they cannot be summarized."""
+            if 'x' not in columns or aggregated_prop not in columns or \
+               approximation not in ['average', 'sum', 'high', 'low', 'open', 'close',
+                                     'range', 'ohlc']:
+                return None
+
+            return utility_functions.summarize_by_time(
+                columns['x'],
+                columns[aggregated_prop],
+                chunk_aggregation.get('unit'),
+                multiple = chunk_aggregation.get('multiple', 1)
+            )
+
+        def split_summary(summary):
+            """Split ``summary`` into the intervals which are complete, and the last
+            interval (which may continue in the next chunk)."""
+            if not len(summary['x']):
+                return summary, None
+
+            return ({key: value[:-1] for key, value in summary.items()},
+                    {key: value[-1:] for key, value in summary.items()})
+
+        def summary_to_columns(summary):
+            """Convert ``summary`` to columns with one data point per aggregated value
+            (e.g. four data points per interval for ``'ohlc'``), all at the start of
+            the interval, which aggregate to the summarized values."""
+            if approximation == 'average':
+                values = [summary['sum'] / summary['count']]
+            elif approximation == 'range':
+                values = [summary['low'], summary['high']]
+            elif approximation == 'ohlc':
+                values = [summary['open'], summary['high'], summary['low'],
+                          summary['close']]
+            else:
+                values = [summary[approximation]]
+
+            return {
+                'x': np.repeat(summary['x'], len(values)),
+                aggregated_prop: np.stack(values, axis = 1).ravel()
+            }
+
+        def reduce(columns):
+            if not len(list(columns.values())[0]):
+                return None
+
+            collection = cls._get_collection_from_columns(columns)
+            if chunk_aggregation:
+                collection = collection.group_by_time(**chunk_aggregation)
+            if chunk_downsample:
+                collection = collection.downsample(**chunk_downsample)
+
+            return collection
+
+        # When aggregating, only a summary of the last (open) interval of each chunk is
+        # carried into the next chunk, so memory use does not depend on how many rows
+        # fall within a single interval.
+        reduced = [[] for x in series_columns]
+        carried = [None for x in series_columns]
+        for column_names, chunk in chunks:
+            for index, csv_columns in enumerate(series_columns):
+                columns = {key: chunk[csv_columns[key]] for key in csv_columns}
+                summary = summarize(columns) if chunk_aggregation else None
+                if summary is not None:
+                    summary = utility_functions.merge_time_summaries([carried[index],
+                                                                      summary])
+                    summary, carried[index] = split_summary(summary)
+                    columns = summary_to_columns(summary)
+
+                collection = reduce(columns)
+                if collection is not None:
+                    reduced[index].append(collection)
+
+        collections = []
+        collection_cls = cls._data_collection_class()
+        for index in range(len(series_columns)):
+            if carried[index] is not None:
+                collection = reduce(summary_to_columns(carried[index]))
+                if collection is not None:
+                    reduced[index].append(collection)
+
+            is_columnar = all([x.ndarray is not None and not x.data_points
+                               for x in reduced[index]])
+            if not reduced[index]:
+                collections.append(collection_cls())
+            elif is_columnar:
+                columns = {
+                    key: utility_functions.concatenate_ndarrays([x.ndarray[key]
+                                                                 for x in reduced[index]])
+                    for key in reduced[index][0].ndarray
+                }
+                collections.append(collection_cls.from_columns(columns))
+            else:
+                data_points = []
+                for collection in reduced[index]:
+                    data_points.extend(collection.to_array(force_object = True))
+                collections.append(collection_cls(data_points = data_points))
+
+        return collections
+
     @classmethod
     def _from_csv_multi_map(cls,
                             as_string_or_file,
@@ -743,6 +1094,9 @@ class SeriesBase(SeriesOptions):
                             double_wrapper_character_when_nested = False,
                             escape_character = "\\",
                             series_in_rows = False,
+                            chunksize = None,
+                            chunk_downsample = None,
+                            chunk_aggregation = None,
                             **kwargs):
         """Replace the existing
         :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
@@ -873,6 +1227,32 @@ class SeriesBase(SeriesOptions):
           :obj:`False <python:False>`.
         :type series_in_rows: :class:`bool <python:bool>`
 
+        :param chunksize: If supplied, the CSV data is read in chunks of (at most)
+          ``chunksize`` records, so that peak memory use is proportional to
+          ``chunksize`` and to the size of the resulting series rather than to the size
+          of the CSV data. If the CSV data is a file, it is read using a memory map.
+          Requires `NumPy <https://numpy.org>`__ and a ``property_column_map``.
+          Defaults to :obj:`None <python:None>`, which reads the CSV data in full.
+        :type chunksize: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param chunk_downsample: If supplied (together with ``chunksize``), each chunk is
+          downsampled as it is read. Accepts either the number of data points to retain
+          from each chunk, or a :class:`dict <python:dict>` of keyword arguments for
+          :meth:`DataPointCollection.downsample() <highcharts_core.options.series.data.collections.DataPointCollection.downsample>`.
+          Defaults to :obj:`None <python:None>`.
+        :type chunk_downsample: :class:`int <python:int>`, :class:`dict <python:dict>`,
+          or :obj:`None <python:None>`
+
+        :param chunk_aggregation: If supplied (together with ``chunksize``), each chunk is
+          aggregated into regular time intervals as it is read. Accepts a
+          :class:`dict <python:dict>` of keyword arguments for
+          :meth:`DataPointCollection.group_by_time() <highcharts_core.options.series.data.collections.DataPointCollection.group_by_time>`
+          (e.g. ``{'unit': 'hour', 'approximation': 'average'}``). A summary of the
+          last interval of each chunk (rather than its data points) is carried over to
+          the next chunk, so intervals that span chunks are aggregated correctly
+          provided the CSV data is sorted by its ``x`` values. Defaults to :obj:`None <python:None>`.
+        :type chunk_aggregation: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
         :param **kwargs: Remaining keyword arguments will be attempted on the resulting
           :term:`series` instance and the data points it contains.
 
@@ -904,9 +1284,54 @@ class SeriesBase(SeriesOptions):
                                                                f'instead.')
             cleaned_column_map[key] = map_value
 
-        if not checkers.is_on_filesystem(as_string_or_file):
+        if HAS_NUMPY:
+            parser = utility_functions.parse_csv_columns
+            projected_columns = []
+            for map_value in cleaned_column_map.values():
+                is_iterable = not isinstance(map_value,
+                                             (str, bytes, dict, UserDict)) and \
+                    hasattr(map_value, '__iter__')
+                if not is_iterable:
+                    map_value = [map_value]
+                for item in map_value:
+                    if item not in projected_columns:
+                        projected_columns.append(item)
+            parser_kwargs = {'columns': projected_columns}
+        else:
+            parser = utility_functions.parse_csv
+            parser_kwargs = {}
+
+        chunks = None
+        if chunksize and not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('Reading CSV data in chunks requires '
+                                                   'NumPy be installed. The runtime '
+                                                   'environment does not currently have '
+                                                   'NumPy installed. Please install '
+                                                   'NumPy using "pip install numpy" or '
+                                                   'similar.')
+        elif chunksize:
+            chunks = utility_functions.iter_csv_columns(
+                as_string_or_file,
+                columns = projected_columns,
+                chunksize = chunksize,
+                has_header_row = has_header_row,
+                delimiter = delimiter,
+                null_text = null_text,
+                wrapper_character = wrapper_character,
+                line_terminator = line_terminator,
+                wrap_all_strings = False,
+                double_wrapper_character_when_nested = False,
+                escape_character = "\\"
+            )
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                columns, csv_records = [], {}
+            else:
+                columns, csv_records = first_chunk
+                chunks = itertools.chain([first_chunk], chunks)
+        elif not checkers.is_on_filesystem(as_string_or_file):
             as_str = as_string_or_file
-            columns, csv_records = utility_functions.parse_csv(
+            columns, csv_records = parser(
                 as_str,
                 has_header_row = has_header_row,
                 delimiter = delimiter,
@@ -915,11 +1340,12 @@ class SeriesBase(SeriesOptions):
                 line_terminator = line_terminator,
                 wrap_all_strings = False,
                 double_wrapper_character_when_nested = False,
-                escape_character = "\\"
+                escape_character = "\\",
+                **parser_kwargs
             )
         else:
             with open(as_string_or_file, 'r', newline = '') as file_:
-                columns, csv_records = utility_functions.parse_csv(
+                columns, csv_records = parser(
                     file_,
                     has_header_row = has_header_row,
                     delimiter = delimiter,
@@ -928,7 +1354,8 @@ class SeriesBase(SeriesOptions):
                     line_terminator = line_terminator,
                     wrap_all_strings = False,
                     double_wrapper_character_when_nested = False,
-                    escape_character = "\\"
+                    escape_character = "\\",
+                    **parser_kwargs
                 )
 
         fixed_values = {}
@@ -991,8 +1418,35 @@ class SeriesBase(SeriesOptions):
             )
         
         collections = []
-        for index in range(number_of_series):
+        if chunks is not None:
+            series_columns = []
+            for index in range(number_of_series):
+                csv_columns = {}
+                for key in iterable_values:
+                    csv_columns[key] = iterable_values[key][index]
+                for key in fixed_values:
+                    csv_columns[key] = fixed_values[key]
+                series_columns.append(csv_columns)
+
+            collections = cls._get_collections_from_chunks(
+                chunks,
+                series_columns,
+                chunk_downsample = chunk_downsample,
+                chunk_aggregation = chunk_aggregation
+            )
+
+        for index in range(len(collections), number_of_series):
             collection_cls = cls._data_collection_class()
+            if HAS_NUMPY:
+                csv_columns = {}
+                for key in iterable_values:
+                    csv_columns[key] = csv_records[iterable_values[key][index]]
+                for key in fixed_values:
+                    csv_columns[key] = csv_records[fixed_values[key]]
+
+                collections.append(cls._get_collection_from_columns(csv_columns))
+                continue
+
             collection_instance = collection_cls()
             for key in iterable_values:
                 iterable_value = iterable_values[key][index]
@@ -1051,6 +1505,9 @@ class SeriesBase(SeriesOptions):
                  escape_character = "\\",
                  series_in_rows = False,
                  series_index = None,
+                 chunksize = None,
+                 chunk_downsample = None,
+                 chunk_aggregation = None,
                  **kwargs):
         """Create one or more new :term:`series` instances with
         :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>`
@@ -1143,6 +1600,15 @@ class SeriesBase(SeriesOptions):
               header row and a :class:`str <python:str>` value is found, a
               :exc:`HighchartsCSVDeserializationError` will be raised.
 
+            .. tip::
+
+              If `NumPy <https://numpy.org>`__ is installed, only the columns referenced
+              in ``property_column_map`` are parsed, directly into typed
+              :class:`numpy.ndarray <numpy:numpy.ndarray>` columns (see
+              :func:`parse_csv_columns() <highcharts_core.utility_functions.parse_csv_columns>`).
+              If those columns contain only numerical or ISO 8601 date/time values, the
+              series' data is populated without creating an object for each data point.
+
         :type property_column_map: :class:`dict <python:dict>` or :obj:`None <python:None>`
 
         :param has_header_row: If ``True``, indicates that the first row of
@@ -1224,6 +1690,32 @@ class SeriesBase(SeriesOptions):
         :type series_index: :class:`int <python:int>`, slice, or 
           :obj:`None <python:None>`
 
+        :param chunksize: If supplied, the CSV data is read in chunks of (at most)
+          ``chunksize`` records, so that peak memory use is proportional to
+          ``chunksize`` and to the size of the resulting series rather than to the size
+          of the CSV data. If the CSV data is a file, it is read using a memory map.
+          Requires `NumPy <https://numpy.org>`__ and a ``property_column_map``.
+          Defaults to :obj:`None <python:None>`, which reads the CSV data in full.
+        :type chunksize: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param chunk_downsample: If supplied (together with ``chunksize``), each chunk is
+          downsampled as it is read. Accepts either the number of data points to retain
+          from each chunk, or a :class:`dict <python:dict>` of keyword arguments for
+          :meth:`DataPointCollection.downsample() <highcharts_core.options.series.data.collections.DataPointCollection.downsample>`.
+          Defaults to :obj:`None <python:None>`.
+        :type chunk_downsample: :class:`int <python:int>`, :class:`dict <python:dict>`,
+          or :obj:`None <python:None>`
+
+        :param chunk_aggregation: If supplied (together with ``chunksize``), each chunk is
+          aggregated into regular time intervals as it is read. Accepts a
+          :class:`dict <python:dict>` of keyword arguments for
+          :meth:`DataPointCollection.group_by_time() <highcharts_core.options.series.data.collections.DataPointCollection.group_by_time>`
+          (e.g. ``{'unit': 'hour', 'approximation': 'average'}``). A summary of the
+          last interval of each chunk (rather than its data points) is carried over to
+          the next chunk, so intervals that span chunks are aggregated correctly
+          provided the CSV data is sorted by its ``x`` values. Defaults to :obj:`None <python:None>`.
+        :type chunk_aggregation: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
         :param **kwargs: Remaining keyword arguments will be attempted on the resulting
           :term:`series` instance and the data points it contains.
 
@@ -1241,6 +1733,10 @@ class SeriesBase(SeriesOptions):
 
         """
         series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        if chunksize and series_in_rows:
+            raise errors.HighchartsCSVDeserializationError('chunksize is not supported '
+                                                           'when series_in_rows is '
+                                                           'True.')
         if series_in_rows:
             return cls.from_csv_in_rows(
                 as_string_or_file,
@@ -1270,6 +1766,9 @@ class SeriesBase(SeriesOptions):
                 wrap_all_strings = wrap_all_strings,
                 double_wrapper_character_when_nested = double_wrapper_character_when_nested,
                 escape_character = escape_character,
+                chunksize = chunksize,
+                chunk_downsample = chunk_downsample,
+                chunk_aggregation = chunk_aggregation,
                 **kwargs
             )
             if len(series_list) == 1:
@@ -1302,6 +1801,9 @@ class SeriesBase(SeriesOptions):
                 wrap_all_strings = wrap_all_strings,
                 double_wrapper_character_when_nested = double_wrapper_character_when_nested,
                 escape_character = escape_character,
+                chunksize = chunksize,
+                chunk_downsample = chunk_downsample,
+                chunk_aggregation = chunk_aggregation,
                 **kwargs
             )
             for index in range(len(series_list)):
@@ -1318,6 +1820,13 @@ class SeriesBase(SeriesOptions):
             return series_list
 
         # SCENARIO 3: No Explicit Properties
+        if chunksize:
+            raise errors.HighchartsCSVDeserializationError('chunksize requires a '
+                                                           'property_column_map (or '
+                                                           'data point properties '
+                                                           'supplied as keyword '
+                                                           'arguments).')
+
         if not checkers.is_on_filesystem(as_string_or_file):
             as_str = as_string_or_file
             columns, csv_records = utility_functions.parse_csv(
@@ -1876,6 +2385,106 @@ class SeriesBase(SeriesOptions):
         
         return series_list
 
+    @classmethod
+    def _from_pandas_grouped(cls,
+                             df,
+                             group_by,
+                             property_map = None,
+                             series_kwargs = None,
+                             series_in_rows = False,
+                             **kwargs):
+        """Create one :term:`series` instance for each distinct value of the ``group_by``
+        column of a `pandas <https://pandas.pydata.org/>`_
+        :class:`DataFrame <pandas:pandas.DataFrame>`.
+
+        ``property_map`` is resolved once, each referenced column is re-ordered once so
+        that the rows of each group are contiguous, and each series is then populated
+        from :class:`numpy.ndarray <numpy:numpy.ndarray>` views of those columns.
+
+        :param df: The :class:`DataFrame <pandas:pandas.DataFrame>` from which data should be
+          loaded.
+        :type df: :class:`DataFrame <pandas:pandas.DataFrame>`
+
+        :param group_by: The label of the column (or of the index) whose distinct values
+          should each produce a series.
+        :type group_by: :class:`str <python:str>`
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column in ``df``. If
+          :obj:`None <python:None>`, data point properties supplied in ``kwargs`` are
+          used instead. Defaults to :obj:`None <python:None>`.
+        :type property_map: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating each series instance. Defaults
+          to :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param series_in_rows: Not supported when grouping. Defaults to
+          :obj:`False <python:False>`.
+        :type series_in_rows: :class:`bool <python:bool>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instances.
+
+        :rtype: :class:`list <python:list>` of series instances (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`)
+
+        :raises HighchartsPandasDeserializationError: if ``property_map`` or
+          ``group_by`` reference a column that does not exist in the data frame, or if
+          no data point properties were supplied
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in your runtime '
+                                                   'environment. Please make sure it is '
+                                                   'installed in your runtime '
+                                                   'environment.')
+        if series_in_rows:
+            raise errors.HighchartsPandasDeserializationError(
+                'group_by is not supported when series_in_rows is True.'
+            )
+
+        if not property_map:
+            props_from_array = cls._data_point_class()._get_props_from_array()
+            if not props_from_array:
+                props_from_array = ['x', 'y']
+            property_map = {}
+            for prop in props_from_array:
+                if prop in kwargs:
+                    property_map[prop] = kwargs.pop(prop)
+
+        if not property_map:
+            raise errors.HighchartsPandasDeserializationError(
+                'group_by requires a property_map or data point properties supplied as '
+                'keyword arguments.'
+            )
+
+        column_names = [x for x in df.columns.values]
+        if df.index.name is not None and df.index.name not in column_names:
+            column_names.append(df.index.name)
+        if group_by not in column_names:
+            raise errors.HighchartsPandasDeserializationError(
+                f'Unable to find a column labeled "{group_by}" in df.'
+            )
+
+        def get_column(label):
+            if label in df.columns.values:
+                return df[label].to_numpy()
+            return df.index.to_numpy()
+
+        return cls._from_columns_multi_map(
+            property_map,
+            column_names,
+            get_column,
+            series_kwargs = series_kwargs,
+            error_cls = errors.HighchartsPandasDeserializationError,
+            groups = utility_functions.get_group_slices(get_column(group_by)),
+            **kwargs
+        )
+
     @classmethod
     def from_pandas_in_rows(cls,
                             df,
@@ -1982,6 +2591,7 @@ class SeriesBase(SeriesOptions):
                     series_kwargs = None,
                     series_in_rows = False,
                     series_index = None,
+                    group_by = None,
                     **kwargs):
         """Create one or more :term:`series` instances whose
         :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` properties
@@ -2022,6 +2632,15 @@ class SeriesBase(SeriesOptions):
                                                   'id': 'id'
                                                })
 
+            ## EXAMPLE 5. Creates ONE series per distinct value of the "ticker" column.
+
+            my_series = LineSeries.from_pandas(df,
+                                               property_map = {
+                                                  'x': 'date',
+                                                  'y': 'price'
+                                               },
+                                               group_by = 'ticker')
+
         :param df: The :class:`DataFrame <pandas:pandas.DataFrame>` from which data should be
           loaded.
         :type df: :class:`DataFrame <pandas:pandas.DataFrame>`
@@ -2078,6 +2697,15 @@ class SeriesBase(SeriesOptions):
         :type series_index: :class:`int <python:int>`, slice, or 
           :obj:`None <python:None>`
 
+        :param group_by: If supplied, the label of a column (or of the index) whose
+          distinct values should each produce a separate series (named for the value),
+          in the order in which the values first appear in ``df``. The rows are sorted
+          once and each series is populated from views of the sorted columns, so no
+          per-group :class:`DataFrame <pandas:pandas.DataFrame>` is created. Requires
+          either ``property_map`` or data point properties supplied in ``kwargs``.
+          Defaults to :obj:`None <python:None>`.
+        :type group_by: :class:`str <python:str>` or :obj:`None <python:None>`
+
         :param **kwargs: Remaining keyword arguments will be attempted on the resulting
           :term:`series` instance and the data points it contains.
 
@@ -2092,10 +2720,29 @@ class SeriesBase(SeriesOptions):
 
         :raises HighchartsPandasDeserializationError: if ``property_map`` references
           a column that does not exist in the data frame
+        :raises HighchartsPandasDeserializationError: if ``group_by`` is supplied without
+          ``property_map`` or data point properties in ``kwargs``, or references a
+          column that does not exist in the data frame
         :raises HighchartsDependencyError: if `pandas <https://pandas.pydata.org/>`_ is
           not available in the runtime environment
         """
         series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        # SCENARIO G: One Series per Group
+        if group_by is not None:
+            series_list = cls._from_pandas_grouped(df,
+                                                   group_by,
+                                                   property_map,
+                                                   series_kwargs,
+                                                   series_in_rows = series_in_rows,
+                                                   **kwargs)
+            if len(series_list) == 1:
+                return series_list[0]
+
+            if series_index is not None:
+                return series_list[series_index]
+
+            return series_list
         
         # SCENARIO 0: Series in Rows
         if series_in_rows:
@@ -2247,9 +2894,183 @@ class SeriesBase(SeriesOptions):
 
         return series_list
 
+    @classmethod
+    def _get_collection_from_pyspark(cls, df, property_map):
+        """Create a data point collection from the Arrow record batches which make up
+        ``df``, converting each batch's columns directly to
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` values.
+
+        :param df: The (already projected) PySpark data frame to collect.
+        :type df: :class:`DataFrame <pyspark:pyspark.sql.DataFrame>`
+
+        :param property_map: A :class:`dict <python:dict>` mapping data point properties
+          to columns in ``df``.
+        :type property_map: :class:`dict <python:dict>`
+
+        :rtype: :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+        """
+        parts = {key: [] for key in property_map}
+        for batch in utility_functions.iter_pyspark_arrow_batches(df):
+            batch_columns = batch.schema.names
+            for key in property_map:
+                index = batch_columns.index(property_map[key])
+                parts[key].append(utility_functions.arrow_to_ndarray(batch.column(index)))
+
+        columns = {}
+        for key in parts:
+            if not parts[key]:
+                columns[key] = np.asarray([], dtype = np.float64)
+            elif len(set([x.dtype.kind for x in parts[key]])) > 1:
+                columns[key] = np.concatenate([x.astype(object) for x in parts[key]])
+            else:
+                columns[key] = np.concatenate(parts[key])
+
+        return cls._get_collection_from_columns(columns)
+
+    @staticmethod
+    def _aggregate_pyspark_df(df,
+                              property_map,
+                              bucket_by = None,
+                              bucket = None,
+                              bins = None,
+                              top_k = None,
+                              agg = 'avg'):
+        """Group and aggregate the rows of ``df`` within Spark, so that only the
+        aggregated values need to be collected to the driver.
+
+        :param df: The (already projected) PySpark data frame to aggregate.
+        :type df: :class:`DataFrame <pyspark:pyspark.sql.DataFrame>`
+
+        :param property_map: A :class:`dict <python:dict>` mapping data point properties
+          to columns in ``df``.
+        :type property_map: :class:`dict <python:dict>`
+
+        :returns: A 2-member :class:`tuple <python:tuple>` containing the aggregated
+          data frame and the :class:`dict <python:dict>` mapping data point properties
+          to its columns.
+        :rtype: :class:`tuple <python:tuple>`
+
+        :raises HighchartsValueError: if the aggregation options are not valid
+        :raises HighchartsPySparkDeserializationError: if ``bucket_by`` is not a column
+          referenced in ``property_map``
+        """
+        from pyspark.sql import functions as F
+        from pyspark.sql import types as T
+
+        if bucket is not None and bins is not None:
+            raise errors.HighchartsValueError('bucket and bins cannot both be supplied.')
+
+        property_map = {key: property_map[key] for key in property_map}
+        if not bucket_by:
+            if bucket is None and bins is None and 'name' in property_map:
+                bucket_by = property_map['name']
+            else:
+                bucket_by = property_map.get('x', None)
+        if not bucket_by:
+            raise errors.HighchartsValueError('Unable to determine the column to group '
+                                              'by. Please supply bucket_by, or map a '
+                                              'column to "x".')
+        if bucket_by not in property_map.values():
+            raise errors.HighchartsPySparkDeserializationError(
+                f'bucket_by expects a column referenced in property_map. Received: '
+                f'"{bucket_by}"'
+            )
+
+        agg_functions = {
+            'avg': F.avg,
+            'mean': F.avg,
+            'sum': F.sum,
+            'min': F.min,
+            'max': F.max,
+            'count': F.count,
+        }
+        if checkers.is_dict(agg):
+            aggs = {key: validators.string(agg[key]).lower() for key in agg}
+            default_agg = 'avg'
+        else:
+            aggs = {}
+            default_agg = validators.string(agg).lower()
+        for value in list(aggs.values()) + [default_agg]:
+            if value not in agg_functions:
+                raise errors.HighchartsValueError(f'agg expects one of: '
+                                                  f'{", ".join(agg_functions)}. '
+                                                  f'Received: "{value}"')
+
+        column = F.col(bucket_by)
+        data_type = df.schema[bucket_by].dataType
+        is_temporal = isinstance(data_type, (T.TimestampType, T.DateType))
+        if bucket is not None:
+            if is_temporal:
+                seconds = utility_functions.parse_time_interval(bucket) / 1000
+                key = (F.floor(column.cast('timestamp').cast('double') / seconds) *
+                       seconds).cast('timestamp')
+            else:
+                width = validators.numeric(bucket, minimum = 0)
+                if not width:
+                    raise errors.HighchartsValueError('bucket must be greater than 0.')
+                key = F.floor(column / width) * width
+        elif bins is not None:
+            bins = validators.integer(bins, minimum = 1)
+            if is_temporal:
+                column = column.cast('timestamp').cast('double')
+            bounds = df.agg(F.min(column), F.max(column)).first()
+            minimum, maximum = bounds[0], bounds[1]
+            if minimum is None:
+                minimum, maximum = 0, 0
+            width = (maximum - minimum) / bins or 1
+            index = F.least(F.floor((column - F.lit(minimum)) / F.lit(width)),
+                            F.lit(bins - 1))
+            key = F.lit(minimum) + index * F.lit(width)
+            if is_temporal:
+                key = key.cast('timestamp')
+        else:
+            key = column
+
+        value_columns = []
+        for prop in property_map:
+            if property_map[prop] != bucket_by and property_map[prop] not in value_columns:
+                value_columns.append(property_map[prop])
+
+        aggregations = []
+        for name in value_columns:
+            props = [x for x in property_map if property_map[x] == name]
+            function_name = aggs.get(props[0], default_agg)
+            if isinstance(df.schema[name].dataType, T.NumericType) or \
+               function_name == 'count':
+                aggregations.append(agg_functions[function_name](name).alias(name))
+            else:
+                aggregations.append(F.first(name, ignorenulls = True).alias(name))
+
+        if 'y' not in property_map:
+            property_map['y'] = '_count'
+            aggregations.append(F.count(F.lit(1)).alias('_count'))
+
+        if not aggregations:
+            aggregations.append(F.count(F.lit(1)).alias('_count'))
+
+        result = df.groupBy(key.alias(bucket_by)).agg(*aggregations)
+        if top_k is not None:
+            top_k = validators.integer(top_k, minimum = 1)
+            result = result.orderBy(F.col(property_map['y']).desc_nulls_last())
+            result = result.limit(top_k)
+            if bucket is not None or bins is not None:
+                result = result.orderBy(bucket_by)
+        else:
+            result = result.orderBy(bucket_by)
+
+        return result, property_map
+
     def load_from_pyspark(self,
                           df,
-                          property_map):
+                          property_map,
+                          use_arrow = None,
+                          sample_fraction = None,
+                          seed = None,
+                          bucket_by = None,
+                          bucket = None,
+                          bins = None,
+                          top_k = None,
+                          agg = 'avg'):
         """Replaces the contents of the
         :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
         with values from a `PySpark <https://spark.apache.org/docs/latest/api/python/>`_
@@ -2266,8 +3087,76 @@ class SeriesBase(SeriesOptions):
           :class:`DataFrame <pyspark:pyspark.sql.DataFrame>` column.
         :type property_map: :class:`dict <python:dict>`
 
+        :param use_arrow: If ``True``, collects ``df`` to the driver as Arrow record
+          batches whose columns are converted directly to
+          :class:`numpy.ndarray <numpy:numpy.ndarray>` values, without creating a Python
+          object for each row. If ``False`` (or if NumPy is not available), collects
+          ``df`` row-by-row as JSON. Defaults to :obj:`None <python:None>`, which uses
+          Arrow if both NumPy and
+          `PyArrow <https://arrow.apache.org/docs/python/>`__ are available, and JSON
+          otherwise.
+
+          .. note::
+
+            If ``use_arrow`` is explicitly ``True``,
+            `PyArrow <https://arrow.apache.org/docs/python/>`__ must be installed in the
+            runtime environment.
+
+        :type use_arrow: :class:`bool <python:bool>` or :obj:`None <python:None>`
+
+        :param sample_fraction: If supplied, only a random sample of (approximately)
+          this proportion of the rows in ``df`` is collected, with the sample being
+          drawn within Spark. Defaults to :obj:`None <python:None>`, which collects all
+          rows.
+        :type sample_fraction: :class:`float <python:float>` or
+          :obj:`None <python:None>`
+
+        :param seed: The seed to use when sampling rows with ``sample_fraction``.
+          Defaults to :obj:`None <python:None>`.
+        :type seed: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param bucket_by: The column in ``df`` whose values should be grouped when
+          aggregating with ``bucket``, ``bins``, or ``top_k``. Must be one of the columns
+          referenced in ``property_map``. If :obj:`None <python:None>`, defaults to the
+          column mapped to ``'x'`` (or, when only ``top_k`` is supplied, the column
+          mapped to ``'name'`` if there is one). Defaults to :obj:`None <python:None>`.
+        :type bucket_by: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param bucket: If supplied, groups the rows of ``df`` into regular intervals of
+          ``bucket_by`` within Spark, and aggregates the remaining columns within each
+          interval. For date / time columns, accepts an interval such as ``'1h'``,
+          ``'15min'``, or ``'1 day'`` (see
+          :func:`parse_time_interval() <highcharts_core.utility_functions.parse_time_interval>`),
+          while for numerical columns accepts the width of each interval. Defaults to
+          :obj:`None <python:None>`.
+        :type bucket: :class:`str <python:str>`, numeric, or :obj:`None <python:None>`
+
+        :param bins: If supplied, groups the rows of ``df`` into this number of
+          equal-width bins of ``bucket_by`` within Spark (e.g. for a histogram), and
+          aggregates the remaining columns within each bin. Each bin is identified by its
+          lower edge. Defaults to :obj:`None <python:None>`.
+        :type bins: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param top_k: If supplied, only collects the ``top_k`` groups with the highest
+          ``'y'`` value. If neither ``bucket`` nor ``bins`` are supplied, the rows of
+          ``df`` are grouped by the distinct values of ``bucket_by`` (e.g. for a
+          categorical series). Defaults to :obj:`None <python:None>`.
+        :type top_k: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param agg: How numerical columns are aggregated within each group when using
+          ``bucket``, ``bins``, or ``top_k``. Accepts ``'avg'`` (or ``'mean'``),
+          ``'sum'``, ``'min'``, ``'max'``, or ``'count'``, or a
+          :class:`dict <python:dict>` mapping data point properties to one of those
+          values. Non-numerical columns take the first value in each group. If
+          ``property_map`` does not map a column to ``'y'``, ``'y'`` receives the number
+          of rows in each group. Defaults to ``'avg'``.
+        :type agg: :class:`str <python:str>` or :class:`dict <python:dict>`
+
         :raises HighchartsPySparkDeserializationError: if ``property_map`` references
-          a column that does not exist in the data frame
+          a column that does not exist in the data frame, or if ``bucket_by`` is not
+          referenced in ``property_map``
+        :raises HighchartsValueError: if ``bucket``, ``bins``, ``top_k``, or ``agg`` are
+          not valid
         :raises HighchartsDependencyError: if
           `PySpark <https://spark.apache.org/docs/latest/api/python/>`_ is not available
           in the runtime environment
@@ -2295,6 +3184,33 @@ class SeriesBase(SeriesOptions):
             column_instances.append(column_instance)
 
         narrower_df = df.select(*column_instances)
+        if sample_fraction is not None:
+            sample_fraction = validators.float(sample_fraction,
+                                               minimum = 0,
+                                               maximum = 1)
+            narrower_df = narrower_df.sample(fraction = sample_fraction,
+                                             seed = seed)
+
+        if bucket is not None or bins is not None or top_k is not None:
+            narrower_df, property_map = self._aggregate_pyspark_df(narrower_df,
+                                                                   property_map,
+                                                                   bucket_by = bucket_by,
+                                                                   bucket = bucket,
+                                                                   bins = bins,
+                                                                   top_k = top_k,
+                                                                   agg = agg)
+
+        if use_arrow is None:
+            try:
+                import pyarrow
+                use_arrow = HAS_NUMPY
+            except ImportError:
+                use_arrow = False
+
+        if HAS_NUMPY and use_arrow:
+            self.data = self._get_collection_from_pyspark(narrower_df, property_map)
+            return
+
         rdd_as_jsons = narrower_df.toJSON()
 
         df_as_dicts = [json.loads(x) for x in rdd_as_jsons.toLocalIterator()]
@@ -2312,7 +3228,15 @@ class SeriesBase(SeriesOptions):
     def from_pyspark(cls,
                      df,
                      property_map,
-                     series_kwargs = None):
+                     series_kwargs = None,
+                     use_arrow = None,
+                     sample_fraction = None,
+                     seed = None,
+                     bucket_by = None,
+                     bucket = None,
+                     bins = None,
+                     top_k = None,
+                     agg = 'avg'):
         """Create a :term:`series` instance whose
         :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
         is populated from a `PySpark <https://spark.apache.org/docs/latest/api/python/>`_
@@ -2340,6 +3264,64 @@ class SeriesBase(SeriesOptions):
 
         :type series_kwargs: :class:`dict <python:dict>`
 
+        :param use_arrow: If ``True``, collects ``df`` to the driver as Arrow record
+          batches whose columns are converted directly to
+          :class:`numpy.ndarray <numpy:numpy.ndarray>` values, without creating a Python
+          object for each row. If ``False`` (or if NumPy is not available), collects
+          ``df`` row-by-row as JSON. Defaults to :obj:`None <python:None>`, which uses
+          Arrow if both NumPy and
+          `PyArrow <https://arrow.apache.org/docs/python/>`__ are available, and JSON
+          otherwise.
+        :type use_arrow: :class:`bool <python:bool>` or :obj:`None <python:None>`
+
+        :param sample_fraction: If supplied, only a random sample of (approximately)
+          this proportion of the rows in ``df`` is collected, with the sample being
+          drawn within Spark. Defaults to :obj:`None <python:None>`, which collects all
+          rows.
+        :type sample_fraction: :class:`float <python:float>` or
+          :obj:`None <python:None>`
+
+        :param seed: The seed to use when sampling rows with ``sample_fraction``.
+          Defaults to :obj:`None <python:None>`.
+        :type seed: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param bucket_by: The column in ``df`` whose values should be grouped when
+          aggregating with ``bucket``, ``bins``, or ``top_k``. Must be one of the columns
+          referenced in ``property_map``. If :obj:`None <python:None>`, defaults to the
+          column mapped to ``'x'`` (or, when only ``top_k`` is supplied, the column
+          mapped to ``'name'`` if there is one). Defaults to :obj:`None <python:None>`.
+        :type bucket_by: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param bucket: If supplied, groups the rows of ``df`` into regular intervals of
+          ``bucket_by`` within Spark, and aggregates the remaining columns within each
+          interval. For date / time columns, accepts an interval such as ``'1h'``,
+          ``'15min'``, or ``'1 day'`` (see
+          :func:`parse_time_interval() <highcharts_core.utility_functions.parse_time_interval>`),
+          while for numerical columns accepts the width of each interval. Defaults to
+          :obj:`None <python:None>`.
+        :type bucket: :class:`str <python:str>`, numeric, or :obj:`None <python:None>`
+
+        :param bins: If supplied, groups the rows of ``df`` into this number of
+          equal-width bins of ``bucket_by`` within Spark (e.g. for a histogram), and
+          aggregates the remaining columns within each bin. Each bin is identified by its
+          lower edge. Defaults to :obj:`None <python:None>`.
+        :type bins: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param top_k: If supplied, only collects the ``top_k`` groups with the highest
+          ``'y'`` value. If neither ``bucket`` nor ``bins`` are supplied, the rows of
+          ``df`` are grouped by the distinct values of ``bucket_by`` (e.g. for a
+          categorical series). Defaults to :obj:`None <python:None>`.
+        :type top_k: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param agg: How numerical columns are aggregated within each group when using
+          ``bucket``, ``bins``, or ``top_k``. Accepts ``'avg'`` (or ``'mean'``),
+          ``'sum'``, ``'min'``, ``'max'``, or ``'count'``, or a
+          :class:`dict <python:dict>` mapping data point properties to one of those
+          values. Non-numerical columns take the first value in each group. If
+          ``property_map`` does not map a column to ``'y'``, ``'y'`` receives the number
+          of rows in each group. Defaults to ``'avg'``.
+        :type agg: :class:`str <python:str>` or :class:`dict <python:dict>`
+
         :returns: A :term:`series` instance (descended from
           :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) with its
           :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
@@ -2348,7 +3330,10 @@ class SeriesBase(SeriesOptions):
           :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`)
 
         :raises HighchartsPySparkDeserializationError: if ``property_map`` references
-          a column that does not exist in the data frame
+          a column that does not exist in the data frame, or if ``bucket_by`` is not
+          referenced in ``property_map``
+        :raises HighchartsValueError: if ``bucket``, ``bins``, ``top_k``, or ``agg`` are
+          not valid
         :raises HighchartsDependencyError: if
           `PySpark <https://spark.apache.org/docs/latest/api/python/>`_ is not available
           in the runtime environment
@@ -2356,29 +3341,1433 @@ class SeriesBase(SeriesOptions):
         series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
 
         instance = cls(**series_kwargs)
-        instance.load_from_pyspark(df, property_map)
+        instance.load_from_pyspark(df,
+                                   property_map,
+                                   use_arrow = use_arrow,
+                                   sample_fraction = sample_fraction,
+                                   seed = seed,
+                                   bucket_by = bucket_by,
+                                   bucket = bucket,
+                                   bins = bins,
+                                   top_k = top_k,
+                                   agg = agg)
 
         return instance
 
-    def to_chart(self, chart_kwargs = None, options_kwargs = None):
-        """Create a :class:`Chart <highcharts_core.chart.Chart>` instance containing the
-        series instance.
-        
-        :param chart_kwargs: Optional keyword arguments to use when constructing the 
-          :class:`Chart <highcharts_core.chart.Chart>` instance. Defaults to
-          :obj:`None <python:None>`.
-        :type chart_kwargs: :class:`dict <python:dict>`
-        
-        :param options_kwargs: Optional keyword arguments to use when constructing the
-          chart's :class:`HighchartsOptions <highcharts_core.options.HighchartsOptions>`
-          object. Defaults to :obj:`None <python:None>`.
-          
-          .. warning:: 
-          
-            If your ``chart_kwargs`` contains an ``options`` key, its value
-            will be overwritten if you supply ``options_kwargs``.
+    def load_from_arrow(self,
+                        table,
+                        property_map,
+                        series_index = None):
+        """Replace the contents of the
+        :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
+        with data points populated from an `Apache Arrow <https://arrow.apache.org/>`__
+        :class:`Table <pyarrow:pyarrow.Table>` or
+        :class:`RecordBatch <pyarrow:pyarrow.RecordBatch>`.
 
-        :type options_kwargs: :class:`dict <python:dict>`
+        :param table: The :class:`Table <pyarrow:pyarrow.Table>` or
+          :class:`RecordBatch <pyarrow:pyarrow.RecordBatch>` from which data should be
+          loaded.
+        :type table: :class:`Table <pyarrow:pyarrow.Table>` or
+          :class:`RecordBatch <pyarrow:pyarrow.RecordBatch>`
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column in ``table``. The keys in
+          the :class:`dict <python:dict>` should correspond to properties in the data
+          point class, while the value should indicate the name of the column.
+        :type property_map: :class:`dict <python:dict>`
+
+        :param series_index: If ``property_map`` generates multiple series, load the
+          data of the series at the ``series_index`` position. Defaults to
+          :obj:`None <python:None>`.
+
+          .. warning::
+
+            If :obj:`None <python:None>` and ``property_map`` generates multiple
+            series, then a :exc:`HighchartsArrowDeserializationError` will be raised.
+
+        :type series_index: :class:`int <python:int>`, or :obj:`None <python:None>`
+
+        :raises HighchartsArrowDeserializationError: if ``property_map`` references
+          a column that does not exist in ``table``
+        :raises HighchartsArrowDeserializationError: if ``series_index`` is
+          :obj:`None <python:None>`, and it is ambiguous which series generated from
+          ``table`` should be used
+        :raises HighchartsDependencyError: if NumPy or
+          `PyArrow <https://arrow.apache.org/docs/python/>`__ are not available in the
+          runtime environment
+        """
+        cls = self.__class__
+        new_instance = cls.from_arrow(table, property_map = property_map)
+        if series_index is None and isinstance(new_instance, list):
+            raise errors.HighchartsArrowDeserializationError(
+                f'Expected data for a single series, but got {len(new_instance)} when '
+                f'loading from table. Please provide more targeted instructions using '
+                f'the property_map argument.'
+            )
+        elif isinstance(new_instance, list):
+            new_instance = new_instance[series_index]
+
+        self.data = new_instance.data
+
+    @classmethod
+    def from_arrow(cls,
+                   table,
+                   property_map,
+                   series_kwargs = None,
+                   series_index = None,
+                   **kwargs):
+        """Create one or more :term:`series` instances whose
+        :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` properties
+        are populated from an `Apache Arrow <https://arrow.apache.org/>`__
+        :class:`Table <pyarrow:pyarrow.Table>` or
+        :class:`RecordBatch <pyarrow:pyarrow.RecordBatch>`.
+
+        Columns are converted to :class:`numpy.ndarray <numpy:numpy.ndarray>` values
+        without copying their memory wherever their types allow (see
+        :func:`arrow_to_ndarray() <highcharts_core.utility_functions.arrow_to_ndarray>`),
+        so no Python object is created for each data point unless the data points
+        require one (e.g. because they have a ``name``).
+
+          .. code-block:: python
+
+            # Given a PyArrow Table instance named "table"
+            from highcharts_core.options.series.area import LineSeries
+
+            ## EXAMPLE 1. Creates ONE series.
+
+            my_series = LineSeries.from_arrow(table,
+                                              property_map = {
+                                                  'x': 'timestamp',
+                                                  'y': 'value'
+                                              })
+
+            ## EXAMPLE 2. Creates THREE series.
+
+            my_series = LineSeries.from_arrow(table,
+                                              property_map = {
+                                                  'x': 'timestamp',
+                                                  'y': ['value1', 'value2', 'value3']
+                                              })
+
+        :param table: The :class:`Table <pyarrow:pyarrow.Table>` or
+          :class:`RecordBatch <pyarrow:pyarrow.RecordBatch>` from which data should be
+          loaded.
+        :type table: :class:`Table <pyarrow:pyarrow.Table>` or
+          :class:`RecordBatch <pyarrow:pyarrow.RecordBatch>`
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column in ``table``. The keys in
+          the :class:`dict <python:dict>` should correspond to properties in the data
+          point class, while the value should indicate the name of the column.
+
+            .. note::
+
+              If any of the values in ``property_map`` contain an iterable, then
+              one series will be produced for each item in the iterable.
+
+        :type property_map: :class:`dict <python:dict>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+            The ``data`` value will be created from ``table`` instead.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param series_index: If supplied, return the series that Highcharts for Python
+          generated from ``table`` at the ``series_index`` value. Defaults to
+          :obj:`None <python:None>`, which returns all series generated from ``table``.
+        :type series_index: :class:`int <python:int>`, slice, or
+          :obj:`None <python:None>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance(s).
+
+        :returns: A :term:`series` instance (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) OR
+          :class:`list <python:list>` of series instances with its
+          :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
+          populated from the data in ``table``.
+        :rtype: :class:`list <python:list>` of series instances (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) or
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`-descendent
+
+        :raises HighchartsArrowDeserializationError: if ``property_map`` references
+          a column that does not exist in ``table``
+        :raises HighchartsDependencyError: if NumPy or
+          `PyArrow <https://arrow.apache.org/docs/python/>`__ are not available in the
+          runtime environment
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise errors.HighchartsDependencyError('pyarrow is not available in the '
+                                                   'runtime environment. Please install '
+                                                   'using "pip install pyarrow"')
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in your runtime '
+                                                   'environment. Please make sure it is '
+                                                   'installed in your runtime '
+                                                   'environment.')
+
+        if not isinstance(table, (pa.Table, pa.RecordBatch)):
+            raise errors.HighchartsValueError(f'table is expected to be a PyArrow Table '
+                                              f'or RecordBatch. Was: '
+                                              f'{table.__class__.__name__}')
+
+        column_names = table.schema.names
+        series_list = cls._from_columns_multi_map(
+            property_map,
+            column_names,
+            lambda x: utility_functions.arrow_to_ndarray(
+                table.column(column_names.index(x))
+            ),
+            series_kwargs = series_kwargs,
+            error_cls = errors.HighchartsArrowDeserializationError,
+            **kwargs
+        )
+
+        if len(series_list) == 1:
+            return series_list[0]
+
+        if series_index is not None:
+            return series_list[series_index]
+
+        return series_list
+
+    @staticmethod
+    def _get_arrow_filter(schema, property_map, filters = None, x_range = None):
+        """Return a PyArrow :class:`Expression <pyarrow:pyarrow.dataset.Expression>`
+        which combines ``filters`` with the ``x_range`` of the column mapped to ``'x'``.
+
+        :param schema: The schema of the data being filtered.
+        :type schema: :class:`Schema <pyarrow:pyarrow.Schema>`
+
+        :param property_map: A :class:`dict <python:dict>` mapping data point
+          properties to columns.
+        :type property_map: :class:`dict <python:dict>`
+
+        :param filters: Filters expressed either as a PyArrow
+          :class:`Expression <pyarrow:pyarrow.dataset.Expression>` or in the
+          disjunctive normal form accepted by
+          :func:`pyarrow.parquet.read_table() <pyarrow:pyarrow.parquet.read_table>`.
+          Defaults to :obj:`None <python:None>`.
+
+        :param x_range: The (inclusive) minimum and maximum values of ``'x'``. Either
+          value may be :obj:`None <python:None>`. Dates / times may be supplied as
+          :class:`datetime <python:datetime.datetime>` values, ISO 8601 strings, or
+          milliseconds since the Unix epoch. Defaults to :obj:`None <python:None>`.
+        :type x_range: :class:`tuple <python:tuple>` or :obj:`None <python:None>`
+
+        :returns: The combined filter expression, or :obj:`None <python:None>` if there
+          is nothing to filter.
+        :rtype: :class:`Expression <pyarrow:pyarrow.dataset.Expression>` or
+          :obj:`None <python:None>`
+
+        :raises HighchartsArrowDeserializationError: if ``x_range`` is supplied but
+          ``property_map`` does not map a single column to ``'x'``
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        expression = None
+        if filters is not None:
+            if isinstance(filters, pc.Expression):
+                expression = filters
+            else:
+                expression = pq.filters_to_expression(filters)
+
+        if x_range is None:
+            return expression
+
+        x_column = property_map.get('x', None)
+        if not isinstance(x_column, str):
+            raise errors.HighchartsArrowDeserializationError(
+                'x_range requires property_map to map a single column to "x".'
+            )
+        if x_column not in schema.names:
+            raise errors.HighchartsArrowDeserializationError(
+                f'Unable to find a column labeled "{x_column}".'
+            )
+        if len(x_range) != 2:
+            raise errors.HighchartsValueError(f'x_range expects a minimum and a maximum. '
+                                              f'Received: {x_range}')
+
+        x_type = schema.field(x_column).type
+        is_temporal = pa.types.is_timestamp(x_type) or pa.types.is_date(x_type)
+        bounds = []
+        for value in x_range:
+            if value is None:
+                bounds.append(None)
+                continue
+            if is_temporal and checkers.is_numeric(value) and not isinstance(value, str):
+                value = pa.scalar(int(value), type = pa.timestamp('ms'))
+            elif is_temporal:
+                value = pa.scalar(validators.datetime(value))
+            else:
+                value = pa.scalar(value)
+            if is_temporal and pa.types.is_timestamp(x_type) and x_type.tz and \
+               not value.type.tz:
+                value = pa.scalar(value.as_py(),
+                                  type = pa.timestamp(value.type.unit, tz = 'UTC'))
+            bounds.append(value.cast(x_type))
+
+        minimum, maximum = bounds
+        if minimum is not None:
+            range_expression = pc.field(x_column) >= minimum
+            expression = range_expression if expression is None else \
+                expression & range_expression
+        if maximum is not None:
+            range_expression = pc.field(x_column) <= maximum
+            expression = range_expression if expression is None else \
+                expression & range_expression
+
+        return expression
+
+    @classmethod
+    def from_parquet(cls,
+                     path,
+                     property_map,
+                     filters = None,
+                     x_range = None,
+                     series_kwargs = None,
+                     series_index = None,
+                     **kwargs):
+        """Create one or more :term:`series` instances whose
+        :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` properties
+        are populated from one or more `Parquet <https://parquet.apache.org/>`__ files.
+
+        Only the columns referenced in ``property_map`` are read, and the statistics of
+        each row group are used to skip row groups which fall entirely outside of
+        ``filters`` / ``x_range``. The resulting data is wrapped as
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` columns (see
+        :meth:`.from_arrow() <highcharts_core.options.series.base.SeriesBase.from_arrow>`).
+
+          .. code-block:: python
+
+            import datetime
+            from highcharts_core.options.series.area import LineSeries
+
+            my_series = LineSeries.from_parquet(
+                'metrics/',
+                property_map = {'x': 'timestamp', 'y': 'value'},
+                filters = [('metric', '=', 'cpu')],
+                x_range = (datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 8))
+            )
+
+        :param path: The Parquet file, directory of Parquet files, or
+          :class:`list <python:list>` of Parquet files from which data should be loaded.
+        :type path: :class:`str <python:str>`, path-like, or
+          :class:`list <python:list>`
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column. The keys in the
+          :class:`dict <python:dict>` should correspond to properties in the data point
+          class, while the value should indicate the name of the column.
+
+            .. note::
+
+              If any of the values in ``property_map`` contain an iterable, then
+              one series will be produced for each item in the iterable.
+
+        :type property_map: :class:`dict <python:dict>`
+
+        :param filters: Rows which do not match ``filters`` are skipped. Accepts either a
+          PyArrow :class:`Expression <pyarrow:pyarrow.dataset.Expression>` or filters
+          in the disjunctive normal form accepted by
+          :func:`pyarrow.parquet.read_table() <pyarrow:pyarrow.parquet.read_table>`
+          (e.g. ``[('metric', '=', 'cpu')]``). Defaults to :obj:`None <python:None>`.
+        :type filters: :class:`list <python:list>`,
+          :class:`Expression <pyarrow:pyarrow.dataset.Expression>`, or
+          :obj:`None <python:None>`
+
+        :param x_range: If supplied, only rows whose ``'x'`` value is between the
+          (inclusive) minimum and maximum are read. Either value may be
+          :obj:`None <python:None>`. Dates / times may be supplied as
+          :class:`datetime <python:datetime.datetime>` values, ISO 8601 strings, or
+          milliseconds since the Unix epoch. Defaults to :obj:`None <python:None>`.
+        :type x_range: :class:`tuple <python:tuple>` or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+            The ``data`` value will be created from ``path`` instead.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param series_index: If supplied, return the series that Highcharts for Python
+          generated at the ``series_index`` value. Defaults to
+          :obj:`None <python:None>`, which returns all series generated.
+        :type series_index: :class:`int <python:int>`, slice, or
+          :obj:`None <python:None>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance(s).
+
+        :returns: A :term:`series` instance (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) OR
+          :class:`list <python:list>` of series instances with its
+          :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
+          populated from the data in ``path``.
+        :rtype: :class:`list <python:list>` of series instances (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) or
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`-descendent
+
+        :raises HighchartsArrowDeserializationError: if ``property_map`` references
+          a column that does not exist in the data
+        :raises HighchartsDependencyError: if NumPy or
+          `PyArrow <https://arrow.apache.org/docs/python/>`__ are not available in the
+          runtime environment
+        """
+        try:
+            import pyarrow.dataset as ds
+        except ImportError:
+            raise errors.HighchartsDependencyError('pyarrow is not available in the '
+                                                   'runtime environment. Please install '
+                                                   'using "pip install pyarrow"')
+
+        property_map = validators.dict(property_map)
+        if isinstance(path, os.PathLike):
+            path = os.fspath(path)
+
+        dataset = ds.dataset(path, format = 'parquet')
+        columns = cls._get_property_map_columns(property_map)
+        for column in columns:
+            if column not in dataset.schema.names:
+                raise errors.HighchartsArrowDeserializationError(
+                    f'Unable to find a column labeled "{column}".'
+                )
+
+        expression = cls._get_arrow_filter(dataset.schema,
+                                           property_map,
+                                           filters = filters,
+                                           x_range = x_range)
+        table = dataset.to_table(columns = columns, filter = expression)
+
+        return cls.from_arrow(table,
+                              property_map,
+                              series_kwargs = series_kwargs,
+                              series_index = series_index,
+                              **kwargs)
+
+    @classmethod
+    def from_feather(cls,
+                     path,
+                     property_map,
+                     filters = None,
+                     x_range = None,
+                     series_kwargs = None,
+                     series_index = None,
+                     **kwargs):
+        """Create one or more :term:`series` instances whose
+        :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` properties
+        are populated from a `Feather <https://arrow.apache.org/docs/python/feather.html>`__
+        (Arrow IPC) file.
+
+        The file is memory-mapped and only the columns referenced in ``property_map``
+        are read, so uncompressed files are read without copying their data (see
+        :meth:`.from_arrow() <highcharts_core.options.series.base.SeriesBase.from_arrow>`).
+
+        .. note::
+
+          Only Feather V2 files (the Arrow IPC file format, written by default by
+          :func:`pyarrow.feather.write_feather() <pyarrow:pyarrow.feather.write_feather>`
+          and ``pandas.DataFrame.to_feather()``) are supported. Legacy Feather V1 files
+          are rejected by PyArrow's IPC reader and must be re-written as V2 first.
+
+        :param path: The Feather file from which data should be loaded.
+        :type path: :class:`str <python:str>` or path-like
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column. The keys in the
+          :class:`dict <python:dict>` should correspond to properties in the data point
+          class, while the value should indicate the name of the column.
+
+            .. note::
+
+              If any of the values in ``property_map`` contain an iterable, then
+              one series will be produced for each item in the iterable.
+
+        :type property_map: :class:`dict <python:dict>`
+
+        :param filters: Rows which do not match ``filters`` are skipped. Accepts either a
+          PyArrow :class:`Expression <pyarrow:pyarrow.dataset.Expression>` or filters
+          in the disjunctive normal form accepted by
+          :func:`pyarrow.parquet.read_table() <pyarrow:pyarrow.parquet.read_table>`
+          (e.g. ``[('metric', '=', 'cpu')]``). Defaults to :obj:`None <python:None>`.
+        :type filters: :class:`list <python:list>`,
+          :class:`Expression <pyarrow:pyarrow.dataset.Expression>`, or
+          :obj:`None <python:None>`
+
+        :param x_range: If supplied, only rows whose ``'x'`` value is between the
+          (inclusive) minimum and maximum are retained. Either value may be
+          :obj:`None <python:None>`. Dates / times may be supplied as
+          :class:`datetime <python:datetime.datetime>` values, ISO 8601 strings, or
+          milliseconds since the Unix epoch. Defaults to :obj:`None <python:None>`.
+        :type x_range: :class:`tuple <python:tuple>` or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+            The ``data`` value will be created from ``path`` instead.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param series_index: If supplied, return the series that Highcharts for Python
+          generated at the ``series_index`` value. Defaults to
+          :obj:`None <python:None>`, which returns all series generated.
+        :type series_index: :class:`int <python:int>`, slice, or
+          :obj:`None <python:None>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance(s).
+
+        :returns: A :term:`series` instance (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) OR
+          :class:`list <python:list>` of series instances with its
+          :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
+          populated from the data in ``path``.
+        :rtype: :class:`list <python:list>` of series instances (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) or
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`-descendent
+
+        :raises HighchartsArrowDeserializationError: if ``property_map`` references
+          a column that does not exist in the data
+        :raises HighchartsDependencyError: if NumPy or
+          `PyArrow <https://arrow.apache.org/docs/python/>`__ are not available in the
+          runtime environment
+        """
+        try:
+            import pyarrow as pa
+            from pyarrow import feather
+        except ImportError:
+            raise errors.HighchartsDependencyError('pyarrow is not available in the '
+                                                   'runtime environment. Please install '
+                                                   'using "pip install pyarrow"')
+
+        property_map = validators.dict(property_map)
+        if isinstance(path, os.PathLike):
+            path = os.fspath(path)
+
+        with pa.memory_map(path, 'r') as source:
+            schema = pa.ipc.open_file(source).schema
+
+        columns = cls._get_property_map_columns(property_map)
+        for column in columns:
+            if column not in schema.names:
+                raise errors.HighchartsArrowDeserializationError(
+                    f'Unable to find a column labeled "{column}".'
+                )
+
+        expression = cls._get_arrow_filter(schema,
+                                           property_map,
+                                           filters = filters,
+                                           x_range = x_range)
+        if expression is not None:
+            table = feather.read_table(path, memory_map = True)
+            table = table.filter(expression).select(columns)
+        else:
+            table = feather.read_table(path, columns = columns, memory_map = True)
+
+        return cls.from_arrow(table,
+                              property_map,
+                              series_kwargs = series_kwargs,
+                              series_index = series_index,
+                              **kwargs)
+
+    @staticmethod
+    def _get_polars_frame(df, columns = None):
+        """Return ``df`` as a Polars :class:`DataFrame <polars:polars.DataFrame>`,
+        collecting it (projected to ``columns``) if it is a
+        :class:`LazyFrame <polars:polars.LazyFrame>`.
+
+        :param df: The data frame.
+        :type df: :class:`DataFrame <polars:polars.DataFrame>` or
+          :class:`LazyFrame <polars:polars.LazyFrame>`
+
+        :param columns: The names of the columns which should be collected from a
+          :class:`LazyFrame <polars:polars.LazyFrame>`. Defaults to
+          :obj:`None <python:None>`, which collects all columns.
+        :type columns: :class:`list <python:list>` of :class:`str <python:str>`, or
+          :obj:`None <python:None>`
+
+        :rtype: :class:`DataFrame <polars:polars.DataFrame>`
+
+        :raises HighchartsDependencyError: if `Polars <https://pola.rs/>`__ is not
+          available in the runtime environment
+        :raises HighchartsPolarsDeserializationError: if ``columns`` references a column
+          that does not exist in ``df``
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise errors.HighchartsDependencyError('polars is not available in the '
+                                                   'runtime environment. Please install '
+                                                   'using "pip install polars"')
+
+        if isinstance(df, pl.LazyFrame):
+            if columns is not None:
+                available_columns = df.collect_schema().names()
+                for column in columns:
+                    if column not in available_columns:
+                        raise errors.HighchartsPolarsDeserializationError(
+                            f'Unable to find a column labeled "{column}" in df.'
+                        )
+                df = df.select(list(dict.fromkeys(columns)))
+
+            return df.collect()
+
+        if not isinstance(df, pl.DataFrame):
+            raise errors.HighchartsValueError(f'df is expected to be a Polars DataFrame '
+                                              f'or LazyFrame. Was: '
+                                              f'{df.__class__.__name__}')
+
+        return df
+
+    def load_from_polars(self,
+                         df,
+                         property_map = None,
+                         series_in_rows = False,
+                         series_index = None):
+        """Replace the contents of the
+        :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
+        with data points populated from a `Polars <https://pola.rs/>`__
+        :class:`DataFrame <polars:polars.DataFrame>` or
+        :class:`LazyFrame <polars:polars.LazyFrame>`.
+
+        :param df: The :class:`DataFrame <polars:polars.DataFrame>` or
+          :class:`LazyFrame <polars:polars.LazyFrame>` from which data should be loaded.
+          A :class:`LazyFrame <polars:polars.LazyFrame>` is collected with only the
+          columns referenced in ``property_map``.
+        :type df: :class:`DataFrame <polars:polars.DataFrame>` or
+          :class:`LazyFrame <polars:polars.LazyFrame>`
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column in ``df``. The keys in the
+          :class:`dict <python:dict>` should correspond to properties in the data point
+          class, while the value should indicate the label for the column. Defaults to
+          :obj:`None <python:None>`.
+        :type property_map: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param series_in_rows: if ``True``, will attempt a streamlined cartesian series
+          with x-values taken from column names, y-values taken from row values, and
+          the series name taken from the first column (if it contains strings).
+          Defaults to :obj:`False <python:False>`.
+        :type series_in_rows: :class:`bool <python:bool>`
+
+        :param series_index: If supplied, return the series that Highcharts for Python
+          generated from ``df`` at the ``series_index`` value. Defaults to
+          :obj:`None <python:None>`, which returns all series generated from ``df``.
+
+          .. warning::
+
+            If :obj:`None <python:None>` and Highcharts for Python generates multiple
+            series, then a :exc:`HighchartsPolarsDeserializationError` will be raised.
+
+        :type series_index: :class:`int <python:int>`, or :obj:`None <python:None>`
+
+        :raises HighchartsPolarsDeserializationError: if ``property_map`` references
+          a column that does not exist in the data frame
+        :raises HighchartsPolarsDeserializationError: if ``series_index`` is
+          :obj:`None <python:None>`, and it is ambiguous which series generated from
+          the data frame should be used
+        :raises HighchartsDependencyError: if `Polars <https://pola.rs/>`__ or NumPy are
+          not available in the runtime environment
+        """
+        cls = self.__class__
+        new_instance = cls.from_polars(df,
+                                       property_map = property_map,
+                                       series_in_rows = series_in_rows)
+        if series_index is None and isinstance(new_instance, list):
+            raise errors.HighchartsPolarsDeserializationError(
+                f'Expected data for a single series, but got {len(new_instance)} when '
+                f'loading from df. Please either modify the structure of df '
+                f'or provide more targeted instructions using the property_map '
+                f'argument.'
+            )
+        elif isinstance(new_instance, list):
+            new_instance = new_instance[series_index]
+
+        self.data = new_instance.data
+
+    @classmethod
+    def from_polars_in_rows(cls,
+                            df,
+                            series_kwargs = None,
+                            series_index = None,
+                            **kwargs):
+        """Create a collection of :term:`series` instances, one for each
+        row in ``df``.
+
+        :param df: The :class:`DataFrame <polars:polars.DataFrame>` or
+          :class:`LazyFrame <polars:polars.LazyFrame>` from which data should be loaded.
+        :type df: :class:`DataFrame <polars:polars.DataFrame>` or
+          :class:`LazyFrame <polars:polars.LazyFrame>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be
+            *overwritten*. The ``data`` value will be created from ``df`` instead.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param series_index: If supplied, return the series that Highcharts for Python
+          generated from ``df`` at the ``series_index`` value. Defaults to
+          :obj:`None <python:None>`, which returns all series generated from ``df``.
+
+        :type series_index: :class:`int <python:int>`, slice, or
+          :obj:`None <python:None>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance and the data points it contains.
+
+        :returns: Collection of :term:`series` instances corresponding, with one series
+          per row in ``df``, and where:
+
+            * the series x-values are populated from the column labels in ``df`` (other
+              than the first column, if it contains strings)
+            * the series name is set to the value of the first column in ``df``, if it
+              contains strings
+            * the series y-values are populated from the values within that row in ``df``
+
+        :rtype: :class:`list <python:list>` of
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`-descendent
+          instances
+
+        :raises HighchartsDependencyError: if `Polars <https://pola.rs/>`__ or NumPy are
+          not available in the runtime environment
+        """
+        df = cls._get_polars_frame(df)
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in your runtime '
+                                                   'environment. Please make sure it is '
+                                                   'installed in your runtime '
+                                                   'environment.')
+
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        collection_cls = cls._data_collection_class()
+        supported_dimensions = collection_cls._get_supported_dimensions()
+        if 2 not in supported_dimensions:
+            raise errors.HighchartsPolarsDeserializationError(
+                f'Unable to create a collection of {cls.__name__} instances '
+                f'from df using a 2-dimensional array because {cls.__name__} does '
+                f'not support 2-dimensional arrays as inputs. Please use a '
+                f'different series type, or transpose df to a columnar structure '
+                f'and supply a property_map for greater precision.'
+            )
+        data_properties = collection_cls._get_props_from_array()
+
+        columns = df.columns
+        name_values = None
+        if columns and not df.schema[columns[0]].is_numeric():
+            name_values = df.get_column(columns[0]).to_list()
+            columns = columns[1:]
+
+        x_values = np.asarray(columns, dtype = object)
+        y_rows = df.select(columns).to_numpy()
+
+        series_list = []
+        for row in range(len(df)):
+            as_array = np.column_stack((x_values, y_rows[row]))
+            collection = collection_cls.from_array(as_array)
+            series_instance_kwargs = series_kwargs.copy()
+            series_instance_kwargs['data'] = collection
+            if name_values is not None:
+                series_instance_kwargs['name'] = name_values[row]
+            series_instance = cls(**series_instance_kwargs)
+            for key in kwargs:
+                if key not in series_instance_kwargs and key not in data_properties:
+                    setattr(series_instance, key, kwargs[key])
+
+            series_list.append(series_instance)
+
+        if series_index is not None:
+            return series_list[series_index]
+
+        return series_list
+
+    @classmethod
+    def from_polars(cls,
+                    df,
+                    property_map = None,
+                    series_kwargs = None,
+                    series_in_rows = False,
+                    series_index = None,
+                    **kwargs):
+        """Create one or more :term:`series` instances whose
+        :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` properties
+        are populated from a `Polars <https://pola.rs/>`__
+        :class:`DataFrame <polars:polars.DataFrame>` or
+        :class:`LazyFrame <polars:polars.LazyFrame>`.
+
+        Columns are converted to :class:`numpy.ndarray <numpy:numpy.ndarray>` values
+        without copying their memory wherever their types allow, and a
+        :class:`LazyFrame <polars:polars.LazyFrame>` is collected with only the columns
+        that are needed.
+
+          .. code-block:: python
+
+            # Given a Polars DataFrame or LazyFrame instance named "df"
+            from highcharts_core.options.series.area import LineSeries
+
+            ## EXAMPLE 1. Minimum code required. Creates one or more series.
+
+            my_series = LineSeries.from_polars(df)
+
+            ## EXAMPLE 2. More precise configuration. Creates ONE series.
+
+            my_series = LineSeries.from_polars(df,
+                                               property_map = {
+                                                  'x': 'date',
+                                                  'y': 'value',
+                                                  'id': 'id'
+                                               })
+
+            ## EXAMPLE 3. More precise configuration. Creates THREE series.
+
+            my_series = LineSeries.from_polars(df,
+                                               property_map = {
+                                                  'x': 'date',
+                                                  'y': ['value1', 'value2', 'value3'],
+                                                  'id': 'id'
+                                               })
+
+        :param df: The :class:`DataFrame <polars:polars.DataFrame>` or
+          :class:`LazyFrame <polars:polars.LazyFrame>` from which data should be loaded.
+        :type df: :class:`DataFrame <polars:polars.DataFrame>` or
+          :class:`LazyFrame <polars:polars.LazyFrame>`
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column in ``df``. The keys in the
+          :class:`dict <python:dict>` should correspond to properties in the data point
+          class, while the value should indicate the label for the column. Defaults to
+          :obj:`None <python:None>`.
+
+            .. note::
+
+              If any of the values in ``property_map`` contain an iterable, then
+              one series will be produced for each item in the iterable.
+
+            .. note::
+
+              If :obj:`None <python:None>`, the first column of ``df`` is used for the
+              first data point property (e.g. ``'x'``). If the remaining columns do not
+              align exactly to the data point's properties, each of them is used to
+              populate the ``'y'`` values of a separate series.
+
+        :type property_map: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+            The ``data`` value will be created from ``df`` instead.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param series_in_rows: if ``True``, will attempt a streamlined cartesian series
+          with x-values taken from column names, y-values taken from row values, and
+          the series name taken from the first column (if it contains strings).
+          Defaults to :obj:`False <python:False>`.
+        :type series_in_rows: :class:`bool <python:bool>`
+
+        :param series_index: If supplied, return the series that Highcharts for Python
+          generated from ``df`` at the ``series_index`` value. Defaults to
+          :obj:`None <python:None>`, which returns all series generated from ``df``.
+
+        :type series_index: :class:`int <python:int>`, slice, or
+          :obj:`None <python:None>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance and the data points it contains.
+
+        :returns: A :term:`series` instance (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) OR
+          :class:`list <python:list>` of series instances with its
+          :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
+          populated from the data in ``df``.
+        :rtype: :class:`list <python:list>` of series instances (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) or
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`-descendent
+
+        :raises HighchartsPolarsDeserializationError: if ``property_map`` references
+          a column that does not exist in the data frame
+        :raises HighchartsDependencyError: if `Polars <https://pola.rs/>`__ or NumPy are
+          not available in the runtime environment
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        # SCENARIO 0: Series in Rows
+        if series_in_rows:
+            return cls.from_polars_in_rows(df,
+                                           series_kwargs,
+                                           series_index = series_index,
+                                           **kwargs)
+
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in your runtime '
+                                                   'environment. Please make sure it is '
+                                                   'installed in your runtime '
+                                                   'environment.')
+
+        data_point_cls = cls._data_point_class()
+        props_from_array = data_point_cls._get_props_from_array()
+        if not props_from_array:
+            props_from_array = ['x', 'y']
+
+        # SCENARIO 2: Properties in KWARGS
+        if not property_map:
+            property_map = {}
+            for prop in props_from_array:
+                if prop in kwargs:
+                    property_map[prop] = kwargs.pop(prop)
+
+        # SCENARIO 1: Has Property Map
+        if property_map:
+            property_map = validators.dict(property_map)
+            df = cls._get_polars_frame(df,
+                                       cls._get_property_map_columns(property_map))
+
+        # SCENARIO 3: No Explicit Properties
+        else:
+            df = cls._get_polars_frame(df)
+            columns = df.columns
+            column_count = len(columns)
+            supported_dimensions = cls._data_collection_class()._get_supported_dimensions()
+            for length in [column_count, 2]:
+                if length not in supported_dimensions or length > column_count:
+                    continue
+                try:
+                    props_from_array = data_point_cls._get_props_from_array(
+                        length = length
+                    )
+                except KeyError:
+                    continue
+                if not props_from_array:
+                    props_from_array = ['x', 'y']
+                if 'name' in props_from_array:
+                    continue
+                if length == column_count:
+                    property_map = dict(zip(props_from_array, columns))
+                else:
+                    property_map = {props_from_array[0]: columns[0],
+                                    props_from_array[1]: columns[1:]}
+                break
+
+            if not property_map:
+                raise errors.HighchartsPolarsDeserializationError(
+                    f'Could not determine how to deserialize data frame with '
+                    f'{column_count} columns into a {cls.__name__} instance. Please '
+                    f'supply more precise instructions using property_map or by '
+                    f'explicitly specificying data property kwargs.'
+                )
+
+        series_list = cls._from_columns_multi_map(
+            property_map,
+            df.columns,
+            lambda x: utility_functions.polars_to_ndarray(df.get_column(x)),
+            series_kwargs = series_kwargs,
+            error_cls = errors.HighchartsPolarsDeserializationError,
+            **kwargs
+        )
+
+        if len(series_list) == 1:
+            return series_list[0]
+
+        if series_index is not None:
+            return series_list[series_index]
+
+        return series_list
+
+    @classmethod
+    def from_sql(cls,
+                 cursor_or_connection,
+                 query,
+                 property_map,
+                 parameters = None,
+                 batch_size = 10000,
+                 split_by = None,
+                 series_kwargs = None,
+                 series_index = None,
+                 **kwargs):
+        """Create one or more :term:`series` instances whose
+        :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` properties
+        are populated from the results of a SQL query executed using a
+        :pep:`DB-API 2.0 <249>` connection or cursor (e.g. :mod:`sqlite3 <python:sqlite3>`,
+        ``psycopg``, ``pyodbc``, etc.).
+
+        Results are retrieved in batches of ``batch_size`` rows using the cursor's
+        ``fetchmany()`` method, and each batch is converted immediately into typed
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` columns (see
+        :func:`values_to_ndarray() <highcharts_core.utility_functions.values_to_ndarray>`)
+        so that the full result set is never held in memory as Python tuples. Only the
+        columns referenced in ``property_map`` (and ``split_by``) are retained.
+
+          .. code-block:: python
+
+            import sqlite3
+            from highcharts_core.options.series.area import LineSeries
+
+            connection = sqlite3.connect('my-database.db')
+
+            ## EXAMPLE 1. Creates ONE series.
+
+            my_series = LineSeries.from_sql(connection,
+                                            'SELECT timestamp, value FROM readings',
+                                            property_map = {
+                                                'x': 'timestamp',
+                                                'y': 'value'
+                                            })
+
+            ## EXAMPLE 2. Creates ONE series per sensor.
+
+            my_series = LineSeries.from_sql(connection,
+                                            'SELECT sensor, timestamp, value '
+                                            'FROM readings WHERE timestamp > ?',
+                                            property_map = {
+                                                'x': 'timestamp',
+                                                'y': 'value'
+                                            },
+                                            parameters = ('2023-01-01', ),
+                                            split_by = 'sensor')
+
+        :param cursor_or_connection: The :pep:`DB-API 2.0 <249>` cursor or connection
+          to use to execute ``query``. If a connection is supplied, a new cursor will be
+          created (and closed once the results have been retrieved).
+        :type cursor_or_connection: DB-API 2.0 ``Cursor`` or ``Connection``
+
+        :param query: The SQL query to execute.
+        :type query: :class:`str <python:str>`
+
+        :param property_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which column in the query's results. The
+          keys in the :class:`dict <python:dict>` should correspond to properties in the
+          data point class, while the value should indicate the name of the column.
+
+            .. note::
+
+              If any of the values in ``property_map`` contain an iterable, then
+              one series will be produced for each item in the iterable.
+
+        :type property_map: :class:`dict <python:dict>`
+
+        :param parameters: Optional parameters to bind to ``query`` when executing it.
+          Defaults to :obj:`None <python:None>`.
+        :type parameters: :class:`tuple <python:tuple>`,
+          :class:`dict <python:dict>`, or :obj:`None <python:None>`
+
+        :param batch_size: The number of rows to retrieve from the cursor at a time.
+          Defaults to ``10000``.
+        :type batch_size: :class:`int <python:int>`
+
+        :param split_by: If supplied, the name of a column whose distinct values should
+          each produce a separate series (named for the value), in the order in which the
+          values first appear in the results. Defaults to :obj:`None <python:None>`.
+        :type split_by: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+            The ``data`` value will be created from the query's results instead.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param series_index: If supplied, return the series that Highcharts for Python
+          generated from the query's results at the ``series_index`` value. Defaults to
+          :obj:`None <python:None>`, which returns all series generated.
+        :type series_index: :class:`int <python:int>`, slice, or
+          :obj:`None <python:None>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance(s).
+
+        :returns: A :term:`series` instance (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) OR
+          :class:`list <python:list>` of series instances with its
+          :meth:`.data <highcharts_core.options.series.base.SeriesBase.data>` property
+          populated from the query's results.
+        :rtype: :class:`list <python:list>` of series instances (descended from
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`) or
+          :class:`SeriesBase <highcharts_core.options.series.base.SeriesBase>`-descendent
+
+        :raises HighchartsSQLDeserializationError: if ``property_map`` or ``split_by``
+          reference a column that does not exist in the query's results
+        :raises HighchartsValueError: if ``cursor_or_connection`` is not a DB-API 2.0
+          cursor or connection
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in your runtime '
+                                                   'environment. Please make sure it is '
+                                                   'installed in your runtime '
+                                                   'environment.')
+
+        query = validators.string(query)
+        batch_size = validators.integer(batch_size, minimum = 1)
+        split_by = validators.string(split_by, allow_empty = True)
+
+        if hasattr(cursor_or_connection, 'fetchmany'):
+            cursor = cursor_or_connection
+            close_cursor = False
+        elif hasattr(cursor_or_connection, 'cursor'):
+            cursor = cursor_or_connection.cursor()
+            close_cursor = True
+        else:
+            raise errors.HighchartsValueError(f'cursor_or_connection is expected to be a '
+                                              f'DB-API cursor or connection. Was: '
+                                              f'{cursor_or_connection.__class__.__name__}')
+
+        try:
+            if parameters is not None:
+                cursor.execute(query, parameters)
+            else:
+                cursor.execute(query)
+
+            if not cursor.description:
+                raise errors.HighchartsSQLDeserializationError('query did not return '
+                                                               'any columns')
+            column_names = [x[0] for x in cursor.description]
+
+            required_columns = cls._get_property_map_columns(property_map)
+            if split_by and split_by not in required_columns:
+                required_columns.append(split_by)
+            for column in required_columns:
+                if column not in column_names:
+                    raise errors.HighchartsSQLDeserializationError(
+                        f'Unable to find a column labeled "{column}".'
+                    )
+            positions = {x: column_names.index(x) for x in required_columns}
+
+            parts = {x: [] for x in required_columns}
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for column in required_columns:
+                    position = positions[column]
+                    parts[column].append(
+                        utility_functions.values_to_ndarray([x[position] for x in rows])
+                    )
+                del rows
+        finally:
+            if close_cursor:
+                cursor.close()
+
+        columns = {}
+        for column in required_columns:
+            columns[column] = utility_functions.concatenate_ndarrays(parts[column])
+            parts[column] = None
+
+        groups = None
+        if split_by:
+            groups = utility_functions.get_group_slices(columns[split_by])
+
+        series_list = cls._from_columns_multi_map(
+            property_map,
+            required_columns,
+            columns.pop,
+            series_kwargs = series_kwargs,
+            error_cls = errors.HighchartsSQLDeserializationError,
+            groups = groups,
+            **kwargs
+        )
+
+        if len(series_list) == 1:
+            return series_list[0]
+
+        if series_index is not None:
+            return series_list[series_index]
+
+        return series_list
+
+    def downsample(self, n_points, method = 'lttb', prop = 'y'):
+        """Reduce the series' data to (approximately) ``n_points`` data points, selected
+        so as to preserve the visual shape of the series when plotted.
+
+        The first and last data points are always retained, as are gaps in the series.
+
+        .. note::
+
+          This method modifies the series *in place* and returns
+          :obj:`None <python:None>`, whereas
+          :meth:`.simplify() <highcharts_core.options.series.base.SeriesBase.simplify>`
+          leaves the series unchanged and returns a new series. To downsample a copy,
+          call ``series.copy()`` first.
+
+        .. seealso::
+
+          * :meth:`DataPointCollection.downsample() <highcharts_core.options.series.data.collections.DataPointCollection.downsample>`
+
+        :param n_points: The (target) number of data points to retain.
+        :type n_points: :class:`int <python:int>`
+
+        :param method: The algorithm to apply. Accepts ``'lttb'``
+          (Largest-Triangle-Three-Buckets), ``'minmax'``, or ``'m4'``. Defaults to
+          ``'lttb'``.
+        :type method: :class:`str <python:str>`
+
+        :param prop: The data point property whose values determine which data points
+          to retain. Defaults to ``'y'``.
+        :type prop: :class:`str <python:str>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          installed
+        :raises HighchartsValueError: if the series' data has no values for ``prop``
+        """
+        if not self.data:
+            return
+
+        if checkers.is_type(self.data, 'DataPointCollection'):
+            self.data = self.data.downsample(n_points, method = method, prop = prop)
+        else:
+            collection = self._data_collection_class()(data_points = self.data)
+            downsampled = collection.downsample(n_points, method = method, prop = prop)
+            self.data = downsampled.data_points
+
+    def simplify(self, tolerance, method = 'rdp', preserve_topology = True):
+        """Return a copy of the series whose data retains only those data points needed
+        to preserve the shape of its line (or polygon) within ``tolerance``.
+
+        Unlike :meth:`.downsample() <highcharts_core.options.series.base.SeriesBase.downsample>`,
+        which targets a number of data points, simplification targets a maximum
+        deviation from the original shape, which makes it well-suited to outlines and
+        other geometries with many (often redundant) vertices.
+
+        The first and last data points are always retained, as are gaps in the series.
+
+        .. note::
+
+          This method leaves the series unchanged and returns a new series, whereas
+          :meth:`.downsample() <highcharts_core.options.series.base.SeriesBase.downsample>`
+          modifies the series *in place*. To simplify the series in place, assign the
+          result's data back to it (``series.data = series.simplify(...).data``).
+
+        .. seealso::
+
+          * :meth:`DataPointCollection.simplify() <highcharts_core.options.series.data.collections.DataPointCollection.simplify>`
+
+        :param tolerance: For ``'rdp'``, the maximum distance (in data units) between a
+          discarded data point and the simplified line. For ``'visvalingam'``, the
+          minimum (effective) area of the triangle formed by a retained data point and
+          its neighbours.
+        :type tolerance: numeric
+
+        :param method: The algorithm to apply. Accepts ``'rdp'``
+          (Ramer-Douglas-Peucker) or ``'visvalingam'`` (Visvalingam-Whyatt). Defaults to
+          ``'rdp'``.
+        :type method: :class:`str <python:str>`
+
+        :param preserve_topology: If ``True``, closed rings retain at least three
+          distinct vertices, so that polygons do not collapse into lines. Defaults to
+          ``True``.
+        :type preserve_topology: :class:`bool <python:bool>`
+
+        :returns: A new series containing the simplified data.
+        :rtype: :class:`SeriesBase`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          installed
+        :raises HighchartsValueError: if the series' data has no ``y`` values
+        """
+        data = self._data
+        self._data = None
+        try:
+            series = self.copy()
+        finally:
+            self._data = data
+
+        if not data:
+            return series
+
+        if checkers.is_type(data, 'DataPointCollection'):
+            series.data = data.simplify(tolerance,
+                                        method = method,
+                                        preserve_topology = preserve_topology)
+        else:
+            collection = self._data_collection_class()(data_points = data)
+            simplified = collection.simplify(tolerance,
+                                             method = method,
+                                             preserve_topology = preserve_topology)
+            series.data = simplified.data_points
+
+        return series
+
+    def group_by_time(self,
+                      unit,
+                      multiple = 1,
+                      approximation = 'average',
+                      prop = 'y',
+                      use_point_interval = False):
+        """Aggregate the series' data into regular time intervals, based on the data
+        points' ``x`` values.
+
+        .. seealso::
+
+          * :meth:`DataPointCollection.group_by_time() <highcharts_core.options.series.data.collections.DataPointCollection.group_by_time>`
+
+        :param unit: The unit of time of each interval. Accepts ``'millisecond'``,
+          ``'second'``, ``'minute'``, ``'hour'``, ``'day'``, ``'week'``, ``'month'``, or
+          ``'year'``.
+        :type unit: :class:`str <python:str>`
+
+        :param multiple: The number of ``unit`` in each interval. Defaults to ``1``.
+        :type multiple: :class:`int <python:int>`
+
+        :param approximation: How the values in each interval are aggregated. Accepts
+          ``'average'``, ``'sum'``, ``'high'``, ``'low'``, ``'open'``, ``'close'``,
+          ``'range'``, or ``'ohlc'``. Defaults to ``'average'``.
+        :type approximation: :class:`str <python:str>`
+
+        :param prop: The data point property whose values are aggregated. Defaults to
+          ``'y'``.
+        :type prop: :class:`str <python:str>`
+
+        :param use_point_interval: If ``True``, the data points will not contain ``x``
+          values. Instead, an (empty) data point is included for every interval, and the
+          series' :meth:`.point_start <highcharts_core.options.series.base.SeriesBase.point_start>`,
+          :meth:`.point_interval <highcharts_core.options.series.base.SeriesBase.point_interval>`,
+          and :meth:`.point_interval_unit <highcharts_core.options.series.base.SeriesBase.point_interval_unit>`
+          are set instead, which reduces the size of the serialized series. Defaults to
+          ``False``.
+        :type use_point_interval: :class:`bool <python:bool>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          installed
+        :raises HighchartsValueError: if the series' data has no ``x`` or ``prop``
+          values, or if the series type does not support ``use_point_interval``
+        """
+        if not self.data:
+            return
+
+        if use_point_interval and not hasattr(self, 'point_interval'):
+            raise errors.HighchartsValueError(f'{self.__class__.__name__} does not '
+                                              f'support point_interval')
+
+        if checkers.is_type(self.data, 'DataPointCollection'):
+            collection = self.data
+        else:
+            collection = self._data_collection_class()(data_points = self.data)
+
+        grouped = collection.group_by_time(unit,
+                                           multiple = multiple,
+                                           approximation = approximation,
+                                           prop = prop,
+                                           fill_gaps = use_point_interval)
+
+        if use_point_interval and len(grouped):
+            interval_starts = grouped.ndarray['x']
+            columns = {key: value for key, value in grouped.ndarray.items()
+                       if key != 'x'}
+            grouped = grouped.from_columns(columns)
+
+            unit = validators.string(unit).lower()
+            self.point_start = int(interval_starts[0])
+            if unit in ['month', 'year']:
+                self.point_interval = multiple
+                self.point_interval_unit = unit
+            else:
+                self.point_interval = constants.TIME_UNITS_IN_MS[unit] * multiple
+                self.point_interval_unit = None
+
+        self.data = grouped
+
+    def infer_point_interval(self, rtol = 1e-9) -> bool:
+        """If the ``x`` values of the series' data points are evenly spaced, remove them
+        from the data points and instead set the series'
+        :meth:`.point_start <highcharts_core.options.series.base.SeriesBase.point_start>`
+        and :meth:`.point_interval <highcharts_core.options.series.base.SeriesBase.point_interval>`,
+        so that the series' data is serialized as a primitive array of ``y`` values.
+
+        This roughly halves the size of the serialized series (and the time the browser
+        needs to parse it) for regular time series.
+
+        .. note::
+
+          If the ``x`` values cannot be safely removed (e.g. because they are irregularly
+          spaced), the series is left unchanged.
+
+        .. seealso::
+
+          * :meth:`DataPointCollection.split_point_interval() <highcharts_core.options.series.data.collections.DataPointCollection.split_point_interval>`
+
+        :param rtol: The relative tolerance (as a proportion of the interval) within
+          which the difference between two consecutive ``x`` values is considered equal
+          to the interval. Defaults to ``1e-9``.
+        :type rtol: numeric
+
+        :returns: ``True`` if the ``x`` values were removed, ``False`` if the series was
+          left unchanged.
+        :rtype: :class:`bool <python:bool>`
+        """
+        if not self.data or not hasattr(self, 'point_interval'):
+            return False
+
+        if checkers.is_type(self.data, 'DataPointCollection'):
+            collection = self.data
+        else:
+            collection = self._data_collection_class()(data_points = self.data)
+
+        result = collection.split_point_interval(rtol = rtol)
+        if result is None:
+            return False
+
+        point_start, point_interval, collection = result
+        self.point_start = point_start
+        self.point_interval = point_interval
+        self.point_interval_unit = None
+        self.data = collection
+
+        return True
+
+    def to_chart(self, chart_kwargs = None, options_kwargs = None):
+        """Create a :class:`Chart <highcharts_core.chart.Chart>` instance containing the
+        series instance.
+        
+        :param chart_kwargs: Optional keyword arguments to use when constructing the 
+          :class:`Chart <highcharts_core.chart.Chart>` instance. Defaults to
+          :obj:`None <python:None>`.
+        :type chart_kwargs: :class:`dict <python:dict>`
+        
+        :param options_kwargs: Optional keyword arguments to use when constructing the
+          chart's :class:`HighchartsOptions <highcharts_core.options.HighchartsOptions>`
+          object. Defaults to :obj:`None <python:None>`.
+          
+          .. warning:: 
+          
+            If your ``chart_kwargs`` contains an ``options`` key, its value
+            will be overwritten if you supply ``options_kwargs``.
+
+        :type options_kwargs: :class:`dict <python:dict>`
         
         :returns: A :class:`Chart <highcharts_core.chart.Chart>` instance containing the
           series instance.
@@ -2520,4 +4909,213 @@ class SeriesBase(SeriesOptions):
                                                          f'{self.__class__.__name__} instance '
                                                          f'to {series_type_name}')
         
-        return target
\ No newline at end of file
+        return target
+
+
+class HierarchicalSeriesMixin(object):
+    """Mixin which provides the
+    :meth:`from_paths() <HierarchicalSeriesMixin.from_paths>` constructor to series
+    whose data points form a hierarchy (e.g. treemaps and sunbursts)."""
+
+    @classmethod
+    def from_paths(cls,
+                   data,
+                   levels,
+                   value = None,
+                   min_value = None,
+                   other_label = 'Other',
+                   separator = '/',
+                   series_kwargs = None,
+                   **kwargs):
+        """Create a series whose (hierarchical) data points are built from a flat table
+        of paths, e.g. one row per city with ``region``, ``country``, and ``city``
+        columns.
+
+        One data point is produced for each node in the hierarchy, with stable ids
+        derived from each node's path (e.g. ``'Europe/France/Paris'``), and with parent
+        values rolled up from their descendants in vectorized form (see
+        :func:`rollup_paths() <highcharts_core.utility_functions.rollup_paths>`).
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.treemap import TreemapSeries
+
+            my_series = TreemapSeries.from_paths(df,
+                                                 levels = ['region', 'country', 'city'],
+                                                 value = 'population',
+                                                 min_value = 1e6)
+
+        :param data: The table containing the paths, e.g. a
+          :class:`pandas.DataFrame <pandas:pandas.DataFrame>`, a
+          :class:`polars.DataFrame <polars:polars.DataFrame>`, a
+          :class:`pyarrow.Table <pyarrow:pyarrow.Table>`, or a
+          :class:`dict <python:dict>` of arrays. If :obj:`None <python:None>`, then
+          ``levels`` (and ``value``) are expected to contain the arrays themselves.
+        :type data: table-like, :class:`dict <python:dict>`, or
+          :obj:`None <python:None>`
+
+        :param levels: The columns containing the labels at each level of the hierarchy,
+          from the root down.
+        :type levels: :class:`list <python:list>` of :class:`str <python:str>` or of
+          Array-like
+
+        :param value: The column containing the value of each row. If
+          :obj:`None <python:None>`, each row has a value of ``1``. Defaults to
+          :obj:`None <python:None>`.
+        :type value: :class:`str <python:str>`, Array-like, or :obj:`None <python:None>`
+
+        :param min_value: If supplied, nodes whose value is below ``min_value`` are
+          combined (under their parent) into a single node labeled ``other_label``, and
+          their descendants are not emitted. Defaults to :obj:`None <python:None>`.
+        :type min_value: numeric or :obj:`None <python:None>`
+
+        :param other_label: The label to apply to nodes that combine pruned siblings.
+          Defaults to ``'Other'``.
+        :type other_label: :class:`str <python:str>`
+
+        :param separator: The string used to join labels into node ids. Defaults to
+          ``'/'``.
+        :type separator: :class:`str <python:str>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :returns: An instance of the series class on which the method was called.
+        :rtype: :class:`SeriesBase` descendant
+
+        :raises HighchartsValueError: if ``levels`` is empty, references a column that
+          does not exist in ``data``, or if the columns have different lengths
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        levels = [x for x in validators.iterable(levels, forbid_literals = (str, bytes))]
+
+        def get_column(column):
+            if data is None or not isinstance(column, (str, int)):
+                return column
+            try:
+                return data[column]
+            except (KeyError, IndexError, TypeError, ValueError):
+                raise errors.HighchartsValueError(f'Unable to find a column labeled '
+                                                  f'"{column}".')
+
+        columns = utility_functions.rollup_paths([get_column(x) for x in levels],
+                                                 values = get_column(value),
+                                                 min_value = min_value,
+                                                 other_label = other_label,
+                                                 separator = separator)
+
+        series_kwargs = series_kwargs.copy()
+        series_kwargs['data'] = cls._data_collection_class().from_columns(columns)
+        series_instance = cls(**series_kwargs)
+        for key in kwargs:
+            if key not in series_kwargs:
+                setattr(series_instance, key, kwargs[key])
+
+        return series_instance
+
+
+class ConnectionSeriesMixin(object):
+    """Mixin which provides the
+    :meth:`from_edges() <ConnectionSeriesMixin.from_edges>` constructor to series
+    whose data points are weighted links between nodes (e.g. dependency wheels, sankey
+    diagrams, and arc diagrams)."""
+
+    @classmethod
+    def from_edges(cls,
+                   sources,
+                   targets,
+                   weights = None,
+                   min_weight = None,
+                   top_n_nodes = None,
+                   other_label = 'Other',
+                   series_kwargs = None,
+                   **kwargs):
+        """Create a series whose links are aggregated from a (potentially very long)
+        list of edges, e.g. a raw event log of user flows.
+
+        Duplicate edges are summed into a single link, rare nodes may be collapsed into a
+        single ``other_label`` node, and the resulting data collection is populated in
+        columnar form (see :func:`aggregate_edges()
+        <highcharts_core.utility_functions.aggregate_edges>`).
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.dependencywheel import DependencyWheelSeries
+
+            my_series = DependencyWheelSeries.from_edges(df['from_page'],
+                                                         df['to_page'],
+                                                         top_n_nodes = 20)
+
+        :param sources: The node that each edge runs from.
+        :type sources: Array-like
+
+        :param targets: The node that each edge runs to.
+        :type targets: Array-like
+
+        :param weights: The weight of each edge. If :obj:`None <python:None>`, each edge
+          has a weight of ``1``. Defaults to :obj:`None <python:None>`.
+        :type weights: Array-like or :obj:`None <python:None>`
+
+        :param min_weight: If supplied, aggregated links whose weight is below
+          ``min_weight`` are dropped. Defaults to :obj:`None <python:None>`.
+        :type min_weight: numeric or :obj:`None <python:None>`
+
+        :param top_n_nodes: If supplied, only the ``top_n_nodes`` nodes with the greatest
+          total weight are kept, and all other nodes are collapsed into a single node
+          labeled ``other_label``. Defaults to :obj:`None <python:None>`.
+        :type top_n_nodes: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param other_label: The label to apply to the node that combines collapsed
+          nodes. Defaults to ``'Other'``.
+        :type other_label: :class:`str <python:str>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :returns: An instance of the series class on which the method was called.
+        :rtype: :class:`SeriesBase` descendant
+
+        :raises HighchartsValueError: if ``sources``, ``targets``, and ``weights`` have
+          different lengths
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        columns = utility_functions.aggregate_edges(sources,
+                                                    targets,
+                                                    weights = weights,
+                                                    min_weight = min_weight,
+                                                    top_n_nodes = top_n_nodes,
+                                                    other_label = other_label)
+
+        series_kwargs = series_kwargs.copy()
+        series_kwargs['data'] = cls._data_collection_class().from_columns(columns)
+        series_instance = cls(**series_kwargs)
+        for key in kwargs:
+            if key not in series_kwargs:
+                setattr(series_instance, key, kwargs[key])
+
+        return series_instance
@@ -2,10 +2,17 @@ from typing import Optional
 
 from validator_collection import validators
 
-from highcharts_core.options.series.area import AreaSeries
+from highcharts_core import errors, utility_functions
+from highcharts_core.options.series.area import AreaSeries, AreaSplineSeries
 from highcharts_core.options.plot_options.bellcurve import BellCurveOptions
 from highcharts_core.utility_functions import mro__to_untrimmed_dict
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 class BellCurveSeries(AreaSeries, BellCurveOptions):
     """Options to configure a Bell Curve series.
@@ -69,6 +76,185 @@ class BellCurveSeries(AreaSeries, BellCurveOptions):
 
             self._base_series = value
 
+    @classmethod
+    def from_stats(cls,
+                   mean,
+                   std,
+                   n = None,
+                   intervals = 3,
+                   n_points = 100,
+                   bin_width = None,
+                   series_kwargs = None,
+                   **kwargs):
+        """Create an :class:`AreaSplineSeries <highcharts_core.options.series.area.AreaSplineSeries>`
+        which renders the normal distribution described by ``mean`` and ``std``, with the
+        curve computed in Python.
+
+        Because a Bell Curve series is derived in the browser from the raw samples of
+        its :meth:`base_series <BellCurveSeries.base_series>`, every sample would
+        otherwise have to be serialized. This method instead returns a series
+        containing only the ``n_points`` points of the (precomputed) curve.
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.bellcurve import BellCurveSeries
+
+            my_series = BellCurveSeries.from_stats(mean = 120.5, std = 14.2)
+
+        :param mean: The mean of the distribution.
+        :type mean: numeric
+
+        :param std: The standard deviation of the distribution.
+        :type std: numeric
+
+        :param n: If supplied, the number of samples in the distribution. The curve is
+          then scaled from a probability density to the expected number of samples per
+          unit of ``x`` (or per bin, if ``bin_width`` is supplied), so that it can be
+          overlaid on a histogram of the samples. Defaults to
+          :obj:`None <python:None>`.
+        :type n: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param intervals: The number of standard deviations either side of the mean that
+          the curve should cover. Defaults to ``3``.
+        :type intervals: numeric
+
+        :param n_points: The number of points to plot along the curve. Defaults to
+          ``100``.
+        :type n_points: :class:`int <python:int>`
+
+        :param bin_width: The width of the histogram bins that the curve will be overlaid
+          on. Only applies if ``n`` is supplied. Defaults to :obj:`None <python:None>`.
+        :type bin_width: numeric or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :rtype: :class:`AreaSplineSeries <highcharts_core.options.series.area.AreaSplineSeries>`
+
+        :raises HighchartsValueError: if ``std`` is not a positive number
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in your runtime '
+                                                   'environment. Please make sure it is '
+                                                   'installed in your runtime '
+                                                   'environment.')
+
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        mean = validators.numeric(mean)
+        try:
+            std = validators.numeric(std, minimum = 0)
+        except (ValueError, TypeError):
+            std = None
+        if not std or not np.isfinite(std):
+            raise errors.HighchartsValueError(f'std must be a positive number. '
+                                              f'Received: {std}')
+        n = validators.integer(n, allow_empty = True, minimum = 0)
+        intervals = validators.numeric(intervals, minimum = 0)
+        n_points = validators.integer(n_points, minimum = 2)
+        bin_width = validators.numeric(bin_width, allow_empty = True, minimum = 0)
+
+        x = np.linspace(mean - intervals * std, mean + intervals * std, n_points)
+        y = np.exp(-0.5 * np.square((x - mean) / std)) / (std * np.sqrt(2 * np.pi))
+        if n is not None:
+            y *= n * (bin_width or 1)
+
+        series_kwargs = series_kwargs.copy()
+        series_kwargs['data'] = AreaSplineSeries._data_collection_class().from_columns({
+            'x': x,
+            'y': y
+        })
+
+        series_instance = AreaSplineSeries(**series_kwargs)
+        for key in kwargs:
+            if key not in series_kwargs:
+                setattr(series_instance, key, kwargs[key])
+
+        return series_instance
+
+    @classmethod
+    def from_samples(cls,
+                     values,
+                     intervals = 3,
+                     n_points = 100,
+                     scale_to_count = False,
+                     bin_width = None,
+                     series_kwargs = None,
+                     **kwargs):
+        """Create an :class:`AreaSplineSeries <highcharts_core.options.series.area.AreaSplineSeries>`
+        which renders the normal distribution fitted to ``values``, with the mean and
+        standard deviation computed in Python.
+
+        The statistics are computed in a single, numerically stable streaming pass (see
+        :func:`compute_mean_std() <highcharts_core.utility_functions.compute_mean_std>`),
+        so ``values`` may be an iterable of array chunks that is too large to hold in
+        memory. Only the points of the curve are serialized.
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.bellcurve import BellCurveSeries
+
+            my_series = BellCurveSeries.from_samples(measurements, n_points = 200)
+
+        :param values: The samples to fit the curve to. Non-finite values are ignored.
+        :type values: Array-like, or iterable of array-likes
+
+        :param intervals: The number of standard deviations either side of the mean that
+          the curve should cover. Defaults to ``3``.
+        :type intervals: numeric
+
+        :param n_points: The number of points to plot along the curve. Defaults to
+          ``100``.
+        :type n_points: :class:`int <python:int>`
+
+        :param scale_to_count: If ``True``, scale the curve from a probability density
+          to the expected number of samples per unit of ``x`` (or per bin, if
+          ``bin_width`` is supplied). Defaults to :obj:`False <python:False>`.
+        :type scale_to_count: :class:`bool <python:bool>`
+
+        :param bin_width: The width of the histogram bins that the curve will be overlaid
+          on. Only applies if ``scale_to_count`` is ``True``. Defaults to
+          :obj:`None <python:None>`.
+        :type bin_width: numeric or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :rtype: :class:`AreaSplineSeries <highcharts_core.options.series.area.AreaSplineSeries>`
+
+        :raises HighchartsValueError: if ``values`` contains fewer than two distinct
+          finite values
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        count, mean, std = utility_functions.compute_mean_std(values)
+
+        return cls.from_stats(mean,
+                              std,
+                              n = count if scale_to_count else None,
+                              intervals = intervals,
+                              n_points = n_points,
+                              bin_width = bin_width,
+                              series_kwargs = series_kwargs,
+                              **kwargs)
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         kwargs = {
@@ -1,11 +1,21 @@
 from typing import Optional, List
 
+from validator_collection import validators
+
+from highcharts_core import errors, utility_functions
 from highcharts_core.options.series.bar import BarSeries
+from highcharts_core.options.series.scatter import ScatterSeries
 from highcharts_core.options.series.data.boxplot import BoxPlotData, BoxPlotDataCollection
 from highcharts_core.options.series.data.range import RangeData, RangeDataCollection
 from highcharts_core.options.plot_options.boxplot import BoxPlotOptions
 from highcharts_core.utility_functions import mro__to_untrimmed_dict, is_ndarray
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 class BoxPlotSeries(BarSeries, BoxPlotOptions):
     """Options to configure a Box Plot series.
@@ -255,6 +265,229 @@ class BoxPlotSeries(BarSeries, BoxPlotOptions):
 
         return untrimmed
 
+    @classmethod
+    def from_samples(cls,
+                     values,
+                     groups = None,
+                     whiskers = 1.5,
+                     outliers = False,
+                     series_kwargs = None,
+                     outlier_series_kwargs = None,
+                     **kwargs):
+        """Create a series whose data points summarize the distribution of ``values``
+        (optionally split by ``groups``), with the summary statistics computed in
+        Python.
+
+        All groups are summarized in one vectorized pass: the groups are factorized, the
+        samples are sorted once by group and value (with a single
+        :func:`numpy.lexsort() <numpy:numpy.lexsort>`), and each group's quartiles,
+        whiskers, and outliers are then computed from the boundaries of its
+        (contiguous) slice of the sorted samples, without any per-group Python loop.
+        Quartiles are interpolated linearly (matching NumPy's default ``'linear'``
+        method).
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.boxplot import BoxPlotSeries
+
+            ## EXAMPLE 1. One box per region, with Tukey's (1.5 x IQR) whiskers.
+
+            my_series = BoxPlotSeries.from_samples(df['latency'].values,
+                                                   groups = df['region'].values)
+
+            ## EXAMPLE 2. Also returns the outliers in a companion scatter series.
+
+            boxes, outliers = BoxPlotSeries.from_samples(df['latency'].values,
+                                                         groups = df['region'].values,
+                                                         outliers = True)
+
+        :param values: The samples to summarize. Non-finite values are ignored.
+        :type values: Array-like
+
+        :param groups: If supplied, the group that each member of ``values`` belongs to.
+          One data point is produced per distinct group, in the order in which the groups
+          first appear. Numerical and :class:`numpy.datetime64 <numpy:numpy.datetime64>`
+          groups are used as the data points' ``x`` values, while other groups are used
+          as their ``name``. Defaults to
+          :obj:`None <python:None>`, which produces a single data point.
+        :type groups: Array-like or :obj:`None <python:None>`
+
+        :param whiskers: How to determine the ``low`` and ``high`` whiskers. Accepts:
+
+            * a number ``k``, in which case the whiskers extend to the most extreme
+              samples within ``k`` times the inter-quartile range of the box (Tukey's
+              rule), with any samples beyond them considered outliers,
+            * a 2-member :class:`tuple <python:tuple>` of percentiles (e.g. ``(5, 95)``),
+              with any samples beyond them considered outliers, or
+            * :obj:`None <python:None>`, in which case the whiskers extend to the minimum
+              and maximum samples.
+
+          Defaults to ``1.5``.
+        :type whiskers: numeric, :class:`tuple <python:tuple>`, or
+          :obj:`None <python:None>`
+
+        :param outliers: If ``True``, also return a
+          :class:`ScatterSeries <highcharts_core.options.series.scatter.ScatterSeries>`
+          containing the samples that fall outside the whiskers, linked to the series
+          returned. Defaults to :obj:`False <python:False>`.
+        :type outliers: :class:`bool <python:bool>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param outlier_series_kwargs: An optional :class:`dict <python:dict>` containing
+          keyword arguments that should be used when instantiating the outlier series.
+          Defaults to :obj:`None <python:None>`.
+        :type outlier_series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :returns: The series, or (if ``outliers`` is ``True``) a 2-member
+          :class:`list <python:list>` containing the series and the outlier series.
+        :rtype: :class:`BoxPlotSeries` or :class:`list <python:list>`
+
+        :raises HighchartsValueError: if ``groups`` is not the same length as ``values``,
+          or if ``whiskers`` is invalid
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in your runtime '
+                                                   'environment. Please make sure it is '
+                                                   'installed in your runtime '
+                                                   'environment.')
+
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        outlier_series_kwargs = validators.dict(outlier_series_kwargs,
+                                                allow_empty = True) or {}
+
+        whisker_percentiles = None
+        if whiskers is not None and utility_functions.is_iterable(whiskers):
+            whisker_percentiles = [validators.numeric(x, minimum = 0, maximum = 100)
+                                   for x in whiskers]
+            if len(whisker_percentiles) != 2 or \
+               whisker_percentiles[0] > whisker_percentiles[1]:
+                raise errors.HighchartsValueError(f'whiskers expects a number or two '
+                                                  f'ascending percentiles. Received: '
+                                                  f'{whiskers}')
+        elif whiskers is not None:
+            whiskers = validators.numeric(whiskers, minimum = 0)
+
+        values = np.asarray(values, dtype = np.float64).ravel()
+        is_finite = np.isfinite(values)
+        if groups is not None:
+            groups = np.asarray(groups)
+            if groups.ndim != 1 or len(groups) != len(values):
+                raise errors.HighchartsValueError(f'groups must have the same length as '
+                                                  f'values. Received {len(groups)} '
+                                                  f'groups for {len(values)} values.')
+            groups = groups[is_finite]
+        values = values[is_finite]
+
+        # Factorize the groups into codes numbered in order of first appearance, then
+        # sort once by group and by value, so each group's sorted samples are
+        # contiguous.
+        if groups is None:
+            keys = np.asarray([None], dtype = object)
+            codes = np.zeros(len(values), dtype = np.int64)
+        elif groups.dtype.kind == 'O':
+            mapping = {}
+            codes = np.fromiter((mapping.setdefault(x, len(mapping))
+                                 for x in groups.tolist()),
+                                dtype = np.int64,
+                                count = len(groups))
+            keys = np.asarray(list(mapping.keys()))
+        else:
+            uniques, first_indices, inverse = np.unique(groups,
+                                                        return_index = True,
+                                                        return_inverse = True)
+            appearance = np.argsort(first_indices, kind = 'stable')
+            ranks = np.empty_like(appearance)
+            ranks[appearance] = np.arange(len(appearance))
+            codes = ranks[inverse.ravel()]
+            keys = uniques[appearance]
+        if not len(values):
+            keys = keys[:0]
+
+        values = values[np.lexsort((values, codes))]
+        counts = np.bincount(codes, minlength = len(keys)).astype(np.int64)
+        starts = np.cumsum(counts) - counts
+        codes = np.repeat(np.arange(len(keys)), counts)
+
+        def quantiles(q):
+            position = starts + (counts - 1) * (q / 100)
+            lower = np.floor(position).astype(np.int64)
+            upper = np.minimum(lower + 1, starts + counts - 1)
+            fraction = position - lower
+            return values[lower] + (values[upper] - values[lower]) * fraction
+
+        q1 = quantiles(25)
+        median = quantiles(50)
+        q3 = quantiles(75)
+        if whisker_percentiles is not None:
+            low = quantiles(whisker_percentiles[0])
+            high = quantiles(whisker_percentiles[1])
+            is_outlier = (values < low[codes]) | (values > high[codes])
+        elif whiskers is not None and len(values):
+            iqr = q3 - q1
+            lower_fence = (q1 - whiskers * iqr)[codes]
+            upper_fence = (q3 + whiskers * iqr)[codes]
+            is_outlier = (values < lower_fence) | (values > upper_fence)
+            low = np.minimum.reduceat(np.where(is_outlier, np.inf, values), starts)
+            high = np.maximum.reduceat(np.where(is_outlier, -np.inf, values), starts)
+        else:
+            low = values[starts] if len(values) else q1
+            high = values[starts + counts - 1] if len(values) else q3
+            is_outlier = np.zeros(len(values), dtype = bool)
+
+        columns = {
+            'low': low,
+            'q1': q1,
+            'median': median,
+            'q3': q3,
+            'high': high
+        }
+        x = None
+        if groups is not None:
+            if keys.dtype.kind in ['i', 'u', 'f', 'M']:
+                x = keys
+                columns['x'] = keys
+            else:
+                columns['name'] = np.asarray([str(key) for key in keys.tolist()],
+                                             dtype = object)
+        supported_props = cls._data_point_class()._get_props_from_array()
+        columns = {key: columns[key] for key in columns if key in supported_props}
+
+        series_kwargs = series_kwargs.copy()
+        series_kwargs['data'] = cls._data_collection_class().from_columns(columns)
+        series_instance = cls(**series_kwargs)
+        for key in kwargs:
+            if key not in series_kwargs:
+                setattr(series_instance, key, kwargs[key])
+
+        if not outliers:
+            return series_instance
+
+        outlier_codes = codes[is_outlier]
+        outlier_kwargs = outlier_series_kwargs.copy()
+        outlier_kwargs['data'] = ScatterSeries._data_collection_class().from_columns({
+            'x': x[outlier_codes] if x is not None else outlier_codes,
+            'y': values[is_outlier]
+        })
+        outlier_kwargs.setdefault('linked_to', ':previous')
+        outlier_series = ScatterSeries(**outlier_kwargs)
+
+        return [series_instance, outlier_series]
+
 
 class ErrorBarSeries(BoxPlotSeries):
     """Options to configure an Error Bar series.
@@ -459,7 +459,16 @@ class DataPointCollection(HighchartsMeta):
         else:
             as_array = value
 
-        if HAS_NUMPY and isinstance(as_array, np.ndarray):
+        props_from_array = None
+        if HAS_NUMPY and isinstance(as_array, np.ndarray) and as_array.ndim == 1:
+            try:
+                props_from_array = self._get_props_from_array(length = 1)
+            except KeyError:
+                props_from_array = None
+
+        if props_from_array and props_from_array[0] != 'name':
+            self._ndarray = {props_from_array[0]: as_array}
+        elif HAS_NUMPY and isinstance(as_array, np.ndarray):
             dimensions = as_array.ndim
             supported_dimensions = self._get_supported_dimensions()
             if dimensions not in supported_dimensions:
@@ -584,6 +593,96 @@ class DataPointCollection(HighchartsMeta):
 
         return cls(ndarray = value)
     
+    @classmethod
+    def from_columns(cls, columns):
+        """Creates a
+        :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+        instance from a set of columns, without creating an object for each data point.
+
+        If all of the columns are properties that Highcharts can interpret from a
+        primitive array (e.g. ``'x'`` and ``'y'``), they are stored in
+        :meth:`.ndarray <highcharts_core.options.series.data.collections.DataPointCollection.ndarray>`,
+        ordered as Highcharts expects them.
+
+        .. note::
+
+          If any column cannot be represented in a primitive array (e.g. ``'name'``,
+          ``'id'``, or ``'color'``), the data points must be serialized as JavaScript
+          objects. In that case, the collection is populated with data point objects
+          in :meth:`.data_points <highcharts_core.options.series.data.collections.DataPointCollection.data_points>`
+          instead.
+
+        :param columns: A :class:`dict <python:dict>` whose keys are data point
+          properties and whose values are the (equal-length) array-like values for that
+          property.
+        :type columns: :class:`dict <python:dict>`
+
+        :returns: A collection of data points.
+        :rtype: :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not installed
+        :raises HighchartsValueError: if the columns have different lengths
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('DataPointCollection requires NumPy '
+                                                   'be installed. The runtime '
+                                                   'environment does not currently have '
+                                                   'NumPy installed. Please use the data '
+                                                   'point pattern instead, or install NumPy'
+                                                   ' using "pip install numpy" or similar.')
+
+        columns = validators.dict(columns, allow_empty = True) or {}
+        columns = {key: np.asarray(value) if not isinstance(value, np.ndarray) else value
+                   for key, value in columns.items()}
+        lengths = set([len(x) for x in columns.values()])
+        if len(lengths) > 1:
+            raise errors.HighchartsValueError(f'columns must all have the same length. '
+                                              f'Received lengths: {sorted(lengths)}')
+
+        instance = cls()
+        if not columns:
+            return instance
+        length = lengths.pop()
+
+        array_props = [x for x in cls._get_props_from_array() if x != 'name']
+        array_keys = [x for x in columns if x in array_props]
+
+        if len(array_keys) < len(columns):
+            data_point_cls = cls._get_data_point_class()
+            data_points = [data_point_cls() for x in range(length)]
+            for key in columns:
+                values = utility_functions.from_ndarray(columns[key])
+                for data_point, value in zip(data_points, values):
+                    if value is not None:
+                        setattr(data_point, key, value)
+
+            # The data points were created above with the correct class, so there is
+            # no need to re-validate them through the data_points setter.
+            instance._data_points = data_points
+        else:
+            props = array_props
+            for dimension in cls._get_supported_dimensions():
+                try:
+                    dimension_props = cls._get_props_from_array(dimension)
+                except KeyError:
+                    continue
+                if 'name' in dimension_props:
+                    continue
+                if all([x in dimension_props for x in array_keys]):
+                    props = dimension_props
+                    break
+
+            as_dict = {}
+            for prop in props:
+                if prop in columns:
+                    as_dict[prop] = columns[prop]
+                else:
+                    as_dict[prop] = np.full(length, np.nan)
+
+            instance._ndarray = as_dict
+
+        return instance
+
     @property
     def requires_js_object(self) -> bool:
         """Indicates whether or not the data point *must* be serialized to a JS literal 
@@ -800,6 +899,9 @@ class DataPointCollection(HighchartsMeta):
                     columns.append(utility_functions.from_ndarray(value))
                 else:
                     columns.append(value)
+            if list(self.ndarray.keys()) == ['y']:
+                return [x for x in columns[0]]
+
             as_list = [list(x) for x in zip(*columns)]
             
             return as_list
@@ -811,6 +913,363 @@ class DataPointCollection(HighchartsMeta):
 
         return [x for x in self._assemble_data_points()]
 
+    def downsample(self, n_points, method = 'lttb', prop = 'y'):
+        """Return a new collection containing (approximately) ``n_points`` of the
+        collection's data points, selected so as to preserve the visual shape of the
+        series when plotted.
+
+        The first and last data points are always retained, as are gaps in the series
+        (data points whose ``prop`` is empty). Data points are selected by index without
+        being converted into data point objects, so this method is efficient for very
+        large collections stored in
+        :meth:`.ndarray <highcharts_core.options.series.data.collections.DataPointCollection.ndarray>`.
+
+        .. seealso::
+
+          * :func:`downsample_indices() <highcharts_core.utility_functions.downsample_indices>`
+
+        :param n_points: The (target) number of data points to retain.
+        :type n_points: :class:`int <python:int>`
+
+        :param method: The algorithm to apply. Accepts ``'lttb'``
+          (Largest-Triangle-Three-Buckets), ``'minmax'``, or ``'m4'``. Defaults to
+          ``'lttb'``.
+        :type method: :class:`str <python:str>`
+
+        :param prop: The data point property whose values determine which data points
+          to retain. Defaults to ``'y'``.
+        :type prop: :class:`str <python:str>`
+
+        :returns: A new collection containing the retained data points.
+        :rtype: :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          installed
+        :raises HighchartsValueError: if the collection has no values for ``prop``
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('Downsampling requires NumPy be '
+                                                   'installed. The runtime environment '
+                                                   'does not currently have NumPy '
+                                                   'installed. Please install NumPy '
+                                                   'using "pip install numpy" or '
+                                                   'similar.')
+
+        prop = validators.variable_name(prop)
+        length = len(self)
+        if not length:
+            return self.__class__()
+
+        data_points = [x for x in self.data_points or []]
+        if self.ndarray is not None:
+            if prop not in self.ndarray:
+                raise errors.HighchartsValueError(f'Unable to downsample on "{prop}", '
+                                                  f'which is not present in the '
+                                                  f'collection.')
+            y = self.ndarray[prop]
+            x = self.ndarray.get('x', None)
+        else:
+            y = [getattr(data_point, prop, None) for data_point in data_points]
+            x = [getattr(data_point, 'x', None) for data_point in data_points]
+
+        if x is not None:
+            try:
+                x = utility_functions.to_float_ndarray(x)
+            except errors.HighchartsValueError:
+                x = None
+        if x is not None and np.isnan(x).all():
+            x = None
+
+        indices = utility_functions.downsample_indices(y,
+                                                       n_points,
+                                                       x = x,
+                                                       method = method)
+
+        instance = self.__class__()
+        if self.ndarray is not None:
+            instance._ndarray = {key: value[indices]
+                                 for key, value in self.ndarray.items()}
+        if data_points:
+            data_point_cls = self._get_data_point_class()
+            data_points.extend([data_point_cls()
+                                for x in range(length - len(data_points))])
+            instance.data_points = [data_points[index] for index in indices]
+
+        return instance
+
+    def simplify(self, tolerance, method = 'rdp', preserve_topology = True):
+        """Return a new collection containing only those data points needed to
+        preserve the shape of the line (or polygon) formed by the collection's ``x`` and
+        ``y`` values, within ``tolerance``.
+
+        The first and last data points are always retained, as are gaps in the series
+        (data points whose ``y`` is empty). Data points are selected by index without
+        being converted into data point objects, so this method is efficient for very
+        large collections stored in
+        :meth:`.ndarray <highcharts_core.options.series.data.collections.DataPointCollection.ndarray>`.
+
+        .. seealso::
+
+          * :func:`simplify_indices() <highcharts_core.utility_functions.simplify_indices>`
+
+        :param tolerance: For ``'rdp'``, the maximum distance (in data units) between a
+          discarded data point and the simplified line. For ``'visvalingam'``, the
+          minimum (effective) area of the triangle formed by a retained data point and
+          its neighbours.
+        :type tolerance: numeric
+
+        :param method: The algorithm to apply. Accepts ``'rdp'``
+          (Ramer-Douglas-Peucker) or ``'visvalingam'`` (Visvalingam-Whyatt). Defaults to
+          ``'rdp'``.
+        :type method: :class:`str <python:str>`
+
+        :param preserve_topology: If ``True``, closed rings retain at least three
+          distinct vertices, so that polygons do not collapse into lines. Defaults to
+          ``True``.
+        :type preserve_topology: :class:`bool <python:bool>`
+
+        :returns: A new collection containing the retained data points.
+        :rtype: :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          installed
+        :raises HighchartsValueError: if the collection has no ``y`` values
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('Simplification requires NumPy be '
+                                                   'installed. The runtime environment '
+                                                   'does not currently have NumPy '
+                                                   'installed. Please install NumPy '
+                                                   'using "pip install numpy" or '
+                                                   'similar.')
+
+        length = len(self)
+        if not length:
+            return self.__class__()
+
+        data_points = [x for x in self.data_points or []]
+        if self.ndarray is not None:
+            if 'y' not in self.ndarray:
+                raise errors.HighchartsValueError('Unable to simplify a collection '
+                                                  'with no "y" values.')
+            y = self.ndarray['y']
+            x = self.ndarray.get('x', None)
+        else:
+            y = [getattr(data_point, 'y', None) for data_point in data_points]
+            x = [getattr(data_point, 'x', None) for data_point in data_points]
+
+        if x is not None:
+            try:
+                x = utility_functions.to_float_ndarray(x)
+            except errors.HighchartsValueError:
+                x = None
+        if x is not None and np.isnan(x).all():
+            x = None
+
+        indices = utility_functions.simplify_indices(y,
+                                                     tolerance,
+                                                     x = x,
+                                                     method = method,
+                                                     preserve_topology = preserve_topology)
+
+        instance = self.__class__()
+        if self.ndarray is not None:
+            instance._ndarray = {key: value[indices]
+                                 for key, value in self.ndarray.items()}
+        if data_points:
+            data_point_cls = self._get_data_point_class()
+            data_points.extend([data_point_cls()
+                                for x in range(length - len(data_points))])
+            instance.data_points = [data_points[index] for index in indices]
+
+        return instance
+
+    def group_by_time(self,
+                      unit,
+                      multiple = 1,
+                      approximation = 'average',
+                      prop = 'y',
+                      fill_gaps = False):
+        """Return a new collection whose data points aggregate the collection's values
+        into regular time intervals, based on the data points' ``x`` values.
+
+        The aggregation is vectorized using NumPy and does not create an object for
+        each data point.
+
+        .. seealso::
+
+          * :func:`group_by_time() <highcharts_core.utility_functions.group_by_time>`
+
+        :param unit: The unit of time of each interval. Accepts ``'millisecond'``,
+          ``'second'``, ``'minute'``, ``'hour'``, ``'day'``, ``'week'``, ``'month'``, or
+          ``'year'``.
+        :type unit: :class:`str <python:str>`
+
+        :param multiple: The number of ``unit`` in each interval. Defaults to ``1``.
+        :type multiple: :class:`int <python:int>`
+
+        :param approximation: How the values in each interval are aggregated. Accepts
+          ``'average'``, ``'sum'``, ``'high'``, ``'low'``, ``'open'``, ``'close'``,
+          ``'range'`` (which populates ``low`` and ``high``), or ``'ohlc'`` (which
+          populates ``open``, ``high``, ``low``, and ``close``). Defaults to
+          ``'average'``.
+        :type approximation: :class:`str <python:str>`
+
+        :param prop: The data point property whose values are aggregated. Defaults to
+          ``'y'``.
+        :type prop: :class:`str <python:str>`
+
+        :param fill_gaps: If ``True``, returns a data point for every interval between
+          the first and last interval (with empty values for intervals that contain no
+          data). Defaults to ``False``.
+        :type fill_gaps: :class:`bool <python:bool>`
+
+        :returns: A new collection containing one data point per interval, whose ``x``
+          values are the start of each interval (in milliseconds since the Unix epoch).
+        :rtype: :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          installed
+        :raises HighchartsValueError: if the collection has no ``x`` or ``prop`` values,
+          or if its data points do not support the properties populated by
+          ``approximation``
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('Grouping by time requires NumPy be '
+                                                   'installed. The runtime environment '
+                                                   'does not currently have NumPy '
+                                                   'installed. Please install NumPy '
+                                                   'using "pip install numpy" or '
+                                                   'similar.')
+
+        prop = validators.variable_name(prop)
+        if not len(self):
+            return self.__class__()
+
+        if self.ndarray is not None:
+            x = self.ndarray.get('x', None)
+            y = self.ndarray.get(prop, None)
+        else:
+            data_points = self.data_points or []
+            x = [getattr(data_point, 'x', None) for data_point in data_points]
+            y = [getattr(data_point, prop, None) for data_point in data_points]
+            if all([value is None for value in x]):
+                x = None
+            if all([value is None for value in y]):
+                y = None
+
+        if x is None:
+            raise errors.HighchartsValueError('Unable to group by time, because the '
+                                              'collection has no x values.')
+        if y is None:
+            raise errors.HighchartsValueError(f'Unable to group by time on "{prop}", '
+                                              f'which is not present in the '
+                                              f'collection.')
+
+        interval_starts, columns = utility_functions.group_by_time(
+            x,
+            y,
+            unit,
+            multiple = multiple,
+            approximation = approximation,
+            fill_gaps = fill_gaps
+        )
+        if 'y' in columns:
+            columns = {prop: columns['y']}
+
+        supported_props = self._get_props_from_array()
+        for key in columns:
+            if key not in supported_props:
+                raise errors.HighchartsValueError(f'approximation "{approximation}" '
+                                                  f'populates "{key}", which is not '
+                                                  f'supported by '
+                                                  f'{self.__class__.__name__}')
+
+        return self.from_columns({'x': interval_starts, **columns})
+
+    def split_point_interval(self, rtol = 1e-9):
+        """If the collection's ``x`` values are evenly spaced, return a new collection
+        *without* ``x`` values, together with the ``pointStart`` and ``pointInterval``
+        which Highcharts can use to reconstruct them.
+
+        Evenly-spaced ``x`` values are detected using a single vectorized pass over the
+        ``x`` values.
+        Serializing a collection without ``x`` values produces a substantially smaller
+        payload, which is also faster for the browser to parse.
+
+        .. note::
+
+          This method returns :obj:`None <python:None>` (leaving the collection
+          unchanged) whenever the ``x`` values cannot be safely removed, e.g. if they
+          are irregularly spaced, are not in ascending order, or contain empty values,
+          if the data points must be serialized as JavaScript objects, or if the
+          remaining properties cannot be represented in a primitive array without ``x``
+          values.
+
+        .. seealso::
+
+          * :func:`get_constant_interval() <highcharts_core.utility_functions.get_constant_interval>`
+
+        :param rtol: The relative tolerance (as a proportion of the interval) within
+          which the difference between two consecutive ``x`` values is considered equal
+          to the interval. Defaults to ``1e-9``.
+        :type rtol: numeric
+
+        :returns: A 3-member :class:`tuple <python:tuple>` containing the first ``x``
+          value, the interval between ``x`` values, and a new collection without ``x``
+          values, or :obj:`None <python:None>` if the ``x`` values cannot be removed.
+        :rtype: :class:`tuple <python:tuple>` or :obj:`None <python:None>`
+        """
+        if not HAS_NUMPY or self.array:
+            return None
+
+        if self.ndarray is not None and self.data_points:
+            return None
+        elif self.ndarray is not None:
+            columns = {key: value for key, value in self.ndarray.items()}
+        elif self.data_points and not self.requires_js_object:
+            if any([getattr(x, 'name', None) is not None for x in self.data_points]):
+                return None
+            array_props = [x for x in self._get_props_from_array() if x != 'name']
+            columns = {}
+            for prop in array_props:
+                values = [getattr(x, prop, None) for x in self.data_points]
+                if all([value is None for value in values]):
+                    continue
+                as_array = np.asarray(values)
+                if as_array.dtype.kind in ['i', 'u', 'f']:
+                    columns[prop] = as_array
+                    continue
+                try:
+                    columns[prop] = utility_functions.to_float_ndarray(values)
+                except errors.HighchartsValueError:
+                    return None
+        else:
+            return None
+
+        x = columns.pop('x', None)
+        if x is None or not columns:
+            return None
+
+        try:
+            point_interval = utility_functions.get_constant_interval(x, rtol = rtol)
+        except errors.HighchartsValueError:
+            return None
+        if point_interval is None:
+            return None
+
+        collection = self.from_columns(columns)
+        if collection.ndarray is None or 'x' in collection.ndarray:
+            return None
+
+        point_start = utility_functions.to_float_ndarray(x[:1])[0]
+        if float(point_start).is_integer():
+            point_start = int(point_start)
+        else:
+            point_start = float(point_start)
+
+        return point_start, point_interval, collection
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         """Convenience method which returns the keyword arguments used to initialize the
@@ -874,7 +1333,7 @@ class DataPointCollection(HighchartsMeta):
             filename = validators.path(filename)
 
         untrimmed = self.to_array()
-        is_ndarray = all([isinstance(x, list) for x in untrimmed])
+        is_ndarray = all([not hasattr(x, 'to_js_literal') for x in untrimmed])
         if not is_ndarray:
             as_str = '['
             as_str += ','.join([x.to_js_literal(encoding = encoding,
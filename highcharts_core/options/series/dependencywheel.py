@@ -1,14 +1,14 @@
 from typing import Optional, List
 
 from highcharts_core.decorators import class_sensitive
-from highcharts_core.options.series.base import SeriesBase
+from highcharts_core.options.series.base import SeriesBase, ConnectionSeriesMixin
 from highcharts_core.options.series.data.connections import WeightedConnectionData, WeightedConnectionDataCollection
 from highcharts_core.options.plot_options.dependencywheel import DependencyWheelOptions
 from highcharts_core.utility_functions import mro__to_untrimmed_dict, is_ndarray
 from highcharts_core.utility_classes.nodes import DependencyWheelNodeOptions
 
 
-class DependencyWheelSeries(SeriesBase, DependencyWheelOptions):
+class DependencyWheelSeries(SeriesBase, DependencyWheelOptions, ConnectionSeriesMixin):
     """Options to configure a Dependency Wheel series.
 
     A dependency wheel chart is a type of flow diagram, where all nodes are laid out
@@ -1,10 +1,19 @@
 from typing import Optional, List
 
+from validator_collection import validators
+
+from highcharts_core import errors, utility_functions
 from highcharts_core.options.series.base import SeriesBase
 from highcharts_core.options.series.data.cartesian import CartesianValueData, CartesianValueDataCollection
 from highcharts_core.options.plot_options.heatmap import HeatmapOptions, TilemapOptions
 from highcharts_core.utility_functions import mro__to_untrimmed_dict, is_ndarray
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 class HeatmapSeries(SeriesBase, HeatmapOptions):
     """Options to configure to a Heatmap series.
@@ -124,6 +133,242 @@ class HeatmapSeries(SeriesBase, HeatmapOptions):
         else:
             self._data = CartesianValueData.from_array(value)
 
+    @staticmethod
+    def _get_matrix_coordinates(categories, length, name):
+        """Return the coordinates to use along one axis of a matrix.
+
+        :param categories: The categories supplied for the axis (if any).
+        :param length: The length of the matrix along the axis.
+        :type length: :class:`int <python:int>`
+        :param name: The name of the argument that supplied ``categories``.
+        :type name: :class:`str <python:str>`
+
+        :returns: A 2-member :class:`tuple <python:tuple>` containing the categories'
+          values if they are numerical (otherwise the position of each row / column),
+          and whether the categories should be applied as axis categories.
+        :rtype: :class:`tuple <python:tuple>`
+
+        :raises HighchartsValueError: if the number of categories does not match
+          ``length``
+        """
+        if categories is None:
+            return np.arange(length, dtype = np.int32), False
+
+        categories = np.asarray(categories)
+        if categories.ndim != 1 or len(categories) != length:
+            raise errors.HighchartsValueError(f'{name} must have one member for each of '
+                                              f'the {length} positions in the matrix. '
+                                              f'Received: {categories.size}')
+        if categories.dtype.kind in ['i', 'u', 'f', 'M']:
+            return categories, False
+
+        return np.arange(length, dtype = np.int32), True
+
+    @classmethod
+    def from_matrix(cls,
+                    matrix,
+                    x_categories = None,
+                    y_categories = None,
+                    skip_nan = True,
+                    series_kwargs = None,
+                    **kwargs):
+        """Create a series whose data points are populated from the cells of a
+        two-dimensional matrix, where each row of the matrix corresponds to a position on
+        the y-axis and each column to a position on the x-axis.
+
+        The ``[x, y, value]`` data points are generated without a Python loop (by
+        flattening a :func:`meshgrid <numpy:numpy.meshgrid>` of the row and column
+        coordinates), and are stored as a :class:`numpy.ndarray <numpy:numpy.ndarray>`.
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.heatmap import HeatmapSeries
+
+            my_series = HeatmapSeries.from_matrix(correlations)
+
+          .. hint::
+
+            To also populate the categories of the chart's axes, use
+            :meth:`Chart.from_matrix() <highcharts_core.chart.Chart.from_matrix>`.
+
+        :param matrix: The matrix whose cells should be plotted.
+        :type matrix: 2-dimensional Array-like
+
+        :param x_categories: The labels of the matrix's columns. If they are numerical (or
+          dates / times), they are used as the data points' ``x`` values. Otherwise
+          the ``x`` values are the positions of the columns (i.e. indices into the
+          categories). Defaults to :obj:`None <python:None>`.
+        :type x_categories: Array-like or :obj:`None <python:None>`
+
+        :param y_categories: The labels of the matrix's rows. If they are numerical (or
+          dates / times), they are used as the data points' ``y`` values. Otherwise
+          the ``y`` values are the positions of the rows (i.e. indices into the
+          categories). Defaults to :obj:`None <python:None>`.
+        :type y_categories: Array-like or :obj:`None <python:None>`
+
+        :param skip_nan: If ``True``, cells whose value is
+          :obj:`numpy.nan <numpy:numpy.nan>` (or :obj:`None <python:None>`) are omitted.
+          Defaults to ``True``.
+        :type skip_nan: :class:`bool <python:bool>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :rtype: :class:`HeatmapSeries`
+
+        :raises HighchartsValueError: if ``matrix`` is not two-dimensional, or if the
+          number of categories does not match its shape
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in your runtime '
+                                                   'environment. Please make sure it is '
+                                                   'installed in your runtime '
+                                                   'environment.')
+
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2:
+            raise errors.HighchartsValueError(f'matrix must be two-dimensional. Received '
+                                              f'an array with {matrix.ndim} dimensions.')
+        if matrix.dtype.kind not in ['i', 'u', 'f']:
+            matrix = np.asarray(np.where(matrix == None, np.nan, matrix),          # noqa: E711
+                                dtype = np.float64)
+        row_count, column_count = matrix.shape
+
+        x = cls._get_matrix_coordinates(x_categories, column_count, 'x_categories')[0]
+        y = cls._get_matrix_coordinates(y_categories, row_count, 'y_categories')[0]
+        x, y = np.meshgrid(x, y, copy = False)
+        x, y, value = x.ravel(), y.ravel(), matrix.ravel()
+
+        if skip_nan and value.dtype.kind == 'f':
+            is_valid = ~np.isnan(value)
+            if not is_valid.all():
+                x, y, value = x[is_valid], y[is_valid], value[is_valid]
+
+        series_kwargs = series_kwargs.copy()
+        series_kwargs['data'] = cls._data_collection_class().from_columns({
+            'x': x,
+            'y': y,
+            'value': value
+        })
+        series_instance = cls(**series_kwargs)
+        for key in kwargs:
+            if key not in series_kwargs:
+                setattr(series_instance, key, kwargs[key])
+
+        return series_instance
+
+    @classmethod
+    def from_long_form(cls,
+                       x,
+                       y,
+                       value = None,
+                       x_bins = 10,
+                       y_bins = 10,
+                       agg = 'sum',
+                       bin_range = None,
+                       series_kwargs = None,
+                       **kwargs):
+        """Create a series by binning long-form ``(x, y, value)`` data onto a regular
+        grid (see
+        :func:`bin_to_grid() <highcharts_core.utility_functions.bin_to_grid>`), with one
+        data point per non-empty cell.
+
+        Each data point is positioned at the center of its cell, and the series'
+        :meth:`.colsize <HeatmapSeries.colsize>` and
+        :meth:`.rowsize <HeatmapSeries.rowsize>` are set to the width and height of the
+        cells (when the bins are of equal width).
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.heatmap import HeatmapSeries
+
+            my_series = HeatmapSeries.from_long_form(df['hour'],
+                                                     df['latency'],
+                                                     x_bins = 24,
+                                                     y_bins = 50,
+                                                     agg = 'count')
+
+        :param x: The x-coordinate of each member.
+        :type x: Array-like
+
+        :param y: The y-coordinate of each member.
+        :type y: Array-like
+
+        :param value: The value of each member. If :obj:`None <python:None>`, each cell's
+          value is the number of members that fall into it. Defaults to
+          :obj:`None <python:None>`.
+        :type value: Array-like or :obj:`None <python:None>`
+
+        :param x_bins: The number of equal-width bins along the x-axis, or their edges.
+          Defaults to ``10``.
+        :type x_bins: :class:`int <python:int>` or Array-like
+
+        :param y_bins: The number of equal-width bins along the y-axis, or their edges.
+          Defaults to ``10``.
+        :type y_bins: :class:`int <python:int>` or Array-like
+
+        :param agg: How to aggregate the values in each cell. Accepts ``'sum'``,
+          ``'mean'``, ``'min'``, ``'max'``, or ``'count'``. Defaults to ``'sum'``.
+        :type agg: :class:`str <python:str>`
+
+        :param bin_range: The ``((x_min, x_max), (y_min, y_max))`` bounds of the bins.
+          Defaults to :obj:`None <python:None>`.
+        :type bin_range: :class:`tuple <python:tuple>` or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :rtype: :class:`HeatmapSeries`
+
+        :raises HighchartsValueError: if ``x``, ``y``, and ``value`` have different
+          lengths, or if ``agg`` is not supported
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        grid, x_edges, y_edges = utility_functions.bin_to_grid(x,
+                                                               y,
+                                                               value = value,
+                                                               x_bins = x_bins,
+                                                               y_bins = y_bins,
+                                                               agg = agg,
+                                                               bin_range = bin_range)
+
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        series_kwargs = series_kwargs.copy()
+        if 'colsize' not in series_kwargs:
+            colsize = utility_functions.get_constant_interval(x_edges, rtol = 1e-6)
+            if colsize is not None:
+                series_kwargs['colsize'] = colsize
+        if 'rowsize' not in series_kwargs:
+            rowsize = utility_functions.get_constant_interval(y_edges, rtol = 1e-6)
+            if rowsize is not None:
+                series_kwargs['rowsize'] = rowsize
+
+        return cls.from_matrix(grid,
+                               x_categories = (x_edges[:-1] + x_edges[1:]) / 2,
+                               y_categories = (y_edges[:-1] + y_edges[1:]) / 2,
+                               series_kwargs = series_kwargs,
+                               **kwargs)
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         kwargs = {
@@ -2,7 +2,8 @@ from typing import Optional
 
 from validator_collection import validators
 
-from highcharts_core.options.series.bar import BarSeries
+from highcharts_core import utility_functions
+from highcharts_core.options.series.bar import BarSeries, ColumnSeries
 from highcharts_core.options.plot_options.histogram import HistogramOptions
 from highcharts_core.utility_functions import mro__to_untrimmed_dict
 
@@ -69,6 +70,108 @@ class HistogramSeries(BarSeries, HistogramOptions):
     def data(self, value):
         pass
 
+    @classmethod
+    def from_samples(cls,
+                     values,
+                     bins = 'auto',
+                     weights = None,
+                     bin_range = None,
+                     series_kwargs = None,
+                     **kwargs):
+        """Create a :class:`ColumnSeries <highcharts_core.options.series.bar.ColumnSeries>`
+        which renders the histogram of ``values``, with the bins computed in Python
+        rather than in the browser.
+
+        Because a Histogram series is derived in the browser from the raw samples of its
+        :meth:`base_series <HistogramSeries.base_series>`, every sample would otherwise
+        have to be serialized. This method instead bins ``values`` using NumPy (streaming
+        over chunks if ``values`` is an iterable of arrays) and returns a column series
+        with one data point per bin, whose ``x`` value is the center of the bin and whose
+        ``y`` value is the number of samples (or sum of ``weights``) in the bin.
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.histogram import HistogramSeries
+
+            my_series = HistogramSeries.from_samples(latencies, bins = 50)
+
+            # Streaming over a generator of NumPy arrays
+            my_series = HistogramSeries.from_samples(read_chunks('latencies.bin'),
+                                                     bins = 50,
+                                                     bin_range = (0, 2000))
+
+        :param values: The samples to bin.
+        :type values: Array-like, or iterable of array-likes
+
+        :param bins: The number of equal-width bins, the edges of the bins, or the name
+          of a :func:`NumPy bin estimator <numpy:numpy.histogram_bin_edges>`. If
+          ``values`` is a one-shot iterator of chunks, named estimators cannot be
+          applied and ten equal-width bins across ``bin_range`` are used instead.
+          Defaults to ``'auto'``.
+        :type bins: :class:`int <python:int>`, :class:`str <python:str>`, or Array-like
+
+        :param weights: Optional weights for each member of ``values``, supplied in the
+          same shape. Defaults to :obj:`None <python:None>`.
+        :type weights: Array-like, iterable of array-likes, or :obj:`None <python:None>`
+
+        :param bin_range: The lower and upper bounds of the bins when ``bins`` is not a
+          sequence of edges. Required if ``values`` is a one-shot iterator of chunks and
+          ``bins`` is not a sequence of edges. Defaults to :obj:`None <python:None>`.
+        :type bin_range: 2-member :class:`tuple <python:tuple>` or
+          :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+            The ``data`` value will be created from ``values`` instead.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :returns: A column series whose data points represent the bins of the histogram.
+          If the bins are of equal width, the series'
+          :meth:`.point_range <highcharts_core.options.series.bar.ColumnSeries.point_range>`
+          is set to the bin width so that the columns touch.
+        :rtype: :class:`ColumnSeries <highcharts_core.options.series.bar.ColumnSeries>`
+
+        :raises HighchartsValueError: if ``bins``, ``weights``, or ``bin_range`` are
+          invalid
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        counts, edges = utility_functions.compute_histogram(values,
+                                                            bins = bins,
+                                                            weights = weights,
+                                                            bin_range = bin_range)
+        centers = (edges[:-1] + edges[1:]) / 2
+
+        series_kwargs = series_kwargs.copy()
+        series_kwargs['data'] = ColumnSeries._data_collection_class().from_columns({
+            'x': centers,
+            'y': counts
+        })
+        series_kwargs.setdefault('point_padding', 0)
+        series_kwargs.setdefault('group_padding', 0)
+        series_kwargs.setdefault('grouping', False)
+        if 'point_range' not in series_kwargs:
+            point_range = utility_functions.get_constant_interval(edges, rtol = 1e-6)
+            if point_range is not None:
+                series_kwargs['point_range'] = point_range
+
+        series_instance = ColumnSeries(**series_kwargs)
+        for key in kwargs:
+            if key not in series_kwargs:
+                setattr(series_instance, key, kwargs[key])
+
+        return series_instance
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         kwargs = {
@@ -1,12 +1,12 @@
 from typing import Optional, List
 
-from highcharts_core.options.series.base import SeriesBase
+from highcharts_core.options.series.base import SeriesBase, HierarchicalSeriesMixin
 from highcharts_core.options.series.data.sunburst import SunburstData, SunburstDataCollection
 from highcharts_core.options.plot_options.sunburst import SunburstOptions
 from highcharts_core.utility_functions import mro__to_untrimmed_dict, is_ndarray
 
 
-class SunburstSeries(SeriesBase, SunburstOptions):
+class SunburstSeries(SeriesBase, SunburstOptions, HierarchicalSeriesMixin):
     """Options to configure a Sunburst series.
 
     A Sunburst displays hierarchical data, where a level in the hierarchy is
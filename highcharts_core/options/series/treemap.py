@@ -1,12 +1,12 @@
 from typing import Optional, List
 
-from highcharts_core.options.series.base import SeriesBase
+from highcharts_core.options.series.base import SeriesBase, HierarchicalSeriesMixin
 from highcharts_core.options.series.data.treemap import TreemapData, TreemapDataCollection
 from highcharts_core.options.plot_options.treemap import TreemapOptions
 from highcharts_core.utility_functions import mro__to_untrimmed_dict, is_ndarray
 
 
-class TreemapSeries(SeriesBase, TreemapOptions):
+class TreemapSeries(SeriesBase, TreemapOptions, HierarchicalSeriesMixin):
     """Options to configure a Treemap series.
 
     A treemap displays hierarchical data using nested rectangles. The data can be laid
@@ -1,5 +1,8 @@
 from typing import Optional, List
 
+from validator_collection import validators
+
+from highcharts_core import errors, utility_functions
 from highcharts_core.options.series.base import SeriesBase
 from highcharts_core.options.series.data.vector import VectorData, VectorDataCollection
 from highcharts_core.options.plot_options.vector import VectorOptions
@@ -83,6 +86,99 @@ class VectorSeries(SeriesBase, VectorOptions):
         else:
             self._data = VectorData.from_array(value)
 
+    @classmethod
+    def from_components(cls,
+                        x,
+                        y,
+                        u,
+                        v,
+                        stride = 1,
+                        skip_nan = True,
+                        series_kwargs = None,
+                        **kwargs):
+        """Create a series whose vectors are derived from the ``u`` (eastward) and ``v``
+        (northward) components of a vector field, e.g. gridded wind data.
+
+        Each vector's length and direction are computed in vectorized form, the grid may
+        be decimated using ``stride``, and the resulting columns are written directly
+        into the series' data collection (see :func:`compute_vectors()
+        <highcharts_core.utility_functions.compute_vectors>`).
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.vector import VectorSeries
+
+            # u and v are grids of shape (len(latitudes), len(longitudes))
+            my_series = VectorSeries.from_components(longitudes,
+                                                     latitudes,
+                                                     u,
+                                                     v,
+                                                     stride = 4)
+
+        :param x: The x coordinates, either one member per column of the grid or one
+          member per point.
+        :type x: Array-like
+
+        :param y: The y coordinates, either one member per row of the grid or one member
+          per point.
+        :type y: Array-like
+
+        :param u: The eastward component of each vector, either one-dimensional or a grid
+          of shape ``(len(y), len(x))``.
+        :type u: Array-like
+
+        :param v: The northward component of each vector, with the same shape as ``u``.
+        :type v: Array-like
+
+        :param stride: Decimate the points by keeping only every ``stride``-th point
+          (along each axis, for grids). For grids, a ``(y_stride, x_stride)`` tuple may
+          also be supplied. Defaults to ``1``.
+        :type stride: :class:`int <python:int>` or :class:`tuple <python:tuple>`
+
+        :param skip_nan: If ``True``, points whose components are not finite are
+          omitted. Defaults to ``True``.
+        :type skip_nan: :class:`bool <python:bool>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :rtype: :class:`VectorSeries`
+
+        :raises HighchartsValueError: if the shapes of ``x``, ``y``, ``u``, and ``v`` are
+          incompatible
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        if y is None:
+            raise errors.HighchartsValueError('VectorSeries.from_components() requires y')
+
+        columns = utility_functions.compute_vectors(x,
+                                                    y,
+                                                    u,
+                                                    v,
+                                                    stride = stride,
+                                                    skip_nan = skip_nan)
+
+        series_kwargs = series_kwargs.copy()
+        series_kwargs['data'] = cls._data_collection_class().from_columns(columns)
+        series_instance = cls(**series_kwargs)
+        for key in kwargs:
+            if key not in series_kwargs:
+                setattr(series_instance, key, kwargs[key])
+
+        return series_instance
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         kwargs = {
@@ -1,5 +1,8 @@
 from typing import Optional, List
 
+from validator_collection import validators
+
+from highcharts_core import utility_functions
 from highcharts_core.options.series.base import SeriesBase
 from highcharts_core.options.series.data.venn import VennData, VennDataCollection
 from highcharts_core.options.plot_options.venn import VennOptions
@@ -80,6 +83,73 @@ class VennSeries(SeriesBase, VennOptions):
         else:
             self._data = VennData.from_array(value)
 
+    @classmethod
+    def from_sets(cls,
+                  sets,
+                  skip_empty = False,
+                  series_kwargs = None,
+                  **kwargs):
+        """Create a series whose data points are the sizes of the sets supplied and of
+        all of their intersections.
+
+        All :math:`2^k - 1` intersection sizes are computed in vectorized form from a
+        single sort of the sets' members, rather than by intersecting Python sets (see
+        :func:`compute_set_intersections()
+        <highcharts_core.utility_functions.compute_set_intersections>`).
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.venn import VennSeries
+
+            my_series = VennSeries.from_sets({
+                'Newsletter': newsletter_user_ids,
+                'Mobile App': app_user_ids,
+                'Premium': premium_user_ids
+            })
+
+        :param sets: The sets to intersect, keyed by their names. Each set may be any
+          iterable of hashable members (e.g. a :class:`set <python:set>`, a
+          :class:`list <python:list>`, a :class:`numpy.ndarray <numpy:numpy.ndarray>`,
+          or a :class:`pandas.Series <pandas:pandas.Series>`).
+        :type sets: :class:`dict <python:dict>`
+
+        :param skip_empty: If ``True``, intersections with no members are omitted.
+          Defaults to ``False``.
+        :type skip_empty: :class:`bool <python:bool>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :rtype: :class:`VennSeries`
+
+        :raises HighchartsValueError: if ``sets`` is empty or contains more than 20 sets
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        columns = utility_functions.compute_set_intersections(sets,
+                                                              skip_empty = skip_empty)
+
+        series_kwargs = series_kwargs.copy()
+        series_kwargs['data'] = cls._data_collection_class().from_columns(columns)
+        series_instance = cls(**series_kwargs)
+        for key in kwargs:
+            if key not in series_kwargs:
+                setattr(series_instance, key, kwargs[key])
+
+        return series_instance
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         kwargs = {
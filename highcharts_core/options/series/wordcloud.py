@@ -1,5 +1,8 @@
 from typing import Optional, List
 
+from validator_collection import validators
+
+from highcharts_core import utility_functions
 from highcharts_core.options.series.base import SeriesBase
 from highcharts_core.options.series.data.wordcloud import WordcloudData, WordcloudDataCollection
 from highcharts_core.options.plot_options.wordcloud import WordcloudOptions
@@ -67,6 +70,96 @@ class WordcloudSeries(SeriesBase, WordcloudOptions):
         else:
             self._data = WordcloudData.from_array(value)
 
+    @classmethod
+    def from_text(cls,
+                  documents,
+                  top_k = 200,
+                  stopwords = None,
+                  tokenizer = None,
+                  lowercase = True,
+                  capacity = 100000,
+                  series_kwargs = None,
+                  **kwargs):
+        """Create a series whose data points are the ``top_k`` most frequent terms in a
+        stream of documents, weighted by their frequency.
+
+        The documents are consumed one at a time (so a generator reading from a file or
+        database cursor can be supplied), terms are counted with a bounded-memory
+        counter, and only the terms that will actually be drawn are added to the series
+        (see :func:`count_terms() <highcharts_core.utility_functions.count_terms>`).
+
+          .. code-block:: python
+
+            from highcharts_core.options.series.wordcloud import WordcloudSeries
+
+            with open('tickets.txt') as file_:
+                my_series = WordcloudSeries.from_text(file_, top_k = 100)
+
+        :param documents: The documents whose terms should be counted.
+        :type documents: iterable of :class:`str <python:str>`, or
+          :class:`str <python:str>`
+
+        :param top_k: The number of terms to include in the series. Defaults to ``200``.
+        :type top_k: :class:`int <python:int>`
+
+        :param stopwords: Terms to ignore. If :obj:`None <python:None>`, defaults to
+          :obj:`constants.DEFAULT_STOPWORDS
+          <highcharts_core.constants.DEFAULT_STOPWORDS>`. Supply an empty collection to
+          keep all terms.
+        :type stopwords: iterable of :class:`str <python:str>`, or
+          :obj:`None <python:None>`
+
+        :param tokenizer: A callable that receives a document and returns an iterable of
+          its terms. If :obj:`None <python:None>`, documents are split into runs of
+          letters. Defaults to :obj:`None <python:None>`.
+        :type tokenizer: callable or :obj:`None <python:None>`
+
+        :param lowercase: If ``True``, documents are lowercased before being tokenized.
+          Defaults to ``True``.
+        :type lowercase: :class:`bool <python:bool>`
+
+        :param capacity: The number of distinct terms to retain when the counter is
+          pruned. Defaults to ``100000``.
+        :type capacity: :class:`int <python:int>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` key, its value will be *overwritten*.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param **kwargs: Remaining keyword arguments will be attempted on the resulting
+          :term:`series` instance.
+
+        :rtype: :class:`WordcloudSeries`
+
+        :raises HighchartsValueError: if ``tokenizer`` is not callable, or if
+          ``capacity`` is less than ``top_k``
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        columns = utility_functions.count_terms(documents,
+                                                top_k = top_k,
+                                                stopwords = stopwords,
+                                                tokenizer = tokenizer,
+                                                lowercase = lowercase,
+                                                capacity = capacity)
+
+        series_kwargs = series_kwargs.copy()
+        series_kwargs['data'] = cls._data_collection_class().from_columns(columns)
+        series_instance = cls(**series_kwargs)
+        for key in kwargs:
+            if key not in series_kwargs:
+                setattr(series_instance, key, kwargs[key])
+
+        return series_instance
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         kwargs = {
@@ -1,11 +1,16 @@
 """Collection of utility functions used across the library."""
 import csv
 import datetime
+import heapq
+import itertools
+import mmap
 import os
+import re
 import string
 import random
 import typing
-from collections import UserDict
+from collections import Counter, UserDict
+from decimal import Decimal
 
 from validator_collection import validators, checkers
 try:
@@ -326,35 +331,24 @@ def parse_csv(csv_data,
     if isinstance(csv_data, str):
         csv_data = csv_data.split(line_terminator)
 
-    if not wrapper_character:
-        wrapper_character = "'"
-
-    if wrap_all_strings:
-        quoting = csv.QUOTE_NONNUMERIC
-    else:
-        quoting = csv.QUOTE_MINIMAL
-
-    if 'highcharts' in csv.list_dialects():
-        csv.unregister_dialect('highcharts')
-
-    csv.register_dialect('highcharts',
-                         delimiter = delimiter,
-                         doublequote = double_wrapper_character_when_nested,
-                         escapechar = escape_character,
-                         quotechar = wrapper_character,
-                         quoting = quoting,
-                         lineterminator = line_terminator)
+    dialect_kwargs = get_csv_dialect_kwargs(
+        delimiter = delimiter,
+        wrapper_character = wrapper_character,
+        wrap_all_strings = wrap_all_strings,
+        double_wrapper_character_when_nested = double_wrapper_character_when_nested,
+        escape_character = escape_character,
+        line_terminator = line_terminator
+    )
 
     if has_header_row:
         csv_reader = csv.DictReader(csv_data,
-                                    dialect = 'highcharts',
                                     restkey = None,
-                                    restval = None)
+                                    restval = None,
+                                    **dialect_kwargs)
         records_as_dicts = [x for x in csv_reader]
         columns = csv_reader.fieldnames
     else:
-        csv_reader = csv.reader(csv_data,
-                                dialect = 'highcharts')
+        csv_reader = csv.reader(csv_data, **dialect_kwargs)
         records_as_dicts = []
         columns = []
         for row in csv_reader:
@@ -370,6 +364,440 @@ def parse_csv(csv_data,
     return columns, records_as_dicts
 
 
+def get_csv_dialect_kwargs(delimiter = ',',
+                           wrapper_character = "'",
+                           wrap_all_strings = False,
+                           double_wrapper_character_when_nested = False,
+                           escape_character = "\\",
+                           line_terminator = '\r\n') -> dict:
+    """Return the formatting parameters used to parse CSV data, as keyword arguments
+    that can be supplied directly to :func:`csv.reader() <python:csv.reader>` or
+    :class:`csv.DictReader <python:csv.DictReader>`.
+
+    .. note::
+
+      The parameters are supplied to each reader directly rather than registered as a
+      (process-global) :mod:`csv <python:csv>` dialect, so CSV data can safely be
+      parsed concurrently (e.g. in a thread pool) with different parameters.
+
+    :param delimiter: The delimiter used between columns. Defaults to ``,``.
+    :type delimiter: :class:`str <python:str>`
+
+    :param wrapper_character: The string used to wrap string values when
+      wrapping is applied. Defaults to ``'``.
+    :type wrapper_character: :class:`str <python:str>`
+
+    :param wrap_all_strings: If ``True``, indicates that the CSV data has all string
+      data values wrapped in quotation marks. Defaults to ``False``.
+    :type wrap_all_strings: :class:`bool <python:bool>`
+
+    :param double_wrapper_character_when_nested: If ``True``, quote character is
+      doubled when appearing within a string value. If ``False``, the
+      ``escape_character`` is used to prefix quotation marks. Defaults to ``False``.
+    :type double_wrapper_character_when_nested: :class:`bool <python:bool>`
+
+    :param escape_character: A one-character string that indicates the character used
+      to escape quotation marks if they appear within a string value that is already
+      wrapped in quotation marks. Defaults to ``\\``.
+    :type escape_character: :class:`str <python:str>`
+
+    :param line_terminator: The string used to indicate the end of a line/record in
+      the CSV data. Defaults to ``'\\r\\n'``.
+    :type line_terminator: :class:`str <python:str>`
+
+    :rtype: :class:`dict <python:dict>`
+    """
+    if not wrapper_character:
+        wrapper_character = "'"
+
+    if wrap_all_strings:
+        quoting = csv.QUOTE_NONNUMERIC
+    else:
+        quoting = csv.QUOTE_MINIMAL
+
+    return {
+        'delimiter': delimiter,
+        'doublequote': double_wrapper_character_when_nested,
+        'escapechar': escape_character,
+        'quotechar': wrapper_character,
+        'quoting': quoting,
+        'lineterminator': line_terminator,
+    }
+
+
+def _csv_column_to_ndarray(values, null_text = 'None', sample_size = 1000):
+    """Convert the (raw) ``values`` of a CSV column to a typed
+    :class:`numpy.ndarray <numpy:numpy.ndarray>`, inferring its type from a sample of
+    its non-empty values.
+
+    Numeric columns (which may use ``,`` as a thousands separator) are converted to
+    ``int64`` or ``float64`` values, with empty values represented as
+    :obj:`numpy.nan <numpy:numpy.nan>`. Columns of ISO 8601 dates / times are converted
+    to ``datetime64[ms]`` values, with empty values represented as ``NaT``. Any other
+    column is returned with an ``object`` dtype, with empty values represented as
+    :obj:`None <python:None>`.
+
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    """
+    if not len(values):
+        return np.asarray([], dtype = np.float64)
+
+    as_str = np.asarray(values, dtype = str)
+    is_null = (as_str == '') | (as_str == str(null_text))
+    sample = as_str[~is_null][:sample_size]
+
+    cleaned = np.char.replace(as_str, ',', '')
+    if len(sample):
+        try:
+            np.char.replace(sample, ',', '').astype(np.float64)
+            is_numeric = True
+        except ValueError:
+            is_numeric = False
+    else:
+        is_numeric = True
+
+    if is_numeric:
+        try:
+            if not is_null.any():
+                try:
+                    return cleaned.astype(np.int64)
+                except (ValueError, OverflowError):
+                    pass
+            return np.where(is_null, 'nan', cleaned).astype(np.float64)
+        except ValueError:
+            pass
+    else:
+        try:
+            sample.astype('datetime64[ms]')
+            is_datetime = True
+        except ValueError:
+            is_datetime = False
+
+        if is_datetime:
+            try:
+                return np.where(is_null, 'NaT', as_str).astype('datetime64[ms]')
+            except ValueError:
+                pass
+
+    as_object = as_str.astype(object)
+    as_object[is_null] = None
+
+    return as_object
+
+
+def parse_csv_columns(csv_data,
+                      columns = None,
+                      has_header_row = True,
+                      delimiter = ',',
+                      null_text = 'None',
+                      wrapper_character = "'",
+                      wrap_all_strings = False,
+                      double_wrapper_character_when_nested = False,
+                      escape_character = "\\",
+                      line_terminator = '\r\n',
+                      sample_size = 1000):
+    """Parse ``csv_data`` into one typed :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    per column, without creating a :class:`dict <python:dict>` for each record.
+
+    The type of each column is inferred from a sample of its non-empty values:
+
+      * numeric columns (which may use ``,`` as a thousands separator) are returned as
+        ``int64`` or ``float64`` arrays, with empty values represented as
+        :obj:`numpy.nan <numpy:numpy.nan>`
+      * columns of ISO 8601 dates / times are returned as ``datetime64[ms]`` arrays,
+        with empty values represented as ``NaT``
+      * all other columns are returned as ``object`` arrays of
+        :class:`str <python:str>`, with empty values represented as
+        :obj:`None <python:None>`
+
+    :param csv_data: The CSV data, expressed either as a :class:`str <python:str>` or
+      as an iterable of lines (e.g. an open file).
+    :type csv_data: :class:`str <python:str>` or iterable of :class:`str <python:str>`
+
+    :param columns: The columns to return, identified either by their label (if
+      ``has_header_row`` is ``True``) or by their numerical index (starting with ``0``).
+      Columns that are not requested are never converted. If
+      :obj:`None <python:None>`, returns all columns. Defaults to
+      :obj:`None <python:None>`.
+    :type columns: iterable of :class:`str <python:str>` / :class:`int <python:int>`,
+      or :obj:`None <python:None>`
+
+    :param has_header_row: If ``True``, indicates that the first row of ``csv_data``
+      contains column labels, rather than actual data. Defaults to ``True``.
+    :type has_header_row: :class:`bool <python:bool>`
+
+    :param delimiter: The delimiter used between columns. Defaults to ``,``.
+    :type delimiter: :class:`str <python:str>`
+
+    :param null_text: The string used to indicate an empty value. Defaults to
+      ``'None'``.
+    :type null_text: :class:`str <python:str>`
+
+    :param wrapper_character: The string used to wrap string values when
+      wrapping is applied. Defaults to ``'``.
+    :type wrapper_character: :class:`str <python:str>`
+
+    :param wrap_all_strings: If ``True``, indicates that the CSV data has all string
+      data values wrapped in quotation marks. Defaults to ``False``.
+    :type wrap_all_strings: :class:`bool <python:bool>`
+
+    :param double_wrapper_character_when_nested: If ``True``, quote character is
+      doubled when appearing within a string value. If ``False``, the
+      ``escape_character`` is used to prefix quotation marks. Defaults to ``False``.
+    :type double_wrapper_character_when_nested: :class:`bool <python:bool>`
+
+    :param escape_character: A one-character string that indicates the character used
+      to escape quotation marks if they appear within a string value that is already
+      wrapped in quotation marks. Defaults to ``\\``.
+    :type escape_character: :class:`str <python:str>`
+
+    :param line_terminator: The string used to indicate the end of a line/record in
+      the CSV data. Defaults to ``'\\r\\n'``.
+    :type line_terminator: :class:`str <python:str>`
+
+    :param sample_size: The number of non-empty values used to infer the type of each
+      column. Defaults to ``1000``.
+    :type sample_size: :class:`int <python:int>`
+
+    :returns: The labels (or numerical indices) of *all* columns in the CSV data, and a
+      :class:`dict <python:dict>` whose keys are the requested columns (as supplied in
+      ``columns``) and whose values are the typed column values
+    :rtype: :class:`tuple <python:tuple>` of a :class:`list <python:list>` of column
+      names and a :class:`dict <python:dict>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsCSVDeserializationError: if ``columns`` requests a column that is
+      not present in ``csv_data``
+    """
+    column_names = []
+    as_dict = {}
+    for column_names, as_dict in iter_csv_columns(
+        csv_data,
+        columns = columns,
+        has_header_row = has_header_row,
+        delimiter = delimiter,
+        null_text = null_text,
+        wrapper_character = wrapper_character,
+        wrap_all_strings = wrap_all_strings,
+        double_wrapper_character_when_nested = double_wrapper_character_when_nested,
+        escape_character = escape_character,
+        line_terminator = line_terminator,
+        sample_size = sample_size
+    ):
+        pass
+
+    return column_names, as_dict
+
+
+def _iter_mmap_lines(filename, encoding = 'utf-8'):
+    """Iterate over the lines of the file at ``filename`` using a read-only memory map,
+    so that the file is never read into memory in full."""
+    with open(filename, 'rb') as file_:
+        try:
+            memory_map = mmap.mmap(file_.fileno(), 0, access = mmap.ACCESS_READ)
+        except ValueError:
+            return
+
+        try:
+            for line in iter(memory_map.readline, b''):
+                yield line.decode(encoding)
+        finally:
+            memory_map.close()
+
+
+def iter_csv_columns(csv_data,
+                     columns = None,
+                     chunksize = None,
+                     has_header_row = True,
+                     delimiter = ',',
+                     null_text = 'None',
+                     wrapper_character = "'",
+                     wrap_all_strings = False,
+                     double_wrapper_character_when_nested = False,
+                     escape_character = "\\",
+                     line_terminator = '\r\n',
+                     sample_size = 1000,
+                     encoding = 'utf-8'):
+    """Parse ``csv_data`` in chunks of (at most) ``chunksize`` records, yielding one
+    typed :class:`numpy.ndarray <numpy:numpy.ndarray>` per column for each chunk.
+
+    Only one chunk of records is held in memory at a time. If ``csv_data`` is the path to
+    a file, the file is read using a read-only memory map.
+
+    .. seealso::
+
+      * :func:`parse_csv_columns() <highcharts_core.utility_functions.parse_csv_columns>`,
+        which describes how the type of each column is inferred
+
+    .. note::
+
+      The type of each column is inferred separately for each chunk.
+
+    :param csv_data: The CSV data, expressed either as a :class:`str <python:str>`, as
+      an iterable of lines (e.g. an open file), or as the path to a file.
+    :type csv_data: :class:`str <python:str>`, Path-like, or iterable of
+      :class:`str <python:str>`
+
+    :param columns: The columns to return, identified either by their label (if
+      ``has_header_row`` is ``True``) or by their numerical index (starting with ``0``).
+      If :obj:`None <python:None>`, returns all columns. Defaults to
+      :obj:`None <python:None>`.
+    :type columns: iterable of :class:`str <python:str>` / :class:`int <python:int>`,
+      or :obj:`None <python:None>`
+
+    :param chunksize: The maximum number of records in each chunk. If
+      :obj:`None <python:None>`, all records are returned in a single chunk. Defaults to
+      :obj:`None <python:None>`.
+    :type chunksize: :class:`int <python:int>` or :obj:`None <python:None>`
+
+    :param has_header_row: If ``True``, indicates that the first row of ``csv_data``
+      contains column labels, rather than actual data. Defaults to ``True``.
+    :type has_header_row: :class:`bool <python:bool>`
+
+    :param delimiter: The delimiter used between columns. Defaults to ``,``.
+    :type delimiter: :class:`str <python:str>`
+
+    :param null_text: The string used to indicate an empty value. Defaults to
+      ``'None'``.
+    :type null_text: :class:`str <python:str>`
+
+    :param wrapper_character: The string used to wrap string values when
+      wrapping is applied. Defaults to ``'``.
+    :type wrapper_character: :class:`str <python:str>`
+
+    :param wrap_all_strings: If ``True``, indicates that the CSV data has all string
+      data values wrapped in quotation marks. Defaults to ``False``.
+    :type wrap_all_strings: :class:`bool <python:bool>`
+
+    :param double_wrapper_character_when_nested: If ``True``, quote character is
+      doubled when appearing within a string value. If ``False``, the
+      ``escape_character`` is used to prefix quotation marks. Defaults to ``False``.
+    :type double_wrapper_character_when_nested: :class:`bool <python:bool>`
+
+    :param escape_character: A one-character string that indicates the character used
+      to escape quotation marks if they appear within a string value that is already
+      wrapped in quotation marks. Defaults to ``\\``.
+    :type escape_character: :class:`str <python:str>`
+
+    :param line_terminator: The string used to indicate the end of a line/record in
+      the CSV data. Defaults to ``'\\r\\n'``.
+    :type line_terminator: :class:`str <python:str>`
+
+    :param sample_size: The number of non-empty values used to infer the type of each
+      column. Defaults to ``1000``.
+    :type sample_size: :class:`int <python:int>`
+
+    :param encoding: The character encoding of the file, if ``csv_data`` is the path to
+      a file. Defaults to ``'utf-8'``.
+    :type encoding: :class:`str <python:str>`
+
+    :returns: A generator which yields, for each chunk, the labels (or numerical
+      indices) of *all* columns in the CSV data and a :class:`dict <python:dict>` whose
+      keys are the requested columns (as supplied in ``columns``) and whose values are
+      the typed column values
+    :rtype: generator of :class:`tuple <python:tuple>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsCSVDeserializationError: if ``columns`` requests a column that is
+      not present in ``csv_data``
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    sample_size = validators.integer(sample_size, minimum = 1)
+    chunksize = validators.integer(chunksize, minimum = 1, allow_empty = True)
+    if not csv_data:
+        return
+
+    if isinstance(csv_data, os.PathLike):
+        csv_data = _iter_mmap_lines(csv_data, encoding = encoding)
+    elif isinstance(csv_data, str) and checkers.is_on_filesystem(csv_data):
+        csv_data = _iter_mmap_lines(csv_data, encoding = encoding)
+    elif isinstance(csv_data, str):
+        csv_data = csv_data.split(line_terminator)
+
+    dialect_kwargs = get_csv_dialect_kwargs(
+        delimiter = delimiter,
+        wrapper_character = wrapper_character,
+        wrap_all_strings = wrap_all_strings,
+        double_wrapper_character_when_nested = double_wrapper_character_when_nested,
+        escape_character = escape_character,
+        line_terminator = line_terminator
+    )
+
+    csv_reader = csv.reader(csv_data, **dialect_kwargs)
+
+    first_row = next(csv_reader, None)
+    while first_row is not None and not first_row:
+        first_row = next(csv_reader, None)
+    if first_row is None:
+        return
+
+    if has_header_row:
+        column_names = [x for x in first_row]
+    else:
+        column_names = [x for x in range(len(first_row))]
+
+    if columns is None:
+        columns = [x for x in column_names]
+    else:
+        columns = [x for x in columns]
+
+    positions = []
+    for column in columns:
+        if column in column_names:
+            positions.append(column_names.index(column))
+        elif checkers.is_integer(column) and 0 <= int(column) < len(column_names):
+            positions.append(int(column))
+        else:
+            raise errors.HighchartsCSVDeserializationError(f'Unable to find a column '
+                                                           f'labeled "{column}" in the '
+                                                           f'CSV data.')
+
+    def to_chunk(buffers):
+        as_dict = {}
+        for column, buffer in zip(columns, buffers):
+            as_dict[column] = _csv_column_to_ndarray(buffer,
+                                                     null_text = null_text,
+                                                     sample_size = sample_size)
+
+        return column_names, as_dict
+
+    buffers = [[] for x in positions]
+    projection = list(zip(buffers, positions))
+    records = 0
+    has_yielded = False
+    if not has_header_row:
+        for buffer, position in projection:
+            buffer.append(first_row[position])
+        records += 1
+
+    for row in csv_reader:
+        if chunksize and records >= chunksize:
+            yield to_chunk(buffers)
+            has_yielded = True
+            buffers = [[] for x in positions]
+            projection = list(zip(buffers, positions))
+            records = 0
+
+        if not row:
+            continue
+        length = len(row)
+        for buffer, position in projection:
+            buffer.append(row[position] if position < length else '')
+        records += 1
+
+    if records or not has_yielded:
+        yield to_chunk(buffers)
+
+
 def jupyter_add_script(url, is_last = False, use_require = False):
     """Generates the JavaScript code Promise which adds a <script/> tag to the Jupyter 
     Lab environment.
@@ -691,7 +1119,8 @@ def from_ndarray(as_ndarray, force_enforced_null = False):
     if as_ndarray.dtype.char not in ['O', 'U', 'M']:
         stripped = np.where(np.isnan(as_ndarray), nan_replacement, as_ndarray)
     elif as_ndarray.dtype.char == 'M':
-        stripped = (as_ndarray.astype(np.int64) / 10**6).astype(np.int64)
+        as_ms = as_ndarray.astype('datetime64[ms]').astype(np.int64)
+        stripped = np.where(np.isnat(as_ndarray), nan_replacement, as_ms)
     else:
         prelim_stripped = as_ndarray.tolist()
         stripped = []
@@ -935,4 +1364,2334 @@ def datetime64_to_datetime(dt64):
                                                'environment.')
     timestamp = (dt64 - np.datetime64("1970-01-01T00:00:00")) / np.timedelta64(1, "s")
     
-    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
\ No newline at end of file
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+
+def to_float_ndarray(value):
+    """Convert ``value`` to a one-dimensional :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    of :class:`float <python:float>` values, with empty values represented as
+    :obj:`numpy.nan <numpy:numpy.nan>` and dates / times represented as milliseconds
+    since the Unix epoch.
+
+    :param value: The array-like value to convert.
+    :type value: Array-like
+
+    :returns: A :class:`numpy.ndarray <numpy:numpy.ndarray>` with a ``float64`` dtype.
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsValueError: if ``value`` contains values that cannot be
+      converted to numbers
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    as_array = np.asarray(value)
+    if as_array.dtype.kind == 'M':
+        result = as_array.astype('datetime64[ms]').astype(np.int64).astype(np.float64)
+        result[np.isnat(as_array)] = np.nan
+        return result
+    elif as_array.dtype.kind in 'biuf':
+        return as_array.astype(np.float64)
+
+    as_list = []
+    for item in as_array.tolist():
+        if item is None or isinstance(item, constants.EnforcedNullType):
+            as_list.append(np.nan)
+        elif checkers.is_datetime(item) or checkers.is_date(item):
+            as_list.append(validators.datetime(item).timestamp() * 1000)
+        else:
+            as_list.append(item)
+
+    try:
+        return np.asarray(as_list, dtype = np.float64)
+    except (TypeError, ValueError):
+        raise errors.HighchartsValueError('Unable to convert the values supplied to '
+                                          'numbers.')
+
+
+def _lttb_indices(x, y, n_points):
+    """Select ``n_points`` indices from a gap-free series using the
+    Largest-Triangle-Three-Buckets algorithm."""
+    length = len(y)
+    if n_points >= length:
+        return np.arange(length)
+    if n_points < 3:
+        return np.asarray([0, length - 1])
+
+    edges = np.linspace(1, length - 1, n_points - 1).astype(np.int64)
+    counts = np.diff(edges)
+    bucket_x = np.add.reduceat(x[1:length - 1], edges[:-1] - 1) / counts
+    bucket_y = np.add.reduceat(y[1:length - 1], edges[:-1] - 1) / counts
+    next_x = np.append(bucket_x[1:], x[-1])
+    next_y = np.append(bucket_y[1:], y[-1])
+
+    selected = np.empty(n_points, dtype = np.int64)
+    selected[0] = 0
+    selected[-1] = length - 1
+    previous = 0
+    for index in range(n_points - 2):
+        start = edges[index]
+        end = edges[index + 1]
+        areas = np.abs((x[previous] - next_x[index]) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (next_y[index] - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[index + 1] = previous
+
+    return selected
+
+
+def _bucket_extrema_indices(y, edges):
+    """Return the indices of the minimum and maximum values of ``y`` within each of the
+    contiguous buckets delimited by ``edges``."""
+    bucket_ids = np.repeat(np.arange(len(edges) - 1), np.diff(edges))
+    order = np.lexsort((y[edges[0]:edges[-1]], bucket_ids)) + edges[0]
+    starts = edges[:-1] - edges[0]
+    ends = edges[1:] - edges[0]
+
+    return order[starts], order[ends - 1]
+
+
+def _minmax_indices(x, y, n_points):
+    """Select (up to) ``n_points`` indices from a gap-free series by retaining the
+    minimum and maximum values within each bucket."""
+    length = len(y)
+    if n_points >= length:
+        return np.arange(length)
+
+    buckets = max(1, (n_points - 2) // 2)
+    edges = np.linspace(1, length - 1, buckets + 1).astype(np.int64)
+    minimums, maximums = _bucket_extrema_indices(y, edges)
+
+    return np.unique(np.concatenate(([0], minimums, maximums, [length - 1])))
+
+
+def _m4_indices(x, y, n_points):
+    """Select (up to) ``n_points`` indices from a gap-free series by retaining the
+    first, last, minimum, and maximum values within each bucket."""
+    length = len(y)
+    if n_points >= length:
+        return np.arange(length)
+
+    buckets = max(1, n_points // 4)
+    edges = np.linspace(0, length, buckets + 1).astype(np.int64)
+    minimums, maximums = _bucket_extrema_indices(y, edges)
+
+    return np.unique(np.concatenate((edges[:-1], edges[1:] - 1, minimums, maximums)))
+
+
+def downsample_indices(y, n_points, x = None, method = 'lttb'):
+    """Select the indices of (approximately) ``n_points`` values from ``y`` which
+    preserve the visual shape of the series when plotted.
+
+    The first and last values of the series are always retained. Empty values
+    (:obj:`numpy.nan <numpy:numpy.nan>`) are treated as gaps: the first empty value of
+    each gap is retained (so that Highcharts continues to render the gap), and each
+    contiguous run of values between gaps is downsampled independently, with
+    ``n_points`` apportioned between them based on their length.
+
+    :param y: The values of the series.
+    :type y: Array-like
+
+    :param n_points: The (target) number of values to retain.
+    :type n_points: :class:`int <python:int>`
+
+    :param x: The x-values of the series. If :obj:`None <python:None>`, the values are
+      assumed to be evenly spaced. Defaults to :obj:`None <python:None>`.
+    :type x: Array-like or :obj:`None <python:None>`
+
+    :param method: The algorithm to apply. Accepts:
+
+      * ``'lttb'`` - Largest-Triangle-Three-Buckets, which retains the point in each
+        bucket that forms the largest triangle with its neighbouring buckets
+      * ``'minmax'`` - retains the minimum and maximum value in each bucket
+      * ``'m4'`` - retains the first, last, minimum, and maximum value in each bucket
+
+      Defaults to ``'lttb'``.
+    :type method: :class:`str <python:str>`
+
+    :returns: The (sorted) indices of the values to retain.
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>` of :class:`int <python:int>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsValueError: if ``method`` is not supported
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    methods = {
+        'lttb': _lttb_indices,
+        'minmax': _minmax_indices,
+        'm4': _m4_indices,
+    }
+    method = validators.string(method).lower()
+    if method not in methods:
+        raise errors.HighchartsValueError(f'method expects "lttb", "minmax", or "m4". '
+                                          f'Received: "{method}"')
+    n_points = validators.integer(n_points, minimum = 2)
+
+    y = to_float_ndarray(y)
+    length = len(y)
+    if x is None:
+        x = np.arange(length, dtype = np.float64)
+    else:
+        x = to_float_ndarray(x)
+        if len(x) != length:
+            raise errors.HighchartsValueError(f'x and y must have the same length. '
+                                              f'Received: {len(x)} and {length}')
+
+    if length <= n_points:
+        return np.arange(length)
+
+    is_gap = np.isnan(y) | np.isnan(x)
+    if not is_gap.any():
+        return methods[method](x, y, n_points)
+
+    gap_boundaries = np.flatnonzero(np.diff(np.concatenate(([0],
+                                                           is_gap.astype(np.int8),
+                                                           [0]))))
+    segment_boundaries = np.flatnonzero(np.diff(np.concatenate(([0],
+                                                               (~is_gap).astype(np.int8),
+                                                               [0]))))
+    gap_starts = gap_boundaries[::2]
+    segment_starts = segment_boundaries[::2]
+    segment_ends = segment_boundaries[1::2]
+
+    budget = max(n_points - len(gap_starts), 2 * len(segment_starts))
+    valid_count = length - int(is_gap.sum())
+
+    selected = [gap_starts]
+    for start, end in zip(segment_starts, segment_ends):
+        segment_points = max(2, int(round(budget * (end - start) / valid_count)))
+        selected.append(start + methods[method](x[start:end],
+                                                y[start:end],
+                                                segment_points))
+
+    return np.sort(np.concatenate(selected))
+
+
+def _rdp_indices(x, y, tolerance, min_points = 2):
+    """Select the indices of the vertices of a gap-free line to retain using the
+    Ramer-Douglas-Peucker algorithm, where ``tolerance`` is the maximum distance
+    between a discarded vertex and the simplified line."""
+    length = len(y)
+    if length <= 2:
+        return np.arange(length)
+
+    def get_farthest(start, end):
+        dx = x[end] - x[start]
+        dy = y[end] - y[start]
+        px = x[start + 1:end] - x[start]
+        py = y[start + 1:end] - y[start]
+        squared_norm = dx * dx + dy * dy
+        if squared_norm > 0:
+            t = np.clip((px * dx + py * dy) / squared_norm, 0, 1)
+            distances = np.hypot(px - t * dx, py - t * dy)
+        else:
+            distances = np.hypot(px, py)
+        index = int(np.argmax(distances))
+
+        return start + 1 + index, distances[index]
+
+    is_kept = np.zeros(length, dtype = bool)
+    is_kept[0] = True
+    is_kept[-1] = True
+    stack = [(0, length - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        index, distance = get_farthest(start, end)
+        if distance > tolerance:
+            is_kept[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+
+    min_points = min(min_points, length)
+    while is_kept.sum() < min_points:
+        kept = np.flatnonzero(is_kept)
+        candidates = [get_farthest(start, end)
+                      for start, end in zip(kept[:-1], kept[1:])
+                      if end - start >= 2]
+        is_kept[max(candidates, key = lambda item: item[1])[0]] = True
+
+    return np.flatnonzero(is_kept)
+
+
+def _visvalingam_indices(x, y, tolerance, min_points = 2):
+    """Select the indices of the vertices of a gap-free line to retain using the
+    Visvalingam-Whyatt algorithm, where ``tolerance`` is the minimum (effective) area
+    of the triangle formed by a retained vertex and its neighbours."""
+    length = len(y)
+    if length <= 2:
+        return np.arange(length)
+
+    # Areas are handled doubled throughout, to save a multiplication per triangle.
+    tolerance = 2 * tolerance
+    areas = np.zeros(length)
+    areas[1:-1] = np.abs((x[:-2] - x[2:]) * (y[1:-1] - y[:-2]) -
+                         (x[:-2] - x[1:-1]) * (y[2:] - y[:-2]))
+
+    # Vertices whose area already meets the tolerance can only be removed once a
+    # neighbour has been, so only the remaining vertices seed the heap.
+    candidates = np.flatnonzero(areas[1:-1] < tolerance) + 1
+    heap = list(zip(areas[candidates].tolist(), candidates.tolist()))
+    heapq.heapify(heap)
+
+    x = x.tolist()
+    y = y.tolist()
+    areas = areas.tolist()
+    previous = list(range(-1, length - 1))
+    following = list(range(1, length + 1))
+    is_removed = bytearray(length)
+    removable = length - min_points
+    last = length - 1
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    heapreplace = heapq.heapreplace
+
+    # Each vertex below the tolerance keeps a heap entry whose area is no greater than
+    # its current area. Increases to a vertex's area are applied lazily, when its
+    # (outdated) entry reaches the top of the heap, so that only decreases require a
+    # new entry and the heap holds few stale entries.
+    while heap and removable > 0:
+        area, index = heap[0]
+        if is_removed[index]:
+            heappop(heap)
+            continue
+        current = areas[index]
+        if area != current:
+            if area < current and current < tolerance:
+                heapreplace(heap, (current, index))
+            else:
+                heappop(heap)
+            continue
+
+        heappop(heap)
+        is_removed[index] = 1
+        removable -= 1
+        before = previous[index]
+        after = following[index]
+        following[before] = after
+        previous[after] = before
+        x_before, y_before = x[before], y[before]
+        x_after, y_after = x[after], y[after]
+
+        # Neighbours may not be eliminated before the vertex just removed, so their
+        # areas are at least that of the vertex just removed.
+        if before != 0:
+            start = previous[before]
+            x_start, y_start = x[start], y[start]
+            neighbour_area = abs((x_start - x_after) * (y_before - y_start) -
+                                 (x_start - x_before) * (y_after - y_start))
+            if neighbour_area < area:
+                neighbour_area = area
+            if neighbour_area < areas[before] and neighbour_area < tolerance:
+                heappush(heap, (neighbour_area, before))
+            areas[before] = neighbour_area
+        if after != last:
+            end = following[after]
+            x_end, y_end = x[end], y[end]
+            neighbour_area = abs((x_before - x_end) * (y_after - y_before) -
+                                 (x_before - x_after) * (y_end - y_before))
+            if neighbour_area < area:
+                neighbour_area = area
+            if neighbour_area < areas[after] and neighbour_area < tolerance:
+                heappush(heap, (neighbour_area, after))
+            areas[after] = neighbour_area
+
+    return np.flatnonzero(np.frombuffer(bytes(is_removed), dtype = np.uint8) == 0)
+
+
+def simplify_indices(y,
+                     tolerance,
+                     x = None,
+                     method = 'rdp',
+                     preserve_topology = True):
+    """Select the indices of the vertices of a line or polygon to retain so that its
+    simplified shape stays within ``tolerance`` of the original.
+
+    The first and last vertices are always retained. Empty values
+    (:obj:`numpy.nan <numpy:numpy.nan>`) are treated as gaps: the first empty value of
+    each gap is retained, and each contiguous run of vertices between gaps is
+    simplified independently.
+
+    .. note::
+
+      The tolerance is applied in the units of the data. If the x and y values are
+      measured on very different scales, they should be rescaled first.
+
+    :param y: The y-values of the vertices.
+    :type y: Array-like
+
+    :param tolerance: For ``'rdp'``, the maximum distance between a discarded vertex
+      and the simplified line. For ``'visvalingam'``, the minimum (effective) area of
+      the triangle formed by a retained vertex and its neighbours.
+    :type tolerance: numeric
+
+    :param x: The x-values of the vertices. If :obj:`None <python:None>`, the values
+      are assumed to be evenly spaced. Defaults to :obj:`None <python:None>`.
+    :type x: Array-like or :obj:`None <python:None>`
+
+    :param method: The algorithm to apply. Accepts:
+
+      * ``'rdp'`` - Ramer-Douglas-Peucker, which recursively retains the vertex
+        farthest from the simplified line
+      * ``'visvalingam'`` - Visvalingam-Whyatt, which repeatedly discards the vertex
+        forming the smallest triangle with its neighbours (using a heap, in
+        :math:`O(n \\log n)`)
+
+      Defaults to ``'rdp'``.
+    :type method: :class:`str <python:str>`
+
+    :param preserve_topology: If ``True``, closed rings (whose first and last vertices
+      coincide) retain at least three distinct vertices, so that polygons do not
+      collapse into lines. Intersections between non-adjacent edges are not checked.
+      Defaults to ``True``.
+    :type preserve_topology: :class:`bool <python:bool>`
+
+    :returns: The (sorted) indices of the vertices to retain.
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>` of :class:`int <python:int>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsValueError: if ``method`` is not supported, or if ``x`` and ``y``
+      have different lengths
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    methods = {
+        'rdp': _rdp_indices,
+        'visvalingam': _visvalingam_indices,
+    }
+    method = validators.string(method).lower()
+    if method not in methods:
+        raise errors.HighchartsValueError(f'method expects "rdp" or "visvalingam". '
+                                          f'Received: "{method}"')
+    tolerance = validators.numeric(tolerance, minimum = 0)
+
+    y = to_float_ndarray(y)
+    length = len(y)
+    if x is None:
+        x = np.arange(length, dtype = np.float64)
+    else:
+        x = to_float_ndarray(x)
+        if len(x) != length:
+            raise errors.HighchartsValueError(f'x and y must have the same length. '
+                                              f'Received: {len(x)} and {length}')
+
+    is_gap = np.isnan(y) | np.isnan(x)
+    if not is_gap.any():
+        segment_starts = np.asarray([0])
+        segment_ends = np.asarray([length])
+        selected = []
+    else:
+        gap_boundaries = np.flatnonzero(np.diff(np.concatenate(([0],
+                                                               is_gap.astype(np.int8),
+                                                               [0]))))
+        segment_boundaries = np.flatnonzero(
+            np.diff(np.concatenate(([0], (~is_gap).astype(np.int8), [0])))
+        )
+        segment_starts = segment_boundaries[::2]
+        segment_ends = segment_boundaries[1::2]
+        selected = [gap_boundaries[::2]]
+
+    for start, end in zip(segment_starts, segment_ends):
+        segment_x = x[start:end]
+        segment_y = y[start:end]
+        min_points = 2
+        if preserve_topology and end - start > 3 and \
+           segment_x[0] == segment_x[-1] and segment_y[0] == segment_y[-1]:
+            min_points = 4
+        selected.append(start + methods[method](segment_x,
+                                                segment_y,
+                                                tolerance,
+                                                min_points = min_points))
+
+    if not selected:
+        return np.arange(0)
+
+    return np.sort(np.concatenate(selected))
+
+
+def to_epoch_ms(value):
+    """Convert ``value`` to a one-dimensional
+    :class:`numpy.ndarray <numpy:numpy.ndarray>` of integer milliseconds since the Unix
+    epoch (the representation of time used by Highcharts).
+
+    :param value: The dates / times to convert, either as
+      :class:`numpy.datetime64 <numpy:numpy.datetime64>` values, Python
+      :class:`datetime <python:datetime.datetime>` values, or numbers (which are
+      assumed to already be expressed in milliseconds since the Unix epoch).
+    :type value: Array-like
+
+    :returns: A 2-member :class:`tuple <python:tuple>` containing a
+      :class:`numpy.ndarray <numpy:numpy.ndarray>` with an ``int64`` dtype and a
+      boolean :class:`numpy.ndarray <numpy:numpy.ndarray>` indicating which members of
+      ``value`` were empty.
+    :rtype: :class:`tuple <python:tuple>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsValueError: if ``value`` contains values that cannot be
+      converted to dates / times
+    """
+    as_float = to_float_ndarray(value)
+    is_empty = np.isnan(as_float)
+
+    return np.where(is_empty, 0, np.floor(as_float)).astype(np.int64), is_empty
+
+
+def _validate_time_unit(unit):
+    """Validate that ``unit`` is a unit of time supported by :func:`group_by_time`.
+
+    :returns: The (lower-cased) unit.
+    :rtype: :class:`str <python:str>`
+
+    :raises HighchartsValueError: if ``unit`` is not supported
+    """
+    unit = validators.string(unit).lower()
+    if unit not in constants.TIME_UNITS_IN_MS and unit not in ['month', 'year']:
+        raise errors.HighchartsValueError(f'unit expects one of: '
+                                          f'{", ".join(constants.TIME_UNITS_IN_MS)}, '
+                                          f'month, or year. Received: "{unit}"')
+
+    return unit
+
+
+def _get_interval_keys(x, unit, multiple):
+    """Return the key of the time interval (of ``multiple`` ``unit``) which contains
+    each member of ``x``, expressed in milliseconds since the Unix epoch. Consecutive
+    intervals have consecutive keys.
+
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    """
+    if unit in ['month', 'year']:
+        months = x.astype('datetime64[ms]').astype('datetime64[M]').astype(np.int64)
+        if unit == 'year':
+            multiple = multiple * 12
+        return np.floor_divide(months, multiple)
+
+    step = constants.TIME_UNITS_IN_MS[unit] * multiple
+
+    return np.floor_divide(x + _get_interval_offset(unit), step)
+
+
+def _get_interval_offset(unit):
+    """Return the offset (in milliseconds) applied to times before they are divided
+    into intervals of ``unit``.
+
+    :rtype: :class:`int <python:int>`
+    """
+    if unit == 'week':
+        # Unix epoch was a Thursday, so offset intervals to begin on a Monday.
+        return 3 * constants.TIME_UNITS_IN_MS['day']
+
+    return 0
+
+
+def _get_interval_starts(keys, unit, multiple):
+    """Return the start (in milliseconds since the Unix epoch) of the time intervals
+    identified by ``keys`` (see :func:`_get_interval_keys`).
+
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    """
+    if unit in ['month', 'year']:
+        if unit == 'year':
+            multiple = multiple * 12
+        interval_starts = (keys * multiple).astype('datetime64[M]')
+        return interval_starts.astype('datetime64[ms]').astype(np.int64)
+
+    return keys * constants.TIME_UNITS_IN_MS[unit] * multiple - _get_interval_offset(unit)
+
+
+def group_by_time(x,
+                  y,
+                  unit,
+                  multiple = 1,
+                  approximation = 'average',
+                  fill_gaps = False):
+    """Group the values in ``y`` into regular time intervals based on the dates / times
+    in ``x``, and aggregate the values in each interval.
+
+    Intervals are aligned to calendar boundaries (in UTC), with weeks starting on
+    Monday. Values for which either ``x`` or ``y`` is empty are ignored.
+
+    :param x: The dates / times of the values, either as
+      :class:`numpy.datetime64 <numpy:numpy.datetime64>` values, Python
+      :class:`datetime <python:datetime.datetime>` values, or numbers expressed in
+      milliseconds since the Unix epoch.
+    :type x: Array-like
+
+    :param y: The values to aggregate.
+    :type y: Array-like
+
+    :param unit: The unit of time of each interval. Accepts ``'millisecond'``,
+      ``'second'``, ``'minute'``, ``'hour'``, ``'day'``, ``'week'``, ``'month'``, or
+      ``'year'``.
+    :type unit: :class:`str <python:str>`
+
+    :param multiple: The number of ``unit`` in each interval. Defaults to ``1``.
+    :type multiple: :class:`int <python:int>`
+
+    :param approximation: How the values in each interval are aggregated. Accepts:
+
+      * ``'average'`` - the mean of the values
+      * ``'sum'`` - the sum of the values
+      * ``'high'`` - the highest value
+      * ``'low'`` - the lowest value
+      * ``'open'`` - the first value
+      * ``'close'`` - the last value
+      * ``'range'`` - the lowest and highest values
+      * ``'ohlc'`` - the first, highest, lowest, and last values
+
+      Defaults to ``'average'``.
+    :type approximation: :class:`str <python:str>`
+
+    :param fill_gaps: If ``True``, returns a value for every interval between the first
+      and last interval (with empty intervals receiving
+      :obj:`numpy.nan <numpy:numpy.nan>`), so that the results are evenly spaced.
+      Defaults to ``False``.
+    :type fill_gaps: :class:`bool <python:bool>`
+
+    :returns: A 2-member :class:`tuple <python:tuple>` containing a
+      :class:`numpy.ndarray <numpy:numpy.ndarray>` with the start of each interval
+      (in milliseconds since the Unix epoch), and a :class:`dict <python:dict>` whose
+      keys are the names of the aggregated values (``'y'`` for single-value
+      approximations, ``'low'`` / ``'high'`` for ``'range'``, and ``'open'`` /
+      ``'high'`` / ``'low'`` / ``'close'`` for ``'ohlc'``) and whose values are
+      :class:`numpy.ndarray <numpy:numpy.ndarray>` instances.
+    :rtype: :class:`tuple <python:tuple>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsValueError: if ``unit`` or ``approximation`` are not supported,
+      or if ``x`` and ``y`` have different lengths
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    unit = _validate_time_unit(unit)
+    multiple = validators.integer(multiple, minimum = 1)
+    approximation = validators.string(approximation).lower()
+    if approximation not in ['average', 'sum', 'high', 'low', 'open', 'close', 'range',
+                             'ohlc']:
+        raise errors.HighchartsValueError(f'approximation "{approximation}" is not '
+                                          f'supported')
+
+    x, x_is_empty = to_epoch_ms(x)
+    y = to_float_ndarray(y)
+    if len(x) != len(y):
+        raise errors.HighchartsValueError(f'x and y must have the same length. '
+                                          f'Received: {len(x)} and {len(y)}')
+
+    is_valid = ~(x_is_empty | np.isnan(y))
+    x = x[is_valid]
+    y = y[is_valid]
+
+    order = np.argsort(x, kind = 'stable')
+    x = x[order]
+    y = y[order]
+
+    keys = _get_interval_keys(x, unit, multiple)
+
+    if not len(keys):
+        empty = np.asarray([], dtype = np.float64)
+        if approximation == 'range':
+            return np.asarray([], dtype = np.int64), {'low': empty, 'high': empty}
+        elif approximation == 'ohlc':
+            return np.asarray([], dtype = np.int64), {'open': empty,
+                                                      'high': empty,
+                                                      'low': empty,
+                                                      'close': empty}
+        return np.asarray([], dtype = np.int64), {'y': empty}
+
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ends = np.append(starts[1:], len(keys))
+    bucket_keys = keys[starts]
+
+    def aggregate(name):
+        if name == 'average':
+            return np.add.reduceat(y, starts) / (ends - starts)
+        elif name == 'sum':
+            return np.add.reduceat(y, starts)
+        elif name == 'high':
+            return np.maximum.reduceat(y, starts)
+        elif name == 'low':
+            return np.minimum.reduceat(y, starts)
+        elif name == 'open':
+            return y[starts]
+
+        return y[ends - 1]
+
+    if approximation == 'range':
+        columns = {'low': aggregate('low'), 'high': aggregate('high')}
+    elif approximation == 'ohlc':
+        columns = {
+            'open': aggregate('open'),
+            'high': aggregate('high'),
+            'low': aggregate('low'),
+            'close': aggregate('close'),
+        }
+    else:
+        columns = {'y': aggregate(approximation)}
+
+    if fill_gaps:
+        all_keys = np.arange(bucket_keys[0], bucket_keys[-1] + 1)
+        positions = bucket_keys - bucket_keys[0]
+        for key in columns:
+            filled = np.full(len(all_keys), np.nan)
+            filled[positions] = columns[key]
+            columns[key] = filled
+        bucket_keys = all_keys
+
+    return _get_interval_starts(bucket_keys, unit, multiple), columns
+
+
+def summarize_by_time(x, y, unit, multiple = 1):
+    """Summarize the values in ``y`` for each regular time interval (based on the dates
+    / times in ``x``), such that the summaries of two sets of values falling in the
+    same interval can be merged without retaining the values themselves (see
+    :func:`merge_time_summaries`).
+
+    Intervals are determined as in :func:`group_by_time`, and values for which either
+    ``x`` or ``y`` is empty are ignored.
+
+    :param x: The dates / times of the values, either as
+      :class:`numpy.datetime64 <numpy:numpy.datetime64>` values, Python
+      :class:`datetime <python:datetime.datetime>` values, or numbers expressed in
+      milliseconds since the Unix epoch.
+    :type x: Array-like
+
+    :param y: The values to summarize.
+    :type y: Array-like
+
+    :param unit: The unit of time of each interval. Accepts ``'millisecond'``,
+      ``'second'``, ``'minute'``, ``'hour'``, ``'day'``, ``'week'``, ``'month'``, or
+      ``'year'``.
+    :type unit: :class:`str <python:str>`
+
+    :param multiple: The number of ``unit`` in each interval. Defaults to ``1``.
+    :type multiple: :class:`int <python:int>`
+
+    :returns: A :class:`dict <python:dict>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>` columns with one member per
+      interval, in ascending order: ``'x'`` (the start of the interval, in milliseconds
+      since the Unix epoch), ``'count'``, ``'sum'``, ``'low'``, ``'high'``, ``'open'``
+      and ``'close'`` (the first and last values), and ``'open_x'`` and ``'close_x'``
+      (the times of the first and last values).
+    :rtype: :class:`dict <python:dict>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsValueError: if ``unit`` is not supported, or if ``x`` and ``y``
+      have different lengths
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    unit = _validate_time_unit(unit)
+    multiple = validators.integer(multiple, minimum = 1)
+
+    x, x_is_empty = to_epoch_ms(x)
+    y = to_float_ndarray(y)
+    if len(x) != len(y):
+        raise errors.HighchartsValueError(f'x and y must have the same length. '
+                                          f'Received: {len(x)} and {len(y)}')
+
+    is_valid = ~(x_is_empty | np.isnan(y))
+    order = np.argsort(x[is_valid], kind = 'stable')
+    x = x[is_valid][order]
+    y = y[is_valid][order]
+
+    keys = _get_interval_keys(x, unit, multiple)
+    if not len(keys):
+        return {
+            'x': np.asarray([], dtype = np.int64),
+            'count': np.asarray([], dtype = np.int64),
+            'sum': y,
+            'low': y,
+            'high': y,
+            'open': y,
+            'close': y,
+            'open_x': x,
+            'close_x': x
+        }
+
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ends = np.append(starts[1:], len(keys))
+
+    return {
+        'x': _get_interval_starts(keys[starts], unit, multiple),
+        'count': ends - starts,
+        'sum': np.add.reduceat(y, starts),
+        'low': np.minimum.reduceat(y, starts),
+        'high': np.maximum.reduceat(y, starts),
+        'open': y[starts],
+        'close': y[ends - 1],
+        'open_x': x[starts],
+        'close_x': x[ends - 1]
+    }
+
+
+def merge_time_summaries(summaries):
+    """Merge summaries produced by :func:`summarize_by_time` (for the same ``unit``
+    and ``multiple``) into a single summary, combining the members which describe the
+    same interval.
+
+    Where two summaries' first (or last) values occur at the same time, the first value
+    is taken from the earlier summary (and the last value from the later summary), so
+    that merging the summaries of consecutive chunks of values is equivalent to
+    summarizing all of the values at once.
+
+    :param summaries: The summaries to merge, in order.
+    :type summaries: iterable of :class:`dict <python:dict>`
+
+    :returns: The merged summary.
+    :rtype: :class:`dict <python:dict>`
+    """
+    summaries = [x for x in summaries if x is not None]
+    keys = list(summaries[0].keys())
+    columns = {key: np.concatenate([x[key] for x in summaries]) for key in keys}
+    if not len(columns['x']):
+        return columns
+
+    order = np.argsort(columns['x'], kind = 'stable')
+    columns = {key: value[order] for key, value in columns.items()}
+    x = columns['x']
+    is_first = np.concatenate(([True], x[1:] != x[:-1]))
+    if is_first.all():
+        return columns
+
+    starts = np.flatnonzero(is_first)
+    group = np.cumsum(is_first) - 1
+    # The first value is the earliest one (or, on a tie, the first to be supplied), and
+    # the last value the latest one (or, on a tie, the last to be supplied).
+    open_order = np.lexsort((np.arange(len(x)), columns['open_x'], group))
+    close_order = np.lexsort((np.arange(len(x)), columns['close_x'], group))
+    ends = np.append(starts[1:], len(x))
+
+    return {
+        'x': x[starts],
+        'count': np.add.reduceat(columns['count'], starts),
+        'sum': np.add.reduceat(columns['sum'], starts),
+        'low': np.minimum.reduceat(columns['low'], starts),
+        'high': np.maximum.reduceat(columns['high'], starts),
+        'open': columns['open'][open_order[starts]],
+        'close': columns['close'][close_order[ends - 1]],
+        'open_x': columns['open_x'][open_order[starts]],
+        'close_x': columns['close_x'][close_order[ends - 1]]
+    }
+
+
+def get_constant_interval(value, rtol = 1e-9):
+    """Determine whether the (one-dimensional) values in ``value`` are evenly spaced in
+    ascending order, and if so return the interval between them.
+
+    :param value: The values to evaluate, either as numbers or as
+      :class:`numpy.datetime64 <numpy:numpy.datetime64>` /
+      :class:`datetime <python:datetime.datetime>` values (which are evaluated in
+      milliseconds since the Unix epoch).
+    :type value: Array-like
+
+    :param rtol: The relative tolerance (as a proportion of the interval) within which
+      the difference between two consecutive values is considered equal to the
+      interval. Defaults to ``1e-9``.
+    :type rtol: numeric
+
+    :returns: The interval between consecutive values, or :obj:`None <python:None>` if
+      the values are not evenly spaced, are not in ascending order, contain empty
+      values, or contain fewer than two members.
+    :rtype: numeric or :obj:`None <python:None>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsValueError: if ``value`` contains values that cannot be
+      converted to numbers
+    """
+    rtol = validators.numeric(rtol, minimum = 0)
+
+    as_float = to_float_ndarray(value)
+    if len(as_float) < 2 or not np.isfinite(as_float).all():
+        return None
+
+    interval = (as_float[-1] - as_float[0]) / (len(as_float) - 1)
+    if interval <= 0:
+        return None
+
+    differences = np.diff(as_float)
+    if (np.abs(differences - interval) > rtol * interval).any():
+        return None
+
+    if float(interval).is_integer():
+        return int(interval)
+
+    return float(interval)
+
+
+def arrow_to_ndarray(value):
+    """Convert a `PyArrow <https://arrow.apache.org/docs/python/>`__ array into a
+    one-dimensional :class:`numpy.ndarray <numpy:numpy.ndarray>`.
+
+    Numerical arrays without empty values are converted without copying their memory
+    where possible. Otherwise:
+
+      * empty numerical values are represented as :obj:`numpy.nan <numpy:numpy.nan>`
+        (in a ``float64`` array),
+      * dates / times are converted to ``datetime64[ms]`` (in UTC), with empty values
+        represented as :obj:`numpy.datetime64('NaT') <numpy:numpy.datetime64>`,
+      * decimal values are converted to ``float64``, and
+      * all other values are returned in an ``object`` array, with empty values
+        represented as :obj:`None <python:None>`.
+
+    :param value: The array to convert.
+    :type value: :class:`pyarrow.Array <pyarrow:pyarrow.Array>` or
+      :class:`pyarrow.ChunkedArray <pyarrow:pyarrow.ChunkedArray>`
+
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy or PyArrow are not available in the
+      runtime environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise errors.HighchartsDependencyError('pyarrow is not available in the '
+                                               'runtime environment. Please install '
+                                               'using "pip install pyarrow"')
+
+    if isinstance(value, pa.ChunkedArray):
+        if value.num_chunks == 1:
+            return arrow_to_ndarray(value.chunk(0))
+        chunks = [arrow_to_ndarray(x) for x in value.chunks]
+        if not chunks:
+            return np.asarray([], dtype = np.float64)
+        if len(set([x.dtype.kind for x in chunks])) > 1:
+            chunks = [x.astype(object) for x in chunks]
+        return np.concatenate(chunks)
+
+    arrow_type = value.type
+    if pa.types.is_dictionary(arrow_type):
+        value = value.dictionary_decode()
+        arrow_type = value.type
+
+    if pa.types.is_decimal(arrow_type):
+        value = value.cast(pa.float64())
+        arrow_type = value.type
+
+    if pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+        return value.to_numpy(zero_copy_only = False).astype('datetime64[ms]')
+
+    if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type):
+        return value.to_numpy(zero_copy_only = False)
+
+    return np.asarray(value.to_numpy(zero_copy_only = False), dtype = object)
+
+
+def iter_pyspark_arrow_batches(df):
+    """Collect the contents of a
+    `PySpark <https://spark.apache.org/docs/latest/api/python/>`_
+    :class:`DataFrame <pyspark:pyspark.sql.DataFrame>` to the driver as Arrow record
+    batches, rather than as individual rows.
+
+    Uses :meth:`DataFrame.toArrow() <pyspark:pyspark.sql.DataFrame.toArrow>` where it is
+    available (PySpark 4.0+), falling back to Spark's Arrow-batched collection in
+    earlier versions.
+
+    :param df: The :class:`DataFrame <pyspark:pyspark.sql.DataFrame>` to collect.
+    :type df: :class:`DataFrame <pyspark:pyspark.sql.DataFrame>`
+
+    :returns: Iterable of the record batches which make up ``df``, in order.
+    :rtype: iterable of :class:`pyarrow.RecordBatch <pyarrow:pyarrow.RecordBatch>`
+
+    :raises HighchartsDependencyError: if PyArrow is not available in the runtime
+      environment
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise errors.HighchartsDependencyError('pyarrow is not available in the '
+                                               'runtime environment. Please install '
+                                               'using "pip install pyarrow"')
+
+    if hasattr(df, 'toArrow'):
+        yield from df.toArrow().to_batches()
+    else:
+        yield from df._collect_as_arrow()
+
+
+def parse_time_interval(value):
+    """Convert ``value`` to a number of milliseconds.
+
+    :param value: The interval to convert. Accepts a number (which is assumed to already
+      be expressed in milliseconds), a :class:`timedelta <python:datetime.timedelta>`,
+      or a string containing an (optional) number followed by a unit of time, e.g.
+      ``'1h'``, ``'15min'``, ``'30 seconds'``, or ``'day'``.
+    :type value: numeric, :class:`timedelta <python:datetime.timedelta>`, or
+      :class:`str <python:str>`
+
+    :returns: The number of milliseconds in ``value``.
+    :rtype: numeric
+
+    :raises HighchartsValueError: if ``value`` cannot be interpreted as an interval of
+      time, or is not greater than zero
+    """
+    if isinstance(value, datetime.timedelta):
+        result = value.total_seconds() * 1000
+    elif checkers.is_numeric(value) and not isinstance(value, str):
+        result = value
+    else:
+        value = validators.string(value, allow_empty = True) or ''
+        as_string = value.strip().lower()
+        number = as_string.rstrip(string.ascii_letters + ' ')
+        unit = as_string[len(number):].strip()
+        unit = constants.TIME_UNIT_ALIASES.get(unit, unit)
+        if unit not in constants.TIME_UNITS_IN_MS:
+            raise errors.HighchartsValueError(f'Unable to interpret "{value}" as an '
+                                              f'interval of time.')
+        try:
+            multiple = float(number) if number.strip() else 1
+        except ValueError:
+            raise errors.HighchartsValueError(f'Unable to interpret "{value}" as an '
+                                              f'interval of time.')
+        result = multiple * constants.TIME_UNITS_IN_MS[unit]
+
+    if not result > 0:
+        raise errors.HighchartsValueError(f'Intervals of time must be greater than '
+                                          f'zero. Received: {value}')
+    if float(result).is_integer():
+        return int(result)
+
+    return result
+
+
+def polars_to_ndarray(value):
+    """Convert a `Polars <https://pola.rs/>`__ :class:`Series <polars:polars.Series>`
+    into a one-dimensional :class:`numpy.ndarray <numpy:numpy.ndarray>`.
+
+    Numerical series without empty values are converted without copying their memory
+    where possible. Empty numerical values are represented as
+    :obj:`numpy.nan <numpy:numpy.nan>`, and dates / times are converted to
+    ``datetime64[ms]`` (in UTC).
+
+    :param value: The series to convert.
+    :type value: :class:`Series <polars:polars.Series>`
+
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    result = value.to_numpy()
+    if result.dtype.kind == 'M':
+        return result.astype('datetime64[ms]')
+    elif result.dtype.kind in 'US':
+        return result.astype(object)
+
+    return result
+
+
+ISO_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}')
+ISO_OFFSET_PATTERN = re.compile(r'[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?\s*(Z|[+-]\d{2}(:?\d{2})?)$')
+
+
+def values_to_ndarray(values):
+    """Convert a sequence of Python values (e.g. a column of rows returned by a
+    database cursor) to a typed :class:`numpy.ndarray <numpy:numpy.ndarray>`, inferring
+    its type from its non-empty values.
+
+    Integers are converted to ``int64`` values (or ``float64`` values if any are
+    empty), other numbers to ``float64`` values, and dates / times (including strings
+    that begin with an ISO 8601 ``YYYY-MM-DD`` date, with or without a UTC offset) to
+    ``datetime64[ms]`` values (in UTC). Other strings, such as ``'2019'``, are never
+    interpreted as dates. Empty numerical values are represented as
+    :obj:`numpy.nan <numpy:numpy.nan>` and empty dates / times as ``NaT``. Any other
+    values are returned with an ``object`` dtype.
+
+    :param values: The values to convert.
+    :type values: :class:`list <python:list>`
+
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    values = list(values)
+    if not values:
+        return np.asarray([], dtype = np.float64)
+
+    non_null = [x for x in values
+                if x is not None and not isinstance(x, constants.EnforcedNullType)]
+    has_nulls = len(non_null) < len(values)
+    if not non_null:
+        return np.full(len(values), np.nan)
+
+    types = set([type(x) for x in non_null])
+    if all([issubclass(x, int) and not issubclass(x, bool) for x in types]):
+        if not has_nulls:
+            try:
+                return np.asarray(values, dtype = np.int64)
+            except OverflowError:
+                pass
+        return np.asarray([np.nan if x is None else x for x in values],
+                          dtype = np.float64)
+
+    if all([issubclass(x, (int, float, Decimal)) and not issubclass(x, bool)
+            for x in types]):
+        return np.asarray([np.nan if x is None else x for x in values],
+                          dtype = np.float64)
+
+    if all([issubclass(x, (datetime.datetime, datetime.date)) for x in types]):
+        as_utc = []
+        for value in values:
+            if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+                value = value.astimezone(datetime.timezone.utc).replace(tzinfo = None)
+            as_utc.append(np.datetime64('NaT') if value is None else value)
+        return np.asarray(as_utc, dtype = 'datetime64[ms]')
+
+    if all([issubclass(x, str) for x in types]) and \
+       all([ISO_DATE_PATTERN.match(x) for x in non_null]):
+        # NumPy deprecates parsing UTC offsets, so strings with an offset are parsed
+        # by Python and converted to UTC.
+        as_utc = []
+        try:
+            for value in values:
+                if value is not None and ISO_OFFSET_PATTERN.search(value):
+                    value = datetime.datetime.fromisoformat(value)
+                    value = value.astimezone(datetime.timezone.utc).replace(tzinfo = None)
+                as_utc.append('NaT' if value is None else value)
+            return np.asarray(as_utc, dtype = 'datetime64[ms]')
+        except ValueError:
+            pass
+
+    as_object = np.empty(len(values), dtype = object)
+    as_object[:] = values
+
+    return as_object
+
+
+def concatenate_ndarrays(arrays):
+    """Concatenate one-dimensional :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    instances, promoting them to a common dtype.
+
+    Numerical arrays are promoted to a common numerical dtype, while arrays of any other
+    mix of dtypes are promoted to ``object``. Arrays that contain only empty values
+    (i.e. all-:obj:`numpy.nan <numpy:numpy.nan>` float arrays, as produced when a chunk of
+    a column is entirely empty) are first cast to the dtype of the remaining arrays, so
+    that e.g. an empty chunk of a date column becomes ``NaT``.
+
+    :param arrays: The arrays to concatenate.
+    :type arrays: iterable of :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    arrays = [x for x in arrays]
+    if not arrays:
+        return np.asarray([], dtype = np.float64)
+    if len(arrays) == 1:
+        return arrays[0]
+
+    is_empty = [x.dtype.kind == 'f' and bool(np.isnan(x).all()) for x in arrays]
+    other_kinds = set([x.dtype.kind for x, empty in zip(arrays, is_empty) if not empty])
+    if len(other_kinds) == 1 and other_kinds.issubset(set('MmOUS')):
+        target = [x for x, empty in zip(arrays, is_empty) if not empty][0].dtype
+        if target.kind in 'Mm':
+            empty_value = np.datetime64('NaT') if target.kind == 'M' else \
+                np.timedelta64('NaT')
+            arrays = [np.full(len(x), empty_value, dtype = target) if empty else x
+                      for x, empty in zip(arrays, is_empty)]
+        else:
+            arrays = [np.full(len(x), None, dtype = object) if empty else x
+                      for x, empty in zip(arrays, is_empty)]
+
+    kinds = set([x.dtype.kind for x in arrays])
+    if len(kinds) > 1 and not kinds.issubset(set('iuf')):
+        arrays = [x.astype(object) for x in arrays]
+
+    return np.concatenate(arrays)
+
+
+def get_group_slices(keys):
+    """Determine the order in which to sort members of ``keys`` so that equal keys are
+    contiguous, and the slice of the sorted values which belongs to each distinct key.
+
+    Groups are returned in the order in which their key first appears in ``keys``, and
+    the members of each group retain their original relative order.
+
+      .. code-block:: python
+
+        keys, order, slices = get_group_slices(region_column)
+        sorted_values = value_column[order]
+        for key, slice_ in zip(keys, slices):
+            group_values = sorted_values[slice_]    # a view, not a copy
+
+    :param keys: The key of each member.
+    :type keys: Array-like
+
+    :returns: A 3-member :class:`tuple <python:tuple>` containing a
+      :class:`list <python:list>` of the distinct keys, a
+      :class:`numpy.ndarray <numpy:numpy.ndarray>` of the indices which sort the members
+      by group, and a :class:`list <python:list>` of the :class:`slice <python:slice>`
+      of the sorted members belonging to each distinct key.
+    :rtype: :class:`tuple <python:tuple>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    keys = np.asarray(keys)
+    if not len(keys):
+        return [], np.asarray([], dtype = np.int64), []
+
+    if keys.dtype.kind == 'O':
+        mapping = {}
+        codes = np.fromiter((mapping.setdefault(x, len(mapping)) for x in keys.tolist()),
+                            dtype = np.int64,
+                            count = len(keys))
+        distinct_keys = list(mapping.keys())
+    else:
+        uniques, first_indices, inverse = np.unique(keys,
+                                                    return_index = True,
+                                                    return_inverse = True)
+        appearance = np.argsort(first_indices, kind = 'stable')
+        ranks = np.empty_like(appearance)
+        ranks[appearance] = np.arange(len(appearance))
+        codes = ranks[inverse.ravel()]
+        distinct_keys = uniques[appearance].tolist()
+
+    order = np.argsort(codes, kind = 'stable')
+    boundaries = np.concatenate(([0],
+                                 np.cumsum(np.bincount(codes,
+                                                       minlength = len(distinct_keys)))))
+    slices = [slice(int(boundaries[x]), int(boundaries[x + 1]))
+              for x in range(len(distinct_keys))]
+
+    return distinct_keys, order, slices
+
+
+def _is_single_array(value) -> bool:
+    """Evaluate whether ``value`` is a single one-dimensional array of values (as opposed
+    to an iterable of array chunks).
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    if is_ndarray(value) or hasattr(value, 'to_numpy'):
+        return True
+    if isinstance(value, (list, tuple)):
+        return not value or not is_iterable(value[0])
+
+    return False
+
+
+def iter_ndarray_chunks(value, dtype = None):
+    """Iterate over ``value`` as one or more one-dimensional
+    :class:`numpy.ndarray <numpy:numpy.ndarray>` chunks.
+
+    ``value`` may either be a single array of values (a :class:`list <python:list>`,
+    :class:`numpy.ndarray <numpy:numpy.ndarray>`, :class:`pandas.Series
+    <pandas:pandas.Series>`, etc.), which is yielded as a single chunk, or an iterable
+    (e.g. a generator) that itself yields arrays of values, each of which is yielded as
+    a chunk in turn without ever being combined with the others.
+
+    :param value: The values to iterate over.
+    :type value: Array-like, or iterable of array-likes
+
+    :param dtype: The dtype to convert each chunk to. Defaults to ``float64``.
+    :type dtype: :class:`numpy.dtype <numpy:numpy.dtype>` or :obj:`None <python:None>`
+
+    :rtype: generator of :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+    dtype = dtype or np.float64
+
+    if _is_single_array(value):
+        yield np.asarray(value, dtype = dtype).ravel()
+        return
+
+    for chunk in value:
+        yield np.asarray(chunk, dtype = dtype).ravel()
+
+
+DEFAULT_HISTOGRAM_BINS = 10
+
+
+def compute_histogram(values, bins = 'auto', weights = None, bin_range = None):
+    """Compute the histogram of ``values``, which may be supplied either as a single
+    array or as an iterable of array chunks (e.g. a generator reading a large file).
+
+    Non-finite values (and their weights) are ignored.
+
+    :param values: The samples to bin.
+    :type values: Array-like, or iterable of array-likes
+
+    :param bins: The bins to use. Accepts either the number of equal-width bins, the
+      edges of the bins (in ascending order), or the name of a
+      :func:`NumPy bin estimator <numpy:numpy.histogram_bin_edges>` (e.g. ``'auto'``,
+      ``'fd'``, ``'sturges'``). When ``values`` is supplied in chunks, named estimators
+      apply Sturges' rule to the total number of samples, except for a one-shot
+      iterator of chunks, which cannot be counted in advance and is instead split into
+      :data:`DEFAULT_HISTOGRAM_BINS` bins. Defaults to ``'auto'``.
+    :type bins: :class:`int <python:int>`, :class:`str <python:str>`, or Array-like
+
+    :param weights: Optional weights for each member of ``values``, supplied in the
+      same shape (a single array, or matching chunks). Defaults to
+      :obj:`None <python:None>`.
+    :type weights: Array-like, iterable of array-likes, or :obj:`None <python:None>`
+
+    :param bin_range: The lower and upper bounds of the bins when ``bins`` is not a
+      sequence of edges. If :obj:`None <python:None>`, the minimum and maximum of
+      ``values`` are used. Defaults to :obj:`None <python:None>`.
+
+      .. note::
+
+        When ``values`` is a one-shot iterator of chunks (e.g. a generator), the
+        bounds cannot be determined without consuming it, so either ``bin_range`` or
+        explicit bin edges must be supplied. If ``bin_range`` is supplied with a named
+        estimator for ``bins``, :data:`DEFAULT_HISTOGRAM_BINS` equal-width bins are
+        used.
+
+    :type bin_range: 2-member :class:`tuple <python:tuple>` or
+      :obj:`None <python:None>`
+
+    :returns: A 2-member :class:`tuple <python:tuple>` containing the counts (or summed
+      weights) in each bin and the edges of the bins.
+    :rtype: :class:`tuple <python:tuple>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsValueError: if ``bins``, ``weights``, or ``bin_range`` are
+      invalid, or if the bin bounds cannot be determined
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    if bin_range is not None:
+        bin_range = validators.iterable(bin_range, minimum_length = 2, maximum_length = 2)
+        bin_range = (validators.numeric(bin_range[0]), validators.numeric(bin_range[1]))
+        if bin_range[0] > bin_range[1]:
+            raise errors.HighchartsValueError(f'bin_range must be in ascending order. '
+                                              f'Received: {bin_range}')
+
+    edges = None
+    bin_count = None
+    if isinstance(bins, str):
+        bin_count = bins
+    elif is_iterable(bins):
+        edges = np.asarray(bins, dtype = np.float64).ravel()
+        if len(edges) < 2 or (np.diff(edges) <= 0).any():
+            raise errors.HighchartsValueError('bins must contain at least two edges, '
+                                              'in ascending order')
+    else:
+        bin_count = validators.integer(bins, minimum = 1)
+
+    def iter_chunks():
+        value_chunks = iter_ndarray_chunks(values)
+        if weights is None:
+            for chunk in value_chunks:
+                is_finite = np.isfinite(chunk)
+                yield chunk[is_finite], None
+            return
+
+        for chunk, weight_chunk in zip(value_chunks, iter_ndarray_chunks(weights)):
+            if len(chunk) != len(weight_chunk):
+                raise errors.HighchartsValueError('weights must have the same shape as '
+                                                  'values')
+            is_finite = np.isfinite(chunk) & np.isfinite(weight_chunk)
+            yield chunk[is_finite], weight_chunk[is_finite]
+
+    if edges is None and _is_single_array(values):
+        chunk, weight_chunk = next(iter_chunks())
+        edges = np.histogram_bin_edges(chunk, bins = bin_count, range = bin_range)
+    elif edges is None:
+        is_one_shot = iter(values) is values
+        if is_one_shot and bin_range is None:
+            raise errors.HighchartsValueError('values was supplied as a one-shot '
+                                              'iterator, so bin_range or explicit bin '
+                                              'edges are required')
+        if is_one_shot and isinstance(bin_count, str):
+            bin_count = DEFAULT_HISTOGRAM_BINS
+        if bin_range is None or isinstance(bin_count, str):
+            minimum, maximum, total = np.inf, -np.inf, 0
+            for chunk, weight_chunk in iter_chunks():
+                if len(chunk):
+                    minimum = min(minimum, chunk.min())
+                    maximum = max(maximum, chunk.max())
+                    total += len(chunk)
+            if bin_range is None:
+                bin_range = (minimum, maximum) if total else (0, 1)
+            if isinstance(bin_count, str):
+                bin_count = int(np.ceil(np.log2(total))) + 1 if total > 1 else 1
+
+        lower, upper = bin_range
+        if lower == upper:
+            lower, upper = lower - 0.5, upper + 0.5
+        edges = np.linspace(lower, upper, bin_count + 1)
+
+    counts = np.zeros(len(edges) - 1,
+                      dtype = np.int64 if weights is None else np.float64)
+    for chunk, weight_chunk in iter_chunks():
+        counts += np.histogram(chunk, bins = edges, weights = weight_chunk)[0]
+
+    return counts, edges
+
+
+def compute_mean_std(values, ddof = 1):
+    """Compute the number of (finite) members, the mean, and the standard deviation of
+    ``values`` in a single, numerically stable pass.
+
+    ``values`` may be supplied either as a single array or as an iterable of array
+    chunks (e.g. a generator reading a large file). The statistics of each chunk are
+    computed with NumPy, and are then merged into the running totals using the
+    pairwise form of Welford's algorithm (Chan et al.), which avoids the catastrophic
+    cancellation of the naive sum-of-squares approach.
+
+    :param values: The samples to evaluate. Non-finite values are ignored.
+    :type values: Array-like, or iterable of array-likes
+
+    :param ddof: The delta degrees of freedom used when computing the standard
+      deviation. Defaults to ``1`` (the sample standard deviation, matching the
+      calculation performed by Highcharts for a bell curve series).
+    :type ddof: :class:`int <python:int>`
+
+    :returns: A 3-member :class:`tuple <python:tuple>` containing the number of members,
+      their mean, and their standard deviation. The mean and standard deviation are
+      :obj:`numpy.nan <numpy:numpy.nan>` if there are too few members to compute them.
+    :rtype: :class:`tuple <python:tuple>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    ddof = validators.integer(ddof, minimum = 0)
+
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for chunk in iter_ndarray_chunks(values):
+        chunk = chunk[np.isfinite(chunk)]
+        chunk_count = len(chunk)
+        if not chunk_count:
+            continue
+        chunk_mean = chunk.mean()
+        chunk_m2 = np.square(chunk - chunk_mean).sum()
+
+        total = count + chunk_count
+        delta = chunk_mean - mean
+        mean += delta * chunk_count / total
+        m2 += chunk_m2 + delta * delta * count * chunk_count / total
+        count = total
+
+    if not count:
+        return 0, np.nan, np.nan
+
+    if count - ddof <= 0:
+        return count, float(mean), np.nan
+
+    return count, float(mean), float(np.sqrt(m2 / (count - ddof)))
+
+
+def bin_to_grid(x,
+                y,
+                value = None,
+                x_bins = 10,
+                y_bins = 10,
+                agg = 'sum',
+                bin_range = None):
+    """Bin long-form ``(x, y, value)`` data onto a regular two-dimensional grid,
+    aggregating the values that fall into each cell.
+
+    :param x: The x-coordinate of each member.
+    :type x: Array-like
+
+    :param y: The y-coordinate of each member.
+    :type y: Array-like
+
+    :param value: The value of each member. If :obj:`None <python:None>`, the number
+      of members in each cell is returned. Defaults to :obj:`None <python:None>`.
+    :type value: Array-like or :obj:`None <python:None>`
+
+    :param x_bins: The number of equal-width bins along the x-axis, their edges, or the
+      name of a :func:`NumPy bin estimator <numpy:numpy.histogram_bin_edges>`. Defaults
+      to ``10``.
+    :type x_bins: :class:`int <python:int>`, :class:`str <python:str>`, or Array-like
+
+    :param y_bins: The number of equal-width bins along the y-axis, their edges, or the
+      name of a :func:`NumPy bin estimator <numpy:numpy.histogram_bin_edges>`. Defaults
+      to ``10``.
+    :type y_bins: :class:`int <python:int>`, :class:`str <python:str>`, or Array-like
+
+    :param agg: How to aggregate the values in each cell. Accepts ``'sum'``,
+      ``'mean'``, ``'min'``, ``'max'``, or ``'count'``. Defaults to ``'sum'``.
+    :type agg: :class:`str <python:str>`
+
+    :param bin_range: The ``((x_min, x_max), (y_min, y_max))`` bounds of the bins. If
+      :obj:`None <python:None>`, the minimum and maximum coordinates are used. Defaults
+      to :obj:`None <python:None>`.
+    :type bin_range: :class:`tuple <python:tuple>` or :obj:`None <python:None>`
+
+    :returns: A 3-member :class:`tuple <python:tuple>` containing the grid (with one row
+      per y-bin and one column per x-bin, and :obj:`numpy.nan <numpy:numpy.nan>` for
+      cells that received no members), the edges of the x-bins, and the edges of the
+      y-bins.
+    :rtype: :class:`tuple <python:tuple>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsValueError: if ``x``, ``y``, and ``value`` have different lengths,
+      or if ``agg`` is not supported
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    agg = validators.string(agg).lower()
+    if agg not in ['sum', 'mean', 'min', 'max', 'count']:
+        raise errors.HighchartsValueError(f'agg expects "sum", "mean", "min", "max", or '
+                                          f'"count". Received: "{agg}"')
+
+    x = to_float_ndarray(np.asarray(x).ravel())
+    y = to_float_ndarray(np.asarray(y).ravel())
+    if value is None:
+        agg = 'count'
+        value = np.ones(len(x))
+    else:
+        value = np.asarray(value, dtype = np.float64).ravel()
+    if len(x) != len(y) or len(x) != len(value):
+        raise errors.HighchartsValueError(f'x, y, and value must have the same length. '
+                                          f'Received: {len(x)}, {len(y)}, {len(value)}')
+
+    is_finite = np.isfinite(x) & np.isfinite(y) & np.isfinite(value)
+    x, y, value = x[is_finite], y[is_finite], value[is_finite]
+
+    x_range, y_range = bin_range if bin_range is not None else (None, None)
+
+    def get_edges(coordinates, bins, range_):
+        if is_iterable(bins) and not isinstance(bins, str):
+            return np.asarray(bins, dtype = np.float64).ravel()
+        if not isinstance(bins, str):
+            bins = validators.integer(bins, minimum = 1)
+        if range_ is None and len(coordinates) and coordinates.min() == coordinates.max():
+            range_ = (coordinates.min() - 0.5, coordinates.max() + 0.5)
+        return np.histogram_bin_edges(coordinates, bins = bins, range = range_)
+
+    x_edges = get_edges(x, x_bins, x_range)
+    y_edges = get_edges(y, y_bins, y_range)
+    x_count, y_count = len(x_edges) - 1, len(y_edges) - 1
+
+    x_index = np.searchsorted(x_edges, x, side = 'right') - 1
+    x_index[x == x_edges[-1]] = x_count - 1
+    y_index = np.searchsorted(y_edges, y, side = 'right') - 1
+    y_index[y == y_edges[-1]] = y_count - 1
+    is_inside = (x_index >= 0) & (x_index < x_count) & \
+        (y_index >= 0) & (y_index < y_count)
+
+    cells = y_index[is_inside] * x_count + x_index[is_inside]
+    value = value[is_inside]
+    size = x_count * y_count
+
+    counts = np.bincount(cells, minlength = size)
+    if agg == 'count':
+        grid = counts.astype(np.float64)
+    elif agg in ['sum', 'mean']:
+        grid = np.bincount(cells, weights = value, minlength = size)
+        if agg == 'mean':
+            grid = grid / np.maximum(counts, 1)
+    else:
+        grid = np.full(size, np.inf if agg == 'min' else -np.inf)
+        ufunc = np.minimum if agg == 'min' else np.maximum
+        ufunc.at(grid, cells, value)
+
+    grid[counts == 0] = np.nan
+
+    return grid.reshape(y_count, x_count), x_edges, y_edges
+
+
+def _get_label_array(value):
+    """Convert ``value`` to a :class:`numpy.ndarray <numpy:numpy.ndarray>` of string
+    labels, along with a mask indicating which members are empty (:obj:`None
+    <python:None>`, :obj:`numpy.nan <numpy:numpy.nan>`, or an empty string).
+
+    :rtype: :class:`tuple <python:tuple>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    """
+    if hasattr(value, 'to_numpy') and not is_ndarray(value):
+        value = value.to_numpy()
+    value = np.asarray(value)
+    if value.ndim != 1:
+        value = value.ravel()
+
+    if value.dtype.kind == 'U':
+        return value, value == ''
+    if value.dtype.kind == 'S':
+        is_empty = value == b''
+    elif value.dtype.kind == 'f':
+        is_empty = np.isnan(value)
+    elif value.dtype.kind == 'M':
+        is_empty = np.isnat(value)
+    elif value.dtype.kind == 'O':
+        # NaN is the only value which is not equal to itself.
+        is_empty = np.equal(value, None) | np.not_equal(value, value) | \
+                   np.equal(value, '')
+    else:
+        is_empty = np.zeros(len(value), dtype = bool)
+
+    labels = value.astype(str)
+    labels[is_empty] = ''
+
+    return labels, is_empty
+
+
+def _factorize_labels(labels):
+    """Factorize an array of string labels, returning the sorted distinct labels and
+    the code of each member.
+
+    Fixed-width string arrays are factorized by hashing their raw characters, which is
+    several times faster than sorting the strings themselves. Hash collisions are
+    detected, in which case the strings are sorted directly.
+
+    :rtype: :class:`tuple <python:tuple>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    """
+    if labels.dtype.kind != 'U' or len(labels) < 1024 or labels.dtype.itemsize == 0:
+        uniques, codes = np.unique(labels, return_inverse = True)
+        return uniques, codes.ravel()
+
+    characters = np.ascontiguousarray(labels).view(np.uint32).reshape(len(labels), -1)
+    hashes = np.zeros(len(labels), dtype = np.uint64)
+    for index in range(characters.shape[1]):
+        hashes *= np.uint64(1099511628211)
+        hashes ^= characters[:, index]
+
+    order = np.argsort(hashes)
+    sorted_hashes = hashes[order]
+    is_first = np.empty(len(labels), dtype = bool)
+    is_first[0] = True
+    np.not_equal(sorted_hashes[1:], sorted_hashes[:-1], out = is_first[1:])
+    codes = np.empty(len(labels), dtype = np.int64)
+    codes[order] = np.cumsum(is_first) - 1
+    uniques = labels[order[is_first]]
+    if not (uniques[codes] == labels).all():
+        uniques, codes = np.unique(labels, return_inverse = True)
+        return uniques, codes.ravel()
+
+    order = np.argsort(uniques, kind = 'stable')
+    lookup = np.empty(len(order), dtype = np.int64)
+    lookup[order] = np.arange(len(order))
+
+    return uniques[order], lookup[codes]
+
+
+def rollup_paths(levels,
+                 values = None,
+                 min_value = None,
+                 other_label = 'Other',
+                 separator = '/'):
+    """Build the nodes of a hierarchy (e.g. for a treemap or sunburst) from a flat table
+    of paths, with each node's value rolled up from the rows beneath it.
+
+    Each level is factorized in a single vectorized pass: the code of a row's node at
+    a given level is derived from the code of its parent and the row's label at that
+    level, and each node's value is the sum of the values of its rows (so parents
+    always equal the sum of their descendants). Nodes are identified by their full
+    path (e.g. ``'Europe/France/Paris'``), so ids are stable regardless of the order
+    of the rows.
+
+    If a row's label is empty (:obj:`None <python:None>`, :obj:`numpy.nan
+    <numpy:numpy.nan>`, or ``''``) at some level, its path ends at the preceding level.
+
+    :param levels: The labels at each level of the hierarchy, from the root down.
+    :type levels: iterable of Array-like
+
+    :param values: The value of each row. If :obj:`None <python:None>`, each row has a
+      value of ``1``. Non-finite values are treated as ``0``. Defaults to
+      :obj:`None <python:None>`.
+    :type values: Array-like or :obj:`None <python:None>`
+
+    :param min_value: If supplied, nodes whose value is below ``min_value`` are not
+      emitted (nor are their descendants). Instead, the pruned siblings under each
+      parent are combined into a single node labeled ``other_label``. Defaults to
+      :obj:`None <python:None>`.
+    :type min_value: numeric or :obj:`None <python:None>`
+
+    :param other_label: The label to apply to the nodes that combine pruned siblings.
+      Defaults to ``'Other'``.
+    :type other_label: :class:`str <python:str>`
+
+    :param separator: The string used to join labels into node ids. Defaults to
+      ``'/'``.
+    :type separator: :class:`str <python:str>`
+
+    :returns: A :class:`dict <python:dict>` whose keys are ``'id'``, ``'parent'``,
+      ``'name'``, and ``'value'``, and whose values are
+      :class:`numpy.ndarray <numpy:numpy.ndarray>` columns with one member per node.
+      Parents precede their children.
+    :rtype: :class:`dict <python:dict>`
+
+    :raises HighchartsValueError: if ``levels`` is empty, or if the levels and
+      ``values`` have different lengths
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    levels = [x for x in levels]
+    if not levels:
+        raise errors.HighchartsValueError('levels cannot be empty')
+    min_value = validators.numeric(min_value, allow_empty = True)
+    other_label = validators.string(other_label)
+    separator = validators.string(separator)
+
+    level_labels = [_get_label_array(x) for x in levels]
+    row_count = len(level_labels[0][0])
+    if values is None:
+        values = np.ones(row_count)
+    else:
+        values = np.asarray(values, dtype = np.float64).ravel()
+        values = np.where(np.isfinite(values), values, 0)
+    if any([len(x[0]) != row_count for x in level_labels]) or len(values) != row_count:
+        raise errors.HighchartsValueError('levels and values must have the same length')
+
+    ids, parents, names, node_values = [], [], [], []
+
+    row_codes = np.zeros(row_count, dtype = np.int64)
+    is_valid = np.ones(row_count, dtype = bool)
+    parent_ids = np.asarray([''], dtype = object)
+    parent_kept = np.ones(1, dtype = bool)
+    for labels, is_empty in level_labels:
+        is_valid = is_valid & ~is_empty
+        valid_rows = np.flatnonzero(is_valid)
+
+        label_uniques, label_codes = np.unique(labels[valid_rows], return_inverse = True)
+        keys = row_codes[valid_rows] * len(label_uniques) + label_codes.ravel()
+        key_count = len(parent_ids) * len(label_uniques)
+        if key_count <= 4 * len(keys) + 1024:
+            # Dense keys: factorize with a lookup table rather than a sort.
+            is_present = np.bincount(keys, minlength = key_count) > 0
+            lookup = np.cumsum(is_present) - 1
+            node_codes = lookup[keys]
+            node_count = int(is_present.sum())
+            first_rows = np.empty(node_count, dtype = np.int64)
+            first_rows[node_codes[::-1]] = np.arange(len(keys) - 1, -1, -1)
+        else:
+            node_keys, first_rows, node_codes = np.unique(keys,
+                                                          return_index = True,
+                                                          return_inverse = True)
+            node_codes = node_codes.ravel()
+            node_count = len(node_keys)
+
+        node_parents = row_codes[valid_rows][first_rows]
+        node_names = label_uniques[label_codes.ravel()[first_rows]].astype(object)
+        level_values = np.bincount(node_codes,
+                                   weights = values[valid_rows],
+                                   minlength = node_count)
+        prefixes = parent_ids[node_parents]
+        node_ids = np.where(prefixes == '',
+                            node_names,
+                            prefixes + separator + node_names)
+
+        is_kept = parent_kept[node_parents]
+        if min_value is not None:
+            is_pruned = is_kept & (level_values < min_value)
+            is_kept = is_kept & ~is_pruned
+            if is_pruned.any():
+                pruned_parents = node_parents[is_pruned]
+                other_values = np.bincount(pruned_parents,
+                                           weights = level_values[is_pruned],
+                                           minlength = len(parent_ids))
+                other_parents = np.unique(pruned_parents)
+                other_prefixes = parent_ids[other_parents]
+                ids.append(np.where(other_prefixes == '',
+                                    other_label,
+                                    other_prefixes + separator + other_label))
+                parents.append(other_prefixes)
+                names.append(np.full(len(other_parents), other_label, dtype = object))
+                node_values.append(other_values[other_parents])
+
+        ids.append(node_ids[is_kept])
+        parents.append(prefixes[is_kept])
+        names.append(node_names[is_kept])
+        node_values.append(level_values[is_kept])
+
+        new_row_codes = np.full(row_count, -1, dtype = np.int64)
+        new_row_codes[valid_rows] = node_codes
+        row_codes = new_row_codes
+        parent_ids = node_ids
+        parent_kept = is_kept
+
+    parents = np.concatenate(parents).astype(object)
+    parents[parents == ''] = None
+
+    return {
+        'id': np.concatenate(ids).astype(object),
+        'parent': parents,
+        'name': np.concatenate(names).astype(object),
+        'value': np.concatenate(node_values)
+    }
+
+
+def aggregate_edges(sources,
+                    targets,
+                    weights = None,
+                    min_weight = None,
+                    top_n_nodes = None,
+                    other_label = 'Other'):
+    """Aggregate a (potentially very long) list of edges, e.g. a log of user flows, into
+    one weighted link per distinct ``(source, target)`` pair, for use in flow diagrams
+    such as sankeys, dependency wheels, or arc diagrams.
+
+    Nodes are factorized in a single vectorized pass across both ``sources`` and
+    ``targets``, and duplicate edges are summed with :func:`numpy.bincount
+    <numpy:numpy.bincount>` rather than a Python-level group-by.
+
+    :param sources: The node that each edge runs from.
+    :type sources: Array-like
+
+    :param targets: The node that each edge runs to.
+    :type targets: Array-like
+
+    :param weights: The weight of each edge. If :obj:`None <python:None>`, each edge has
+      a weight of ``1``. Non-finite weights are treated as ``0``. Defaults to
+      :obj:`None <python:None>`.
+    :type weights: Array-like or :obj:`None <python:None>`
+
+    :param min_weight: If supplied, aggregated links whose weight is below
+      ``min_weight`` are dropped. Defaults to :obj:`None <python:None>`.
+    :type min_weight: numeric or :obj:`None <python:None>`
+
+    :param top_n_nodes: If supplied, only the ``top_n_nodes`` nodes with the greatest
+      total (incoming plus outgoing) weight are kept, and all other nodes are collapsed
+      into a single node labeled ``other_label``. Links that would run from that node
+      to itself are dropped. Defaults to :obj:`None <python:None>`.
+    :type top_n_nodes: :class:`int <python:int>` or :obj:`None <python:None>`
+
+    :param other_label: The label to apply to the node that combines collapsed nodes.
+      Defaults to ``'Other'``.
+    :type other_label: :class:`str <python:str>`
+
+    :returns: A :class:`dict <python:dict>` whose keys are ``'from_'``, ``'to'``, and
+      ``'weight'``, and whose values are :class:`numpy.ndarray <numpy:numpy.ndarray>`
+      columns with one member per link, sorted by source and then by target (with
+      any collapsed ``other_label`` node sorted last).
+    :rtype: :class:`dict <python:dict>`
+
+    :raises HighchartsValueError: if ``sources``, ``targets``, and ``weights`` have
+      different lengths
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    min_weight = validators.numeric(min_weight, allow_empty = True)
+    top_n_nodes = validators.integer(top_n_nodes, allow_empty = True, minimum = 1)
+    other_label = validators.string(other_label)
+
+    sources, source_is_empty = _get_label_array(sources)
+    targets, target_is_empty = _get_label_array(targets)
+    edge_count = len(sources)
+    if weights is None:
+        weights = np.ones(edge_count)
+    else:
+        weights = np.asarray(weights, dtype = np.float64).ravel()
+        weights = np.where(np.isfinite(weights), weights, 0)
+    if len(targets) != edge_count or len(weights) != edge_count:
+        raise errors.HighchartsValueError('sources, targets, and weights must have the '
+                                          'same length')
+
+    is_valid = ~(source_is_empty | target_is_empty)
+    if not is_valid.all():
+        sources = sources[is_valid]
+        targets = targets[is_valid]
+        weights = weights[is_valid]
+        edge_count = len(sources)
+
+    labels, codes = _factorize_labels(np.concatenate([sources, targets]))
+    source_codes = codes[:edge_count]
+    target_codes = codes[edge_count:]
+    labels = labels.astype(object)
+
+    if top_n_nodes is not None and top_n_nodes < len(labels):
+        node_weights = np.bincount(source_codes,
+                                   weights = weights,
+                                   minlength = len(labels))
+        node_weights += np.bincount(target_codes,
+                                    weights = weights,
+                                    minlength = len(labels))
+        is_kept = np.zeros(len(labels), dtype = bool)
+        is_kept[np.argsort(-node_weights, kind = 'stable')[:top_n_nodes]] = True
+
+        kept_labels = labels[is_kept]
+        matches = np.flatnonzero(kept_labels == other_label)
+        lookup = np.full(len(labels), len(kept_labels), dtype = np.int64)
+        lookup[is_kept] = np.arange(len(kept_labels))
+        if len(matches):
+            other_code = matches[0]
+            lookup[~is_kept] = other_code
+            labels = kept_labels
+        else:
+            other_code = len(kept_labels)
+            labels = np.append(kept_labels, np.asarray([other_label], dtype = object))
+
+        # Edges with a collapsed end which now run from the other node to itself
+        # (including edges between a collapsed node and a kept node labeled
+        # other_label) are dropped, rather than becoming self-loops.
+        is_source_kept = is_kept[source_codes]
+        is_target_kept = is_kept[target_codes]
+        source_codes = lookup[source_codes]
+        target_codes = lookup[target_codes]
+        is_collapsed = (source_codes == other_code) & \
+                       (target_codes == other_code) & \
+                       ~(is_source_kept & is_target_kept)
+        if is_collapsed.any():
+            source_codes = source_codes[~is_collapsed]
+            target_codes = target_codes[~is_collapsed]
+            weights = weights[~is_collapsed]
+
+    node_count = max(len(labels), 1)
+    keys = source_codes.astype(np.int64) * node_count + target_codes
+    if node_count * node_count <= 4 * len(keys) + 1024:
+        # Dense keys: aggregate with a lookup table rather than a sort.
+        link_weights = np.bincount(keys,
+                                   weights = weights,
+                                   minlength = node_count * node_count)
+        link_keys = np.flatnonzero(np.bincount(keys, minlength = node_count * node_count))
+        link_weights = link_weights[link_keys]
+    else:
+        link_keys, key_codes = np.unique(keys, return_inverse = True)
+        link_weights = np.bincount(key_codes.ravel(),
+                                   weights = weights,
+                                   minlength = len(link_keys))
+
+    if min_weight is not None:
+        is_kept = link_weights >= min_weight
+        link_keys = link_keys[is_kept]
+        link_weights = link_weights[is_kept]
+
+    return {
+        'from_': labels[link_keys // node_count],
+        'to': labels[link_keys % node_count],
+        'weight': link_weights
+    }
+
+
+DEFAULT_TOKEN_PATTERN = re.compile(r"[^\W\d_]+(?:['\u2019][^\W\d_]+)*")
+
+
+def count_terms(documents,
+                top_k = 200,
+                stopwords = None,
+                tokenizer = None,
+                lowercase = True,
+                capacity = 100000):
+    """Count the terms in a stream of documents, returning the ``top_k`` most frequent
+    terms (e.g. for use in a word cloud).
+
+    Documents are consumed one at a time, so the corpus never needs to be held in
+    memory. The number of distinct terms tracked is bounded: whenever more than
+    ``2 * capacity`` terms are being tracked, only the ``capacity`` most frequent are
+    retained. The counts are therefore exact as long as the vocabulary has no more than
+    ``2 * capacity`` terms, and approximate (favoring frequent terms) beyond that. The
+    ``top_k`` terms are then selected with a heap rather than by sorting the full
+    vocabulary.
+
+    :param documents: The documents whose terms should be counted.
+    :type documents: iterable of :class:`str <python:str>`, or
+      :class:`str <python:str>`
+
+    :param top_k: The number of terms to return. Defaults to ``200``.
+    :type top_k: :class:`int <python:int>`
+
+    :param stopwords: Terms to ignore. If :obj:`None <python:None>`, defaults to
+      :obj:`constants.DEFAULT_STOPWORDS <highcharts_core.constants.DEFAULT_STOPWORDS>`
+      (common English words). Supply an empty collection to keep all terms.
+    :type stopwords: iterable of :class:`str <python:str>`, or
+      :obj:`None <python:None>`
+
+    :param tokenizer: A callable that receives a document and returns an iterable of its
+      terms. If :obj:`None <python:None>`, documents are split into runs of letters
+      (allowing embedded apostrophes). Defaults to :obj:`None <python:None>`.
+    :type tokenizer: callable or :obj:`None <python:None>`
+
+    :param lowercase: If ``True``, documents are lowercased before being tokenized.
+      Defaults to ``True``.
+    :type lowercase: :class:`bool <python:bool>`
+
+    :param capacity: The number of distinct terms to retain when pruning the counter.
+      Defaults to ``100000``.
+    :type capacity: :class:`int <python:int>`
+
+    :returns: A :class:`dict <python:dict>` whose keys are ``'name'`` and ``'weight'``,
+      and whose values are :class:`list <python:list>` columns with one member per
+      term, ordered from most to least frequent (ties keep the order in which the
+      terms were first seen).
+    :rtype: :class:`dict <python:dict>`
+
+    :raises HighchartsValueError: if ``tokenizer`` is not callable, or if
+      ``capacity`` is less than ``top_k``
+    """
+    top_k = validators.integer(top_k, minimum = 1)
+    capacity = validators.integer(capacity, minimum = 1)
+    if capacity < top_k:
+        raise errors.HighchartsValueError(f'capacity ({capacity}) cannot be less than '
+                                          f'top_k ({top_k})')
+    if tokenizer is None:
+        tokenizer = DEFAULT_TOKEN_PATTERN.findall
+    elif not callable(tokenizer):
+        raise errors.HighchartsValueError(f'tokenizer must be callable. Received: '
+                                          f'{tokenizer.__class__.__name__}')
+    if stopwords is None:
+        stopwords = constants.DEFAULT_STOPWORDS
+    elif isinstance(stopwords, str):
+        stopwords = frozenset([stopwords])
+    else:
+        stopwords = frozenset(stopwords)
+    if lowercase:
+        stopwords = frozenset([x.lower() for x in stopwords])
+    if isinstance(documents, (str, bytes)):
+        documents = [documents]
+
+    counter = Counter()
+    for document in documents:
+        if document is None:
+            continue
+        if isinstance(document, bytes):
+            document = document.decode('utf-8', errors = 'replace')
+        if lowercase:
+            document = document.lower()
+        if stopwords:
+            counter.update([x for x in tokenizer(document) if x not in stopwords])
+        else:
+            counter.update(tokenizer(document))
+
+        if len(counter) > 2 * capacity:
+            counter = Counter(dict(heapq.nlargest(capacity,
+                                                  counter.items(),
+                                                  key = lambda x: x[1])))
+
+    top_terms = heapq.nlargest(top_k, counter.items(), key = lambda x: x[1])
+
+    return {
+        'name': [x[0] for x in top_terms],
+        'weight': [x[1] for x in top_terms]
+    }
+
+
+def _get_member_array(value):
+    """Convert ``value`` (any iterable of hashable members, e.g. a
+    :class:`set <python:set>`, a :class:`list <python:list>`, or an array) to a
+    one-dimensional :class:`numpy.ndarray <numpy:numpy.ndarray>`.
+
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    """
+    if hasattr(value, 'to_numpy') and not is_ndarray(value):
+        value = value.to_numpy()
+    if not is_ndarray(value):
+        value = list(value)
+        as_array = np.asarray(value)
+        # Keep the original members if NumPy would coerce them to strings (e.g. 1 and
+        # 'x') or would unpack them (e.g. tuples).
+        if as_array.ndim != 1 or (as_array.dtype.kind in ['U', 'S'] and
+                                  not all([isinstance(x, (str, bytes)) for x in value])):
+            as_array = np.fromiter(value, dtype = object, count = len(value))
+        value = as_array
+
+    return value.ravel()
+
+
+def compute_set_intersections(sets, skip_empty = False):
+    """Compute the size of every intersection (all :math:`2^k - 1` of them) among
+    ``k`` sets, e.g. for use in a Venn diagram.
+
+    Rather than intersecting each combination of sets in turn, the members of all sets
+    are sorted together once, and each distinct member is assigned a bitmask
+    identifying the sets that contain it. The number of members sharing each bitmask is
+    counted with :func:`numpy.bincount <numpy:numpy.bincount>`, and the size of each intersection is then obtained by
+    summing the counts of all of its supersets in :math:`O(k \\cdot 2^k)` vectorized
+    operations.
+
+    :param sets: The sets to intersect, keyed by their names. Each set may be any
+      iterable of hashable members (duplicates are ignored). Members are compared by
+      value, so ``1`` and ``1.0`` are the same member but ``1`` and ``'1'`` are not.
+    :type sets: :class:`dict <python:dict>`
+
+    :param skip_empty: If ``True``, intersections with no members are omitted. Defaults
+      to ``False``.
+    :type skip_empty: :class:`bool <python:bool>`
+
+    :returns: A :class:`dict <python:dict>` whose keys are ``'sets'`` and ``'value'``,
+      and whose values are :class:`numpy.ndarray <numpy:numpy.ndarray>` columns with one
+      member per intersection. The single sets come first (in the order supplied),
+      followed by their pairwise intersections, and so on.
+    :rtype: :class:`dict <python:dict>`
+
+    :raises HighchartsValueError: if ``sets`` is empty or contains more than 20 sets
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    sets = validators.dict(sets, allow_empty = True)
+    if not sets:
+        raise errors.HighchartsValueError('sets cannot be empty')
+    if len(sets) > 20:
+        raise errors.HighchartsValueError(f'compute_set_intersections() supports at '
+                                          f'most 20 sets. Received: {len(sets)}')
+
+    names = [str(x) for x in sets]
+    set_count = len(names)
+    members = [_get_member_array(sets[x]) for x in sets]
+    bits = np.repeat(np.left_shift(1, np.arange(set_count, dtype = np.int64)),
+                     [len(x) for x in members])
+
+    if bits.size:
+        kinds = set([x.dtype.kind for x in members if len(x)])
+        if kinds <= set(['b', 'i', 'u', 'f']) or (len(kinds) == 1 and 'O' not in kinds):
+            members = np.concatenate(members)
+        else:
+            # Members of different kinds cannot be compared by NumPy without coercing
+            # them (so that 1 would equal '1'), so factorize their Python values.
+            mapping = {}
+            members = np.fromiter((mapping.setdefault(x, len(mapping))
+                                   for x in itertools.chain.from_iterable(
+                                       [x.tolist() for x in members])),
+                                  dtype = np.int64,
+                                  count = bits.size)
+        order = np.argsort(members)
+        sorted_members = members[order]
+        is_first = np.empty(len(sorted_members), dtype = bool)
+        is_first[0] = True
+        np.not_equal(sorted_members[1:], sorted_members[:-1], out = is_first[1:])
+        masks = np.bitwise_or.reduceat(bits[order], np.flatnonzero(is_first))
+        counts = np.bincount(masks, minlength = 2 ** set_count)
+    else:
+        counts = np.zeros(2 ** set_count, dtype = np.int64)
+
+    for index in range(set_count):
+        view = counts.reshape(-1, 2, 2 ** index)
+        view[:, 0, :] += view[:, 1, :]
+
+    combination_sets, combination_masks = [], []
+    for size in range(1, set_count + 1):
+        for combination in itertools.combinations(range(set_count), size):
+            combination_sets.append([names[x] for x in combination])
+            combination_masks.append(sum([1 << x for x in combination]))
+
+    values = counts[combination_masks]
+    sets_column = np.empty(len(combination_sets), dtype = object)
+    for index, value in enumerate(combination_sets):
+        sets_column[index] = value
+
+    if skip_empty:
+        is_kept = values > 0
+        sets_column = sets_column[is_kept]
+        values = values[is_kept]
+
+    return {
+        'sets': sets_column,
+        'value': values
+    }
+
+
+def compute_vectors(x, y, u, v, stride = 1, skip_nan = True):
+    """Convert the ``u`` (eastward) and ``v`` (northward) components of a vector field,
+    e.g. wind, into the lengths and directions expected by vector and windbarb series.
+
+    The direction follows the meteorological convention used by Highcharts: it is
+    expressed in degrees and indicates where the vector comes *from*, so ``0`` is north
+    (with the arrow pointing towards the south).
+
+    ``u`` and ``v`` may be one-dimensional (one member per point) or two-dimensional
+    grids of shape ``(len(y), len(x))``. For grids, ``x`` and ``y`` may either be the
+    one-dimensional coordinates of the grid's columns and rows, or two-dimensional
+    arrays with the same shape as ``u``.
+
+    :param x: The x coordinates.
+    :type x: Array-like
+
+    :param y: The y coordinates. May be :obj:`None <python:None>` if ``u`` and ``v``
+      are one-dimensional.
+    :type y: Array-like or :obj:`None <python:None>`
+
+    :param u: The eastward component of each vector.
+    :type u: Array-like
+
+    :param v: The northward component of each vector.
+    :type v: Array-like
+
+    :param stride: Decimate the points by keeping only every ``stride``-th point (along
+      each axis, for grids). For grids, a ``(y_stride, x_stride)`` tuple may also be
+      supplied. Defaults to ``1``.
+    :type stride: :class:`int <python:int>` or :class:`tuple <python:tuple>`
+
+    :param skip_nan: If ``True``, points whose components are not finite are omitted.
+      Defaults to ``True``.
+    :type skip_nan: :class:`bool <python:bool>`
+
+    :returns: A :class:`dict <python:dict>` whose keys are ``'x'``, ``'y'`` (if ``y`` was
+      supplied), ``'length'``, and ``'direction'``, and whose values are
+      :class:`numpy.ndarray <numpy:numpy.ndarray>` columns with one member per point.
+    :rtype: :class:`dict <python:dict>`
+
+    :raises HighchartsValueError: if the shapes of ``x``, ``y``, ``u``, and ``v`` are
+      incompatible, or if ``stride`` is not a positive integer
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in your runtime '
+                                               'environment. Please make sure it is '
+                                               'installed in your runtime '
+                                               'environment.')
+
+    u = np.asarray(u, dtype = np.float64)
+    v = np.asarray(v, dtype = np.float64)
+    x = np.asarray(x)
+    y = np.asarray(y) if y is not None else None
+    if u.shape != v.shape or u.ndim not in [1, 2]:
+        raise errors.HighchartsValueError(f'u and v must be one- or two-dimensional '
+                                          f'arrays of the same shape. Received: '
+                                          f'{u.shape} and {v.shape}')
+
+    if checkers.is_iterable(stride, forbid_literals = (str, bytes, dict)):
+        strides = [validators.integer(item, minimum = 1) for item in stride]
+    else:
+        strides = [validators.integer(stride, minimum = 1)] * u.ndim
+    if len(strides) != u.ndim:
+        raise errors.HighchartsValueError(f'stride must have one member per dimension '
+                                          f'of u and v ({u.ndim}). Received: '
+                                          f'{len(strides)}')
+
+    if u.ndim == 1:
+        if x.shape != u.shape or (y is not None and y.shape != u.shape):
+            raise errors.HighchartsValueError('x, y, u, and v must have the same length')
+        step = strides[0]
+        x, u, v = x[::step], u[::step], v[::step]
+        if y is not None:
+            y = y[::step]
+    else:
+        if y is None:
+            raise errors.HighchartsValueError('y is required when u and v are '
+                                              'two-dimensional grids')
+        if x.ndim == 1 and y.ndim == 1:
+            if (len(y), len(x)) != u.shape:
+                raise errors.HighchartsValueError(f'a grid of shape {u.shape} expects '
+                                                  f'{u.shape[1]} x coordinates and '
+                                                  f'{u.shape[0]} y coordinates. '
+                                                  f'Received: {len(x)} and {len(y)}')
+            x, y = np.meshgrid(x[::strides[1]], y[::strides[0]], copy = False)
+        elif x.shape == u.shape and y.shape == u.shape:
+            x = x[::strides[0], ::strides[1]]
+            y = y[::strides[0], ::strides[1]]
+        else:
+            raise errors.HighchartsValueError('x and y must either be one-dimensional '
+                                              'coordinates or have the same shape as u '
+                                              'and v')
+        u = u[::strides[0], ::strides[1]]
+        v = v[::strides[0], ::strides[1]]
+        x, y, u, v = x.ravel(), y.ravel(), u.ravel(), v.ravel()
+
+    length = np.hypot(u, v)
+    direction = np.degrees(np.arctan2(-u, -v)) % 360
+    direction[length == 0] = 0
+
+    columns = {'x': x}
+    if y is not None:
+        columns['y'] = y
+    columns['length'] = length
+    columns['direction'] = direction
+
+    if skip_nan:
+        is_finite = np.isfinite(length)
+        if not is_finite.all():
+            columns = {key: value[is_finite] for key, value in columns.items()}
+
+    return columns
@@ -465,3 +465,147 @@ def test__setattr__(name, value, expected, error):
         with pytest.raises(error):
             obj = cls()
             setattr(obj, name, value)
+
+
+@pytest.mark.parametrize('n_points, method, prop, error', [
+    (50, 'lttb', 'y', None),
+    (50, 'minmax', 'y', None),
+    (50, 'm4', 'y', None),
+
+    (50, 'lttb', 'z', errors.HighchartsValueError),
+])
+def test_downsample(n_points, method, prop, error):
+    from highcharts_core.options.series.data.cartesian import CartesianDataCollection
+
+    x = np.arange(1000)
+    y = np.sin(x / 50)
+    instance = CartesianDataCollection.from_ndarray(np.column_stack([x, y]))
+    if not error:
+        result = instance.downsample(n_points, method = method, prop = prop)
+        assert isinstance(result, CartesianDataCollection)
+        assert result is not instance
+        assert len(instance) == 1000
+        assert 0 < len(result) <= n_points
+        assert result.ndarray is not None
+        assert result.ndarray['x'][0] == 0
+        assert result.ndarray['x'][-1] == 999
+        assert result.data_points is None
+    else:
+        with pytest.raises(error):
+            result = instance.downsample(n_points, method = method, prop = prop)
+
+
+@pytest.mark.parametrize('columns, expected_keys, expected_array, error', [
+    ({'y': [1, 2], 'x': [3, 4]}, ['x', 'y'], [[3, 1], [4, 2]], None),
+    ({'y': [1, 2]}, ['y'], [1, 2], None),
+    ({'y': [1, 2], 'id': ['a', 'b']}, None, None, None),
+
+    ({'y': [1, 2], 'x': [3]}, None, None, errors.HighchartsValueError),
+])
+def test_from_columns(columns, expected_keys, expected_array, error):
+    from highcharts_core.options.series.data.cartesian import CartesianDataCollection
+
+    if not error:
+        result = CartesianDataCollection.from_columns(columns)
+        assert isinstance(result, CartesianDataCollection)
+        if expected_keys:
+            assert list(result.ndarray.keys()) == expected_keys
+            assert result.data_points is None
+            assert result.to_array() == expected_array
+        else:
+            assert result.ndarray is None
+            assert len(result.data_points) == len(list(columns.values())[0])
+            for data_point in result.data_points:
+                assert isinstance(data_point, CartesianDataCollection._get_data_point_class())
+    else:
+        with pytest.raises(error):
+            result = CartesianDataCollection.from_columns(columns)
+
+
+@pytest.mark.parametrize('unit, approximation, expected_length, error', [
+    ('day', 'average', 3, None),
+    ('week', 'sum', 1, None),
+
+    ('day', 'ohlc', None, errors.HighchartsValueError),
+])
+def test_group_by_time(unit, approximation, expected_length, error):
+    from highcharts_core.options.series.data.cartesian import CartesianDataCollection
+
+    x = np.arange('2024-01-01T00', '2024-01-04T00', dtype = 'datetime64[h]')
+    instance = CartesianDataCollection.from_columns({
+        'x': x,
+        'y': np.arange(len(x), dtype = float)
+    })
+    if not error:
+        result = instance.group_by_time(unit, approximation = approximation)
+        assert isinstance(result, CartesianDataCollection)
+        assert len(result) == expected_length
+        assert list(result.ndarray.keys()) == ['x', 'y']
+    else:
+        with pytest.raises(error):
+            result = instance.group_by_time(unit, approximation = approximation)
+
+
+@pytest.mark.parametrize('columns, expected, error', [
+    ({'x': [0, 10, 20], 'y': [1, 2, 3]}, (0, 10, [1, 2, 3]), None),
+    ({'x': np.arange('2024-01-01', '2024-01-04', dtype = 'datetime64[D]'),
+      'y': [1, 2, 3]},
+     (1704067200000, 86400000, [1, 2, 3]),
+     None),
+    ({'x': [0, 10, 25], 'y': [1, 2, 3]}, None, None),
+    ({'x': [0, 10, 20], 'y': [1, 2, 3], 'name': ['a', 'b', 'c']}, None, None),
+    ({'y': [1, 2, 3]}, None, None),
+])
+def test_split_point_interval(columns, expected, error):
+    from highcharts_core.options.series.data.cartesian import CartesianDataCollection
+
+    instance = CartesianDataCollection.from_columns(columns)
+    if not error:
+        result = instance.split_point_interval()
+        if expected is None:
+            assert result is None
+        else:
+            point_start, point_interval, collection = result
+            assert point_start == expected[0]
+            assert point_interval == expected[1]
+            assert 'x' not in collection.ndarray
+            assert collection.to_array() == expected[2]
+    else:
+        with pytest.raises(error):
+            result = instance.split_point_interval()
+
+
+@pytest.mark.parametrize('tolerance, method, preserve_topology, expected_length, error', [
+    (0.01, 'rdp', True, 33, None),
+    (10, 'rdp', True, 4, None),
+    (10, 'rdp', False, 2, None),
+    (1e-4, 'visvalingam', True, 80, None),
+    (10, 'visvalingam', True, 4, None),
+
+    (0.01, 'unsupported', True, None, errors.HighchartsValueError),
+    (-1, 'rdp', True, None, (ValueError, TypeError)),
+])
+def test_simplify(tolerance, method, preserve_topology, expected_length, error):
+    from highcharts_core.options.series.data.cartesian import CartesianDataCollection
+
+    t = np.linspace(0, 2 * np.pi, 1001)
+    x = np.cos(t)
+    y = np.sin(t)
+    x[-1], y[-1] = x[0], y[0]
+    instance = CartesianDataCollection.from_ndarray(np.column_stack([x, y]))
+    if not error:
+        result = instance.simplify(tolerance,
+                                   method = method,
+                                   preserve_topology = preserve_topology)
+        assert isinstance(result, CartesianDataCollection)
+        assert result is not instance
+        assert len(instance) == 1001
+        assert len(result) == expected_length
+        assert result.ndarray['x'][0] == x[0]
+        assert result.ndarray['x'][-1] == x[-1]
+        assert result.data_points is None
+    else:
+        with pytest.raises(error):
+            result = instance.simplify(tolerance,
+                                       method = method,
+                                       preserve_topology = preserve_topology)
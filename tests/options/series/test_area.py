@@ -2947,6 +2947,115 @@ def test_bugfix32_LineSeries_from_csv(kwargs, error):
             assert item.id is not None
 
 
+@pytest.mark.parametrize('kwargs, expected_keys, expected_array, error', [
+    ({
+        'as_string_or_file': "Date,HeadCount,Other\r\n2023-01-01,2,a\r\n2023-01-02,4,b\r\n2023-01-03,,c",
+        'property_column_map': {'x': 'Date', 'y': 'HeadCount'}
+     },
+     ['x', 'y'],
+     [[1672531200000, 2.0], [1672617600000, 4.0], [1672704000000, None]],
+     None),
+    ({
+        'as_string_or_file': "Date,HeadCount\r\n1,2\r\n2,4",
+        'property_column_map': {'y': 'HeadCount'}
+     },
+     ['y'],
+     [2, 4],
+     None),
+])
+def test_LineSeries_from_csv_typed_columns(kwargs, expected_keys, expected_array, error):
+    if not error:
+        result = cls5.from_csv(**kwargs)
+        assert isinstance(result, cls5) is True
+        assert result.data.data_points is None
+        assert list(result.data.ndarray.keys()) == expected_keys
+        assert result.data.to_array() == expected_array
+    else:
+        with pytest.raises(error):
+            result = cls5.from_csv(**kwargs)
+
+
+@pytest.mark.parametrize('kwargs, expected_y, error', [
+    ({'chunksize': 7}, [x * 5 for x in range(48)], None),
+    ({'chunksize': 7, 'chunk_aggregation': {'unit': 'hour', 'approximation': 'sum'}},
+     [sum(range(0, 60, 5)) + 720 * x for x in range(4)],
+     None),
+    ({'chunksize': 12, 'chunk_downsample': 4}, None, None),
+])
+def test_LineSeries_from_csv_chunksize(tmp_path, kwargs, expected_y, error):
+    filename = tmp_path / 'chunks.csv'
+    rows = ['Time,Value']
+    rows.extend([f'2024-01-01T{x // 12:02d}:{(x % 12) * 5:02d},{x * 5}'
+                 for x in range(48)])
+    filename.write_text('\r\n'.join(rows))
+
+    if not error:
+        result = cls5.from_csv(str(filename),
+                               property_column_map = {'x': 'Time', 'y': 'Value'},
+                               **kwargs)
+        assert isinstance(result, cls5) is True
+        assert result.data.data_points is None
+        if expected_y is not None:
+            assert result.data.ndarray['y'].tolist() == expected_y
+        else:
+            assert len(result.data) == 16
+    else:
+        with pytest.raises(error):
+            result = cls5.from_csv(str(filename),
+                                   property_column_map = {'x': 'Time', 'y': 'Value'},
+                                   **kwargs)
+
+
+
+@pytest.mark.parametrize('unit', ['hour', 'year'])
+@pytest.mark.parametrize('approximation', ['average', 'sum', 'high', 'low', 'open', 'close'])
+def test_LineSeries_from_csv_chunk_aggregation_spanning_chunks(tmp_path, monkeypatch, unit, approximation):
+    from highcharts_core import utility_functions
+
+    filename = tmp_path / 'spanning.csv'
+    values = [(x * 37) % 23 for x in range(150)]
+    rows = ['Time,Value']
+    rows.extend([f'2024-01-01T{x // 60:02d}:{x % 60:02d},{value}'
+                 for x, value in enumerate(values)])
+    filename.write_text('\r\n'.join(rows))
+
+    merge_time_summaries = utility_functions.merge_time_summaries
+    carried_lengths = []
+    def spy(summaries):
+        carried_lengths.extend([len(x['x']) for x in summaries[:-1] if x is not None])
+        return merge_time_summaries(summaries)
+    monkeypatch.setattr(utility_functions, 'merge_time_summaries', spy)
+
+    aggregation = {'unit': unit, 'approximation': approximation}
+    result = cls5.from_csv(str(filename),
+                           property_column_map = {'x': 'Time', 'y': 'Value'},
+                           chunksize = 7,
+                           chunk_aggregation = aggregation)
+    expected = cls5.from_csv(str(filename),
+                             property_column_map = {'x': 'Time', 'y': 'Value'})
+    expected = expected.data.group_by_time(**aggregation)
+
+    assert result.data.to_array() == expected.to_array()
+    assert carried_lengths and max(carried_lengths) == 1
+
+
+@pytest.mark.parametrize('chunksize', [2, 3, None])
+def test_LineSeries_from_csv_chunksize_empty_chunk(tmp_path, chunksize):
+    filename = tmp_path / 'empty_chunk.csv'
+    filename.write_text('x,y\r\n2024-01-01T00:00,1\r\n2024-01-01T01:00,2\r\n'
+                        'None,3\r\nNone,4\r\n2024-01-01T04:00,5\r\n')
+
+    result = cls5.from_csv(str(filename),
+                           property_column_map = {'x': 'x', 'y': 'y'},
+                           chunksize = chunksize)
+    assert result.data.ndarray['x'].dtype.kind == 'M'
+    assert result.data.to_array() == [[1704067200000, 1],
+                                      [1704070800000, 2],
+                                      [None, 3],
+                                      [None, 4],
+                                      [1704081600000, 5]]
+
+
 @pytest.mark.parametrize('filename, expected_series, expected_data_points, error', [
     ('test-data-files/nst-est2019-01.csv', 57, 10, None),
 ])
@@ -3219,3 +3328,338 @@ def test_StreamGraphSeries_to_dict(kwargs, error):
 ])
 def test_StreamGraphSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls6, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('property_map, kwargs, expected_series, expected_array, error', [
+    ({'x': 'ts', 'y': 'value'},
+     {},
+     1,
+     [[1704067200000, 1.0], [1704153600000, None], [None, 3.0]],
+     None),
+    ({'x': 'ts', 'y': ['value', 'count']},
+     {},
+     2,
+     [[1704067200000, 1.0], [1704153600000, None], [None, 3.0]],
+     None),
+    ({'x': 'ts', 'y': ['value', 'count']},
+     {'series_index': 1},
+     1,
+     [[1704067200000, 1], [1704153600000, 2], [None, 3]],
+     None),
+    ({'y': 'count', 'name': 'label'}, {}, 1, None, None),
+
+    ({'x': 'ts', 'y': 'missing'}, {}, None, None, errors.HighchartsArrowDeserializationError),
+    ({'x': ['ts', 'ts'], 'y': ['value', 'count', 'count']},
+     {},
+     None,
+     None,
+     errors.HighchartsArrowDeserializationError),
+])
+def test_LineSeries_from_arrow(property_map,
+                               kwargs,
+                               expected_series,
+                               expected_array,
+                               error):
+    pa = pytest.importorskip('pyarrow')
+    import datetime
+
+    table = pa.table({
+        'ts': pa.array([datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2), None],
+                       type = pa.timestamp('us')),
+        'value': pa.array([1.0, None, 3.0]),
+        'count': pa.array([1, 2, 3]),
+        'label': pa.array(['a', 'b', 'c'])
+    })
+
+    for source in [table, table.to_batches()[0]]:
+        if not error:
+            result = cls5.from_arrow(source, property_map, **kwargs)
+            if expected_series > 1:
+                assert isinstance(result, list)
+                assert len(result) == expected_series
+                assert [x.name for x in result] == property_map['y']
+                result = result[0]
+            assert isinstance(result, cls5) is True
+            assert len(result.data) == 3
+            if expected_array:
+                assert result.data.data_points is None
+                assert result.data.to_array() == expected_array
+            else:
+                assert result.data.data_points[1].name == 'b'
+        else:
+            with pytest.raises(error):
+                result = cls5.from_arrow(source, property_map, **kwargs)
+
+
+def test_LineSeries_load_from_arrow():
+    pa = pytest.importorskip('pyarrow')
+
+    table = pa.table({'a': [1, 2], 'b': [3.0, 4.0], 'c': [5.0, 6.0]})
+    result = cls5(name = 'Series')
+    result.load_from_arrow(table, {'x': 'a', 'y': 'b'})
+    assert result.name == 'Series'
+    assert result.data.to_array() == [[1, 3.0], [2, 4.0]]
+
+    with pytest.raises(errors.HighchartsArrowDeserializationError):
+        result.load_from_arrow(table, {'x': 'a', 'y': ['b', 'c']})
+
+    result.load_from_arrow(table, {'x': 'a', 'y': ['b', 'c']}, series_index = 1)
+    assert result.data.to_array() == [[1, 5.0], [2, 6.0]]
+
+
+@pytest.mark.parametrize('property_map, kwargs, expected_names, expected_array, error', [
+    ({'x': 'x', 'y': 'a'}, {}, ['a'], [[1, 1.0], [2, None], [3, 3.0]], None),
+    ({'x': 'x', 'y': ['a', 'b']}, {}, ['a', 'b'], [[1, 1.0], [2, None], [3, 3.0]], None),
+    ({'x': 'x', 'y': ['a', 'b']}, {'series_index': 1}, ['b'], [[1, 4], [2, 5], [3, 6]], None),
+    (None, {}, ['a', 'b'], [[1, 1.0], [2, None], [3, 3.0]], None),
+    (None, {'x': 'x', 'y': 'b'}, ['b'], [[1, 4], [2, 5], [3, 6]], None),
+    (None,
+     {'series_in_rows': True},
+     ['r1', 'r2', 'r3'],
+     None,
+     None),
+
+    ({'x': 'x', 'y': 'missing'}, {}, None, None, errors.HighchartsPolarsDeserializationError),
+])
+def test_LineSeries_from_polars(property_map, kwargs, expected_names, expected_array, error):
+    pl = pytest.importorskip('polars')
+
+    df = pl.DataFrame({'x': [1, 2, 3], 'a': [1.0, None, 3.0], 'b': [4, 5, 6]})
+    if kwargs.get('series_in_rows'):
+        df = df.with_columns(pl.Series('label', ['r1', 'r2', 'r3'])).select('label',
+                                                                            'a',
+                                                                            'b')
+
+    for source in [df, df.lazy()]:
+        if not error:
+            result = cls5.from_polars(source, property_map, **kwargs.copy())
+            if not isinstance(result, list):
+                result = [result]
+            assert [x.name for x in result] == expected_names
+            assert all([isinstance(x, cls5) for x in result])
+            if expected_array:
+                assert result[0].data.data_points is None
+                assert result[0].data.to_array() == expected_array
+        else:
+            with pytest.raises(error):
+                result = cls5.from_polars(source, property_map, **kwargs.copy())
+
+
+def test_LineSeries_load_from_polars():
+    pl = pytest.importorskip('polars')
+
+    df = pl.DataFrame({'a': [1, 2], 'b': [3.0, 4.0], 'c': [5.0, 6.0]})
+    result = cls5(name = 'Series')
+    result.load_from_polars(df.lazy(), {'x': 'a', 'y': 'b'})
+    assert result.name == 'Series'
+    assert result.data.to_array() == [[1, 3.0], [2, 4.0]]
+
+    with pytest.raises(errors.HighchartsPolarsDeserializationError):
+        result.load_from_polars(df, {'x': 'a', 'y': ['b', 'c']})
+
+    result.load_from_polars(df, {'x': 'a', 'y': ['b', 'c']}, series_index = 1)
+    assert result.data.to_array() == [[1, 5.0], [2, 6.0]]
+
+
+@pytest.mark.parametrize('file_format, property_map, kwargs, expected_y, error', [
+    ('parquet', {'x': 'ts', 'y': 'value'}, {}, list(range(10)), None),
+    ('parquet',
+     {'x': 'ts', 'y': 'value'},
+     {'x_range': ('2024-01-03', '2024-01-05')},
+     [2, 3, 4],
+     None),
+    ('parquet',
+     {'x': 'ts', 'y': 'value'},
+     {'x_range': (1704585600000, None), 'filters': [('metric', '=', 'a')]},
+     [6, 8],
+     None),
+    ('feather',
+     {'x': 'ts', 'y': 'value'},
+     {'x_range': ('2024-01-03', '2024-01-05')},
+     [2, 3, 4],
+     None),
+    ('feather', {'x': 'ts', 'y': 'value'}, {'filters': [('metric', '=', 'b')]}, [1, 3, 5, 7, 9], None),
+
+    ('parquet', {'x': 'ts', 'y': 'missing'}, {}, None, errors.HighchartsArrowDeserializationError),
+    ('feather', {'x': 'ts', 'y': 'missing'}, {}, None, errors.HighchartsArrowDeserializationError),
+    ('parquet',
+     {'y': 'value'},
+     {'x_range': (0, 1)},
+     None,
+     errors.HighchartsArrowDeserializationError),
+])
+def test_LineSeries_from_parquet(tmp_path, file_format, property_map, kwargs, expected_y, error):
+    pa = pytest.importorskip('pyarrow')
+    from pyarrow import parquet, feather
+    import datetime
+
+    table = pa.table({
+        'ts': pa.array([datetime.datetime(2024, 1, x) for x in range(1, 11)],
+                       type = pa.timestamp('us')),
+        'value': pa.array(list(range(10))),
+        'metric': pa.array(['a', 'b'] * 5)
+    })
+    filename = tmp_path / f'test.{file_format}'
+    if file_format == 'parquet':
+        parquet.write_table(table, filename, row_group_size = 3)
+        method = cls5.from_parquet
+    else:
+        feather.write_feather(table, filename, compression = 'uncompressed')
+        method = cls5.from_feather
+
+    if not error:
+        result = method(filename, property_map, **kwargs)
+        assert isinstance(result, cls5) is True
+        assert result.data.data_points is None
+        assert [x[1] for x in result.data.to_array()] == expected_y
+    else:
+        with pytest.raises(error):
+            result = method(filename, property_map, **kwargs)
+
+
+@pytest.mark.parametrize('property_map, kwargs, expected_names, expected_y, error', [
+    ({'x': 'x', 'y': 'value'}, {}, ['value'], [list(range(10))], None),
+    ({'x': 'x', 'y': 'value'}, {'batch_size': 1}, ['value'], [list(range(10))], None),
+    ({'x': 'x', 'y': ['value', 'other']},
+     {'batch_size': 4},
+     ['value', 'other'],
+     [list(range(10)), [x * 0.5 for x in range(10)]],
+     None),
+    ({'x': 'x', 'y': 'value'},
+     {'batch_size': 3, 'split_by': 'metric'},
+     ['b', 'a'],
+     [[0, 2, 4, 6, 8], [1, 3, 5, 7, 9]],
+     None),
+    ({'x': 'x', 'y': 'value'},
+     {'split_by': 'metric', 'query': 'SELECT * FROM test WHERE value > ?', 'parameters': (6, )},
+     ['a', 'b'],
+     [[7, 9], [8]],
+     None),
+    ({'x': 'x', 'y': 'value'},
+     {'split_by': 'metric', 'series_kwargs': {'name': 'Fixed'}},
+     ['Fixed', 'Fixed'],
+     [[0, 2, 4, 6, 8], [1, 3, 5, 7, 9]],
+     None),
+
+    ({'x': 'x', 'y': 'missing'}, {}, None, None, errors.HighchartsSQLDeserializationError),
+    ({'x': 'x', 'y': 'value'},
+     {'split_by': 'missing'},
+     None,
+     None,
+     errors.HighchartsSQLDeserializationError),
+    ({'x': 'x', 'y': 'value'}, {'batch_size': 0}, None, None, ValueError),
+])
+def test_LineSeries_from_sql(property_map, kwargs, expected_names, expected_y, error):
+    import sqlite3
+
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE test (x INTEGER, value INTEGER, other REAL, metric TEXT)')
+    connection.executemany('INSERT INTO test VALUES (?, ?, ?, ?)',
+                           [(x, x, x * 0.5, 'b' if x % 2 == 0 else 'a')
+                            for x in range(10)])
+    kwargs = kwargs.copy()
+    query = kwargs.pop('query', 'SELECT * FROM test ORDER BY x')
+
+    if not error:
+        result = cls5.from_sql(connection, query, property_map, **kwargs)
+        if not isinstance(result, list):
+            result = [result]
+        assert len(result) == len(expected_y)
+        for series, name, y in zip(result, expected_names, expected_y):
+            assert isinstance(series, cls5) is True
+            assert series.name == name
+            assert series.data.data_points is None
+            assert [x[1] for x in series.data.to_array()] == y
+
+        cursor = connection.cursor()
+        from_cursor = cls5.from_sql(cursor, query, property_map, **kwargs)
+        if not isinstance(from_cursor, list):
+            from_cursor = [from_cursor]
+        assert len(from_cursor) == len(result)
+    else:
+        with pytest.raises(error):
+            result = cls5.from_sql(connection, query, property_map, **kwargs)
+
+
+def test_LineSeries_from_sql_utc_offsets():
+    import sqlite3
+    import warnings
+
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE test (ts TEXT, value INTEGER)')
+    connection.executemany('INSERT INTO test VALUES (?, ?)',
+                           [('2024-01-01T02:00:00+02:00', 1),
+                            ('2024-01-01T01:00:00Z', 2),
+                            ('2024-01-01T00:30:00-01:30', 3)])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = cls5.from_sql(connection,
+                               'SELECT * FROM test',
+                               {'x': 'ts', 'y': 'value'})
+
+    assert result.data.to_array() == [[1704067200000, 1],
+                                      [1704070800000, 2],
+                                      [1704074400000, 3]]
+
+
+@pytest.mark.parametrize('property_map, kwargs, expected_names, expected_y, error', [
+    ({'x': 'x', 'y': 'value'},
+     {'group_by': 'ticker'},
+     ['B', 'A', 'C'],
+     [[0, 3, 5], [1, 4], [2]],
+     None),
+    (None,
+     {'group_by': 'ticker', 'x': 'x', 'y': 'value'},
+     ['B', 'A', 'C'],
+     [[0, 3, 5], [1, 4], [2]],
+     None),
+    ({'x': 'x', 'y': ['value', 'other']},
+     {'group_by': 'ticker'},
+     ['B: value', 'B: other', 'A: value', 'A: other', 'C: value', 'C: other'],
+     [[0, 3, 5], [0, 6, 10], [1, 4], [2, 8], [2], [4]],
+     None),
+    ({'x': 'x', 'y': 'value'},
+     {'group_by': 'ticker', 'series_index': 1},
+     ['A'],
+     [[1, 4]],
+     None),
+    ({'x': 'x', 'y': 'value'},
+     {'group_by': 'ticker', 'series_kwargs': {'name': 'Fixed'}, 'id': 'my-id'},
+     ['Fixed', 'Fixed', 'Fixed'],
+     [[0, 3, 5], [1, 4], [2]],
+     None),
+
+    ({'x': 'x', 'y': 'value'}, {'group_by': 'missing'}, None, None, errors.HighchartsPandasDeserializationError),
+    ({'x': 'x', 'y': 'missing'}, {'group_by': 'ticker'}, None, None, errors.HighchartsPandasDeserializationError),
+    (None, {'group_by': 'ticker'}, None, None, errors.HighchartsPandasDeserializationError),
+    ({'x': 'x', 'y': 'value'},
+     {'group_by': 'ticker', 'series_in_rows': True},
+     None,
+     None,
+     errors.HighchartsPandasDeserializationError),
+])
+def test_LineSeries_from_pandas_group_by(property_map, kwargs, expected_names, expected_y, error):
+    pd = pytest.importorskip('pandas')
+
+    df = pd.DataFrame({
+        'x': list(range(6)),
+        'value': list(range(6)),
+        'other': [x * 2 for x in range(6)],
+        'ticker': ['B', 'A', 'C', 'B', 'A', 'B'],
+    })
+
+    if not error:
+        result = cls5.from_pandas(df, property_map = property_map, **kwargs)
+        if not isinstance(result, list):
+            result = [result]
+        assert len(result) == len(expected_y)
+        for series, name, y in zip(result, expected_names, expected_y):
+            assert isinstance(series, cls5) is True
+            assert series.name == name
+            assert [x[1] for x in series.data.to_array()] == y
+            if 'id' in kwargs:
+                assert series.id == kwargs['id']
+    else:
+        with pytest.raises(error):
+            result = cls5.from_pandas(df, property_map = property_map, **kwargs)
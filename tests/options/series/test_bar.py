@@ -1043,6 +1043,31 @@ def test_ColumnSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls3, input_files, filename, as_file, error)
 
 
+@pytest.mark.parametrize('property_map, kwargs, expected_names, expected', [
+    ({'name': 'cat', 'y': 'v'}, {}, ['v'], [['2019', '2020']]),
+    ({'y': 'v'}, {'split_by': 'cat'}, ['2019', '2020'], [[1], [2]]),
+])
+def test_ColumnSeries_from_sql_year_strings(property_map, kwargs, expected_names, expected):
+    import sqlite3
+
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE t (cat TEXT, v INTEGER)')
+    connection.executemany('INSERT INTO t VALUES (?, ?)', [('2019', 1), ('2020', 2)])
+
+    result = cls3.from_sql(connection, 'SELECT cat, v FROM t', property_map, **kwargs)
+    if not isinstance(result, list):
+        result = [result]
+    assert len(result) == len(expected)
+    for series, name, values in zip(result, expected_names, expected):
+        assert isinstance(series, cls3) is True
+        assert series.name == name
+        points = series.data.to_array()
+        if 'name' in property_map:
+            assert [x[-1] for x in points] == values
+        else:
+            assert points == values
+
+
 # NEXT CLASS!
 
 STANDARD_PARAMS_4 = [
@@ -6442,3 +6467,29 @@ def test_XRangeSeries_to_dict(kwargs, error):
 ])
 def test_XRangeSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls10, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('x, y, u, v, kwargs, expected, error', [
+    ([0, 1, 2], None, [3, 0, 1], [4, -2, float('nan')], {},
+     [(0, None, 5.0, 216.86989764584402), (1, None, 2.0, 0.0)],
+     None),
+    ([0, 1, 2, 3], None, [1, 1, 1, 1], [0, 0, 0, 0], {'stride': 2},
+     [(0, None, 1.0, 270.0), (2, None, 1.0, 270.0)],
+     None),
+    ([0, 1], [10, 20], [[1, 1], [1, 1]], [[0, 0], [0, 0]], {'stride': 2},
+     [(0, 10, 1.0, 270.0)],
+     None),
+
+    ([0, 1], None, [[1, 1], [1, 1]], [[0, 0], [0, 0]], {}, None, errors.HighchartsValueError),
+    ([0, 1], None, [1, 2], [1, 2], {'stride': 0}, None, (ValueError, TypeError)),
+])
+def test_WindBarbSeries_from_components(x, y, u, v, kwargs, expected, error):
+    pytest.importorskip('numpy')
+
+    if not error:
+        result = cls9.from_components(x, y, u, v, **kwargs)
+        assert isinstance(result, cls9) is True
+        assert [(x.x, x.y, x.value, x.direction) for x in result.data] == expected
+    else:
+        with pytest.raises(error):
+            result = cls9.from_components(x, y, u, v, **kwargs)
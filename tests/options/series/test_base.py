@@ -6,6 +6,11 @@ from json.decoder import JSONDecodeError
 from validator_collection import checkers
 
 from highcharts_core.options.series.base import SeriesBase as cls
+from highcharts_core.options.series.treemap import TreemapSeries
+from highcharts_core.options.series.sunburst import SunburstSeries
+from highcharts_core.options.series.dependencywheel import DependencyWheelSeries
+from highcharts_core.options.series.sankey import SankeySeries
+from highcharts_core.options.series.arcdiagram import ArcDiagramSeries
 from highcharts_core import errors
 from tests.fixtures import (input_files,
                             check_input_file,
@@ -15,7 +20,8 @@ from tests.fixtures import (input_files,
                             Class__to_untrimmed_dict,
                             Class_from_dict, Class_to_dict,
                             Class_from_js_literal,
-                            run_pandas_tests)
+                            run_pandas_tests,
+                            run_pyspark_tests)
 
 
 STANDARD_PARAMS = [
@@ -852,6 +858,124 @@ def test_from_pandas(run_pandas_tests,
             result = cls.from_pandas(df, **kwargs)
 
 
+@pytest.mark.parametrize('kwargs, expected_length, error', [
+    ({}, 20, None),
+    ({'use_arrow': False}, 20, None),
+    ({'sample_fraction': 1.0, 'seed': 1}, 20, None),
+    ({'sample_fraction': 0.0}, 0, None),
+    ({'sample_fraction': 2.0}, None, ValueError),
+])
+def test_from_pyspark(run_pyspark_tests, kwargs, expected_length, error):
+    if not run_pyspark_tests:
+        return
+
+    from pyspark.sql import SparkSession
+    from highcharts_core.options.series.area import LineSeries
+
+    spark = SparkSession.builder.appName('highcharts.tests').getOrCreate()
+    df = spark.createDataFrame([(float(x), float(x * 2), f'Point {x}')
+                                for x in range(20)],
+                               ['x', 'y', 'label'])
+
+    if not error:
+        result = LineSeries.from_pyspark(df, {'x': 'x', 'y': 'y'}, **kwargs)
+        assert isinstance(result, LineSeries)
+        assert len(result.data) == expected_length
+        if expected_length:
+            point = result.data.to_array()[1]
+            if not isinstance(point, list):
+                point = [point.x, point.y]
+            assert point == [1.0, 2.0]
+
+        result = LineSeries.from_pyspark(df,
+                                         {'x': 'x', 'y': 'y', 'name': 'label'},
+                                         **kwargs)
+        assert len(result.data) == expected_length
+        if expected_length:
+            assert result.data.to_array()[1].name == 'Point 1'
+    else:
+        with pytest.raises(error):
+            result = LineSeries.from_pyspark(df, {'x': 'x', 'y': 'y'}, **kwargs)
+
+
+@pytest.mark.parametrize('use_arrow, error', [
+    (None, None),
+    (False, None),
+    (True, errors.HighchartsDependencyError),
+])
+def test_from_pyspark_without_pyarrow(run_pyspark_tests, monkeypatch, use_arrow, error):
+    if not run_pyspark_tests:
+        return
+
+    import sys
+    from pyspark.sql import SparkSession
+    from highcharts_core.options.series.area import LineSeries
+
+    spark = SparkSession.builder.appName('highcharts.tests').getOrCreate()
+    df = spark.createDataFrame([(float(x), float(x * 2)) for x in range(20)],
+                               ['x', 'y'])
+    monkeypatch.setitem(sys.modules, 'pyarrow', None)
+
+    if not error:
+        result = LineSeries.from_pyspark(df, {'x': 'x', 'y': 'y'}, use_arrow = use_arrow)
+        assert len(result.data) == 20
+    else:
+        with pytest.raises(error):
+            result = LineSeries.from_pyspark(df,
+                                             {'x': 'x', 'y': 'y'},
+                                             use_arrow = use_arrow)
+
+
+@pytest.mark.parametrize('property_map, kwargs, expected_length, error', [
+    ({'x': 'ts', 'y': 'value'}, {'bucket': '1h'}, 4, None),
+    ({'x': 'ts', 'y': 'value'}, {'bucket': '1h', 'agg': 'sum'}, 4, None),
+    ({'x': 'ts'}, {'bucket': '1 day'}, 1, None),
+    ({'x': 'value'}, {'bins': 5}, 5, None),
+    ({'name': 'category', 'y': 'value'}, {'top_k': 2, 'agg': 'sum'}, 2, None),
+    ({'x': 'ts', 'y': 'value'}, {'bucket': '1h', 'top_k': 2}, 2, None),
+
+    ({'x': 'ts', 'y': 'value'},
+     {'bucket': '1h', 'bins': 5},
+     None,
+     errors.HighchartsValueError),
+    ({'x': 'ts', 'y': 'value'},
+     {'bucket': '1h', 'agg': 'median'},
+     None,
+     errors.HighchartsValueError),
+    ({'x': 'ts', 'y': 'value'},
+     {'bucket': '1h', 'bucket_by': 'category'},
+     None,
+     errors.HighchartsPySparkDeserializationError),
+])
+def test_from_pyspark_aggregated(run_pyspark_tests,
+                                 property_map,
+                                 kwargs,
+                                 expected_length,
+                                 error):
+    if not run_pyspark_tests:
+        return
+
+    import datetime
+    from pyspark.sql import SparkSession
+    from highcharts_core.options.series.area import LineSeries
+
+    spark = SparkSession.builder.appName('highcharts.tests').getOrCreate()
+    start = datetime.datetime(2024, 1, 1)
+    df = spark.createDataFrame([(start + datetime.timedelta(minutes = 15 * x),
+                                 float(x),
+                                 f'Category {x % 3}')
+                                for x in range(16)],
+                               ['ts', 'value', 'category'])
+
+    if not error:
+        result = LineSeries.from_pyspark(df, property_map, **kwargs)
+        assert isinstance(result, LineSeries)
+        assert len(result.data) == expected_length
+    else:
+        with pytest.raises(error):
+            result = LineSeries.from_pyspark(df, property_map, **kwargs)
+
+
 @pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
 def test_to_chart(kwargs, error):
     if not error:
@@ -946,4 +1070,202 @@ def test_bugfix162(input_files):
         df, property_map={"id": "task_id", "name": "name", "start": "start", "end": "end"}
     )
     
-    assert my_series is not None
\ No newline at end of file
+    assert my_series is not None
+
+@pytest.mark.parametrize('data, n_points, method, error', [
+    ([{'x': x, 'y': x % 7, 'name': f'Point {x}'} for x in range(200)], 20, 'lttb', None),
+    ([[x, x % 7] for x in range(200)], 20, 'minmax', None),
+    (None, 20, 'lttb', None),
+])
+def test_downsample(data, n_points, method, error):
+    from highcharts_core.options.series.area import LineSeries
+
+    instance = LineSeries(data = data)
+    if not error:
+        instance.downsample(n_points, method = method)
+        if data is None:
+            assert instance.data is None
+        else:
+            assert len(instance.data) <= n_points
+            assert instance.data[0].x == 0
+            assert instance.data[-1].x == 199
+    else:
+        with pytest.raises(error):
+            instance.downsample(n_points, method = method)
+
+
+@pytest.mark.parametrize('unit, use_point_interval, expected_interval, expected_unit, error', [
+    ('hour', False, None, None, None),
+    ('hour', True, 3600000, None, None),
+    ('month', True, 1, 'month', None),
+])
+def test_group_by_time(unit, use_point_interval, expected_interval, expected_unit, error):
+    from highcharts_core.options.series.area import LineSeries
+
+    instance = LineSeries(data = [{'x': x * 60000, 'y': x} for x in range(180)])
+    if not error:
+        instance.group_by_time(unit, use_point_interval = use_point_interval)
+        assert instance.data is not None
+        assert instance.point_interval == expected_interval
+        assert instance.point_interval_unit == expected_unit
+        if use_point_interval:
+            assert instance.point_start == 0
+            assert 'x' not in instance.data.ndarray
+        else:
+            assert len(instance.data) == 3
+    else:
+        with pytest.raises(error):
+            instance.group_by_time(unit, use_point_interval = use_point_interval)
+
+
+@pytest.mark.parametrize('data, expected_result, expected_start, expected_interval, error', [
+    ([[x * 1000, x % 7] for x in range(50)], True, 0, 1000, None),
+    ([[x * x, x % 7] for x in range(50)], False, None, None, None),
+    ([{'x': x, 'y': x, 'color': '#ccc'} for x in range(5)], False, None, None, None),
+    (None, False, None, None, None),
+])
+def test_infer_point_interval(data,
+                              expected_result,
+                              expected_start,
+                              expected_interval,
+                              error):
+    from highcharts_core.options.series.area import LineSeries
+
+    instance = LineSeries(data = data)
+    if not error:
+        result = instance.infer_point_interval()
+        assert result is expected_result
+        assert instance.point_start == expected_start
+        assert instance.point_interval == expected_interval
+        if result:
+            assert instance.data.to_array() == [x % 7 for x in range(50)]
+    else:
+        with pytest.raises(error):
+            result = instance.infer_point_interval()
+
+
+def test_pickle():
+    import pickle
+    from highcharts_core.options.series.area import LineSeries
+
+    instance = LineSeries(data = [[0, 1], [1, 2]], name = 'Series')
+    result = pickle.loads(pickle.dumps(instance))
+    assert result.to_js_literal() == instance.to_js_literal()
+
+
+@pytest.mark.parametrize('data, tolerance, method, expected, error', [
+    ([[0, 0], [1, 0.01], [2, 0], [3, 5], [4, None], [5, 1]], 0.1, 'rdp',
+     [(0, 0), (2, 0), (3, 5), (4, None), (5, 1)],
+     None),
+    ([{'x': 0, 'y': 0, 'name': 'A'}, {'x': 1, 'y': 0}, {'x': 2, 'y': 0, 'name': 'C'}], 0.1, 'visvalingam',
+     [(0, 0), (2, 0)],
+     None),
+    (None, 0.1, 'rdp', None, None),
+
+    ([[0, 0], [1, 1], [2, 0]], 0.1, 'unsupported', None, errors.HighchartsValueError),
+])
+def test_simplify(data, tolerance, method, expected, error):
+    from highcharts_core.options.series.area import LineSeries
+
+    instance = LineSeries(data = data, name = 'Outline')
+    if not error:
+        result = instance.simplify(tolerance, method = method)
+        assert isinstance(result, LineSeries)
+        assert result is not instance
+        assert result.name == 'Outline'
+        if data is None:
+            assert result.data is None
+        else:
+            assert len(instance.data) == len(data)
+            assert [(x.x, x.y) for x in result.data] == expected
+    else:
+        with pytest.raises(error):
+            result = instance.simplify(tolerance, method = method)
+
+
+@pytest.mark.parametrize('series_cls', [TreemapSeries, SunburstSeries])
+@pytest.mark.parametrize('data, levels, kwargs, expected, error', [
+    ({'region': ['EU', 'EU', 'NA'], 'country': ['FR', 'DE', 'US'], 'sales': [1, 2, 3]},
+     ['region', 'country'],
+     {'value': 'sales'},
+     [('EU', None, 'EU', 3.0),
+      ('NA', None, 'NA', 3.0),
+      ('EU/DE', 'EU', 'DE', 2.0),
+      ('EU/FR', 'EU', 'FR', 1.0),
+      ('NA/US', 'NA', 'US', 3.0)],
+     None),
+    ({'region': ['EU', 'EU', 'EU', 'NA'], 'country': ['FR', 'IT', 'DE', 'US'], 'sales': [5, 1, 1, 10]},
+     ['region', 'country'],
+     {'value': 'sales', 'min_value': 2, 'other_label': 'Rest'},
+     [('EU', None, 'EU', 7.0),
+      ('NA', None, 'NA', 10.0),
+      ('EU/Rest', 'EU', 'Rest', 2.0),
+      ('EU/FR', 'EU', 'FR', 5.0),
+      ('NA/US', 'NA', 'US', 10.0)],
+     None),
+    (None,
+     [['a', 'a', 'b'], ['x', None, 'y']],
+     {'separator': ' > '},
+     [('a', None, 'a', 2.0),
+      ('b', None, 'b', 1.0),
+      ('a > x', 'a', 'x', 1.0),
+      ('b > y', 'b', 'y', 1.0)],
+     None),
+
+    ({'region': ['EU']}, ['missing'], {}, None, errors.HighchartsValueError),
+    ({'region': ['EU', 'NA'], 'sales': [1]}, ['region'], {'value': 'sales'}, None, errors.HighchartsValueError),
+    ({'region': ['EU']}, [], {}, None, (ValueError, TypeError)),
+])
+def test_HierarchicalSeriesMixin_from_paths(series_cls, data, levels, kwargs, expected, error):
+    pytest.importorskip('numpy')
+
+    if not error:
+        result = series_cls.from_paths(data, levels, **kwargs)
+        assert isinstance(result, series_cls) is True
+        assert [(x.id, x.parent, x.name, x.value) for x in result.data] == expected
+    else:
+        with pytest.raises(error):
+            result = series_cls.from_paths(data, levels, **kwargs)
+
+
+@pytest.mark.parametrize('series_cls', [TreemapSeries, SunburstSeries])
+def test_HierarchicalSeriesMixin_from_paths_pandas(series_cls):
+    pd = pytest.importorskip('pandas')
+
+    df = pd.DataFrame({
+        'region': ['EU', 'EU', 'NA', 'NA'],
+        'country': ['FR', 'FR', 'US', None],
+        'sales': [1.0, 2.0, 3.0, float('nan')]
+    })
+    result = series_cls.from_paths(df, ['region', 'country'], value = 'sales')
+    assert [(x.id, x.value) for x in result.data] == [('EU', 3.0),
+                                                      ('NA', 3.0),
+                                                      ('EU/FR', 3.0),
+                                                      ('NA/US', 3.0)]
+
+
+@pytest.mark.parametrize('series_cls', [DependencyWheelSeries, SankeySeries, ArcDiagramSeries])
+@pytest.mark.parametrize('sources, targets, kwargs, expected, error', [
+    (['a', 'a', 'b', 'c'], ['b', 'b', 'c', 'a'], {},
+     [('a', 'b', 2.0), ('b', 'c', 1.0), ('c', 'a', 1.0)],
+     None),
+    (['a', 'a', 'b', None], ['b', 'b', 'c', 'a'], {'weights': [1, 2, 5, 7], 'min_weight': 4},
+     [('b', 'c', 5.0)],
+     None),
+    (['a', 'a', 'b', 'c', 'd'], ['b', 'b', 'c', 'd', 'a'], {'top_n_nodes': 2, 'other_label': 'Rest'},
+     [('a', 'b', 2.0), ('b', 'Rest', 1.0), ('Rest', 'a', 1.0)],
+     None),
+
+    (['a', 'b'], ['b'], {}, None, errors.HighchartsValueError),
+    (['a', 'b'], ['b', 'c'], {'weights': [1]}, None, errors.HighchartsValueError),
+])
+def test_ConnectionSeriesMixin_from_edges(series_cls, sources, targets, kwargs, expected, error):
+    pytest.importorskip('numpy')
+
+    if not error:
+        result = series_cls.from_edges(sources, targets, **kwargs)
+        assert isinstance(result, series_cls) is True
+        assert [(x.from_, x.to, x.weight) for x in result.data] == expected
+    else:
+        with pytest.raises(error):
+            result = series_cls.from_edges(sources, targets, **kwargs)
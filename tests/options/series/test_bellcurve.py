@@ -425,3 +425,61 @@ def test_BellCurveSeries_to_dict(kwargs, error):
 ])
 def test_BellCurveSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('kwargs, expected_length, expected_peak, error', [
+    ({'mean': 0, 'std': 1}, 100, None, None),
+    ({'mean': 0, 'std': 1, 'n_points': 5}, 5, 0.3989422804014327, None),
+    ({'mean': 10, 'std': 2, 'n_points': 3, 'n': 100, 'bin_width': 0.5}, 3, 9.973557010035817, None),
+    ({'mean': 0, 'std': 1, 'series_kwargs': {'name': 'Fit'}, 'id': 'fit'}, 100, None, None),
+
+    ({'mean': 0, 'std': 0}, None, None, errors.HighchartsValueError),
+    ({'mean': 0, 'std': -1}, None, None, errors.HighchartsValueError),
+    ({'mean': 0, 'std': 1, 'n_points': 1}, None, None, ValueError),
+])
+def test_BellCurveSeries_from_stats(kwargs, expected_length, expected_peak, error):
+    pytest.importorskip('numpy')
+    from highcharts_core.options.series.area import AreaSplineSeries
+
+    if not error:
+        result = cls.from_stats(**kwargs)
+        assert isinstance(result, AreaSplineSeries) is True
+        assert result.data.data_points is None
+        as_array = result.data.to_array()
+        assert len(as_array) == expected_length
+        if expected_peak is not None:
+            assert as_array[expected_length // 2][1] == pytest.approx(expected_peak)
+        if 'series_kwargs' in kwargs:
+            assert result.name == kwargs['series_kwargs']['name']
+        if 'id' in kwargs:
+            assert result.id == kwargs['id']
+    else:
+        with pytest.raises(error):
+            result = cls.from_stats(**kwargs)
+
+
+@pytest.mark.parametrize('values, kwargs, expected_mean, expected_std, error', [
+    ([1, 2, 3, 4], {}, 2.5, 1.2909944487358056, None),
+    ([1, 2, float('nan'), 3, 4], {}, 2.5, 1.2909944487358056, None),
+    ([[1, 2], [3, 4]], {}, 2.5, 1.2909944487358056, None),
+    ((x for x in [[1e9 + 1, 1e9 + 2], [1e9 + 3, 1e9 + 4]]), {}, 1e9 + 2.5, 1.2909944487358056, None),
+    ([1, 2, 3, 4], {'scale_to_count': True, 'n_points': 3}, 2.5, 1.2909944487358056, None),
+
+    ([1], {}, None, None, errors.HighchartsValueError),
+    ([1, 1, 1], {}, None, None, errors.HighchartsValueError),
+])
+def test_BellCurveSeries_from_samples(values, kwargs, expected_mean, expected_std, error):
+    np = pytest.importorskip('numpy')
+
+    if not error:
+        result = cls.from_samples(values, **kwargs)
+        as_array = np.asarray(result.data.to_array())
+        x = as_array[:, 0]
+        assert x[0] == pytest.approx(expected_mean - 3 * expected_std)
+        assert x[-1] == pytest.approx(expected_mean + 3 * expected_std)
+        if kwargs.get('scale_to_count'):
+            peak = 4 / (expected_std * np.sqrt(2 * np.pi))
+            assert as_array[1, 1] == pytest.approx(peak)
+    else:
+        with pytest.raises(error):
+            result = cls.from_samples(values, **kwargs)
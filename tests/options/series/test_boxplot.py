@@ -1354,3 +1354,81 @@ def test_ErrorBarSeries_to_dict(kwargs, error):
 ])
 def test_ErrorBarSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls2, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('values, kwargs, expected, expected_outliers, error', [
+    ([1, 2, 3, 4, 5], {}, [[1.0, 2.0, 3.0, 4.0, 5.0]], None, None),
+    ([1, 2, 3, 4, 100, float('nan')],
+     {'outliers': True},
+     [[1.0, 2.0, 3.0, 4.0, 4.0]],
+     [[0, 100.0]],
+     None),
+    ([1, 2, 3, 4, 100], {'whiskers': None, 'outliers': True}, [[1.0, 2.0, 3.0, 4.0, 100.0]], None, None),
+    (list(range(101)), {'whiskers': (5, 95)}, [[5.0, 25.0, 50.0, 75.0, 95.0]], None, None),
+    ([1, 2, 3, 4, 100, 5, 6, 7, 8],
+     {'groups': ['b', 'b', 'b', 'b', 'b', 'a', 'a', 'a', 'a'], 'outliers': True},
+     [['b', 1.0, 2.0, 3.0, 4.0, 4.0], ['a', 5.0, 5.75, 6.5, 7.25, 8.0]],
+     [[0, 100.0]],
+     None),
+    ([5, 6, 7, 1, 2, 3],
+     {'groups': [20, 20, 20, 10, 10, 10]},
+     [[20, 5.0, 5.5, 6.0, 6.5, 7.0], [10, 1.0, 1.5, 2.0, 2.5, 3.0]],
+     None,
+     None),
+    ([1, 2, 3], {'series_kwargs': {'name': 'Latency'}, 'id': 'latency'}, [[1.0, 1.5, 2.0, 2.5, 3.0]], None, None),
+
+    ([1, 2, 3], {'groups': ['a', 'b']}, None, None, errors.HighchartsValueError),
+    ([1, 2, 3], {'whiskers': (95, 5)}, None, None, errors.HighchartsValueError),
+    ([1, 2, 3], {'whiskers': -1}, None, None, ValueError),
+])
+def test_BoxPlotSeries_from_samples(values, kwargs, expected, expected_outliers, error):
+    pytest.importorskip('numpy')
+    from highcharts_core.options.series.scatter import ScatterSeries
+
+    if not error:
+        result = cls.from_samples(values, **kwargs)
+        if kwargs.get('outliers'):
+            assert isinstance(result, list) is True
+            result, outlier_series = result
+            assert isinstance(outlier_series, ScatterSeries) is True
+            assert outlier_series.linked_to == ':previous'
+            if expected_outliers is None:
+                assert outlier_series.data is None
+            else:
+                assert outlier_series.data.to_array() == expected_outliers
+        assert isinstance(result, cls) is True
+        assert [x if isinstance(x, list) else x.to_array()
+                for x in result.data.to_array()] == expected
+        if 'series_kwargs' in kwargs:
+            assert result.name == kwargs['series_kwargs']['name']
+        if 'id' in kwargs:
+            assert result.id == kwargs['id']
+    else:
+        with pytest.raises(error):
+            result = cls.from_samples(values, **kwargs)
+
+
+def test_BoxPlotSeries_from_samples_datetime_groups():
+    np = pytest.importorskip('numpy')
+
+    groups = np.asarray(['2024-01-02', '2024-01-02', '2024-01-02', '2024-01-02',
+                         '2024-01-02', '2024-01-01', '2024-01-01'],
+                        dtype = 'datetime64[ns]')
+    result, outlier_series = cls.from_samples([1, 2, 3, 4, 100, 5, 6],
+                                              groups = groups,
+                                              outliers = True)
+    assert result.data.to_array() == [
+        [1704153600000, 1.0, 2.0, 3.0, 4.0, 4.0],
+        [1704067200000, 5.0, 5.25, 5.5, 5.75, 6.0]
+    ]
+    assert outlier_series.data.to_array() == [[1704153600000, 100.0]]
+
+
+def test_ErrorBarSeries_from_samples():
+    pytest.importorskip('numpy')
+
+    result = cls2.from_samples([1, 2, 3, 4, 5, 6],
+                               groups = [1, 1, 1, 2, 2, 2],
+                               whiskers = None)
+    assert isinstance(result, cls2) is True
+    assert result.data.to_array() == [[1, 1.0, 3.0], [2, 4.0, 6.0]]
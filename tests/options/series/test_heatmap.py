@@ -1698,3 +1698,73 @@ def test_TilemapSeries_to_dict(kwargs, error):
 ])
 def test_TilemapSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls2, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('matrix, kwargs, expected, error', [
+    ([[1, 2], [3, 4]], {}, [[0, 0, 1], [1, 0, 2], [0, 1, 3], [1, 1, 4]], None),
+    ([[1, None], [3, 4]], {}, [[0, 0, 1.0], [0, 1, 3.0], [1, 1, 4.0]], None),
+    ([[1.0, float('nan')], [3.0, 4.0]],
+     {'skip_nan': False},
+     [[0, 0, 1.0], [1, 0, None], [0, 1, 3.0], [1, 1, 4.0]],
+     None),
+    ([[1, 2], [3, 4]],
+     {'x_categories': ['a', 'b'], 'y_categories': [10, 20]},
+     [[0, 10, 1], [1, 10, 2], [0, 20, 3], [1, 20, 4]],
+     None),
+    ([[1, 2, 3]], {'series_kwargs': {'name': 'Grid'}, 'id': 'grid'}, [[0, 0, 1], [1, 0, 2], [2, 0, 3]], None),
+
+    ([1, 2, 3], {}, None, errors.HighchartsValueError),
+    ([[1, 2], [3, 4]], {'x_categories': ['a']}, None, errors.HighchartsValueError),
+    ([[1, 2], [3, 4]], {'y_categories': ['a', 'b', 'c']}, None, errors.HighchartsValueError),
+])
+def test_HeatmapSeries_from_matrix(matrix, kwargs, expected, error):
+    pytest.importorskip('numpy')
+
+    if not error:
+        result = cls.from_matrix(matrix, **kwargs)
+        assert isinstance(result, cls) is True
+        assert result.data.data_points is None
+        as_array = [[None if x != x else x for x in point]
+                    for point in result.data.to_array()]
+        assert as_array == expected
+        if 'series_kwargs' in kwargs:
+            assert result.name == kwargs['series_kwargs']['name']
+        if 'id' in kwargs:
+            assert result.id == kwargs['id']
+    else:
+        with pytest.raises(error):
+            result = cls.from_matrix(matrix, **kwargs)
+
+
+@pytest.mark.parametrize('kwargs, expected, expected_colsize, expected_rowsize, error', [
+    ({'x': [0, 1, 2, 3], 'y': [0, 0, 1, 1], 'value': [1, 2, 3, 4], 'x_bins': 2, 'y_bins': 2},
+     [[0.75, 0.25, 3.0], [2.25, 0.75, 7.0]],
+     1.5,
+     0.5,
+     None),
+    ({'x': [0, 1, 2, 3], 'y': [0, 0, 1, 1], 'x_bins': [0, 2, 4], 'y_bins': 1},
+     [[1.0, 0.5, 2.0], [3.0, 0.5, 2.0]],
+     2,
+     1,
+     None),
+    ({'x': [0, 1, 2, 3], 'y': [0, 0, 1, 1], 'value': [1, 2, 3, 4], 'x_bins': 2, 'y_bins': 2, 'agg': 'mean'},
+     [[0.75, 0.25, 1.5], [2.25, 0.75, 3.5]],
+     1.5,
+     0.5,
+     None),
+
+    ({'x': [0, 1], 'y': [0]}, None, None, None, errors.HighchartsValueError),
+    ({'x': [0, 1], 'y': [0, 1], 'value': [1, 2], 'agg': 'median'}, None, None, None, errors.HighchartsValueError),
+])
+def test_HeatmapSeries_from_long_form(kwargs, expected, expected_colsize, expected_rowsize, error):
+    pytest.importorskip('numpy')
+
+    if not error:
+        result = cls.from_long_form(**kwargs)
+        assert isinstance(result, cls) is True
+        assert result.data.to_array() == expected
+        assert result.colsize == expected_colsize
+        assert result.rowsize == expected_rowsize
+    else:
+        with pytest.raises(error):
+            result = cls.from_long_form(**kwargs)
@@ -496,3 +496,56 @@ def test_HistogramSeries_to_dict(kwargs, error):
 ])
 def test_HistogramSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('values, kwargs, expected_counts, expected_point_range, error', [
+    (list(range(10)), {'bins': 5}, [2, 2, 2, 2, 2], 1.8, None),
+    (list(range(10)), {'bins': [0, 2, 8, 9]}, [2, 6, 2], None, None),
+    ([0.0, 1.0, float('nan'), 2.0], {'bins': 2}, [1, 2], 1, None),
+    (list(range(4)), {'bins': 2, 'weights': [1, 1, 0.5, 0.5]}, [2.0, 1.0], 1.5, None),
+    ([list(range(5)), list(range(5, 10))], {'bins': 5}, [2, 2, 2, 2, 2], 1.8, None),
+    ((x for x in [list(range(5)), list(range(5, 10))]),
+     {'bins': 2, 'bin_range': (0, 10)},
+     [5, 5],
+     5,
+     None),
+    ((x for x in [list(range(5)), list(range(5, 10))]),
+     {'bin_range': (0, 10)},
+     [1] * 10,
+     1,
+     None),
+    ((x for x in [list(range(5)), list(range(5, 10))]),
+     {'bins': 'fd', 'bin_range': (0, 10)},
+     [1] * 10,
+     1,
+     None),
+    ((x for x in [list(range(5)), list(range(5, 10))]),
+     {'bins': [0, 5, 10]},
+     [5, 5],
+     5,
+     None),
+    ([1, 2, 3], {'bins': 2, 'series_kwargs': {'name': 'Latency'}, 'id': 'latency'}, [1, 2], 1, None),
+
+    ((x for x in [list(range(5)), list(range(5, 10))]), {'bins': 2}, None, None, errors.HighchartsValueError),
+    (list(range(10)), {'bins': [2, 1]}, None, None, errors.HighchartsValueError),
+    (list(range(10)), {'bins': 2, 'bin_range': (5, 1)}, None, None, errors.HighchartsValueError),
+    (list(range(4)), {'bins': 2, 'weights': [1, 1]}, None, None, errors.HighchartsValueError),
+])
+def test_HistogramSeries_from_samples(values, kwargs, expected_counts, expected_point_range, error):
+    pytest.importorskip('numpy')
+    from highcharts_core.options.series.bar import ColumnSeries
+
+    if not error:
+        result = cls.from_samples(values, **kwargs)
+        assert isinstance(result, ColumnSeries) is True
+        assert result.data.data_points is None
+        assert [x[1] for x in result.data.to_array()] == expected_counts
+        assert result.point_range == expected_point_range
+        assert result.point_padding == 0
+        if 'series_kwargs' in kwargs:
+            assert result.name == kwargs['series_kwargs']['name']
+        if 'id' in kwargs:
+            assert result.id == kwargs['id']
+    else:
+        with pytest.raises(error):
+            result = cls.from_samples(values, **kwargs)
@@ -1018,3 +1018,31 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('x, y, u, v, kwargs, expected, error', [
+    ([0, 1], [5, 6], [[1, 0], [0, -1]], [[0, 1], [0, 0]], {},
+     [(0, 5, 1.0, 270.0), (1, 5, 1.0, 180.0), (0, 6, 0.0, 0.0), (1, 6, 1.0, 90.0)],
+     None),
+    ([0, 1, 2], [5, 6], [[1, 1, 1], [2, 2, 2]], [[0, 0, 0], [0, 0, 0]], {'stride': (1, 2)},
+     [(0, 5, 1.0, 270.0), (2, 5, 1.0, 270.0), (0, 6, 2.0, 270.0), (2, 6, 2.0, 270.0)],
+     None),
+    ([0, 1, 2, 3], [0, 0, 0, 0], [0, 3, 0, float('nan')], [-1, 4, 2, 1], {'stride': 1},
+     [(0, 0, 1.0, 0.0), (1, 0, 5.0, 216.86989764584402), (2, 0, 2.0, 180.0)],
+     None),
+
+    ([0, 1], None, [1, 2], [1, 2], {}, None, errors.HighchartsValueError),
+    ([0, 1], [0, 1], [1, 2], [1], {}, None, errors.HighchartsValueError),
+    ([0, 1], [0, 1, 2], [[1, 2], [3, 4]], [[1, 2], [3, 4]], {}, None, errors.HighchartsValueError),
+    ([0, 1], [0, 1], [1, 2], [1, 2], {'stride': (1, 2)}, None, errors.HighchartsValueError),
+])
+def test_from_components(x, y, u, v, kwargs, expected, error):
+    pytest.importorskip('numpy')
+
+    if not error:
+        result = cls.from_components(x, y, u, v, **kwargs)
+        assert isinstance(result, cls) is True
+        assert [(x.x, x.y, x.length, x.direction) for x in result.data] == expected
+    else:
+        with pytest.raises(error):
+            result = cls.from_components(x, y, u, v, **kwargs)
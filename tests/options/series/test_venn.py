@@ -942,3 +942,30 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('sets, kwargs, expected, error', [
+    ({'A': {1, 2, 3, 4}, 'B': [3, 4, 5, 5], 'C': range(4, 10)},
+     {},
+     [(['A'], 4), (['B'], 3), (['C'], 6),
+      (['A', 'B'], 2), (['A', 'C'], 1), (['B', 'C'], 2),
+      (['A', 'B', 'C'], 1)],
+     None),
+    ({'A': ['x', 'y'], 'B': ['z'], 'C': ['y', 'z']},
+     {'skip_empty': True},
+     [(['A'], 2), (['B'], 1), (['C'], 2), (['A', 'C'], 1), (['B', 'C'], 1)],
+     None),
+
+    ({}, {}, None, errors.HighchartsValueError),
+    ({str(x): [x] for x in range(21)}, {}, None, errors.HighchartsValueError),
+])
+def test_from_sets(sets, kwargs, expected, error):
+    pytest.importorskip('numpy')
+
+    if not error:
+        result = cls.from_sets(sets, **kwargs)
+        assert isinstance(result, cls) is True
+        assert [(x.sets, x.value) for x in result.data] == expected
+    else:
+        with pytest.raises(error):
+            result = cls.from_sets(sets, **kwargs)
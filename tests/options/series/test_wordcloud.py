@@ -630,3 +630,36 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('documents, kwargs, expected, error', [
+    (['The cat sat on the mat.', 'The CAT sat; 42 cats!', None],
+     {'top_k': 2},
+     [('cat', 2), ('sat', 2)],
+     None),
+    (iter(['a b a', 'b a c']),
+     {'stopwords': []},
+     [('a', 3), ('b', 2), ('c', 1)],
+     None),
+    ('Alpha BETA alpha',
+     {'lowercase': False, 'stopwords': ['beta']},
+     [('Alpha', 1), ('BETA', 1), ('alpha', 1)],
+     None),
+    (['x-1 x-2 x-1'],
+     {'tokenizer': str.split},
+     [('x-1', 2), ('x-2', 1)],
+     None),
+
+    (['a'], {'tokenizer': 'not callable'}, None, errors.HighchartsValueError),
+    (['a'], {'top_k': 10, 'capacity': 5}, None, errors.HighchartsValueError),
+])
+def test_from_text(documents, kwargs, expected, error):
+    pytest.importorskip('numpy')
+
+    if not error:
+        result = cls.from_text(documents, **kwargs)
+        assert isinstance(result, cls) is True
+        assert [(x.name, x.weight) for x in result.data] == expected
+    else:
+        with pytest.raises(error):
+            result = cls.from_text(documents, **kwargs)
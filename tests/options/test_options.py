@@ -120,4 +120,50 @@ def test__str__(kwargs, error):
         assert 'series = ' not in result
     else:
         with pytest.raises(error):
-            result = str(obj)
\ No newline at end of file
+            result = str(obj)
+
+@pytest.mark.parametrize('original, updated, as_json, expected, error', [
+    ({'title': {'text': 'A'}},
+     {'title': {'text': 'A'}},
+     False,
+     {},
+     None),
+    ({'title': {'text': 'A', 'align': 'left'}},
+     {'title': {'text': 'B', 'align': 'left'}},
+     True,
+     {'title': {'text': 'B'}},
+     None),
+    ({'title': {'text': 'A', 'align': 'left'}},
+     {'title': {'text': 'A'}},
+     True,
+     {'title': {'align': None}},
+     None),
+    ({'series': [{'type': 'line', 'id': 'a', 'name': 'A'},
+                 {'type': 'line', 'id': 'b', 'name': 'B'}]},
+     {'series': [{'type': 'line', 'id': 'a', 'name': 'A'},
+                 {'type': 'line', 'id': 'b', 'name': 'Updated'}]},
+     True,
+     {'series': [{'id': 'a'}, {'id': 'b', 'name': 'Updated'}]},
+     None),
+    ({'series': [{'type': 'line', 'id': 'a', 'name': 'A'}]},
+     {'series': [{'type': 'line', 'id': 'a', 'name': 'A'},
+                 {'type': 'bar', 'id': 'b', 'name': 'B'}]},
+     True,
+     {'series': [{'id': 'a'}, {'id': 'b', 'name': 'B', 'type': 'bar'}]},
+     None),
+
+    ({'title': {'text': 'A'}},
+     'not a valid value',
+     False,
+     None,
+     (ValueError, TypeError)),
+])
+def test_diff(original, updated, as_json, expected, error):
+    instance = cls.from_dict(original)
+    if not error:
+        other = cls.from_dict(updated)
+        result = instance.diff(other, as_json = as_json)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = instance.diff(updated)
@@ -630,6 +630,31 @@ def test_from_csv_in_rows(input_files, filename, expected_series, expected_data_
      57,
      None),
     
+    # SCENARIO 1c: Has Property Map, Read in Chunks
+    ('test-data-files/nst-est2019-01.csv',
+     {
+         'x': ['Geographic Area', '2010']
+     },
+     {
+         'wrapper_character': '"',
+         'chunksize': 10
+     },
+     2,
+     57,
+     None),
+    ('test-data-files/nst-est2019-01.csv',
+     {
+         'y': ['2010', '2011']
+     },
+     {
+         'wrapper_character': '"',
+         'chunksize': 20,
+         'chunk_downsample': 5
+     },
+     2,
+     15,
+     None),
+
     # SCENARIO 2a: Single Property in KWARGS
     ('test-data-files/nst-est2019-01.csv',
      {},
@@ -641,6 +666,17 @@ def test_from_csv_in_rows(input_files, filename, expected_series, expected_data_
      1,
      57,
      None),
+
+    # SCENARIO 3: Chunks Require a Property Map
+    ('test-data-files/nst-est2019-01.csv',
+     {},
+     {
+         'wrapper_character': '"',
+         'chunksize': 10
+     },
+     None,
+     None,
+     errors.HighchartsCSVDeserializationError),
     
     # SCENARIO 3a: Exact Match on Column Count
     ('test-data-files/nst-est2019-01-reduced-to-two.csv',
@@ -698,6 +734,125 @@ def test_from_csv(input_files, filename, property_map, kwargs, expected_series,
                                   **kwargs)
 
 
+@pytest.mark.parametrize('kwargs, expected_series, error', [
+    ({}, 3, None),
+    ({'executor': 'process', 'max_workers': 2}, 3, None),
+    ({'property_column_map': {'y': ['b', 'c']}}, 6, None),
+    ({'property_column_map': {'y': ['b', 'c']}, 'series_index': 1}, 3, None),
+
+    ({'executor': 'fiber'}, None, errors.HighchartsValueError),
+])
+def test_from_csv_multiple(kwargs, expected_series, error):
+    sources = [f'a,b,c\r\n1,{x},{x * 2}\r\n2,{x + 1},{x * 3}' for x in range(3)]
+    kwargs['property_column_map'] = kwargs.get('property_column_map',
+                                               {'x': 'a', 'y': 'b'})
+    if not error:
+        result = cls.from_csv(sources, **kwargs)
+        assert isinstance(result, cls)
+        assert len(result.options.series) == expected_series
+        for series in result.options.series:
+            assert len(series.data) == 2
+    else:
+        with pytest.raises(error):
+            result = cls.from_csv(sources, **kwargs)
+
+
+@pytest.mark.parametrize('property_map, kwargs, expected_series, error', [
+    ({'x': 'a', 'y': 'b'}, {}, 1, None),
+    ({'x': 'a', 'y': ['b', 'c']}, {}, 2, None),
+    ({'x': 'a', 'y': ['b', 'c']}, {'series_index': 1}, 1, None),
+    ({'x': 'a', 'y': 'b'}, {'series_type': 'column'}, 1, None),
+
+    ({'x': 'a', 'y': 'd'}, {}, None, errors.HighchartsArrowDeserializationError),
+    ({'x': 'a', 'y': 'b'}, {'series_type': 'not-a-series'}, None, errors.HighchartsValueError),
+])
+def test_from_arrow(property_map, kwargs, expected_series, error):
+    pa = pytest.importorskip('pyarrow')
+
+    table = pa.table({'a': [1, 2, 3], 'b': [1.0, 2.0, None], 'c': [4, 5, 6]})
+    if not error:
+        result = cls.from_arrow(table, property_map, **kwargs)
+        assert isinstance(result, cls)
+        assert len(result.options.series) == expected_series
+        for series in result.options.series:
+            assert len(series.data) == 3
+    else:
+        with pytest.raises(error):
+            result = cls.from_arrow(table, property_map, **kwargs)
+
+
+@pytest.mark.parametrize('property_map, kwargs, expected_series, error', [
+    ({'x': 'a', 'y': 'b'}, {}, 1, None),
+    ({'x': 'a', 'y': ['b', 'c']}, {}, 2, None),
+    ({'x': 'a', 'y': ['b', 'c']}, {'series_index': 1}, 1, None),
+    (None, {}, 2, None),
+    (None, {'series_in_rows': True}, 3, None),
+
+    ({'x': 'a', 'y': 'd'}, {}, None, errors.HighchartsPolarsDeserializationError),
+])
+def test_from_polars(property_map, kwargs, expected_series, error):
+    pl = pytest.importorskip('polars')
+
+    df = pl.DataFrame({'a': [1, 2, 3], 'b': [1.0, 2.0, None], 'c': [4, 5, 6]})
+    if not error:
+        result = cls.from_polars(df, property_map, **kwargs)
+        assert isinstance(result, cls)
+        assert len(result.options.series) == expected_series
+    else:
+        with pytest.raises(error):
+            result = cls.from_polars(df, property_map, **kwargs)
+
+
+@pytest.mark.parametrize('property_map, kwargs, expected_series, error', [
+    ({'x': 'a', 'y': 'b'}, {'group_by': 'key'}, 2, None),
+    ({'x': 'a', 'y': 'b'}, {'group_by': 'key', 'series_type': 'column'}, 2, None),
+    ({'x': 'a', 'y': 'b'}, {'group_by': 'key', 'series_in_rows': True}, None, errors.HighchartsPandasDeserializationError),
+])
+def test_from_pandas_group_by(property_map, kwargs, expected_series, error):
+    pd = pytest.importorskip('pandas')
+
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': [1.0, 2.0, 3.0], 'key': ['x', 'y', 'x']})
+    if not error:
+        result = cls.from_pandas(df, property_map, **kwargs)
+        assert isinstance(result, cls)
+        assert len(result.options.series) == expected_series
+        assert [x.name for x in result.options.series] == ['x', 'y']
+    else:
+        with pytest.raises(error):
+            result = cls.from_pandas(df, property_map, **kwargs)
+
+
+@pytest.mark.parametrize('kwargs, expected_x_categories, expected_y_categories, error', [
+    ({}, None, None, None),
+    ({'x_categories': ['a', 'b'], 'y_categories': [10, 20]}, ['a', 'b'], None, None),
+    ({'x_categories': ['a', 'b'], 'y_categories': ['c', 'd'], 'series_type': 'tilemap'}, ['a', 'b'], ['c', 'd'], None),
+    ({'x_categories': ['a', 'b'], 'options_kwargs': {'x_axis': {'title': {'text': 'X'}}}}, None, None, None),
+
+    ({'series_type': 'line'}, None, None, errors.HighchartsValueError),
+    ({'x_categories': ['a']}, None, None, errors.HighchartsValueError),
+])
+def test_from_matrix(kwargs, expected_x_categories, expected_y_categories, error):
+    pytest.importorskip('numpy')
+
+    matrix = [[1, 2], [3, 4]]
+    if not error:
+        result = cls.from_matrix(matrix, **kwargs)
+        assert isinstance(result, cls)
+        assert len(result.options.series) == 1
+        assert result.options.series[0].type == kwargs.get('series_type', 'heatmap')
+        for axis, expected in [('x_axis', expected_x_categories), ('y_axis', expected_y_categories)]:
+            value = getattr(result.options, axis)
+            if isinstance(value, list):
+                value = value[0]
+            if expected is None:
+                assert value is None or value.categories is None
+            else:
+                assert value.categories == expected
+    else:
+        with pytest.raises(error):
+            result = cls.from_matrix(matrix, **kwargs)
+
+
 @pytest.mark.parametrize('value, expected_shape, has_ndarray, has_data_points, error', [
     (np.asarray([
         [0.0, 15.0], 
@@ -762,3 +917,121 @@ def test_from_array(value, expected_shape, has_ndarray, has_data_points, error):
     else:
         with pytest.raises(error):
             result = cls.from_array(value)
+
+
+@pytest.mark.parametrize('initial_series, updated_series, expected_methods, error', [
+    ([{'type': 'line', 'id': 'a', 'data': [[1, 2], [2, 3], [3, 4]]}],
+     [{'type': 'line', 'id': 'a', 'data': [[1, 2], [2, 3], [3, 4], [4, 5]]}],
+     [('a', 'addPoint', False)],
+     None),
+    ([{'type': 'line', 'id': 'a', 'data': [[1, 2], [2, 3], [3, 4]]}],
+     [{'type': 'line', 'id': 'a', 'data': [[2, 3], [3, 4], [4, 5]]}],
+     [('a', 'addPoint', True)],
+     None),
+    ([{'type': 'line', 'id': 'a', 'data': [[1, 2], [2, 3], [3, 4]]}],
+     [{'type': 'line', 'id': 'a', 'data': [[3, 4], [4, 5]]}],
+     [('a', 'removePoint', None), ('a', 'addPoint', True)],
+     None),
+    ([{'type': 'line', 'id': 'a', 'data': [[1, 2], [2, 3], [3, 4]]}],
+     [{'type': 'line', 'id': 'a', 'data': [[5, 6], [6, 7]]}],
+     [('a', 'setData', None)],
+     None),
+    ([{'type': 'line', 'id': 'a', 'data': [[1, 2], [2, 3], [3, 4]]}],
+     [{'type': 'line', 'id': 'a', 'data': [[1, 2], [2, 3], [3, 4]]}],
+     [],
+     None),
+    ([{'type': 'line', 'data': [[1, 2], [2, 3]]},
+      {'type': 'line', 'id': 'b', 'data': [[1, 2], [2, 3]]}],
+     [{'type': 'line', 'data': [[1, 2], [2, 3], [3, 4]]},
+      {'type': 'line', 'id': 'c', 'data': [[1, 2]]}],
+     [(0, 'addPoint', False), ('b', 'remove', None), ('c', 'addSeries', None)],
+     None),
+])
+def test_get_data_delta(initial_series, updated_series, expected_methods, error):
+    instance = cls(options = {'series': initial_series})
+    instance.snapshot_data()
+    instance.options.series = updated_series
+
+    if not error:
+        result = instance.get_data_delta(commit = False)
+        assert [(x['series'], x['method'], x.get('shift', None))
+                for x in result] == expected_methods
+
+        js_literal = instance.to_delta_js_literal(variable_name = 'myChart')
+        if expected_methods:
+            assert js_literal is not None
+            assert 'myChart.redraw();' in js_literal
+            for series_key, method, shift in expected_methods:
+                assert f'.{method}(' in js_literal
+        else:
+            assert js_literal is None
+
+        assert instance.get_data_delta() == []
+    else:
+        with pytest.raises(error):
+            result = instance.get_data_delta()
+
+
+@pytest.mark.parametrize('initial_data, updated_data, expected_points, error', [
+    (np.asarray([[1, 2], [2, 3], [3, 4]]) if HAS_NUMPY else [[1, 2], [2, 3], [3, 4]],
+     np.asarray([[2, 3], [3, 4], [4, 5]]) if HAS_NUMPY else [[2, 3], [3, 4], [4, 5]],
+     [[4, 5]],
+     None),
+])
+def test_to_delta_json(initial_data, updated_data, expected_points, error):
+    import json
+
+    instance = cls(options = {'series': [{'type': 'line', 'id': 'a'}]})
+    instance.options.series[0].data = initial_data
+    instance.snapshot_data()
+    instance.options.series[0].data = updated_data
+
+    if not error:
+        result = instance.to_delta_json()
+        assert result is not None
+        as_list = json.loads(result)
+        assert len(as_list) == 1
+        assert as_list[0]['series'] == 'a'
+        assert as_list[0]['method'] == 'addPoint'
+        assert as_list[0]['shift'] is True
+        assert as_list[0]['points'] == expected_points
+    else:
+        with pytest.raises(error):
+            result = instance.to_delta_json()
+
+
+@pytest.mark.parametrize('original, updated, as_json, expected, error', [
+    ({'title': {'text': 'A'}},
+     {'title': {'text': 'A'}},
+     False,
+     None,
+     None),
+    ({'title': {'text': 'A'}},
+     {'title': {'text': 'B'}},
+     False,
+     "myChart.update({\n  title: {\n  text: 'B'\n}\n}, true, false);",
+     None),
+    ({'series': [{'type': 'line', 'id': 'a'}, {'type': 'line', 'id': 'b'}]},
+     {'series': [{'type': 'line', 'id': 'a'}]},
+     False,
+     "myChart.update({\n  series: [{\n  id: 'a'\n}]\n}, true, true);",
+     None),
+    ({'series': [{'type': 'line', 'id': 'a'}, {'type': 'line', 'id': 'b'}]},
+     {'series': [{'type': 'line', 'id': 'a'}]},
+     True,
+     {'options': {'series': [{'id': 'a'}]}, 'oneToOne': True},
+     None),
+])
+def test_diff(original, updated, as_json, expected, error):
+    import json
+
+    instance = cls(options = original, variable_name = 'myChart')
+    other = cls(options = updated)
+    if not error:
+        result = instance.diff(other, as_json = as_json)
+        if as_json:
+            result = json.loads(result)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = instance.diff(other, as_json = as_json)
@@ -1,5 +1,8 @@
 """Unit tests for ``highcharts/utility_functions``"""
 
+import datetime
+from decimal import Decimal
+
 import pytest
 from abc import ABC, abstractmethod
 
@@ -11,7 +14,18 @@ except ImportError:
 
 from validator_collection import checkers
 
-from highcharts_core import utility_functions, constants
+from highcharts_core import utility_functions, constants, errors
+
+
+def test_module_compiles_without_warnings():
+    import warnings
+
+    with open(utility_functions.__file__, 'r', encoding = 'utf-8') as file_:
+        source = file_.read()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        compile(source, utility_functions.__file__, 'exec')
 
 
 @pytest.mark.parametrize('kwargs, expected_column_names, expected_records, error', [
@@ -32,6 +46,25 @@ def test_parse_csv(kwargs, expected_column_names, expected_records, error):
             result = utility_functions.parse_csv(**kwargs)
             
 
+def test_parse_csv_is_reentrant():
+    import csv
+    from concurrent.futures import ThreadPoolExecutor
+
+    def parse(delimiter):
+        csv_data = delimiter.join(['a', 'b']) + '\r\n' + delimiter.join(['1', '2'])
+        return utility_functions.parse_csv(csv_data, delimiter = delimiter)
+
+    delimiters = [',', ';', '|', '\t'] * 25
+    with ThreadPoolExecutor(max_workers = 4) as pool:
+        results = [x for x in pool.map(parse, delimiters)]
+
+    for columns, records in results:
+        assert columns == ['a', 'b']
+        assert records == [{'a': '1', 'b': '2'}]
+
+    assert 'highcharts' not in csv.list_dialects()
+
+
 @pytest.mark.parametrize('camelCase, expected, error', [
     ('camelCase', 'camel_case', None),
     ('camelCaseURL', 'camel_case_url', None),
@@ -46,6 +79,28 @@ def test_to_snake_case(camelCase, expected, error):
             result = utility_functions.to_snake_case(camelCase)
 
 
+@pytest.mark.parametrize('value, expected, error', [
+    ('1h', 60 * 60 * 1000, None),
+    ('15min', 15 * 60 * 1000, None),
+    ('30 seconds', 30 * 1000, None),
+    ('day', 24 * 60 * 60 * 1000, None),
+    ('1.5s', 1500, None),
+    (250, 250, None),
+    (datetime.timedelta(minutes = 2), 2 * 60 * 1000, None),
+
+    ('1 fortnight', None, errors.HighchartsValueError),
+    ('0h', None, errors.HighchartsValueError),
+    ('', None, errors.HighchartsValueError),
+])
+def test_parse_time_interval(value, expected, error):
+    if not error:
+        result = utility_functions.parse_time_interval(value)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = utility_functions.parse_time_interval(value)
+
+
 if HAS_NUMPY:
     @pytest.mark.parametrize('value, expected_dtype, error', [
         ([1, 2, 3], [np.int32, np.int64], None),
@@ -160,4 +215,683 @@ if HAS_NUMPY:
             assert result is expected
         else:
             with pytest.raises(error):
-                result = utility_functions.is_ndarray(value)
\ No newline at end of file
+                result = utility_functions.is_ndarray(value)
+
+    @pytest.mark.parametrize('value, expected, error', [
+        ([1, 2, None], [1.0, 2.0, np.nan], None),
+        (np.asarray(['2023-01-01', 'NaT'], dtype = 'datetime64[ms]'),
+         [1672531200000.0, np.nan],
+         None),
+        (['not a number'], None, ValueError),
+    ])
+    def test_to_float_ndarray(value, expected, error):
+        if not error:
+            result = utility_functions.to_float_ndarray(value)
+            assert result.dtype == np.float64
+            assert np.array_equal(result, np.asarray(expected), equal_nan = True)
+        else:
+            with pytest.raises(error):
+                result = utility_functions.to_float_ndarray(value)
+
+
+    @pytest.mark.parametrize('y, n_points, method, has_gap, error', [
+        (np.sin(np.linspace(0, 20, 1000)), 100, 'lttb', False, None),
+        (np.sin(np.linspace(0, 20, 1000)), 100, 'minmax', False, None),
+        (np.sin(np.linspace(0, 20, 1000)), 100, 'm4', False, None),
+        (np.where(np.arange(1000) % 300 == 150, np.nan, np.sin(np.arange(1000))),
+         100,
+         'lttb',
+         True,
+         None),
+        (np.sin(np.linspace(0, 20, 1000)), 5000, 'lttb', False, None),
+
+        (np.sin(np.linspace(0, 20, 1000)), 100, 'unsupported', False, ValueError),
+    ])
+    def test_downsample_indices(y, n_points, method, has_gap, error):
+        if not error:
+            result = utility_functions.downsample_indices(y, n_points, method = method)
+            assert result[0] == 0
+            assert result[-1] == len(y) - 1
+            assert np.all(np.diff(result) > 0)
+            assert len(result) <= max(n_points + 3, n_points)
+            if n_points >= len(y):
+                assert len(result) == len(y)
+            if has_gap:
+                assert np.isnan(y[result]).sum() == np.isnan(y).sum()
+        else:
+            with pytest.raises(error):
+                result = utility_functions.downsample_indices(y,
+                                                              n_points,
+                                                              method = method)
+
+
+    @pytest.mark.parametrize('x, y, kwargs, expected_starts, expected_columns, error', [
+        (np.arange('2024-01-01T00', '2024-01-03T00', dtype = 'datetime64[h]'),
+         np.arange(48, dtype = float),
+         {'unit': 'day'},
+         ['2024-01-01', '2024-01-02'],
+         {'y': [11.5, 35.5]},
+         None),
+        (np.arange('2024-01-01T00', '2024-01-03T00', dtype = 'datetime64[h]'),
+         np.arange(48, dtype = float),
+         {'unit': 'day', 'approximation': 'ohlc'},
+         ['2024-01-01', '2024-01-02'],
+         {'open': [0, 24], 'high': [23, 47], 'low': [0, 24], 'close': [23, 47]},
+         None),
+        (np.asarray(['2024-01-03', '2024-01-10', '2024-02-20'], dtype = 'datetime64[D]'),
+         [1, 2, 3],
+         {'unit': 'week', 'approximation': 'sum'},
+         ['2024-01-01', '2024-01-08', '2024-02-19'],
+         {'y': [1, 2, 3]},
+         None),
+        (np.asarray(['2024-01-03', '2024-01-10', '2024-04-20'], dtype = 'datetime64[D]'),
+         [1, None, 3],
+         {'unit': 'month', 'approximation': 'range', 'fill_gaps': True},
+         ['2024-01-01', '2024-02-01', '2024-03-01', '2024-04-01'],
+         {'low': [1, np.nan, np.nan, 3], 'high': [1, np.nan, np.nan, 3]},
+         None),
+        ([0, 5000, 25000],
+         [1, 2, 3],
+         {'unit': 'second', 'multiple': 10, 'approximation': 'high', 'fill_gaps': True},
+         [0, 10000, 20000],
+         {'y': [2, np.nan, 3]},
+         None),
+
+        ([0, 5000], [1, 2], {'unit': 'fortnight'}, None, None, ValueError),
+        ([0, 5000], [1, 2], {'unit': 'day', 'approximation': 'median'}, None, None,
+         ValueError),
+        ([0, 5000], [1, 2, 3], {'unit': 'day'}, None, None, ValueError),
+    ])
+    def test_group_by_time(x, y, kwargs, expected_starts, expected_columns, error):
+        if not error:
+            starts, columns = utility_functions.group_by_time(x, y, **kwargs)
+            if expected_starts and isinstance(expected_starts[0], str):
+                expected_starts = np.asarray(expected_starts, dtype = 'datetime64[ms]')
+                expected_starts = expected_starts.astype(np.int64)
+            assert np.array_equal(starts, np.asarray(expected_starts))
+            assert list(columns.keys()) == list(expected_columns.keys())
+            for key in expected_columns:
+                assert np.array_equal(columns[key],
+                                      np.asarray(expected_columns[key], dtype = float),
+                                      equal_nan = True)
+        else:
+            with pytest.raises(error):
+                result = utility_functions.group_by_time(x, y, **kwargs)
+
+    @pytest.mark.parametrize('unit, splits', [
+        ('hour', [1, 4]),
+        ('day', [2, 3, 5]),
+        ('week', []),
+    ])
+    def test_merge_time_summaries(unit, splits):
+        x = np.asarray(['2024-01-01T00:10', '2024-01-01T00:10', '2024-01-01T00:50',
+                        '2024-01-01T01:20', '2024-01-02T03:00', '2024-01-02T03:00'],
+                       dtype = 'datetime64[ms]')
+        y = [4.0, 1.0, np.nan, 3.0, 2.0, 6.0]
+        expected = utility_functions.summarize_by_time(x, y, unit)
+
+        bounds = [0] + splits + [len(x)]
+        summaries = [utility_functions.summarize_by_time(x[a:b], y[a:b], unit)
+                     for a, b in zip(bounds, bounds[1:])]
+        result = utility_functions.merge_time_summaries(summaries)
+
+        assert list(result.keys()) == list(expected.keys())
+        for key in expected:
+            assert result[key].tolist() == expected[key].tolist()
+
+
+    @pytest.mark.parametrize('value, kwargs, expected, error', [
+        ([0, 10, 20, 30], {}, 10, None),
+        (np.arange(0, 1, 0.1), {}, 0.1, None),
+        (np.arange('2024-01-01', '2024-01-05', dtype = 'datetime64[D]'), {}, 86400000,
+         None),
+        ([0, 10, 21], {}, None, None),
+        ([0, 10, 21], {'rtol': 0.1}, 10.5, None),
+        ([30, 20, 10], {}, None, None),
+        ([0, np.nan, 20], {}, None, None),
+        ([5], {}, None, None),
+
+        (['a', 'b'], {}, None, ValueError),
+    ])
+    def test_get_constant_interval(value, kwargs, expected, error):
+        if not error:
+            result = utility_functions.get_constant_interval(value, **kwargs)
+            if expected is None:
+                assert result is None
+            else:
+                assert result == pytest.approx(expected)
+        else:
+            with pytest.raises(error):
+                result = utility_functions.get_constant_interval(value, **kwargs)
+
+
+    @pytest.mark.parametrize('kwargs, expected_column_names, expected_dtypes, error', [
+        ({
+            'csv_data': "Date,Value,Label\r\n2023-01-01,2,a\r\n2023-01-02,None,b\r\n2023-01-03,'1,234.5',"
+         },
+         ['Date', 'Value', 'Label'],
+         {'Date': 'M', 'Value': 'f', 'Label': 'O'},
+         None),
+        ({
+            'csv_data': "Date,Value,Label\r\n2023-01-01,2,a\r\n2023-01-02,4,b",
+            'columns': ['Value']
+         },
+         ['Date', 'Value', 'Label'],
+         {'Value': 'i'},
+         None),
+        ({
+            'csv_data': "01/01/2023,2\r\n01/02/2023,4",
+            'has_header_row': False,
+            'columns': [1, 0]
+         },
+         [0, 1],
+         {1: 'i', 0: 'O'},
+         None),
+        ({'csv_data': ''}, [], {}, None),
+
+        ({
+            'csv_data': "Date,Value\r\n2023-01-01,2",
+            'columns': ['Missing']
+         },
+         None,
+         None,
+         errors.HighchartsCSVDeserializationError),
+    ])
+    def test_parse_csv_columns(kwargs, expected_column_names, expected_dtypes, error):
+        if not error:
+            column_names, columns = utility_functions.parse_csv_columns(**kwargs)
+            assert column_names == expected_column_names
+            assert list(columns.keys()) == list(expected_dtypes.keys())
+            for key in expected_dtypes:
+                assert columns[key].dtype.kind == expected_dtypes[key]
+            if 'Value' in columns and columns['Value'].dtype.kind == 'f':
+                assert np.isnan(columns['Value'][1])
+                assert columns['Value'][2] == 1234.5
+            if 'Label' in columns and len(columns['Label']) == 3:
+                assert columns['Label'][2] is None
+        else:
+            with pytest.raises(error):
+                result = utility_functions.parse_csv_columns(**kwargs)
+
+
+    @pytest.mark.parametrize('kwargs, expected_lengths, error', [
+        ({
+            'csv_data': "a,b\r\n1,2\r\n3,4\r\n5,6",
+            'chunksize': 2
+         },
+         [2, 1],
+         None),
+        ({
+            'csv_data': "a,b\r\n1,2\r\n3,4\r\n5,6",
+            'chunksize': 2,
+            'columns': ['b']
+         },
+         [2, 1],
+         None),
+        ({
+            'csv_data': "a,b\r\n1,2\r\n3,4\r\n5,6",
+         },
+         [3],
+         None),
+        ({'csv_data': "a,b"}, [0], None),
+        ({'csv_data': ""}, [], None),
+
+        ({
+            'csv_data': "a,b\r\n1,2",
+            'chunksize': 0
+         },
+         None,
+         ValueError),
+    ])
+    def test_iter_csv_columns(kwargs, expected_lengths, error):
+        if not error:
+            chunks = [x for x in utility_functions.iter_csv_columns(**kwargs)]
+            assert len(chunks) == len(expected_lengths)
+            for chunk, expected_length in zip(chunks, expected_lengths):
+                column_names, columns = chunk
+                assert column_names == ['a', 'b']
+                assert list(columns.keys()) == kwargs.get('columns', ['a', 'b'])
+                for key in columns:
+                    assert len(columns[key]) == expected_length
+        else:
+            with pytest.raises(error):
+                result = [x for x in utility_functions.iter_csv_columns(**kwargs)]
+
+
+    def test_iter_csv_columns_from_file(tmp_path):
+        filename = tmp_path / 'test.csv'
+        filename.write_text('a,b\n1,2\n3,4\n5,6\n')
+
+        chunks = [x for x in utility_functions.iter_csv_columns(str(filename),
+                                                               chunksize = 2)]
+        assert len(chunks) == 2
+        assert chunks[0][1]['b'].tolist() == [2, 4]
+        assert chunks[1][1]['b'].tolist() == [6]
+
+
+    @pytest.mark.parametrize('values, arrow_type, expected_dtype, expected, error', [
+        ([1, 2, 3], 'int64', 'int64', [1, 2, 3], None),
+        ([1, None, 3], 'int64', 'float64', [1.0, None, 3.0], None),
+        ([1.5, 2.5], 'float64', 'float64', [1.5, 2.5], None),
+        ([0, None], 'timestamp', 'datetime64[ms]', [0, None], None),
+        (['a', None], 'string', 'object', ['a', None], None),
+        ([True, False], 'bool_', 'object', [True, False], None),
+    ])
+    def test_arrow_to_ndarray(values, arrow_type, expected_dtype, expected, error):
+        import pyarrow as pa
+
+        if arrow_type == 'timestamp':
+            array = pa.array(values, type = pa.timestamp('us', tz = 'UTC'))
+        else:
+            array = pa.array(values, type = getattr(pa, arrow_type)())
+
+        if not error:
+            result = utility_functions.arrow_to_ndarray(array)
+            assert str(result.dtype) == expected_dtype
+            if expected_dtype in ['datetime64[ms]', 'float64']:
+                result = utility_functions.to_float_ndarray(result)
+                result = np.where(np.isnan(result), None, result)
+            assert result.tolist() == expected
+
+            chunked = utility_functions.arrow_to_ndarray(pa.chunked_array([array, array]))
+            assert len(chunked) == 2 * len(values)
+        else:
+            with pytest.raises(error):
+                result = utility_functions.arrow_to_ndarray(array)
+
+
+    @pytest.mark.parametrize('values, expected_dtype, error', [
+        ([1, 2, 3], 'int64', None),
+        ([1, None, 3], 'float64', None),
+        ([datetime.datetime(2024, 1, 1), None], 'datetime64[ms]', None),
+        ([datetime.date(2024, 1, 1), None], 'datetime64[ms]', None),
+        (['a', None], 'object', None),
+    ])
+    def test_polars_to_ndarray(values, expected_dtype, error):
+        pl = pytest.importorskip('polars')
+
+        series = pl.Series('values', values)
+        if not error:
+            result = utility_functions.polars_to_ndarray(series)
+            assert str(result.dtype) == expected_dtype
+            assert len(result) == len(values)
+        else:
+            with pytest.raises(error):
+                result = utility_functions.polars_to_ndarray(series)
+
+
+    @pytest.mark.parametrize('values, expected_dtype, expected, error', [
+        ([], 'float64', [], None),
+        ([1, 2, 3], 'int64', [1, 2, 3], None),
+        ([1, None, 3], 'float64', [1.0, None, 3.0], None),
+        ([1, 2.5, Decimal('3.5')], 'float64', [1.0, 2.5, 3.5], None),
+        ([None, None], 'float64', [None, None], None),
+        ([datetime.datetime(2024, 1, 1), None],
+         'datetime64[ms]',
+         [datetime.datetime(2024, 1, 1), None],
+         None),
+        ([datetime.datetime(2024, 1, 1, 1, tzinfo = datetime.timezone(datetime.timedelta(hours = 1)))],
+         'datetime64[ms]',
+         [datetime.datetime(2024, 1, 1)],
+         None),
+        (['2024-01-01', '2024-01-02T12:00:00'],
+         'datetime64[ms]',
+         [datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2, 12)],
+         None),
+        (['a', None, 1], 'object', ['a', None, 1], None),
+        (['2024-01-01T02:00:00+02:00', '2024-01-01 00:00Z', None, '2024-01-01T00:00'],
+         'datetime64[ms]',
+         [datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 1), None,
+          datetime.datetime(2024, 1, 1)],
+         None),
+        (['2019', '2020'], 'object', ['2019', '2020'], None),
+        (['10', None], 'object', ['10', None], None),
+        (['2024-01-01', '2020'], 'object', ['2024-01-01', '2020'], None),
+    ])
+    def test_values_to_ndarray(values, expected_dtype, expected, error):
+        import warnings
+
+        if not error:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                result = utility_functions.values_to_ndarray(values)
+            assert str(result.dtype) == expected_dtype
+            if expected_dtype == 'float64':
+                result = np.where(np.isnan(result), None, result)
+            elif expected_dtype == 'datetime64[ms]':
+                result = result.astype(object)
+            assert result.tolist() == expected
+        else:
+            with pytest.raises(error):
+                result = utility_functions.values_to_ndarray(values)
+
+
+    @pytest.mark.parametrize('arrays, expected_dtype, error', [
+        ([], 'float64', None),
+        ([np.asarray([1, 2])], 'int64', None),
+        ([np.asarray([1, 2]), np.asarray([1.5])], 'float64', None),
+        ([np.asarray([1, 2]), np.asarray(['a'], dtype = object)], 'object', None),
+        ([np.asarray(['2024-01-01'], dtype = 'datetime64[ms]'), np.asarray([np.nan, np.nan])],
+         'datetime64[ms]',
+         None),
+        ([np.asarray([np.nan]), np.asarray(['a', None], dtype = object)], 'object', None),
+    ])
+    def test_concatenate_ndarrays(arrays, expected_dtype, error):
+        if not error:
+            result = utility_functions.concatenate_ndarrays(arrays)
+            assert str(result.dtype) == expected_dtype
+            assert len(result) == sum([len(x) for x in arrays])
+        else:
+            with pytest.raises(error):
+                result = utility_functions.concatenate_ndarrays(arrays)
+
+
+    @pytest.mark.parametrize('keys, expected_keys, expected_groups, error', [
+        ([], [], [], None),
+        (['b', 'a', 'b', 'c', 'a'], ['b', 'a', 'c'], [[0, 2], [1, 4], [3]], None),
+        (np.asarray([3, 1, 3, 2, 1]), [3, 1, 2], [[0, 2], [1, 4], [3]], None),
+        (np.asarray(['b', 'a', 'b'], dtype = object), ['b', 'a'], [[0, 2], [1]], None),
+    ])
+    def test_get_group_slices(keys, expected_keys, expected_groups, error):
+        if not error:
+            result_keys, order, slices = utility_functions.get_group_slices(keys)
+            assert result_keys == expected_keys
+            assert [order[x].tolist() for x in slices] == expected_groups
+        else:
+            with pytest.raises(error):
+                result = utility_functions.get_group_slices(keys)
+
+
+    @pytest.mark.parametrize('value, expected_chunks, error', [
+        ([1, 2, 3], [[1.0, 2.0, 3.0]], None),
+        (np.asarray([[1, 2], [3, 4]]), [[1.0, 2.0, 3.0, 4.0]], None),
+        ([[1, 2], [3]], [[1.0, 2.0], [3.0]], None),
+        ((x for x in [[1, 2], np.asarray([3])]), [[1.0, 2.0], [3.0]], None),
+        ([], [[]], None),
+    ])
+    def test_iter_ndarray_chunks(value, expected_chunks, error):
+        if not error:
+            result = [x.tolist() for x in utility_functions.iter_ndarray_chunks(value)]
+            assert result == expected_chunks
+        else:
+            with pytest.raises(error):
+                result = [x for x in utility_functions.iter_ndarray_chunks(value)]
+
+
+    @pytest.mark.parametrize('values, kwargs, expected_counts, expected_edges, error', [
+        ([0, 1, 2, 3], {'bins': 2}, [2, 2], [0.0, 1.5, 3.0], None),
+        ([5, 5, 5], {'bins': 2}, [0, 3], [4.5, 5.0, 5.5], None),
+        ([[0, 1], [2, 3]], {'bins': 'auto'}, [1, 1, 2], [0.0, 1.0, 2.0, 3.0], None),
+        ([0, 1, 2, 3], {'bins': 'fd'}, [2, 2], [0.0, 1.5, 3.0], None),
+
+        ([0, 1, 2, 3], {'bins': 0}, None, None, (ValueError, TypeError)),
+    ])
+    def test_compute_histogram(values, kwargs, expected_counts, expected_edges, error):
+        if not error:
+            counts, edges = utility_functions.compute_histogram(values, **kwargs)
+            assert counts.tolist() == expected_counts
+            assert edges.tolist() == expected_edges
+        else:
+            with pytest.raises(error):
+                result = utility_functions.compute_histogram(values, **kwargs)
+
+
+    @pytest.mark.parametrize('kwargs, expected_grid, expected_x_edges, expected_y_edges, error', [
+        ({'x': [0, 1, 2, 3], 'y': [0, 0, 1, 1], 'x_bins': 2, 'y_bins': 2},
+         [[2.0, None], [None, 2.0]],
+         [0.0, 1.5, 3.0],
+         [0.0, 0.5, 1.0],
+         None),
+        ({'x': [0, 1, 2, 3], 'y': [0, 0, 1, 1], 'value': [1, 5, 3, 4], 'x_bins': 2, 'y_bins': 1, 'agg': 'max'},
+         [[5.0, 4.0]],
+         [0.0, 1.5, 3.0],
+         [0.0, 1.0],
+         None),
+        ({'x': [0, 1, 2, float('nan'), 10], 'y': [0, 0, 0, 0, 0], 'value': [1, 5, 3, 4, 9], 'x_bins': [0, 2, 4], 'y_bins': 1, 'agg': 'min'},
+         [[1.0, 3.0]],
+         [0.0, 2.0, 4.0],
+         [-0.5, 0.5],
+         None),
+
+        ({'x': [0, 1], 'y': [0, 1], 'value': [1, 2, 3]}, None, None, None, errors.HighchartsValueError),
+        ({'x': [0, 1], 'y': [0, 1], 'agg': 'median'}, None, None, None, errors.HighchartsValueError),
+    ])
+    def test_bin_to_grid(kwargs, expected_grid, expected_x_edges, expected_y_edges, error):
+        if not error:
+            grid, x_edges, y_edges = utility_functions.bin_to_grid(**kwargs)
+            grid = np.where(np.isnan(grid), None, grid)
+            assert grid.tolist() == expected_grid
+            assert x_edges.tolist() == expected_x_edges
+            assert y_edges.tolist() == expected_y_edges
+        else:
+            with pytest.raises(error):
+                result = utility_functions.bin_to_grid(**kwargs)
+
+    @pytest.mark.parametrize('kwargs, expected, error', [
+        ({'levels': [['EU', 'EU', 'EU', 'NA', None],
+                     ['FR', 'FR', 'DE', 'US', 'x'],
+                     ['Paris', 'Lyon', None, 'NYC', 'y']],
+          'values': [1, 2, 3, 10, 5]},
+         {'id': ['EU', 'NA', 'EU/DE', 'EU/FR', 'NA/US', 'EU/FR/Lyon', 'EU/FR/Paris', 'NA/US/NYC'],
+          'parent': [None, None, 'EU', 'EU', 'NA', 'EU/FR', 'EU/FR', 'NA/US'],
+          'value': [6.0, 10.0, 3.0, 3.0, 10.0, 2.0, 1.0, 10.0]},
+         None),
+        ({'levels': [['EU', 'EU', 'EU', 'NA'], ['FR', 'IT', 'DE', 'US']],
+          'values': [5, 1, 1, 10],
+          'min_value': 2},
+         {'id': ['EU', 'NA', 'EU/Other', 'EU/FR', 'NA/US'],
+          'parent': [None, None, 'EU', 'EU', 'NA'],
+          'value': [7.0, 10.0, 2.0, 5.0, 10.0]},
+         None),
+        ({'levels': [['b', 'a', 'a']]},
+         {'id': ['a', 'b'],
+          'parent': [None, None],
+          'value': [2.0, 1.0]},
+         None),
+
+        ({'levels': []}, None, errors.HighchartsValueError),
+        ({'levels': [['a', 'b']], 'values': [1]}, None, errors.HighchartsValueError),
+    ])
+    def test_rollup_paths(kwargs, expected, error):
+        if not error:
+            result = utility_functions.rollup_paths(**kwargs)
+            for key in expected:
+                assert list(result[key]) == expected[key]
+        else:
+            with pytest.raises(error):
+                result = utility_functions.rollup_paths(**kwargs)
+
+    def test_rollup_paths_stable_ids():
+        levels = [['EU', 'NA', 'EU', 'NA'], ['FR', 'US', 'DE', 'CA']]
+        values = [1, 2, 3, 4]
+        first = utility_functions.rollup_paths(levels, values)
+        second = utility_functions.rollup_paths([x[::-1] for x in levels], values[::-1])
+        assert dict(zip(first['id'], first['value'])) == dict(zip(second['id'],
+                                                                  second['value']))
+
+    @pytest.mark.parametrize('kwargs, expected, error', [
+        ({'sources': ['a', 'a', 'b', 'c', 'd', None],
+          'targets': ['b', 'b', 'c', 'd', 'a', 'x'],
+          'weights': [1, 2, 3, 1, 1, 9]},
+         {'from_': ['a', 'b', 'c', 'd'],
+          'to': ['b', 'c', 'd', 'a'],
+          'weight': [3.0, 3.0, 1.0, 1.0]},
+         None),
+        ({'sources': ['a', 'a', 'b', 'c', 'd'],
+          'targets': ['b', 'b', 'c', 'd', 'a'],
+          'weights': [1, 2, 3, 1, 1],
+          'top_n_nodes': 2},
+         {'from_': ['a', 'b', 'Other'],
+          'to': ['b', 'Other', 'a'],
+          'weight': [3.0, 3.0, 1.0]},
+         None),
+        ({'sources': ['Other', 'Other', 'x', 'Other'],
+          'targets': ['a', 'a', 'Other', 'Other'],
+          'weights': [5, 5, 1, 1],
+          'top_n_nodes': 2},
+         {'from_': ['Other', 'Other'],
+          'to': ['Other', 'a'],
+          'weight': [1.0, 10.0]},
+         None),
+        ({'sources': ['a', 'a', 'b'],
+          'targets': ['b', 'b', 'c'],
+          'min_weight': 2},
+         {'from_': ['a'],
+          'to': ['b'],
+          'weight': [2.0]},
+         None),
+
+        ({'sources': ['a', 'b'], 'targets': ['b']}, None, errors.HighchartsValueError),
+        ({'sources': ['a'], 'targets': ['b'], 'top_n_nodes': 0}, None, (ValueError, TypeError)),
+    ])
+    def test_aggregate_edges(kwargs, expected, error):
+        if not error:
+            result = utility_functions.aggregate_edges(**kwargs)
+            for key in expected:
+                assert list(result[key]) == expected[key]
+        else:
+            with pytest.raises(error):
+                result = utility_functions.aggregate_edges(**kwargs)
+
+    def test_factorize_labels():
+        labels = np.asarray(['b', 'aa', '', 'b', 'c'] * 500)
+        uniques, codes = utility_functions._factorize_labels(labels)
+        expected_uniques, expected_codes = np.unique(labels, return_inverse = True)
+        assert uniques.tolist() == expected_uniques.tolist()
+        assert codes.tolist() == expected_codes.ravel().tolist()
+
+
+@pytest.mark.parametrize('kwargs, expected, error', [
+    ({'documents': ['y x y', 'z y x', 'the and of']},
+     {'name': ['y', 'x', 'z'], 'weight': [3, 2, 1]},
+     None),
+    ({'documents': ['x ' * 10 + 'y ' * 5, ' '.join(['w%d' % x for x in range(10)])],
+      'top_k': 2,
+      'capacity': 2,
+      'tokenizer': str.split},
+     {'name': ['x', 'y'], 'weight': [10, 5]},
+     None),
+    ({'documents': [], 'top_k': 5},
+     {'name': [], 'weight': []},
+     None),
+
+    ({'documents': ['a'], 'top_k': 0}, None, (ValueError, TypeError)),
+])
+def test_count_terms(kwargs, expected, error):
+    if not error:
+        result = utility_functions.count_terms(**kwargs)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = utility_functions.count_terms(**kwargs)
+
+
+@pytest.mark.parametrize('sets', [
+    {'A': [1, 2, 3], 'B': [2, 3, 4], 'C': [3, 4, 5], 'D': [9]},
+    {'A': ['a', 'b'], 'B': ['b', 'b'], 'C': []},
+    {'A': {1, 2}, 'B': ['x', '1']},
+    {'A': {1, 'x'}, 'B': ['1', 'x'], 'C': [1.0, 2.5]},
+    {'A': [(1, 2), (3, 4)], 'B': [(1, 2)]},
+])
+def test_compute_set_intersections(sets):
+    pytest.importorskip('numpy')
+
+    result = utility_functions.compute_set_intersections(sets)
+    assert len(result['sets']) == 2 ** len(sets) - 1
+    for names, value in zip(result['sets'], result['value']):
+        members = set.intersection(*[set(sets[x]) for x in names])
+        assert value == len(members)
+
+
+@pytest.mark.parametrize('kwargs, expected, error', [
+    ({'x': [0, 1], 'y': [0, 1], 'u': [0, 1], 'v': [1, 0]},
+     {'x': [0, 1], 'y': [0, 1], 'length': [1.0, 1.0], 'direction': [180.0, 270.0]},
+     None),
+    ({'x': [[0, 1], [0, 1]], 'y': [[5, 5], [6, 6]], 'u': [[0, 0], [0, 0]], 'v': [[-1, -2], [-3, -4]], 'stride': (2, 1)},
+     {'x': [0, 1], 'y': [5, 5], 'length': [1.0, 2.0], 'direction': [0.0, 0.0]},
+     None),
+    ({'x': [0, 1], 'y': None, 'u': [0, float('nan')], 'v': [0, 0], 'skip_nan': False},
+     {'x': [0, 1], 'length': [0.0, None], 'direction': [0.0, None]},
+     None),
+
+    ({'x': [[0, 1]], 'y': [[0, 1], [0, 1]], 'u': [[0, 0], [0, 0]], 'v': [[0, 0], [0, 0]]}, None, errors.HighchartsValueError),
+])
+def test_compute_vectors(kwargs, expected, error):
+    np = pytest.importorskip('numpy')
+
+    if not error:
+        result = utility_functions.compute_vectors(**kwargs)
+        assert list(result.keys()) == list(expected.keys())
+        for key in expected:
+            assert [None if x != x else x for x in result[key].tolist()] == expected[key]
+    else:
+        with pytest.raises(error):
+            result = utility_functions.compute_vectors(**kwargs)
+
+
+@pytest.mark.parametrize('kwargs, expected, error', [
+    ({'y': [0, 0.1, 0, 1, 0], 'x': [0, 1, 2, 3, 4], 'tolerance': 0.5},
+     [0, 2, 3, 4],
+     None),
+    ({'y': [0, 0.1, 0, 1, 0], 'tolerance': 2},
+     [0, 4],
+     None),
+    ({'y': [0, 0.1, 0, 1, 0], 'x': [0, 1, 2, 3, 4], 'tolerance': 0.06, 'method': 'visvalingam'},
+     [0, 1, 2, 3, 4],
+     None),
+    ({'y': [0, 0.1, 0, 1, 0], 'x': [0, 1, 2, 3, 4], 'tolerance': 0.2, 'method': 'visvalingam'},
+     [0, 2, 3, 4],
+     None),
+    ({'y': [0, 1, None, None, 2, 2.1, 2], 'tolerance': 0.5},
+     [0, 1, 2, 4, 6],
+     None),
+    ({'y': [0, 1, 0, -1, 0], 'x': [1, 0, -1, 0, 1], 'tolerance': 10},
+     [0, 1, 2, 4],
+     None),
+    ({'y': [0, 1, 0, -1, 0], 'x': [1, 0, -1, 0, 1], 'tolerance': 10, 'preserve_topology': False},
+     [0, 4],
+     None),
+    ({'y': [], 'tolerance': 1},
+     [],
+     None),
+
+    ({'y': [0, 1], 'x': [0], 'tolerance': 1}, None, errors.HighchartsValueError),
+    ({'y': [0, 1], 'tolerance': 1, 'method': 'unsupported'}, None, errors.HighchartsValueError),
+])
+def test_simplify_indices(kwargs, expected, error):
+    pytest.importorskip('numpy')
+
+    if not error:
+        result = utility_functions.simplify_indices(**kwargs)
+        assert result.tolist() == expected
+    else:
+        with pytest.raises(error):
+            result = utility_functions.simplify_indices(**kwargs)
+
+
+@pytest.mark.parametrize('tolerance', [0.01, 0.5, 5, 1e9])
+def test_simplify_indices_visvalingam_reference(tolerance):
+    np = pytest.importorskip('numpy')
+
+    def reference(x, y, tolerance):
+        retained = list(range(len(y)))
+        floor = 0
+        while len(retained) > 2:
+            areas = [0.5 * abs((x[a] - x[c]) * (y[b] - y[a]) - (x[a] - x[b]) * (y[c] - y[a]))
+                     for a, b, c in zip(retained, retained[1:], retained[2:])]
+            areas = [max(area, floor) for area in areas]
+            smallest = min(areas)
+            if smallest >= tolerance:
+                break
+            floor = smallest
+            del retained[areas.index(smallest) + 1]
+        return retained
+
+    rng = np.random.default_rng(7)
+    y = np.round(np.cumsum(rng.normal(size = 150)), 1)
+    x = np.arange(150, dtype = float)
+    result = utility_functions.simplify_indices(y,
+                                                x = x,
+                                                tolerance = tolerance,
+                                                method = 'visvalingam')
+    assert result.tolist() == reference(x.tolist(), y.tolist(), tolerance)